@@ -0,0 +1 @@
+"""Package containing the startup and per-command latency benchmarks of Tidy CLI (run via python -m benchmarks.run)."""
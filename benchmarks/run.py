@@ -0,0 +1,222 @@
+"""
+Module defining the command running the benchmarks of Tidy CLI, storing their results and flagging regressions against a baseline.
+
+Results are stored in the results folder as latest.json (last run), history.jsonl (every run) and baseline.json (reference run,
+saved by the first run or on request), and a benchmark regresses when its median exceeds the baseline one by the threshold ratio.
+"""
+
+# Import packages and modules
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from .suite import (
+    Measurement,
+    measure_cleanup,
+    measure_commands,
+    measure_import,
+    measure_settings,
+)
+
+# Define literals
+RESULTS_DIR = Path(".benchmarks")  # folder storing benchmark results
+LATEST_FILE = "latest.json"  # results of the last run
+HISTORY_FILE = "history.jsonl"  # results of every run, one per line
+BASELINE_FILE = "baseline.json"  # results regressions are flagged against
+MIN_DELTA = 0.005  # seconds a median must grow by to regress, so that noise on very fast benchmarks is not flagged
+
+console = Console()
+app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+
+
+def to_results(
+    measurements: list[Measurement],
+    breakdown: list[dict[str, object]],
+) -> dict[str, Any]:
+    """
+    Function aimed at converting measurements to the stored results, along with the environment they were taken in.
+
+    :param measurements: benchmark measurements
+    :type measurements: list[Measurement]
+    :param breakdown: slowest modules imported by tidy_cli
+    :type breakdown: list[dict[str, object]]
+    :return: results (i.e., timestamp, environment, benchmarks and import breakdown)
+    :rtype: dict[str, Any]
+    """
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {item.name: {"median": item.median, "best": item.best, "samples": item.samples} for item in measurements},
+        "import_breakdown": breakdown,
+    }
+
+
+def find_regressions(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    min_delta: float = MIN_DELTA,
+) -> dict[str, float]:
+    """
+    Function aimed at finding the benchmarks whose median exceeds the baseline one by more than the threshold ratio (and min_delta seconds).
+    Benchmarks missing from the baseline (e.g., newly added) are not compared.
+
+    :param results: results of the current run
+    :type results: dict[str, Any]
+    :param baseline: results of the baseline run
+    :type baseline: dict[str, Any]
+    :param threshold: ratio of the baseline median a benchmark regresses above (e.g., 1.25 for 25% slower)
+    :type threshold: float
+    :param min_delta: seconds a median must grow by to regress, defaults to MIN_DELTA
+    :type min_delta: float
+    :return: ratio of the current median to the baseline one of each regressed benchmark
+    :rtype: dict[str, float]
+    """
+    regressions = {}
+    for name, current in results["benchmarks"].items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None or reference["median"] <= 0:
+            continue
+        ratio = current["median"] / reference["median"]
+        if ratio > threshold and current["median"] - reference["median"] > min_delta:
+            regressions[name] = ratio
+    return regressions
+
+
+def store_results(
+    results: dict[str, Any],
+    results_dir: Path,
+    save_baseline: bool,
+) -> dict[str, Any] | None:
+    """
+    Function aimed at storing the results of a run (as latest and in the history) and at getting the baseline to compare them with.
+
+    :param results: results of the current run
+    :type results: dict[str, Any]
+    :param results_dir: folder storing benchmark results
+    :type results_dir: Path
+    :param save_baseline: whether the results become the baseline (as well as when there is none yet)
+    :type save_baseline: bool
+    :return: baseline results, None if the current results became the baseline
+    :rtype: dict[str, Any] | None
+    """
+    results_dir.mkdir(parents=True, exist_ok=True)
+    (results_dir / LATEST_FILE).write_text(json.dumps(results, indent=2))
+    with open(results_dir / HISTORY_FILE, "a") as file:
+        file.write(json.dumps(results) + "\n")
+    baseline_file = results_dir / BASELINE_FILE
+    if save_baseline is True or not baseline_file.exists():
+        baseline_file.write_text(json.dumps(results, indent=2))
+        return None
+    return json.loads(baseline_file.read_text())
+
+
+def show_results(
+    results: dict[str, Any],
+    baseline: dict[str, Any] | None,
+    regressions: dict[str, float],
+) -> None:
+    """
+    Function aimed at showing the results in a table, along with the ratio to the baseline and the import time breakdown.
+
+    :param results: results of the current run
+    :type results: dict[str, Any]
+    :param baseline: baseline results, None if there is none to compare with
+    :type baseline: dict[str, Any] | None
+    :param regressions: ratio to the baseline of each regressed benchmark
+    :type regressions: dict[str, float]
+    :return: None
+    :rtype: None
+    """
+    table = Table(title="⏱️ Tidy CLI benchmarks")
+    table.add_column("Benchmark", style="bold")
+    table.add_column("Median (ms)", justify="right")
+    table.add_column("Best (ms)", justify="right")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Ratio", justify="right")
+    for name, current in results["benchmarks"].items():
+        reference = (baseline or {}).get("benchmarks", {}).get(name)
+        ratio = "-" if reference is None or reference["median"] <= 0 else f"{current['median'] / reference['median']:.2f}x"
+        table.add_row(
+            name,
+            f"{current['median'] * 1e3:.1f}",
+            f"{current['best'] * 1e3:.1f}",
+            "-" if reference is None else f"{reference['median'] * 1e3:.1f}",
+            f"[red]{ratio}[/red]" if name in regressions else ratio,
+        )
+    console.print(table)
+    breakdown = Table(title="📦 Slowest imports of tidy_cli (self time)")
+    breakdown.add_column("Module", style="bold")
+    breakdown.add_column("Self (ms)", justify="right")
+    breakdown.add_column("Cumulative (ms)", justify="right")
+    for item in results["import_breakdown"]:
+        breakdown.add_row(item["module"], f"{item['self'] * 1e3:.1f}", f"{item['cumulative'] * 1e3:.1f}")
+    console.print(breakdown)
+
+
+@app.command()
+def run(
+    repeat: Annotated[
+        int,
+        typer.Option(
+            "--repeat",
+            min=1,
+            help="🔁 Number of [bold]repetitions[/bold] of each benchmark (medians are compared).",
+        ),
+    ] = 5,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            min=1,
+            help="🚨 Ratio of the [italic]baseline[/italic] median a benchmark [bold]regresses[/bold] above (e.g., 1.25 for 25% slower).",
+        ),
+    ] = 1.25,
+    save_baseline: Annotated[
+        bool,
+        typer.Option(
+            "--save-baseline",
+            help="📌 Store the results as the new [bold]baseline[/bold] (the first run does it anyway).",
+        ),
+    ] = False,
+    results_dir: Annotated[
+        Path,
+        typer.Option(
+            "--results-dir",
+            help="🗂️ Folder storing the [bold]results[/bold] (latest, history and baseline).",
+        ),
+    ] = RESULTS_DIR,
+) -> None:
+    """
+    ⏱️ Run the [bold]benchmarks[/bold]: cold-start import time, command latencies against stub tools, settings loading and test cache cleanup.
+    Exits with code 1 if any benchmark [red]regresses[/red] against the [italic]baseline[/italic].
+    """
+    if sys.platform == "win32":
+        console.print("❌ [red]Benchmarks need POSIX stub executables and cannot run on Windows[/red]")
+        raise typer.Exit(code=1)
+    console.print(f"🚀 Running benchmarks ({repeat} repetitions each)...")
+    import_time, breakdown = measure_import(repeat)
+    measurements = [import_time, *measure_commands(repeat), *measure_settings(repeat), *measure_cleanup(repeat)]
+    results = to_results(measurements, breakdown)
+    baseline = store_results(results, results_dir, save_baseline)
+    regressions = {} if baseline is None else find_regressions(results, baseline, threshold)
+    show_results(results, baseline, regressions)
+    if baseline is None:
+        console.print(f"📌 Results stored as baseline in [bold]{results_dir / BASELINE_FILE}[/bold]")
+    if regressions:
+        for name, ratio in regressions.items():
+            console.print(f"🚨 [red]{name} regressed: {ratio:.2f}x the baseline median (threshold {threshold:.2f}x)[/red]")
+        raise typer.Exit(code=1)
+    console.print("✅ [green]No regressions[/green]")
+
+
+if __name__ == "__main__":
+    app()
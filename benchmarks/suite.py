@@ -0,0 +1,300 @@
+"""
+Module defining the benchmarks of Tidy CLI: cold-start import time, latency of commands against stub tool executables,
+and cost of settings loading and test cache cleanup on synthetic trees of increasing size.
+
+Commands run in a fresh interpreter each time (i.e., as users run them), while settings and cleanup are measured in-process.
+"""
+
+# Import packages and modules
+import contextlib
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from tidy_cli.commons import pyproject, settings
+from tidy_cli.pytest_cli.helpers import cleanup_test_cache
+
+# Define literals
+STUB_TOOLS = ("ruff", "mypy", "dmypy", "pydoclint", "flake8", "coverage")  # executables replaced by stubs exiting at once
+CLI_SCRIPT = "from tidy_cli import app; app()"  # runs the CLI in the benchmark interpreter (i.e., not through a shim changing PATH)
+COMMANDS = {  # benchmarked commands, run from a synthetic project
+    "version": ["version"],
+    "help": ["--help"],
+    "lint-run": ["lint", "run", "--no-cache"],
+    "pytest-run": ["pytest", "run", "--default-dir", ".", "--pyproject-path", "pyproject.toml", "--slowest", "0"],
+}
+SETTINGS_DEPTHS = (1, 10, 50)  # folders between the project root (with pyproject.toml) and the current directory
+CLEANUP_SIZES = (100, 1_000, 10_000)  # bytecode files of the synthetic trees cleaned up
+MODULES_PER_PACKAGE = 50  # bytecode files per __pycache__ folder of the synthetic trees
+IMPORT_BREAKDOWN_SIZE = 10  # modules listed in the import time breakdown, slowest first
+
+
+@dataclass
+class Measurement:
+    """
+    Class aimed at storing the timings of a benchmark.
+
+    .. attribute :: name
+        :type: str
+
+        benchmark name (e.g., command:version)
+
+    .. attribute :: samples
+        :type: list[float]
+
+        duration in seconds of each repetition
+    """
+
+    name: str
+    samples: list[float]
+
+    @property
+    def median(self) -> float:
+        """
+        Method aimed at getting the median duration, the one compared across runs.
+
+        :return: median duration in seconds
+        :rtype: float
+        """
+        return statistics.median(self.samples)
+
+    @property
+    def best(self) -> float:
+        """
+        Method aimed at getting the best duration (i.e., the least disturbed by the machine load).
+
+        :return: minimum duration in seconds
+        :rtype: float
+        """
+        return min(self.samples)
+
+
+def time_call(
+    func: Callable[[], object],
+    repeat: int,
+    setup: Callable[[], object] | None = None,
+) -> list[float]:
+    """
+    Function aimed at timing a function over repetitions, the setup (if any) running untimed before each one.
+
+    :param func: function to be timed
+    :type func: Callable[[], object]
+    :param repeat: number of repetitions
+    :type repeat: int
+    :param setup: function preparing each repetition (e.g., building a tree), defaults to None
+    :type setup: Callable[[], object] | None
+    :return: duration in seconds of each repetition
+    :rtype: list[float]
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started_at = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started_at)
+    return samples
+
+
+def parse_import_times(
+    stderr: str,
+) -> dict[str, tuple[int, int]]:
+    """
+    Function aimed at parsing the output of python -X importtime.
+
+    :param stderr: standard error of the interpreter run with -X importtime
+    :type stderr: str
+    :return: self and cumulative import time in microseconds by module name
+    :rtype: dict[str, tuple[int, int]]
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def measure_import(
+    repeat: int,
+) -> tuple[Measurement, list[dict[str, object]]]:
+    """
+    Function aimed at measuring the cold-start import time of tidy_cli in fresh interpreters, along with its breakdown by module.
+
+    :param repeat: number of fresh interpreters
+    :type repeat: int
+    :return: import time measurement and the slowest modules of the fastest run, by self time
+    :rtype: tuple[Measurement, list[dict[str, object]]]
+    """
+    samples, runs = [], []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import tidy_cli"], capture_output=True, text=True, check=True)
+        times = parse_import_times(result.stderr)
+        samples.append(times["tidy_cli"][1] / 1e6)
+        runs.append(times)
+    fastest = runs[samples.index(min(samples))]
+    slowest = sorted(fastest.items(), key=lambda item: -item[1][0])[:IMPORT_BREAKDOWN_SIZE]
+    breakdown: list[dict[str, object]] = [{"module": name, "self": self_us / 1e6, "cumulative": cumulative_us / 1e6} for name, (self_us, cumulative_us) in slowest]
+    return Measurement("import:tidy_cli", samples), breakdown
+
+
+def make_stub_tools(
+    folder: Path,
+) -> None:
+    """
+    Function aimed at creating executables standing for the tools run by the commands, exiting successfully at once,
+    so that command latencies measure Tidy CLI overhead only.
+
+    :param folder: folder where the stubs are created (to be put first in PATH)
+    :type folder: Path
+    :return: None
+    :rtype: None
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    for tool in STUB_TOOLS:
+        stub = folder / tool
+        stub.write_text("#!/bin/sh\nexit 0\n")
+        stub.chmod(0o755)
+
+
+def make_project(
+    root: Path,
+) -> None:
+    """
+    Function aimed at creating a minimal synthetic project to run the commands from: a package, a test and a pyproject.toml.
+
+    :param root: project folder
+    :type root: Path
+    :return: None
+    :rtype: None
+    """
+    (root / "src" / "package").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / ".git").mkdir()
+    (root / "pyproject.toml").write_text('[project]\nname = "package"\n\n[tool.tidy-cli]\nlint_default_path = "src"\n')
+    (root / "src" / "package" / "__init__.py").write_text('"""Package."""\n')
+    (root / "tests" / "test_package.py").write_text("def test_package():\n    assert True\n")
+
+
+def measure_commands(
+    repeat: int,
+) -> list[Measurement]:
+    """
+    Function aimed at measuring the latency of each command of COMMANDS, run in a fresh interpreter from a synthetic project
+    with stub tool executables first in PATH (headless, as in CI).
+
+    :param repeat: number of runs of each command
+    :type repeat: int
+    :return: latency measurement of each command
+    :rtype: list[Measurement]
+    """
+    with tempfile.TemporaryDirectory(prefix="tidy-cli-bench-") as folder:
+        root = Path(folder)
+        make_stub_tools(root / "bin")
+        make_project(root / "project")
+        env = {**os.environ, "PATH": f"{root / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}", "TIDY_CLI_HEADLESS": "1"}
+        measurements = []
+        for name, args in COMMANDS.items():
+            command = [sys.executable, "-c", CLI_SCRIPT, *args]
+            samples = time_call(
+                lambda command=command: subprocess.run(command, cwd=root / "project", env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True),  # type: ignore[misc]
+                repeat,
+            )
+            measurements.append(Measurement(f"command:{name}", samples))
+        return measurements
+
+
+def clear_settings_caches() -> None:
+    """
+    Function aimed at clearing the in-process caches of settings and pyproject.toml files (i.e., as in a new process).
+
+    :return: None
+    :rtype: None
+    """
+    settings._cache.clear()
+    settings._pyprojects.clear()
+    pyproject._cache.clear()
+
+
+def measure_settings(
+    repeat: int,
+) -> list[Measurement]:
+    """
+    Function aimed at measuring the cost of loading settings, from the settings file and the [tool.tidy-cli] section of a pyproject.toml
+    at increasing depths from the current directory, both cold (i.e., first access of a process) and cached.
+
+    :param repeat: number of repetitions of each measurement
+    :type repeat: int
+    :return: cold and cached settings loading measurements at each depth of SETTINGS_DEPTHS
+    :rtype: list[Measurement]
+    """
+    measurements = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="tidy-cli-bench-") as folder:
+        for depth in SETTINGS_DEPTHS:
+            root = Path(folder) / f"depth-{depth}"
+            make_project(root)
+            current = root.joinpath(*[f"level{level}" for level in range(depth)])
+            (current / "local").mkdir(parents=True)
+            (current / "local" / "tidy_cli_settings.json").write_text('{"pytest_default_path": "tests", "pytest_slowest": "5"}')
+            try:
+                os.chdir(current)
+                measurements.append(Measurement(f"settings:cold:depth-{depth}", time_call(settings.get_settings, repeat, setup=clear_settings_caches)))
+                measurements.append(Measurement(f"settings:cached:depth-{depth}", time_call(settings.get_settings, repeat)))
+            finally:
+                os.chdir(cwd)
+    return measurements
+
+
+def make_bytecode_tree(
+    root: Path,
+    size: int,
+) -> None:
+    """
+    Function aimed at creating a synthetic tree of packages with __pycache__ folders, as left by test runs.
+
+    :param root: tree folder
+    :type root: Path
+    :param size: number of bytecode files, MODULES_PER_PACKAGE per package
+    :type size: int
+    :return: None
+    :rtype: None
+    """
+    for index in range(size):
+        cache = root / f"package{index // MODULES_PER_PACKAGE}" / "__pycache__"
+        if index % MODULES_PER_PACKAGE == 0:
+            cache.mkdir(parents=True, exist_ok=True)
+            (cache.parent / "__init__.py").touch()
+        (cache / f"module{index}.cpython-311.pyc").touch()
+
+
+def measure_cleanup(
+    repeat: int,
+) -> list[Measurement]:
+    """
+    Function aimed at measuring the cost of the post-run test cache cleanup on synthetic trees of increasing size.
+
+    :param repeat: number of repetitions on each tree (rebuilt, untimed, before each one)
+    :type repeat: int
+    :return: cleanup measurement for each size of CLEANUP_SIZES
+    :rtype: list[Measurement]
+    """
+    measurements = []
+    with tempfile.TemporaryDirectory(prefix="tidy-cli-bench-") as folder:
+        for size in CLEANUP_SIZES:
+            root = Path(folder) / f"tree-{size}"
+
+            def cleanup(root: Path = root) -> None:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cleanup_test_cache(root, skipped_dirs=set())
+
+            measurements.append(Measurement(f"cleanup:files-{size}", time_call(cleanup, repeat, setup=lambda root=root, size=size: make_bytecode_tree(root, size))))  # type: ignore[misc]
+    return measurements
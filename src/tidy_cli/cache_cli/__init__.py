@@ -0,0 +1,9 @@
+"""Package containing CLI Commands Group related to Cache functionalities."""
+
+from .cli import (
+    cache_app,
+)
+
+__all__ = [
+    "cache_app",
+]
@@ -0,0 +1,186 @@
+"""Module aimed at defining the CLI Cache Commands Group."""
+
+# Import packages and modules
+import time
+from pathlib import Path
+from typing import Annotated
+
+import click
+import typer
+from rich.table import Table
+
+from tidy_cli.commons.console import console
+
+from .helpers import (
+    CACHE_KINDS,
+    find_cache_locations,
+    format_age,
+    format_size,
+    prune_caches,
+)
+
+# Define Typer Cache program (i.e., commands group)
+cache_app = typer.Typer(
+    name="cache",
+    help="🗄️  [bold]List[/bold] and [bold]prune[/bold] bytecode, tools ([italic]Pytest, Mypy, Ruff, Coverage[/italic]) and Tidy CLI caches.",
+    add_completion=True,
+    rich_markup_mode="rich",
+)
+
+
+@cache_app.command(
+    "list",
+    help="📋 [bold]List[/bold] cache locations under a [bold]path[/bold] (or the [bold]current directory[/bold]) with their [italic]size[/italic] and [italic]age[/italic].",
+)
+def list_caches(
+    path: Annotated[
+        Path,
+        typer.Argument(
+            help="📁 Folder where to look for caches.",
+            show_default="current directory",
+        ),
+    ] = Path("."),
+    locations: Annotated[
+        bool,
+        typer.Option(
+            "--locations",
+            "-l",
+            help="📍 List every cache [bold]location[/bold] instead of totals by kind of cache.",
+            show_default="False",
+        ),
+    ] = False,
+) -> None:
+    """
+    Function aimed at listing the cache locations with their size and age, as totals by kind of cache or one by one.
+
+    :param path: folder where to look for caches, defaults to the current directory
+    :type path: Path
+    :param locations: whether to list every cache location instead of totals by kind, defaults to False
+    :type locations: bool
+    :return: None
+    :rtype: None
+    """
+    found = find_cache_locations(path)
+    if not found:
+        console.print(f"✨ No caches found under [bold]{path}[/bold]", style="green")
+        return
+
+    now = time.time()
+    table = Table(title=f"🗄️  Caches under {path}", title_justify="left")
+    if locations is True:
+        table.add_column("Location")
+        table.add_column("Kind")
+        table.add_column("Size", justify="right")
+        table.add_column("Age", justify="right")
+        for location in found:
+            table.add_row(str(location.path), location.kind, format_size(location.size), format_age(now - location.modified))
+    else:
+        table.add_column("Kind")
+        table.add_column("Locations", justify="right")
+        table.add_column("Size", justify="right")
+        table.add_column("Newest", justify="right")
+        table.add_column("Oldest", justify="right")
+        for kind in CACHE_KINDS:
+            of_kind = [location for location in found if location.kind == kind]
+            if of_kind:
+                table.add_row(
+                    kind,
+                    str(len(of_kind)),
+                    format_size(sum(location.size for location in of_kind)),
+                    format_age(now - max(location.modified for location in of_kind)),
+                    format_age(now - min(location.modified for location in of_kind)),
+                )
+    console.print(table)
+    console.print(f"💾 Total: [bold]{format_size(sum(location.size for location in found))}[/bold] in [bold]{len(found)}[/bold] location(s)", style="white")
+
+
+@cache_app.command(
+    "prune",
+    help="🧹 [bold]Prune[/bold] cache locations under a [bold]path[/bold] (or the [bold]current directory[/bold]) older than an [italic]age[/italic] "
+    "and/or beyond a [italic]size budget[/italic] (least recently used first), or all of them.",
+)
+def prune(
+    path: Annotated[
+        Path,
+        typer.Argument(
+            help="📁 Folder where to look for caches.",
+            show_default="current directory",
+        ),
+    ] = Path("."),
+    older_than: Annotated[
+        float | None,
+        typer.Option(
+            "--older-than",
+            min=0,
+            help="⏳ Prune cache locations not modified for more than the given number of [bold]days[/bold].",
+        ),
+    ] = None,
+    max_size: Annotated[
+        float | None,
+        typer.Option(
+            "--max-size",
+            min=0,
+            help="📦 Prune the least recently modified cache locations until the others fit the given [bold]size budget[/bold] in [italic]MB[/italic].",
+        ),
+    ] = None,
+    kinds: Annotated[
+        list[str],
+        typer.Option(
+            "--kind",
+            "-k",
+            click_type=click.Choice(CACHE_KINDS),
+            help="🏷️  Prune only the given [bold]kind[/bold] of cache (can be used multiple times).",
+            show_default="all kinds",
+        ),
+    ] = [],  # noqa: B006
+    prune_all: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            "-a",
+            help="🗑️  Prune [bold]every[/bold] cache location (of the given kinds).",
+            show_default="False",
+        ),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="👀 Only show what would be pruned.",
+            show_default="False",
+        ),
+    ] = False,
+) -> None:
+    """
+    Function aimed at pruning cache locations by age and/or size budget, or all of them.
+
+    :param path: folder where to look for caches, defaults to the current directory
+    :type path: Path
+    :param older_than: maximum age in days of the kept cache locations
+    :type older_than: float | None
+    :param max_size: maximum total size in megabytes of the kept cache locations
+    :type max_size: float | None
+    :param kinds: kinds of cache to be pruned, defaults to every kind
+    :type kinds: list[str]
+    :param prune_all: whether to prune every cache location, defaults to False
+    :type prune_all: bool
+    :param dry_run: whether to only show what would be pruned, defaults to False
+    :type dry_run: bool
+    :return: None
+    :rtype: None
+    """
+    if older_than is None and max_size is None and prune_all is False:
+        console.print("❌ Provide [bold]--older-than[/bold], [bold]--max-size[/bold] or [bold]--all[/bold]", style="red")
+        raise typer.Exit(1)
+
+    pruned = prune_caches(path, older_than, max_size, kinds, dry_run=dry_run)
+    if not pruned:
+        console.print("✨ Nothing to prune", style="green")
+        return
+    for location in pruned:
+        console.print(f"🗑️  {location.path} ({location.kind}, {format_size(location.size)})", style="white", markup=False, highlight=False)
+    freed = format_size(sum(location.size for location in pruned))
+    if dry_run is True:
+        console.print(f"👀 Would prune [bold]{len(pruned)}[/bold] cache location(s), freeing [bold]{freed}[/bold]", style="white")
+    else:
+        console.print(f"🧹 Pruned [bold]{len(pruned)}[/bold] cache location(s), freeing [bold]{freed}[/bold]", style="green")
@@ -0,0 +1,286 @@
+"""Module defining helpers functions for the CLI Cache Commands Group."""
+
+# Import packages and modules
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tidy_cli.commons.settings import (
+    SETTINGS_FILE,
+    get_settings,
+)
+
+# Define literals
+CACHE_DIRS = {  # cache folders with the kind of cache they store
+    "__pycache__": "bytecode",
+    ".pytest_cache": "pytest",
+    ".mypy_cache": "mypy",
+    ".ruff_cache": "ruff",
+}
+COVERAGE_KIND = "coverage"  # .coverage data files (including parallel mode ones)
+TIDY_KIND = "tidy"  # tidy-cli own data next to the settings file (e.g., lint cache, test durations)
+TIDY_CACHES = (  # caches tidy-cli writes next to the settings file (settings, their lock and backup files are never caches)
+    "tidy_cli_lint_cache.json",  # lint results cache (lint_cli.cache)
+    "tidy_cli_test_durations.json",  # test durations (pytest_cli.durations)
+    "tidy_cli_test_impact.json",  # test impact map (pytest_cli.impact)
+    "coverage",  # Coverage data of the last full run and its reports (pytest_cli.coverage_reports)
+)
+SKIPPED_DIRS = {"node_modules", "site-packages", "venv"}  # on top of hidden folders (e.g., .venv, .git) and virtual environments
+CACHE_KINDS = [*CACHE_DIRS.values(), COVERAGE_KIND, TIDY_KIND]
+
+
+@dataclass
+class CacheLocation:
+    """
+    Class aimed at storing a cache location (i.e., folder or file) with its disk usage.
+
+    .. attribute :: path
+        :type: Path
+
+        path of the cache folder or file
+
+    .. attribute :: kind
+        :type: str
+
+        kind of cache (e.g., pytest)
+
+    .. attribute :: size
+        :type: int
+
+        size in bytes of the location (files included, for folders)
+
+    .. attribute :: modified
+        :type: float
+
+        last modification timestamp of the location (files included, for folders)
+    """
+
+    path: Path
+    kind: str
+    size: int
+    modified: float
+
+
+def get_usage(
+    path: Path,
+) -> tuple[int, float]:
+    """
+    Function aimed at getting the disk usage of a file or a folder (without following symbolic links).
+
+    :param path: file or folder
+    :type path: Path
+    :return: size in bytes and last modification timestamp among the folder and its files
+    :rtype: tuple[int, float]
+    """
+    stat = path.lstat()
+    if not path.is_dir():
+        return stat.st_size, stat.st_mtime
+
+    size, modified = 0, stat.st_mtime
+    stack = [str(path)]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                entry_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            modified = max(modified, entry_stat.st_mtime)
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            else:
+                size += entry_stat.st_size
+    return size, modified
+
+
+def find_cache_locations(
+    root: Path = Path("."),
+    skipped_dirs: set[str] = SKIPPED_DIRS,
+    data_dir: Path | None = None,
+) -> list[CacheLocation]:
+    """
+    Function aimed at finding the cache locations under a root, walking the tree once, plus the caches tidy-cli writes
+    next to its settings file (i.e., TIDY_CACHES only, so that other files kept there are never listed nor pruned).
+    Hidden folders other than caches (e.g., .git, .venv), virtual environments (i.e., folders with a pyvenv.cfg file),
+    skipped folders and the tidy-cli data folder are not descended into, nor is any cache folder.
+
+    :param root: folder where to look for caches, defaults to the current directory
+    :type root: Path
+    :param skipped_dirs: names of the folders not to descend into, defaults to SKIPPED_DIRS
+    :type skipped_dirs: set[str]
+    :param data_dir: folder of the settings file with tidy-cli caches, defaults to the one under the root (i.e., local)
+    :type data_dir: Path | None
+    :return: cache locations sorted by path
+    :rtype: list[CacheLocation]
+    """
+    data_dir = root / SETTINGS_FILE.parent if data_dir is None else data_dir
+    resolved_data_dir = data_dir.resolve()
+    found: list[tuple[Path, str]] = []
+    for current, dirs, names in os.walk(root):
+        if "pyvenv.cfg" in names and Path(current) != root:
+            dirs.clear()
+            continue
+        found.extend((Path(current) / name, CACHE_DIRS[name]) for name in dirs if name in CACHE_DIRS)
+        dirs[:] = [
+            name
+            for name in dirs
+            if name not in CACHE_DIRS
+            and not name.startswith(".")
+            and name not in skipped_dirs
+            and not (name == data_dir.name and (Path(current) / name).resolve() == resolved_data_dir)
+        ]
+        found.extend((Path(current) / name, COVERAGE_KIND) for name in names if name == ".coverage" or name.startswith(".coverage."))
+    found.extend((data_dir / name, TIDY_KIND) for name in TIDY_CACHES if (data_dir / name).exists())
+
+    locations = []
+    for path, kind in found:
+        try:
+            locations.append(CacheLocation(path, kind, *get_usage(path)))
+        except OSError:
+            continue
+    return sorted(locations, key=lambda location: location.path)
+
+
+def select_prunable(
+    locations: list[CacheLocation],
+    max_age: float | None = None,
+    max_size: int | None = None,
+    now: float | None = None,
+) -> list[CacheLocation]:
+    """
+    Function aimed at selecting the cache locations to be pruned: the ones older than the maximum age, then the least recently
+    modified ones until the remaining locations fit the size budget.
+
+    :param locations: cache locations
+    :type locations: list[CacheLocation]
+    :param max_age: maximum age in seconds of the kept locations, defaults to None (i.e., no age limit)
+    :type max_age: float | None
+    :param max_size: maximum total size in bytes of the kept locations, defaults to None (i.e., no size budget)
+    :type max_size: int | None
+    :param now: current timestamp, defaults to the current time
+    :type now: float | None
+    :return: locations to be pruned, least recently modified first
+    :rtype: list[CacheLocation]
+    """
+    now = time.time() if now is None else now
+    prunable = [location for location in locations if max_age is not None and now - location.modified > max_age]
+    pruned = {id(location) for location in prunable}
+    kept = sorted((location for location in locations if id(location) not in pruned), key=lambda location: location.modified, reverse=True)
+    if max_size is not None:
+        total = 0
+        for location in kept:
+            total += location.size
+            if total > max_size:
+                prunable.append(location)
+    return sorted(prunable, key=lambda location: location.modified)
+
+
+def prune_caches(
+    root: Path = Path("."),
+    max_age_days: float | None = None,
+    max_size_mb: float | None = None,
+    kinds: list[str] | None = None,
+    skipped_dirs: set[str] = SKIPPED_DIRS,
+    dry_run: bool = False,
+    data_dir: Path | None = None,
+) -> list[CacheLocation]:
+    """
+    Function aimed at pruning the cache locations under a root by age and size budget.
+    When neither the age nor the size is given every location (of the given kinds) is pruned.
+
+    :param root: folder where to look for caches, defaults to the current directory
+    :type root: Path
+    :param max_age_days: maximum age in days of the kept locations, defaults to None (i.e., no age limit)
+    :type max_age_days: float | None
+    :param max_size_mb: maximum total size in megabytes of the kept locations, defaults to None (i.e., no size budget)
+    :type max_size_mb: float | None
+    :param kinds: kinds of cache to be pruned, defaults to None (i.e., every kind)
+    :type kinds: list[str] | None
+    :param skipped_dirs: names of the folders not to descend into, defaults to SKIPPED_DIRS
+    :type skipped_dirs: set[str]
+    :param dry_run: whether to only select the locations without removing them, defaults to False
+    :type dry_run: bool
+    :param data_dir: folder of the settings file with tidy-cli caches, defaults to the one under the root (i.e., local)
+    :type data_dir: Path | None
+    :return: pruned (or to be pruned, when dry running) locations
+    :rtype: list[CacheLocation]
+    """
+    locations = [location for location in find_cache_locations(root, skipped_dirs, data_dir) if not kinds or location.kind in kinds]
+    if max_age_days is None and max_size_mb is None:
+        prunable = locations
+    else:
+        max_age = None if max_age_days is None else max_age_days * 86400
+        max_size = None if max_size_mb is None else int(max_size_mb * 1024 * 1024)
+        prunable = select_prunable(locations, max_age, max_size)
+    if dry_run is False:
+        for location in prunable:
+            remove_location(location)
+    return prunable
+
+
+def remove_location(
+    location: CacheLocation,
+) -> None:
+    """
+    Function aimed at removing a cache location from disk.
+
+    :param location: cache location to be removed
+    :type location: CacheLocation
+    :return: None
+    :rtype: None
+    """
+    if location.path.is_dir() and not location.path.is_symlink():
+        shutil.rmtree(location.path, ignore_errors=True)
+    else:
+        location.path.unlink(missing_ok=True)
+
+
+def get_prune_budget() -> tuple[float | None, float | None]:
+    """
+    Function aimed at getting the cache prune budget from settings (used by policy-based cleanup after test runs).
+
+    :return: maximum age in days and maximum total size in megabytes, None when not set
+    :rtype: tuple[float | None, float | None]
+    """
+    settings = get_settings()
+    return settings.get_float("cache_max_age_days"), settings.get_float("cache_max_size_mb")
+
+
+def format_size(
+    size: float,
+) -> str:
+    """
+    Function aimed at formatting a size in bytes for humans.
+
+    :param size: size in bytes
+    :type size: float
+    :return: formatted size (e.g., 1.5 MB)
+    :rtype: str
+    """
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_age(
+    seconds: float,
+) -> str:
+    """
+    Function aimed at formatting an age in seconds for humans.
+
+    :param seconds: age in seconds
+    :type seconds: float
+    :return: formatted age (e.g., 3.2 h)
+    :rtype: str
+    """
+    for unit, length in (("d", 86400), ("h", 3600), ("min", 60)):
+        if seconds >= length:
+            return f"{seconds / length:.1f} {unit}"
+    return f"{max(seconds, 0):.0f} s"
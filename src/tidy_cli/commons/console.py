@@ -0,0 +1,182 @@
+"""
+Module defining the console shared across CLI application and its headless mode.
+
+In headless mode (e.g., CI jobs, pipes or provisioning scripts) the CLI skips animations and prompts,
+and prints plain text (i.e., no markup, colors or emoji) straight to the output stream instead of rendering it through Rich.
+"""
+
+# Import packages and modules
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, cast
+
+import typer
+from rich.console import Console
+from rich.text import Text
+
+# Define literals
+HEADLESS_ENV = "TIDY_CLI_HEADLESS"  # environment variable forcing the headless mode on (e.g., 1) or off (e.g., 0)
+CI_ENV_VARS = ("CI", "GITHUB_ACTIONS", "GITLAB_CI", "BUILDKITE", "CIRCLECI", "JENKINS_URL", "TF_BUILD", "TEAMCITY_VERSION")  # set by CI providers
+FALSE_VALUES = {"", "0", "false", "no", "off"}  # values of environment variables meaning disabled (case insensitive)
+SETTING_ENV_PREFIX = "TIDY_CLI_"  # prefix of the environment variables answering init prompts (e.g., TIDY_CLI_LINT_DEFAULT_PATH)
+EMOJI_PATTERN = re.compile(r"[\u2300-\u23ff\u25a0-\u27bf\u2b00-\u2bff\U0001f000-\U0001faff][\ufe0f\u200d]*\s*")  # emoji and symbols, with trailing spaces
+
+_headless: bool | None = None  # headless mode set by the command line option, None to auto-detect it
+
+
+def is_enabled(
+    value: str | None,
+) -> bool:
+    """
+    Function aimed at checking whether an environment variable value means enabled.
+
+    :param value: environment variable value, None if not set
+    :type value: str | None
+    :return: True if the variable is set to a value other than FALSE_VALUES and False otherwise
+    :rtype: bool
+    """
+    return value is not None and value.strip().lower() not in FALSE_VALUES
+
+
+def set_headless(
+    headless: bool | None,
+) -> None:
+    """
+    Function aimed at forcing the headless mode on or off for the rest of the process (i.e., the --headless/--no-headless option).
+
+    :param headless: whether the CLI runs headless, None to auto-detect it
+    :type headless: bool | None
+    :return: None
+    :rtype: None
+    """
+    global _headless
+    _headless = headless
+
+
+def is_headless() -> bool:
+    """
+    Function aimed at checking whether the CLI runs headless, in order: the command line option,
+    the TIDY_CLI_HEADLESS environment variable, CI environment variables, then whether the output is not a terminal.
+
+    :return: True if the CLI runs headless and False otherwise
+    :rtype: bool
+    """
+    if _headless is not None:
+        return _headless
+    if HEADLESS_ENV in os.environ:
+        return is_enabled(os.environ[HEADLESS_ENV])
+    if any(is_enabled(os.environ.get(name)) for name in CI_ENV_VARS):
+        return True
+    return not sys.stdout.isatty()
+
+
+def to_plain_text(
+    text: str,
+    markup: bool = True,
+) -> str:
+    """
+    Function aimed at converting a Rich string to plain text, removing its markup and emoji.
+
+    :param text: string to be printed (e.g., "✅ Saved to [bold]file[/bold]")
+    :type text: str
+    :param markup: whether the string contains Rich markup, defaults to True
+    :type markup: bool
+    :return: plain text (e.g., "Saved to file")
+    :rtype: str
+    """
+    if markup is True and "[" in text:
+        text = Text.from_markup(text).plain
+    return EMOJI_PATTERN.sub("", text)
+
+
+class ConsoleProxy:
+    """
+    Class aimed at standing for the Rich console of every module, resolved at each call so that the headless mode
+    can be set after modules are imported. In headless mode strings are written as plain text straight to the output stream,
+    while other renderables (e.g., tables) are rendered by a Rich console without colors.
+    """
+
+    def __init__(self) -> None:
+        # Consoles are created when first used, the headless one by headless mode
+        self.consoles: dict[bool, Console] = {}
+
+    def get_console(self) -> Console:
+        """
+        Method aimed at getting the Rich console of the current mode.
+
+        :return: Rich console, plain in headless mode
+        :rtype: Console
+        """
+        headless = is_headless()
+        if headless not in self.consoles:
+            self.consoles[headless] = Console(color_system=None, emoji=False, highlight=False, force_terminal=False) if headless is True else Console()
+        return self.consoles[headless]
+
+    def print(
+        self,
+        *objects: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Method aimed at printing objects as Console.print does, as plain text in headless mode.
+
+        :param *objects: objects to be printed (e.g., strings with Rich markup, tables)
+        :type *objects: Any
+        :param **kwargs: Console.print options (e.g., style, end)
+        :type **kwargs: Any
+        :return: None
+        :rtype: None
+        """
+        console = self.get_console()
+        if not is_headless() or not all(isinstance(item, str) for item in objects) or set(kwargs) - {"style", "end", "sep", "markup", "highlight"}:
+            console.print(*objects, **kwargs)
+            return
+        text = to_plain_text(kwargs.get("sep", " ").join(objects), markup=kwargs.get("markup") is not False)
+        console.file.write(text + kwargs.get("end", "\n"))
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        """
+        Method aimed at forwarding any other attribute (e.g., is_terminal, width, file) to the Rich console of the current mode.
+
+        :param name: attribute name
+        :type name: str
+        :return: attribute of the Rich console
+        :rtype: Any
+        """
+        if name == "consoles":  # not set yet (e.g., while copying the proxy)
+            raise AttributeError(name)
+        return getattr(self.get_console(), name)
+
+
+console = cast(Console, ConsoleProxy())  # shared console of every module, behaving as a Rich console
+
+
+def prompt_setting(
+    text: str,
+    key: str,
+    default: str,
+) -> Path:
+    """
+    Function aimed at prompting for a setting, unless it is given via its environment variable (e.g., TIDY_CLI_LINT_DEFAULT_PATH)
+    or the CLI runs headless, in which case the default is taken without prompting.
+
+    :param text: prompt text
+    :type text: str
+    :param key: setting name (e.g., lint_default_path)
+    :type key: str
+    :param default: value proposed by the prompt and taken in headless mode
+    :type default: str
+    :return: setting value
+    :rtype: Path
+    """
+    value = os.environ.get(f"{SETTING_ENV_PREFIX}{key.upper()}")
+    if value:
+        return Path(value)
+    if is_headless() is True:
+        return Path(default)
+    return typer.prompt(text, default=default, show_default=True, type=Path)
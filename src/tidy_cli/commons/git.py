@@ -0,0 +1,170 @@
+"""Module defining git helpers shared across CLI Commands Groups (e.g., changed files detection)."""
+
+# Import packages and modules
+import subprocess
+from pathlib import Path
+
+
+class GitError(Exception):
+    """Exception raised when a git command fails (e.g., not a git repository or unknown ref)."""
+
+
+def run_git(
+    args: list[str],
+) -> str:
+    """
+    Function aimed at running a git command and returning its standard output.
+
+    :param args: git arguments (e.g., ['diff', '--name-only'])
+    :type args: list[str]
+    :raises GitError: when git is not available or the command fails
+    :return: standard output of the git command
+    :rtype: str
+    """
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, text=True)
+    except OSError as e:
+        raise GitError(f"git is not available: {e}") from e
+    if result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout
+
+
+def get_merge_base(
+    ref: str,
+) -> str:
+    """
+    Function aimed at getting the common ancestor between a ref and HEAD, so that only changes made on the current branch are considered.
+
+    :param ref: base ref (e.g., origin/main)
+    :type ref: str
+    :return: commit hash of the merge base
+    :rtype: str
+    """
+    return run_git(["merge-base", ref, "HEAD"]).strip()
+
+
+def get_changed_files(
+    since: str | None = None,
+) -> list[Path]:
+    """
+    Function aimed at listing files changed against a base ref, including staged, unstaged and untracked files.
+    Deleted files are excluded and paths are relative to the current working directory.
+
+    :param since: base ref to compare with (its merge base with HEAD is used), defaults to HEAD (i.e., uncommitted changes only)
+    :type since: str | None
+    :return: sorted list of changed files
+    :rtype: list[Path]
+    """
+    base = "HEAD" if since is None else get_merge_base(since)
+    # Diff of the working tree against the base covers both committed (since base), staged and unstaged changes
+    changed = run_git(["diff", "--name-only", "--relative", "--diff-filter=d", base]).splitlines()
+    untracked = run_git(["ls-files", "--others", "--exclude-standard"]).splitlines()
+    return sorted({Path(name) for name in changed + untracked if name})
+
+
+def get_repo_root() -> Path:
+    """
+    Function aimed at getting the root folder of the git repository the current working directory belongs to.
+
+    :return: absolute path of the repository root
+    :rtype: Path
+    """
+    return Path(run_git(["rev-parse", "--show-toplevel"]).strip())
+
+
+def get_untracked_files() -> list[str]:
+    """
+    Function aimed at listing untracked (and not ignored) files of the whole repository, relative to its root.
+
+    :return: untracked files paths
+    :rtype: list[str]
+    """
+    return [name for name in run_git(["ls-files", "--others", "--exclude-standard", "--full-name", ":/"]).splitlines() if name]
+
+
+def parse_diff(
+    diff: str,
+    new_side: bool = False,
+) -> dict[Path, set[int] | None]:
+    """
+    Function aimed at parsing a zero context diff (i.e., git diff -U0) into the changed lines of each file.
+    File headers are read only between a 'diff --git' line and the first hunk of the file, so that content lines
+    (e.g., a removed line starting with '-- ') are never read as headers.
+
+    :param diff: output of git diff with a/ and b/ prefixes
+    :type diff: str
+    :param new_side: whether lines are numbered as in the current version (i.e., added lines) rather than the base one, defaults to False
+    :type new_side: bool
+    :return: changed lines of each file, None for files added or deleted as a whole
+    :rtype: dict[Path, set[int] | None]
+    """
+    changes: dict[Path, set[int] | None] = {}
+    in_header = False
+    old_path = None
+    path = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            in_header, old_path, path = True, None, None
+        elif in_header and line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[len("--- a/") :]
+        elif in_header and line.startswith("+++ "):
+            new_path = None if line == "+++ /dev/null" else line[len("+++ b/") :]
+            path = Path(old_path or new_path)  # type: ignore[arg-type]
+            # Files added or deleted since the base changed as a whole
+            changes[path] = None if old_path is None or new_path is None else set()
+        elif line.startswith("@@ "):
+            in_header = False
+            if path is None or changes[path] is None:
+                continue
+            start, _, count = line.split()[2 if new_side else 1][1:].partition(",")
+            first, length = int(start), int(count or "1")
+            if new_side:
+                changes[path].update(range(first, first + length))  # type: ignore[union-attr]
+            else:
+                # A pure insertion follows the first line, hence both lines around it are considered changed
+                changes[path].update(range(first, first + length) if length > 0 else (first, first + 1))  # type: ignore[union-attr]
+    return changes
+
+
+def get_changed_lines(
+    since: str | None = None,
+) -> dict[Path, set[int] | None]:
+    """
+    Function aimed at getting the lines changed against a base ref, numbered as in the base version of each file
+    (i.e., the version data recorded on the base ref refers to).
+    A pure insertion marks the lines around it, while added, deleted and untracked files are changed as a whole (i.e., None).
+    Paths are relative to the repository root, whatever the current working directory is.
+
+    :param since: base ref to compare with (its merge base with HEAD is used), defaults to HEAD (i.e., uncommitted changes only)
+    :type since: str | None
+    :return: changed lines of each changed file, None when the whole file changed
+    :rtype: dict[Path, set[int] | None]
+    """
+    base = "HEAD" if since is None else get_merge_base(since)
+    diff = run_git(["diff", "-U0", "--no-renames", "--no-color", "--no-ext-diff", "--src-prefix=a/", "--dst-prefix=b/", base])
+    changes = parse_diff(diff)
+    for name in get_untracked_files():
+        changes[Path(name)] = None
+    return changes
+
+
+def get_added_lines(
+    since: str | None = None,
+) -> dict[Path, set[int] | None]:
+    """
+    Function aimed at getting the lines added or modified against a base ref, numbered as in the current version of each file
+    (i.e., the lines to be covered by tests). Deleted files are excluded, while added and untracked files are changed as a whole (i.e., None).
+    Paths are relative to the repository root, whatever the current working directory is.
+
+    :param since: base ref to compare with (its merge base with HEAD is used), defaults to HEAD (i.e., uncommitted changes only)
+    :type since: str | None
+    :return: added or modified lines of each changed file, None when the whole file is new
+    :rtype: dict[Path, set[int] | None]
+    """
+    base = "HEAD" if since is None else get_merge_base(since)
+    diff = run_git(["diff", "-U0", "--no-renames", "--no-color", "--no-ext-diff", "--diff-filter=d", "--src-prefix=a/", "--dst-prefix=b/", base])
+    changes = parse_diff(diff, new_side=True)
+    for name in get_untracked_files():
+        changes[Path(name)] = None
+    return changes
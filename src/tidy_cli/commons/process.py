@@ -0,0 +1,91 @@
+"""Module defining subprocess helpers shared across CLI Commands Groups (e.g., streaming tools output)."""
+
+# Import packages and modules
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from typing import IO, Any
+
+from .profiling import (
+    is_profiling,
+    wait_process,
+)
+
+# Define literals
+SPILL_LIMIT = 1024 * 1024  # characters kept in memory before buffered output spills to a temporary file
+LineHandler = Callable[[str, str], None]  # (line without trailing newline, stream name among stdout and stderr)
+
+
+def spooled_buffer() -> IO[str]:
+    """
+    Function aimed at creating a text buffer kept in memory up to SPILL_LIMIT and spilled to a temporary file above it.
+
+    :return: spooled text buffer
+    :rtype: IO[str]
+    """
+    return tempfile.SpooledTemporaryFile(max_size=SPILL_LIMIT, mode="w+", encoding="utf-8")
+
+
+def stream_command(
+    command: list[str],
+    on_line: LineHandler,
+    label: str | None = None,
+) -> int:
+    """
+    Function aimed at running a terminal command while forwarding its stdout and stderr lines as soon as they are produced.
+    Both pipes are read incrementally, so that the output is never held in memory as a whole,
+    and the handler is never called concurrently.
+
+    :param command: terminal command to be executed
+    :type command: list[str]
+    :param on_line: function called on each output line with the name of the stream it comes from
+    :type on_line: LineHandler
+    :param label: label of the command when profiling (e.g., Mypy type checking), defaults to the command itself
+    :type label: str | None
+    :return: return code of the command
+    :rtype: int
+    """
+    started_at = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1, errors="replace")
+    lock = threading.Lock()
+
+    def _pump(pipe: IO[str], stream: str) -> None:
+        with pipe:
+            for line in pipe:
+                with lock:
+                    on_line(line.rstrip("\n"), stream)
+
+    # stderr is pumped in a background thread so that neither pipe can fill up and block the command
+    stderr_thread = threading.Thread(target=_pump, args=(process.stderr, "stderr"), daemon=True)
+    stderr_thread.start()
+    _pump(process.stdout, "stdout")  # type: ignore[arg-type]
+    stderr_thread.join()
+    return wait_process(process, label or " ".join(command), started_at)
+
+
+def run_profiled(
+    command: list[str],
+    label: str,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:  # type: ignore[type-arg]
+    """
+    Function aimed at running a terminal command like subprocess.run, recording its resource usage when profiling.
+    When profiling is disabled it is a plain subprocess.run call.
+
+    :param command: terminal command to be executed
+    :type command: list[str]
+    :param label: label of the command when profiling (e.g., Pytest)
+    :type label: str
+    :param **kwargs: extra subprocess.Popen keyword arguments (e.g., env)
+    :type **kwargs: Any
+    :return: completed process (output is not captured)
+    :rtype: subprocess.CompletedProcess
+    """
+    if is_profiling() is False:
+        return subprocess.run(command, **kwargs)
+
+    started_at = time.perf_counter()
+    process = subprocess.Popen(command, **kwargs)
+    return subprocess.CompletedProcess(command, wait_process(process, label, started_at))
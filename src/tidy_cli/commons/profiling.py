@@ -0,0 +1,214 @@
+"""Module defining the timing and resource profiling of the tools spawned by CLI Commands Groups."""
+
+# Import packages and modules
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+# Define literals
+_profiles: list["ToolProfile"] = []  # profiles recorded since profiling started
+_lock = threading.Lock()
+_enabled = threading.Event()
+_started_at = 0.0
+
+
+@dataclass
+class ToolProfile:
+    """
+    Class aimed at storing the resources used by a spawned tool (i.e., child process).
+
+    .. attribute :: label
+        :type: str
+
+        label of the tool (e.g., Mypy type checking)
+
+    .. attribute :: wall_time
+        :type: float
+
+        elapsed time in seconds
+
+    .. attribute :: cpu_time
+        :type: float | None
+
+        user plus system CPU time in seconds, None when not available on the platform
+
+    .. attribute :: peak_rss_mb
+        :type: float | None
+
+        peak resident set size in megabytes, None when not available on the platform
+
+    .. attribute :: returncode
+        :type: int
+
+        return code of the tool
+    """
+
+    label: str
+    wall_time: float
+    cpu_time: float | None
+    peak_rss_mb: float | None
+    returncode: int
+
+
+def start_profiling() -> None:
+    """
+    Function aimed at starting to record the profile of every spawned tool (previous profiles are discarded).
+
+    :return: None
+    :rtype: None
+    """
+    global _started_at
+    with _lock:
+        _profiles.clear()
+        _started_at = time.perf_counter()
+        _enabled.set()
+
+
+def is_profiling() -> bool:
+    """
+    Function aimed at checking whether spawned tools are being profiled.
+
+    :return: True if profiling is enabled and False otherwise
+    :rtype: bool
+    """
+    return _enabled.is_set()
+
+
+def get_profiles() -> list[ToolProfile]:
+    """
+    Function aimed at getting the profiles recorded since profiling started.
+
+    :return: recorded profiles in completion order
+    :rtype: list[ToolProfile]
+    """
+    with _lock:
+        return list(_profiles)
+
+
+def wait_process(
+    process: subprocess.Popen,  # type: ignore[type-arg]
+    label: str,
+    started_at: float,
+) -> int:
+    """
+    Function aimed at waiting for a child process and, when profiling, recording its resource usage.
+    On POSIX platforms the child is reaped via os.wait4 to get its own CPU time and peak RSS.
+
+    :param process: running child process
+    :type process: subprocess.Popen
+    :param label: label of the tool (e.g., Mypy type checking)
+    :type label: str
+    :param started_at: time.perf_counter value when the process was spawned
+    :type started_at: float
+    :return: return code of the process
+    :rtype: int
+    """
+    if is_profiling() is False or hasattr(os, "wait4") is False:
+        returncode = process.wait()
+        if is_profiling() is True:
+            _record(ToolProfile(label, time.perf_counter() - started_at, None, None, returncode))
+        return returncode
+
+    _, status, rusage = os.wait4(process.pid, 0)
+    wall_time = time.perf_counter() - started_at
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is expressed in bytes on macOS and in kilobytes elsewhere
+    peak_rss_mb = rusage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    _record(ToolProfile(label, wall_time, rusage.ru_utime + rusage.ru_stime, peak_rss_mb, process.returncode))
+    return process.returncode
+
+
+def record_call(
+    label: str,
+    started_at: float,
+    returncode: int,
+) -> None:
+    """
+    Function aimed at recording, when profiling, the wall time of a tool run in-process (i.e., without a child process to get resource usage from).
+
+    :param label: label of the tool (e.g., Pydoclint)
+    :type label: str
+    :param started_at: time.perf_counter value when the tool started
+    :type started_at: float
+    :param returncode: return code of the tool
+    :type returncode: int
+    :return: None
+    :rtype: None
+    """
+    if is_profiling() is True:
+        _record(ToolProfile(label, time.perf_counter() - started_at, None, None, returncode))
+
+
+def _record(
+    profile: ToolProfile,
+) -> None:
+    """
+    Function aimed at storing a tool profile (safe to be called from concurrent threads).
+
+    :param profile: tool profile
+    :type profile: ToolProfile
+    :return: None
+    :rtype: None
+    """
+    with _lock:
+        _profiles.append(profile)
+
+
+def finish_profiling(
+    console: Console,
+    command: str,
+    output_path: Path | None = None,
+) -> None:
+    """
+    Function aimed at stopping profiling, printing the summary table and optionally writing it as JSON.
+
+    :param console: Console where to print the summary table
+    :type console: Console
+    :param command: CLI command being profiled (e.g., lint run)
+    :type command: str
+    :param output_path: path of the JSON file where to write the profiles, defaults to None (i.e., no file)
+    :type output_path: Path | None
+    :return: None
+    :rtype: None
+    """
+    total_wall_time = time.perf_counter() - _started_at
+    _enabled.clear()
+    profiles = get_profiles()
+
+    table = Table(title=f"⏱️  {command} profile", title_justify="left")
+    table.add_column("Tool")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("Exit", justify="right")
+    for profile in profiles:
+        table.add_row(
+            profile.label,
+            f"{profile.wall_time:.2f}",
+            "-" if profile.cpu_time is None else f"{profile.cpu_time:.2f}",
+            "-" if profile.peak_rss_mb is None else f"{profile.peak_rss_mb:.1f}",
+            str(profile.returncode),
+        )
+    table.add_section()
+    table.add_row("[bold]Total[/bold]", f"{total_wall_time:.2f}", "", "", "")
+    console.print(table)
+
+    if output_path is not None:
+        report = {
+            "command": command,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "wall_time": total_wall_time,
+            "tools": [asdict(profile) for profile in profiles],
+        }
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2))
+        console.print(f"📝 Profile written to [bold]{output_path}[/bold]", style="white")
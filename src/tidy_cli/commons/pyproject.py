@@ -0,0 +1,111 @@
+"""Module defining the discovery and the cached parsing of pyproject.toml files shared across CLI application."""
+
+# Import packages and modules
+import hashlib
+import sys
+from pathlib import Path
+from typing import Any
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib  # type: ignore[import-not-found, unused-ignore]
+
+# Define literals
+PYPROJECT_FILE = "pyproject.toml"  # name of the project config file
+TOOL_SECTION = "tidy-cli"  # section of the project config file storing CLI settings (i.e., [tool.tidy-cli])
+ROOT_MARKERS = (".git", ".hg")  # folders marking the project root, where the discovery stops
+
+_cache: dict[str, tuple[str, dict[str, Any]]] = {}  # absolute file path -> (content hash, parsed content)
+
+
+def load_toml(
+    path: Path,
+) -> dict[str, Any]:
+    """
+    Function aimed at parsing a TOML file once per process and content: the file is read again on each call,
+    but parsed only when its content hash changes, so that every reader of the same file (e.g., settings and Pydoclint options) shares one parse.
+    If the file is missing or invalid an empty dictionary is returned.
+
+    :param path: path of the TOML file
+    :type path: Path
+    :return: parsed content (not to be modified, as shared across readers)
+    :rtype: dict[str, Any]
+    """
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return {}
+    key = str(path.resolve())
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+    try:
+        data = tomllib.loads(content.decode())
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError):
+        data = {}
+    _cache[key] = (digest, data)
+    return data
+
+
+def get_tool_section(
+    path: Path,
+) -> dict[str, Any] | None:
+    """
+    Function aimed at getting the CLI section (i.e., [tool.tidy-cli]) of a project config file.
+
+    :param path: path of the project config file
+    :type path: Path
+    :return: CLI section, None if the file has none
+    :rtype: dict[str, Any] | None
+    """
+    section = load_toml(path).get("tool", {}).get(TOOL_SECTION)
+    return section if isinstance(section, dict) else None
+
+
+def find_pyproject(
+    start: Path | None = None,
+) -> Path | None:
+    """
+    Function aimed at discovering the project config file with a CLI section, walking up from the given folder to the project root
+    (i.e., the first folder with a version control marker), so that nested packages without the section inherit the root one.
+
+    :param start: folder the discovery starts from, defaults to the current directory
+    :type start: Path | None
+    :return: path of the nearest pyproject.toml with a [tool.tidy-cli] section, None if there is none
+    :rtype: Path | None
+    """
+    folder = (Path.cwd() if start is None else start).resolve()
+    for candidate in (folder, *folder.parents):
+        path = candidate / PYPROJECT_FILE
+        if path.is_file() and get_tool_section(path) is not None:
+            return path
+        if any((candidate / marker).exists() for marker in ROOT_MARKERS):
+            return None
+    return None
+
+
+def flatten_section(
+    section: dict[str, Any],
+    prefix: str = "",
+) -> dict[str, Any]:
+    """
+    Function aimed at flattening the CLI section of a project config file into settings names, so that
+    both 'lint_default_path = "src"' and '[tool.tidy-cli.lint] default-path = "src"' set the lint_default_path setting.
+
+    :param section: CLI section (or one of its tables)
+    :type section: dict[str, Any]
+    :param prefix: settings name prefix of the table, defaults to an empty string (i.e., the section itself)
+    :type prefix: str
+    :return: settings by name
+    :rtype: dict[str, Any]
+    """
+    settings: dict[str, Any] = {}
+    for key, value in section.items():
+        name = f"{prefix}{key.replace('-', '_')}"
+        if isinstance(value, dict):
+            settings.update(flatten_section(value, f"{name}_"))
+        else:
+            settings[name] = value
+    return settings
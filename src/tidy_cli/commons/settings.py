@@ -2,35 +2,404 @@
 
 # Import packages and modules
 import json
+import os
+import stat
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import IO, Any
+
+from .pyproject import (
+    PYPROJECT_FILE,
+    find_pyproject,
+    flatten_section,
+    get_tool_section,
+)
 
 # Define litearls
 SETTINGS_FILE = Path("local/tidy_cli_settings.json")  # path and name of the file storing CLI configuration
+TRUE_VALUES = {"true", "1", "yes", "on"}  # values of boolean settings meaning enabled (case insensitive)
+LOCK_SUFFIX = ".lock"  # suffix of the file locked by settings writers, next to the settings file
+CORRUPT_SUFFIX = ".corrupt"  # suffix of the backup of a corrupt settings file, kept aside when settings are updated
+PATH_SETTINGS = ("lint_default_path", "lint_config_path", "pytest_default_path")  # settings holding paths relative to the current directory
 
 
-def load_settings() -> dict[str, str]:
+@dataclass(frozen=True)
+class Settings:
+    """
+    Class aimed at giving typed access to the CLI settings, each getter falling back to its default when a setting is missing or invalid.
+
+    .. attribute :: values
+        :type: dict[str, Any]
+
+        settings by name, the settings file ones overriding the pyproject.toml ones
+    """
+
+    values: dict[str, Any] = field(default_factory=dict)
+
+    def get(
+        self,
+        key: str,
+        default: str = "",
+    ) -> str:
+        """
+        Method aimed at getting a string setting.
+
+        :param key: setting name
+        :type key: str
+        :param default: value when the setting is missing, defaults to an empty string
+        :type default: str
+        :return: setting value
+        :rtype: str
+        """
+        value = self.values.get(key)
+        return default if value is None else str(value)
+
+    def get_bool(
+        self,
+        key: str,
+        default: bool = False,
+    ) -> bool:
+        """
+        Method aimed at getting a boolean setting (e.g., "true" or true).
+
+        :param key: setting name
+        :type key: str
+        :param default: value when the setting is missing, defaults to False
+        :type default: bool
+        :return: setting value
+        :rtype: bool
+        """
+        value = self.values.get(key)
+        return default if value is None else str(value).strip().lower() in TRUE_VALUES
+
+    def get_int(
+        self,
+        key: str,
+        default: int,
+    ) -> int:
+        """
+        Method aimed at getting an integer setting.
+
+        :param key: setting name
+        :type key: str
+        :param default: value when the setting is missing or not an integer
+        :type default: int
+        :return: setting value
+        :rtype: int
+        """
+        try:
+            return int(self.values.get(key, default))
+        except (TypeError, ValueError):
+            return default
+
+    def get_float(
+        self,
+        key: str,
+        default: float | None = None,
+    ) -> float | None:
+        """
+        Method aimed at getting a float setting.
+
+        :param key: setting name
+        :type key: str
+        :param default: value when the setting is missing or not a number, defaults to None
+        :type default: float | None
+        :return: setting value
+        :rtype: float | None
+        """
+        value = self.values.get(key)
+        try:
+            return default if value is None else float(value)
+        except (TypeError, ValueError):
+            return default
+
+    def get_list(
+        self,
+        key: str,
+    ) -> list[str]:
+        """
+        Method aimed at getting a comma separated (e.g., "a, b") or TOML array (e.g., ["a", "b"]) setting as a list.
+
+        :param key: setting name
+        :type key: str
+        :return: non empty items of the setting, in order (empty when the setting is missing)
+        :rtype: list[str]
+        """
+        value = self.values.get(key)
+        items = value if isinstance(value, list) else self.get(key).split(",")
+        return [str(item).strip() for item in items if str(item).strip()]
+
+
+_cache: dict[tuple[str, str | None, str], tuple[tuple[tuple[int, int] | None, ...], Settings]] = {}  # (settings file, pyproject, folder) -> (signatures, settings)
+_pyprojects: dict[str, tuple[tuple[tuple[int, int] | None, ...], Path | None]] = {}  # folder -> (candidate signatures, discovered config file)
+
+
+def get_file_signature(
+    path: Path,
+) -> tuple[int, int] | None:
+    """
+    Function aimed at getting the signature of a file, changing whenever the file is written.
+
+    :param path: file path
+    :type path: Path
+    :return: modification time in nanoseconds and size, None if the file does not exist
+    :rtype: tuple[int, int] | None
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def read_settings_file(
+    settings_file: Path,
+    recover: bool = False,
+) -> dict[str, Any]:
+    """
+    Function aimed at reading the settings stored in the settings file only.
+    If no settings file is found an empty dictionary is returned, while a corrupt one (i.e., not a JSON object) is reported
+    and, when recovering, moved aside with the CORRUPT_SUFFIX so that it is not silently overwritten by the next write.
+
+    :param settings_file: path of the settings file
+    :type settings_file: Path
+    :param recover: whether a corrupt settings file is moved aside (i.e., before writing new settings), defaults to False
+    :type recover: bool
+    :return: settings stored in the file, empty if the file is missing or corrupt
+    :rtype: dict[str, Any]
+    """
+    try:
+        with open(settings_file) as file:
+            loaded = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        loaded = None
+    if isinstance(loaded, dict):
+        return loaded
+
+    if recover is True:
+        backup = settings_file.with_name(settings_file.name + CORRUPT_SUFFIX)
+        os.replace(settings_file, backup)
+        print(f"⚠️  Settings file {settings_file} is corrupt, moved to {backup} and replaced by the new settings", file=sys.stderr)
+    else:
+        print(f"⚠️  Settings file {settings_file} is corrupt and ignored, default settings are used", file=sys.stderr)
+    return {}
+
+
+def lock_file(
+    file: IO[Any],
+) -> None:
+    """
+    Function aimed at taking the exclusive lock of an open file, waiting for other processes holding it.
+
+    :param file: file opened for writing
+    :type file: IO[Any]
+    :return: None
+    :rtype: None
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+
+def unlock_file(
+    file: IO[Any],
+) -> None:
     """
-    Function aimed at loading settings from local file.
-    If no setting file is found an empty dictionary is returned.
+    Function aimed at releasing the exclusive lock of an open file.
 
+    :param file: file opened for writing and locked
+    :type file: IO[Any]
     :return: None
+    :rtype: None
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+_lock = threading.RLock()  # serializes the threads of the process, the lock file serializing the processes
+_lock_depth = 0  # nesting level of lock_settings in the process (e.g., update_settings saving the settings)
+
+
+@contextmanager
+def lock_settings() -> Iterator[None]:
+    """
+    Function aimed at serializing settings writes across threads and processes (e.g., parallel CI jobs sharing a workspace),
+    via the exclusive lock of a file next to the settings file. It is reentrant, the lock being taken by the outermost call only.
+
+    :yield: None, while holding the lock
+    :ytype: None
+    """
+    global _lock_depth
+    with _lock:
+        file = None
+        if _lock_depth == 0:
+            SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            file = open(SETTINGS_FILE.with_name(SETTINGS_FILE.name + LOCK_SUFFIX), "a")
+            lock_file(file)
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+            if file is not None:
+                unlock_file(file)
+                file.close()
+
+
+def get_candidate_signatures(
+    folder: Path,
+    pyproject: Path | None,
+) -> tuple[tuple[int, int] | None, ...]:
+    """
+    Function aimed at getting the signatures of the pyproject.toml files the discovery from a folder depends on,
+    namely the ones from the folder up to the discovered one (or up to the file system root when none is discovered).
+
+    :param folder: folder the discovery starts from
+    :type folder: Path
+    :param pyproject: discovered project config file, None if there is none
+    :type pyproject: Path | None
+    :return: signature of each candidate file, None for missing ones
+    :rtype: tuple[tuple[int, int] | None, ...]
+    """
+    folders = (folder, *folder.parents)
+    if pyproject is not None and pyproject.parent in folders:
+        folders = folders[: folders.index(pyproject.parent) + 1]
+    return tuple(get_file_signature(candidate / PYPROJECT_FILE) for candidate in folders)
+
+
+def get_pyproject() -> Path | None:
+    """
+    Function aimed at getting the project config file with a CLI section (i.e., [tool.tidy-cli]) of the current directory.
+    The discovery is cached per process and folder, and run again only when a candidate file changes (i.e., is added, removed or written),
+    so that long-running modes (e.g., watch mode, warm Pytest server) pick up a newly added CLI section at a stat call per candidate.
+
+    :return: path of the nearest pyproject.toml with a CLI section, None if there is none
+    :rtype: Path | None
+    """
+    folder = Path(os.getcwd())
+    cached = _pyprojects.get(str(folder))
+    if cached is not None and cached[0] == get_candidate_signatures(folder, cached[1]):
+        return cached[1]
+
+    pyproject = find_pyproject(folder)
+    _pyprojects[str(folder)] = (get_candidate_signatures(folder, pyproject), pyproject)
+    return pyproject
+
+
+def resolve_path_settings(
+    values: dict[str, Any],
+    folder: Path,
+) -> dict[str, Any]:
+    """
+    Function aimed at resolving the relative path settings of a project config file against its folder rather than the current directory,
+    so that running from a nested folder (e.g., a subpackage) finds the same paths as running from the project root.
+    Paths are made relative to the current directory again (absolute when not possible, e.g., on another drive).
+
+    :param values: settings by name, as read from the project config file
+    :type values: dict[str, Any]
+    :param folder: folder of the project config file
+    :type folder: Path
+    :return: settings by name with path settings (see PATH_SETTINGS) resolved
+    :rtype: dict[str, Any]
+    """
+    resolved = dict(values)
+    for name in PATH_SETTINGS:
+        value = values.get(name)
+        if isinstance(value, str) and value and not os.path.isabs(value):
+            path = os.path.join(folder, value)
+            try:
+                resolved[name] = os.path.relpath(path)
+            except ValueError:
+                resolved[name] = os.path.normpath(path)
+    return resolved
+
+
+def get_settings(
+    settings_file: Path | None = None,
+) -> Settings:
+    """
+    Function aimed at getting the CLI settings, layered as defaults (i.e., of each getter), then the [tool.tidy-cli] section
+    of the nearest pyproject.toml, then the settings file (command line options overriding them all at their call site).
+    Settings are loaded once per process and read again only when either file changes (i.e., its modification time or size),
+    so that repeated and long-running accesses (e.g., watch mode) cost a stat call per file.
+
+    :param settings_file: path of the settings file, defaults to SETTINGS_FILE (relative to the current directory)
+    :type settings_file: Path | None
+    :return: settings
+    :rtype: Settings
+    """
+    path = Path(os.path.abspath(SETTINGS_FILE if settings_file is None else settings_file))
+    pyproject = get_pyproject()
+    key = (str(path), None if pyproject is None else str(pyproject), os.getcwd())  # path settings depend on the current directory
+    signatures = (get_file_signature(path), None if pyproject is None else get_file_signature(pyproject))
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == signatures:
+        return cached[1]
+
+    values = {} if pyproject is None else resolve_path_settings(flatten_section(get_tool_section(pyproject) or {}), pyproject.parent)
+    if signatures[0] is not None:
+        values.update(read_settings_file(path))
+    settings = Settings(values)
+    _cache[key] = (signatures, settings)
+    return settings
+
+
+def load_settings() -> dict[str, str]:
+    """
+    Function aimed at loading settings from local file (i.e., without the pyproject.toml ones, to be updated and saved back).
+    If no setting file is found an empty dictionary is returned, and a corrupt one is moved aside.
+
+    :return: settings
     :rtype: dict[str, str]
     """
-    if SETTINGS_FILE.exists() is False:
-        return {}
+    return read_settings_file(SETTINGS_FILE, recover=True)
 
+
+def get_file_mode(
+    path: Path,
+) -> int:
+    """
+    Function aimed at getting the permissions a file is to be written with: the current ones if it exists,
+    the ones open() gives new files otherwise (i.e., 0666 less the process umask).
+
+    :param path: path of the file
+    :type path: Path
+    :return: permission bits (e.g., 0o644)
+    :rtype: int
+    """
     try:
-        with open(SETTINGS_FILE) as file:
-            return json.load(file)
-    except Exception:
-        return {}
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        umask = os.umask(0)  # the umask can only be read by setting it, hence it is restored right away
+        os.umask(umask)
+        return 0o666 & ~umask
 
 
 def save_settings(
     settings: dict[str, str],
 ) -> None:
     """
-    Function aimed at saving settings to local file.
+    Function aimed at saving settings to local file atomically: settings are written to a temporary file
+    in the same folder which then replaces the settings file, so that concurrent readers see either the old or the new settings.
+    The settings file keeps its permissions (or gets the umask ones when new), rather than the private ones of temporary files.
 
     :param settings: settings file represented via a dictionary data structure
     :type settings: dict[str, str]
@@ -38,22 +407,37 @@ def save_settings(
     :rtype: None
     """
     # Create path if does not exist yet
-    SETTINGS_FILE.parent.mkdir(exist_ok=True)
-    with open(SETTINGS_FILE, "w") as file:
-        json.dump(settings, file, indent=2)
+    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with lock_settings():
+        with tempfile.NamedTemporaryFile("w", dir=SETTINGS_FILE.parent, prefix=f".{SETTINGS_FILE.name}.", suffix=".tmp", delete=False) as file:
+            try:
+                json.dump(settings, file, indent=2)
+                file.flush()
+                os.fsync(file.fileno())
+                os.chmod(file.name, get_file_mode(SETTINGS_FILE))
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+        os.replace(file.name, SETTINGS_FILE)
+    # Forget the cached settings, as a write within the file system timestamp granularity may keep the same signature
+    for key in [key for key in _cache if key[0] == os.path.abspath(SETTINGS_FILE)]:
+        del _cache[key]
 
 
 def update_settings(
     settings: dict[str, str],
 ) -> None:
     """
-    Function aimed at updating settings by merging with existing settings (i.e., upserting them).
+    Function aimed at updating settings by merging with existing settings (i.e., upserting them),
+    holding the settings lock so that concurrent updates do not lose each other's settings.
 
     :param settings: new settings to be upserted
     :type settings: dict[str, str]
     :return: None
     :rtype: None
     """
-    existing_settings = load_settings()
-    existing_settings.update(settings)
-    save_settings(existing_settings)
+    with lock_settings():
+        existing_settings = load_settings()
+        existing_settings.update(settings)
+        save_settings(existing_settings)
@@ -6,11 +6,13 @@ import time
 from importlib.metadata import version
 
 from rich.align import Align
-from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-console = Console()
+from .commons.console import (
+    console,
+    is_headless,
+)
 
 
 # Define helper functions
@@ -29,7 +31,7 @@ def get_version() -> str:
 
 def show_ascii_art() -> None:
     """
-    Utility function aimed at printing nicely formatted 90s vibe ASCII art about CLI.
+    Utility function aimed at printing nicely formatted 90s vibe ASCII art about CLI (animated unless the CLI runs headless).
 
     :return: None
     :rtype: None
@@ -44,7 +46,8 @@ def show_ascii_art() -> None:
    ██║   ██║██████╔╝   ██║      ╚██████╗███████╗██║
    ╚═╝   ╚═╝╚═════╝    ╚═╝       ╚═════╝╚══════╝╚═╝
 """
-    # Animate ASCII art line by line
+    # Animate ASCII art line by line (no delays in headless mode)
+    delay = 0.0 if is_headless() is True else 1.0
     console.print("\n\n")
     lines = tidy_art.split("\n")
     colors = ["bold magenta", "bold cyan"]
@@ -53,15 +56,15 @@ def show_ascii_art() -> None:
         if line.strip():  # Skip empty lines
             color = colors[i % len(colors)]
             console.print(Align.center(Text(line, style=color)))
-            time.sleep(0.12)
+            time.sleep(0.12 * delay)
 
-    time.sleep(0.2)
+    time.sleep(0.2 * delay)
 
     # Bottom decoration
     console.print()
     decoration = "▀▄▀▄▀▄ ✨ CLEAN CODE COMMAND LINE INTERFACE ✨ ▄▀▄▀▄▀"
     console.print(Align.center(Text(decoration, style="bright_white")))  # dim
-    time.sleep(0.2)
+    time.sleep(0.2 * delay)
 
     # Retro panel with system info style
     info_panel = Panel(
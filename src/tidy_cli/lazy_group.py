@@ -0,0 +1,109 @@
+"""
+Module aimed at defining the lazy loading of the Commands Groups of the main CLI program.
+
+Each Commands Group (and its dependencies, e.g., Pytest and Coverage for the Pytest one) is imported only when it is invoked,
+so that plain commands, the main help and shell completion of group names do not pay for every group at startup.
+"""
+
+# Import packages and modules
+import importlib
+from dataclasses import dataclass
+from typing import Any
+
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazyCommandGroup:
+    """
+    Class aimed at describing a Commands Group to be imported when invoked.
+
+    .. attribute :: import_path
+        :type: str
+
+        module and Typer app of the group as 'module:attribute' (e.g., tidy_cli.lint_cli.cli:lint_app)
+
+    .. attribute :: help
+        :type: str
+
+        help of the group listed in the main help (before the group is imported)
+
+    .. attribute :: rich_help_panel
+        :type: str | None
+
+        panel of the main help the group is listed in
+    """
+
+    import_path: str
+    help: str
+    rich_help_panel: str | None = None
+
+
+def load_command_group(
+    name: str,
+    group: LazyCommandGroup,
+) -> TyperGroup:
+    """
+    Function aimed at importing a Commands Group and building its Click group out of its Typer app.
+
+    :param name: name the group is invoked with (e.g., lint)
+    :type name: str
+    :param group: Commands Group to be imported
+    :type group: LazyCommandGroup
+    :return: Click group of the Commands Group
+    :rtype: TyperGroup
+    """
+    module_name, _, attribute = group.import_path.partition(":")
+    command = typer.main.get_group(getattr(importlib.import_module(module_name), attribute))
+    command.name = name
+    command.rich_help_panel = group.rich_help_panel
+    return command
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Class aimed at listing the Commands Groups of lazy_groups as lightweight placeholders (i.e., name, help and panel only),
+    swapped for the actual groups only when they are resolved to be invoked (shell completion of their commands included).
+
+    :param **attrs: Typer group settings (e.g., name, commands, help)
+    :type **attrs: Any
+
+    .. attribute :: lazy_groups
+        :type: dict[str, LazyCommandGroup]
+
+        Commands Groups by the name they are invoked with, to be set by subclasses
+    """
+
+    lazy_groups: dict[str, LazyCommandGroup] = {}
+
+    def __init__(
+        self,
+        **attrs: Any,
+    ) -> None:
+        # Placeholders are listed after the plain commands, in the order of lazy_groups
+        super().__init__(**attrs)
+        for name, group in self.lazy_groups.items():
+            self.commands[name] = TyperGroup(name=name, help=group.help, rich_help_panel=group.rich_help_panel)
+        self.loaded: set[str] = set()
+
+    def resolve_command(
+        self,
+        ctx: Any,
+        args: list[str],
+    ) -> tuple[str | None, Any, list[str]]:
+        """
+        Method aimed at resolving the invoked command, importing it first if it is a lazy Commands Group.
+
+        :param ctx: Click context of the main CLI program
+        :type ctx: Any
+        :param args: remaining command line arguments, the command name first
+        :type args: list[str]
+        :return: command name, command and its arguments
+        :rtype: tuple[str | None, Any, list[str]]
+        """
+        name, command, remaining = super().resolve_command(ctx, args)
+        if name in self.lazy_groups and name not in self.loaded:
+            command = self.commands[name] = load_command_group(name, self.lazy_groups[name])
+            self.loaded.add(name)
+        return name, command, remaining
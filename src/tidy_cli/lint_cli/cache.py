@@ -0,0 +1,291 @@
+"""Module defining the per-file result cache for the CLI Linting Commands Group."""
+
+# Import packages and modules
+import hashlib
+import json
+import os
+from functools import cache
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+from tidy_cli.commons.settings import SETTINGS_FILE
+
+from .scheduler import LintTool
+
+# Define literals
+CACHE_FILE = SETTINGS_FILE.parent / "tidy_cli_lint_cache.json"  # stored next to the CLI settings file
+CACHE_VERSION = 1  # bump to invalidate every stored result when the key layout changes
+TOOL_PACKAGES = {  # distribution providing each file-local tool (to key results by tool version)
+    "ruff-check": "ruff",
+    "ruff-format": "ruff",
+    "pydoclint": "pydoclint",
+}
+PYTHON_SUFFIXES = (".py", ".pyi")
+SKIPPED_DIRS = {"__pycache__", "node_modules", "site-packages", "venv"}  # on top of hidden folders (e.g., .venv, .git)
+
+
+def hash_bytes(
+    content: bytes,
+) -> str:
+    """
+    Function aimed at hashing raw content (i.e., file content) in a stable way.
+
+    :param content: content to be hashed
+    :type content: bytes
+    :return: hexadecimal digest of the content
+    :rtype: str
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+@cache
+def get_tool_version(
+    tool: str,
+) -> str:
+    """
+    Function aimed at retrieving the installed version of a Linting tool from package metadata.
+
+    :param tool: name of the tool as used by the scheduler (e.g., ruff-check)
+    :type tool: str
+    :return: installed version of the tool or 'unknown'
+    :rtype: str
+    """
+    try:
+        return version(TOOL_PACKAGES.get(tool, tool))
+    except Exception:
+        return "unknown"
+
+
+def get_config_hash(
+    config_path: str,
+) -> str:
+    """
+    Function aimed at hashing the Linting config file, so that any config change invalidates cached results.
+
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: hexadecimal digest of the config file or 'missing' if it cannot be read
+    :rtype: str
+    """
+    try:
+        return hash_bytes(Path(config_path).read_bytes())
+    except OSError:
+        return "missing"
+
+
+def discover_python_files(
+    path: Path,
+) -> list[Path]:
+    """
+    Function aimed at listing Python files under a path, skipping hidden, cache and virtual environment folders.
+
+    :param path: file or directory to be linted
+    :type path: Path
+    :return: sorted list of Python files
+    :rtype: list[Path]
+    """
+    if path.is_file():
+        return [path]
+
+    files: list[Path] = []
+    for root, dirs, names in os.walk(path):
+        dirs[:] = [name for name in dirs if not name.startswith(".") and name not in SKIPPED_DIRS]
+        files.extend(Path(root) / name for name in names if name.endswith(PYTHON_SUFFIXES))
+    return sorted(files)
+
+
+class LintCache:
+    """
+    Class aimed at storing clean Linting results keyed by file content, tool, tool version and config file.
+    File content hashes are memoized by file modification time and size to avoid reading unchanged files.
+
+    :param config_path: path to the Linting config file used by the tools
+    :type config_path: str
+    :param cache_file: path of the JSON file persisting the cache, defaults to CACHE_FILE
+    :type cache_file: Path
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        cache_file: Path = CACHE_FILE,
+    ) -> None:
+        # Load the cache from disk (an unreadable cache behaves as an empty one)
+        self.cache_file = cache_file
+        self.config_hash = get_config_hash(config_path)
+        self.file_hashes: dict[str, list[Any]] = {}  # path -> [mtime_ns, size, content hash]
+        self.clean: dict[str, dict[str, str]] = {}  # path -> tool -> key of the last clean result
+        self.snapshot: dict[str, str] = {}  # content hash of each file when first looked at in this run
+        self.pending_files: dict[str, list[Path]] = {}  # files each file-local tool runs on in this run
+        self.dirty = False
+
+        try:
+            data = json.loads(cache_file.read_text())
+            if data.get("version") == CACHE_VERSION:
+                self.file_hashes = data.get("files", {})
+                self.clean = data.get("clean", {})
+        except Exception:
+            pass
+
+    def hash_file(
+        self,
+        path: Path,
+    ) -> str | None:
+        """
+        Method aimed at hashing a file content, reusing the stored hash when modification time and size are unchanged.
+
+        :param path: file to be hashed
+        :type path: Path
+        :return: content hash of the file or None if it cannot be read
+        :rtype: str | None
+        """
+        try:
+            stat = path.stat()
+            stored = self.file_hashes.get(str(path))
+            if stored is not None and stored[0] == stat.st_mtime_ns and stored[1] == stat.st_size:
+                return str(stored[2])
+            content_hash = hash_bytes(path.read_bytes())
+        except Exception:
+            return None
+        self.file_hashes[str(path)] = [stat.st_mtime_ns, stat.st_size, content_hash]
+        self.dirty = True
+        return content_hash
+
+    def _key(
+        self,
+        tool: str,
+        content_hash: str,
+    ) -> str:
+        """
+        Method aimed at building the cache key of a tool result on a given file content.
+        Results are stored per path, as tools configuration may be path dependent (e.g., per-file ignores).
+
+        :param tool: name of the tool as used by the scheduler (e.g., ruff-check)
+        :type tool: str
+        :param content_hash: content hash of the linted file
+        :type content_hash: str
+        :return: cache key
+        :rtype: str
+        """
+        return f"{get_tool_version(tool)}|{self.config_hash}|{content_hash}"
+
+    def pending(
+        self,
+        tool: str,
+        files: list[Path],
+    ) -> list[Path]:
+        """
+        Method aimed at filtering the files that have no clean cached result for a tool.
+
+        :param tool: name of the tool as used by the scheduler (e.g., ruff-check)
+        :type tool: str
+        :param files: candidate files to be linted
+        :type files: list[Path]
+        :return: files that need to be linted
+        :rtype: list[Path]
+        """
+        pending = []
+        for path in files:
+            if str(path) not in self.snapshot:
+                self.snapshot[str(path)] = self.hash_file(path) or ""
+            content_hash = self.snapshot[str(path)]
+            if not content_hash or self.clean.get(str(path), {}).get(tool) != self._key(tool, content_hash):
+                pending.append(path)
+        return pending
+
+    def mark_clean(
+        self,
+        tool: str,
+        files: list[Path],
+    ) -> None:
+        """
+        Method aimed at recording a clean tool result for the given files.
+        Files whose content changed during the run (e.g., rewritten by ruff format) are not recorded,
+        as the tool result may refer to a different content, and will be linted again next time.
+
+        :param tool: name of the tool as used by the scheduler (e.g., ruff-check)
+        :type tool: str
+        :param files: files the tool ran on successfully
+        :type files: list[Path]
+        :return: None
+        :rtype: None
+        """
+        for path in files:
+            content_hash = self.hash_file(path)
+            if content_hash is not None and content_hash == self.snapshot.get(str(path)):
+                self.clean.setdefault(str(path), {})[tool] = self._key(tool, content_hash)
+                self.dirty = True
+
+    def apply(
+        self,
+        tools: list[LintTool],
+        files: list[Path],
+    ) -> tuple[list[LintTool], list[LintTool]]:
+        """
+        Method aimed at restricting file-local tools to the files without a clean cached result.
+        The tools targets are rewritten in place: they are kept when no file is cached,
+        replaced by the explicit list of pending files otherwise.
+
+        :param tools: selected Linting tools
+        :type tools: list[LintTool]
+        :param files: Python files covered by the tools targets
+        :type files: list[Path]
+        :return: tools to be run and tools skipped as every file is already clean
+        :rtype: tuple[list[LintTool], list[LintTool]]
+        """
+        to_run: list[LintTool] = []
+        cached: list[LintTool] = []
+        for tool in tools:
+            if tool.name not in TOOL_PACKAGES:
+                to_run.append(tool)
+                continue
+            pending = self.pending(tool.name, files)
+            self.pending_files[tool.name] = pending
+            if not pending:
+                cached.append(tool)
+                continue
+            if len(pending) < len(files):
+                tool.targets = [str(path) for path in pending]
+                if tool.command[0] == "ruff" and "--force-exclude" not in tool.command:
+                    tool.command.append("--force-exclude")  # keep ruff exclusions with explicit files
+            to_run.append(tool)
+        return to_run, cached
+
+    def record(
+        self,
+        tools: list[LintTool],
+        results: list[bool],
+    ) -> None:
+        """
+        Method aimed at recording the clean results of the file-local tools that succeeded and persisting the cache.
+
+        :param tools: Linting tools that have been run
+        :type tools: list[LintTool]
+        :param results: outcome of each tool, in the same order
+        :type results: list[bool]
+        :return: None
+        :rtype: None
+        """
+        for tool, result in zip(tools, results, strict=True):
+            if result is True and tool.name in self.pending_files:
+                self.mark_clean(tool.name, self.pending_files[tool.name])
+        self.save()
+
+    def save(self) -> None:
+        """
+        Method aimed at persisting the cache to disk (when changed), dropping files that no longer exist.
+        Failures are ignored as the cache is an optimization only.
+
+        :return: None
+        :rtype: None
+        """
+        if self.dirty is False:
+            return
+        self.file_hashes = {path: stored for path, stored in self.file_hashes.items() if Path(path).exists()}
+        self.clean = {path: results for path, results in self.clean.items() if path in self.file_hashes}
+        try:
+            self.cache_file.parent.mkdir(exist_ok=True)
+            self.cache_file.write_text(json.dumps({"version": CACHE_VERSION, "files": self.file_hashes, "clean": self.clean}))
+        except OSError:
+            pass
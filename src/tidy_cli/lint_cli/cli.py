@@ -1,17 +1,49 @@
 """Module aimed at defining the CLI Linter Commands Group."""
 
 # Import packages and modules
+import os
+from functools import partial
 from pathlib import Path
 from typing import Annotated
 
 import typer
-from rich.console import Console
 
+from tidy_cli.commons.console import console
+from tidy_cli.commons.git import GitError
+from tidy_cli.commons.profiling import (
+    finish_profiling,
+    start_profiling,
+)
+
+from .cache import (
+    LintCache,
+    discover_python_files,
+)
+from .daemon import (
+    get_daemon_command,
+    get_lint_mypy_daemon,
+)
+from .docstrings import (
+    check_paths,
+    get_plugin,
+)
 from .helpers import (
+    get_changed_lint_files,
     get_lint_config_path,
     get_lint_default_path,
+    get_package_roots,
     init_settings,
     run_command,
+    run_sharded_command,
+)
+from .scheduler import (
+    LintTool,
+    run_tools,
+)
+from .sharding import shard_tools
+from .watch import (
+    WatchBoard,
+    watch_changes,
 )
 
 # Define Typer Linter program (i.e., commands group)
@@ -22,7 +54,15 @@ lint_app = typer.Typer(
     add_completion=True,
     rich_markup_mode="rich",
 )
-console = Console()
+
+# Define Typer Mypy daemon program (i.e., commands sub-group of Linter one)
+daemon_app = typer.Typer(
+    name="daemon",
+    help="🔥 Manage the [bold]persistent Mypy daemon[/bold] (dmypy) used by [code]lint run --mypy-daemon[/code].",
+    add_completion=True,
+    rich_markup_mode="rich",
+)
+lint_app.add_typer(daemon_app)
 
 
 @lint_app.command(
@@ -43,7 +83,7 @@ def run(
             help="🎞️  [bold]Path[/bold] to lint (relative to [italic]default[/italic] folder), "
             "otherwise [bold]entire default[/bold] folder is linted (i.e., [italic]'src'[/italic] or what defined at initialisation).",
             callback=lambda path: path if path is not None else "",
-            show_default=str(get_lint_default_path()),
+            show_default="'lint_default_path' setting or src",
         ),
     ] = None,
     interactive: Annotated[
@@ -114,6 +154,80 @@ def run(
             help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic])",
         ),
     ] = None,
+    sequential: Annotated[
+        bool,
+        typer.Option(
+            "--sequential",
+            help="🐢 Run linters [bold]one after the other[/bold] instead of running read-only ones [italic]concurrently[/italic].",
+            show_default="False",
+        ),
+    ] = False,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help="📡 Stream every linter output [bold]live[/bold] with per-tool prefixes instead of printing outputs in [italic]fixed order[/italic].",
+            show_default="False",
+        ),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="♻️  [bold]Ignore[/bold] cached results and lint [bold]every[/bold] file.",
+            show_default="False",
+        ),
+    ] = False,
+    changed: Annotated[
+        bool,
+        typer.Option(
+            "--changed",
+            "-c",
+            help="🔀 Lint only Python files [bold]changed[/bold] against HEAD (staged, unstaged and untracked).",
+            show_default="False",
+        ),
+    ] = False,
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="🔀 Lint only Python files [bold]changed[/bold] since the given [italic]git ref[/italic] (e.g., origin/main), implies --changed.",
+        ),
+    ] = None,
+    mypy_daemon: Annotated[
+        bool,
+        typer.Option(
+            "--mypy-daemon",
+            "-md",
+            help="🔥 Run Mypy via a [bold]persistent daemon[/bold] (dmypy) kept warm between runs (also enabled by [italic]lint_mypy_daemon[/italic] setting).",
+            show_default="False",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="⏱️  Print a [bold]timing and resource[/bold] report (wall time, CPU time, peak RSS) of every linter.",
+            show_default="False",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-output",
+            help="📝 Write the [bold]profile[/bold] report as [italic]JSON[/italic] to the given path, implies --profile.",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="🧩 Run Pydoclint and Mypy across up to [bold]N[/bold] processes on large trees (1 to disable sharding).",
+            show_default="CPU count",
+            min=1,
+        ),
+    ] = None,
 ) -> None:
     """
     Entry point function to run Linters on the entire default folder, 'src' or wath's defined in the settings, or a specific path.
@@ -137,6 +251,24 @@ def run(
     :type default_dir: Path | None
     :param pyproject_path: pyproject.toml path relative to current working directory that overwrites the one set at init time
     :type pyproject_path: str | None
+    :param sequential: whether to run linters one after the other instead of concurrently, defaults to False
+    :type sequential: bool
+    :param stream: whether to stream concurrent linters output live with per-tool prefixes, defaults to False
+    :type stream: bool
+    :param no_cache: whether to ignore cached clean results of file-local linters, defaults to False
+    :type no_cache: bool
+    :param changed: whether to lint only files changed against HEAD, defaults to False
+    :type changed: bool
+    :param since: git ref to compute changed files against (i.e., merge base with HEAD), implies changed
+    :type since: str | None
+    :param mypy_daemon: whether to run Mypy via the persistent daemon, defaults to False (or lint_mypy_daemon setting)
+    :type mypy_daemon: bool
+    :param profile: whether to print the timing and resource report of every linter, defaults to False
+    :type profile: bool
+    :param profile_output: path of the JSON file where to write the profile report, implies profile
+    :type profile_output: Path | None
+    :param jobs: maximum number of processes Pydoclint and Mypy run across, defaults to the CPU count
+    :type jobs: int | None
     :return: None
     :rtype: None
     """
@@ -159,23 +291,71 @@ def run(
         skip_pydoclint = not typer.confirm("Do you want to run pydoclint?")
         skip_mypy = not typer.confirm("Do you want to run mypy?")
 
-    results = []
     config_path = get_lint_config_path() if pyproject_path is None else pyproject_path
+    jobs = jobs or os.cpu_count() or 1
 
+    # Git-scoped mode: file-local tools get the changed files only, mypy the packages containing them
+    if changed is True or since is not None:
+        try:
+            files = get_changed_lint_files(lint_path, since)
+        except GitError as e:
+            console.print(f"❌ Could not get changed files: [bold]{e}[/bold]", style="red", markup=False)
+            raise typer.Exit(1)  # noqa: B904
+        if not files:
+            console.print("✨ No changed Python files to lint", style="green")
+            return
+        console.print(f"🔀 Linting [bold]{len(files)}[/bold] changed file(s) since [bold]{since or 'HEAD'}[/bold]", style="white")
+        targets = [str(file) for file in files]
+        mypy_targets = [str(root) for root in get_package_roots(files, default_dir)]  # type: ignore
+    else:
+        files = discover_python_files(lint_path) if no_cache is False else []
+        targets = mypy_targets = [str(lint_path)]
+    ruff_options = ["--force-exclude"] if targets != [str(lint_path)] else []
+
+    tools = []
     if skip_ruff is False:
-        cmd = ["ruff", "check", str(lint_path), "--config", config_path]
+        cmd = ["ruff", "check", "--config", config_path, *ruff_options]
         if fix is True:
             cmd.append("--fix")
-        results.append(run_command(cmd, "Ruff linting"))
+        tools.append(LintTool("ruff-check", "Ruff linting", cmd, targets, mutates_files=fix))
 
     if skip_format is False:
-        results.append(run_command(["ruff", "format", str(lint_path), "--config", config_path], "Ruff formatting"))
+        tools.append(LintTool("ruff-format", "Ruff formatting", ["ruff", "format", "--config", config_path, *ruff_options], targets, mutates_files=True))
 
     if skip_pydoclint is False:
-        results.append(run_command(["flake8", str(lint_path), "--toml-config", config_path, "--select", "DOC"], "Pydoclint"))
+        if get_plugin() is not None:
+            # Pydoclint runs in-process through its flake8 plugin, the flake8 subprocess being needed only when the installed flake8 or Pydoclint do not allow it
+            engine = partial(check_paths, config_path=config_path, jobs=jobs)
+            tools.append(LintTool("pydoclint", "Pydoclint", ["pydoclint", "--config", config_path], targets, engine=engine))
+        else:
+            tools.append(LintTool("pydoclint", "Pydoclint", ["flake8", "--toml-config", config_path, "--select", "DOC"], targets))
 
     if skip_mypy is False:
-        results.append(run_command(["mypy", str(lint_path), "--pretty", "--config-file", config_path], "Mypy type checking"))
+        if mypy_daemon is True or get_lint_mypy_daemon() is True:
+            tools.append(LintTool("mypy", "Mypy type checking (daemon)", get_daemon_command("run", config_path), mypy_targets))
+        else:
+            tools.append(LintTool("mypy", "Mypy type checking", ["mypy", "--pretty", "--config-file", config_path], mypy_targets))
+
+    # Skip file-local tools on files already clean for the same content, tool version and config
+    cache = None if no_cache is True else LintCache(config_path)
+    cached_tools: list[LintTool] = []
+    if cache is not None:
+        tools, cached_tools = cache.apply(tools, files)
+    for tool in cached_tools:
+        console.print(f"⚡ {tool.description} [bold]skipped[/bold]: no changes since last clean run", style="white")
+
+    # Large trees are split into balanced file chunks (Pydoclint) and independent package groups (Mypy)
+    shard_tools(tools, jobs, default_dir)  # type: ignore
+
+    # Read-only tools run concurrently with the (chained) file-mutating ruff steps
+    if profile is True or profile_output is not None:
+        start_profiling()
+    results = run_tools(tools, runner=run_command, sequential=sequential, interleave=stream, sharded_runner=run_sharded_command)
+    if cache is not None:
+        cache.record(tools, results)
+    results += [True] * len(cached_tools)
+    if profile is True or profile_output is not None:
+        finish_profiling(console, "lint run", profile_output)
 
     success_count = sum(results)
     total_count = len(results)
@@ -186,17 +366,251 @@ def run(
         console.print(f"⚠️ {success_count}/{total_count} linting tools completed [bold]successfully[/bold]", style="yellow")
 
 
+@lint_app.command(
+    "watch",
+    help="""
+    👀 [bold]Watch[/bold] a [bold]path[/bold] (or the [bold]default folder[/bold]) and re-lint [bold]changed files only[/bold] on every save, updating results in place.
+    [code]Ruff[/code] linting and [code]Pydoclint[/code] run, plus [code]Mypy[/code] when asked.
+    Checks are [italic]read-only[/italic] unless [bold]--fix[/bold] lets Ruff rewrite files (whose saves are not re-linted).
+    Native file system events are used when [italic]watchfiles[/italic] is installed ([code]pip install tidy-cli[watch][/code]), polling otherwise.
+    """,
+)
+def watch(
+    path: Annotated[
+        str | None,
+        typer.Argument(
+            help="🎞️  [bold]Path[/bold] to watch (relative to [italic]default[/italic] folder), "
+            "otherwise [bold]entire default[/bold] folder is watched (i.e., [italic]'src'[/italic] or what defined at initialisation).",
+            callback=lambda path: path if path is not None else "",
+            show_default="'lint_default_path' setting or src",
+        ),
+    ] = None,
+    fix: Annotated[
+        bool,
+        typer.Option(
+            "--fix",
+            "-f",
+            help="🩹 Ruff [bold]auto-fix[/bold] issues when possible.",
+            show_default="False",
+        ),
+    ] = False,
+    mypy: Annotated[
+        bool,
+        typer.Option(
+            "--mypy",
+            "-m",
+            help="🔎 Also run [bold]Mypy[/bold] on the packages containing the changed files.",
+            show_default="False",
+        ),
+    ] = False,
+    mypy_daemon: Annotated[
+        bool,
+        typer.Option(
+            "--mypy-daemon",
+            "-md",
+            help="🔥 Run Mypy via a [bold]persistent daemon[/bold] (dmypy), implies --mypy (also enabled by [italic]lint_mypy_daemon[/italic] setting).",
+            show_default="False",
+        ),
+    ] = False,
+    debounce: Annotated[
+        float,
+        typer.Option(
+            "--debounce",
+            help="⏳ [bold]Seconds[/bold] without further saves before re-linting a burst of changes.",
+        ),
+    ] = 0.1,
+    poll: Annotated[
+        bool,
+        typer.Option(
+            "--poll",
+            help="🔁 [bold]Poll[/bold] the file system even when native file system events are available (e.g., network drives).",
+            show_default="False",
+        ),
+    ] = False,
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the lint [italic]default directory[/italic]",
+        ),
+    ] = None,
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic])",
+        ),
+    ] = None,
+) -> None:
+    """
+    Entry point function to watch the entire default folder, 'src' or wath's defined in the settings, or a specific path,
+    re-running the Linters on the changed files only (read-only unless Ruff auto-fixes them).
+
+    :param path: optional path to be watched
+    :type path: str | None
+    :param fix: whether to allow Ruff to fix errors, defaults to False
+    :type fix: bool
+    :param mypy: whether to run Mypy on the packages containing the changed files, defaults to False
+    :type mypy: bool
+    :param mypy_daemon: whether to run Mypy via the persistent daemon, implies mypy, defaults to False (or lint_mypy_daemon setting)
+    :type mypy_daemon: bool
+    :param debounce: seconds without further changes before a burst of changes is linted, defaults to 0.1
+    :type debounce: float
+    :param poll: whether to poll the file system instead of using native file system events, defaults to False
+    :type poll: bool
+    :param default_dir: default lint path that overwrites the one set at init time
+    :type default_dir: Path | None
+    :param pyproject_path: pyproject.toml path relative to current working directory that overwrites the one set at init time
+    :type pyproject_path: str | None
+    :return: None
+    :rtype: None
+    """
+
+    default_dir: Path = get_lint_default_path() if default_dir is None else default_dir  # type: ignore
+    lint_path = default_dir / path  # type: ignore
+    if lint_path.exists() is False:
+        console.print(f"❌ Path not found: [bold]{lint_path}[/bold]", style="red")
+        raise typer.Exit(1)
+
+    config_path = get_lint_config_path() if pyproject_path is None else pyproject_path
+    mypy_command = None
+    if mypy_daemon is True or (mypy is True and get_lint_mypy_daemon() is True):
+        mypy_command = get_daemon_command("run", config_path)
+    elif mypy is True:
+        mypy_command = ["mypy", "--pretty", "--config-file", config_path]
+
+    # A first full run fills the board, then each burst of saves re-lints the changed files only
+    board = WatchBoard(lint_path, config_path, fix=fix, mypy_command=mypy_command)
+    console.print(f"🔍 Running linters on: [bold]{lint_path}[/bold]", style="white")
+    files, _ = board.changed_files(set(discover_python_files(lint_path)))
+    if files:
+        # The watched path is passed to the tools rather than every file, which may exceed the command line length limit
+        board.lint(files, get_package_roots(files, default_dir) if mypy_command is not None else None, targets=[lint_path])  # type: ignore
+    board.render(console)
+
+    try:
+        for paths in watch_changes(lint_path, debounce, force_polling=poll):
+            files, deleted = board.changed_files(paths)
+            if not files and not deleted:
+                continue
+            board.forget(deleted)
+            if files:
+                board.lint(files, get_package_roots(files, default_dir) if mypy_command is not None else None)  # type: ignore
+            board.render(console)
+    except KeyboardInterrupt:
+        pass
+    console.print("👋 Stopped watching", style="white")
+
+
 @lint_app.command(
     "init",
     help="🎛️  Initialize CLI [bold]default Linting directory[/bold] and [bold]config file path[/bold] settings.",
 )
-def init() -> None:
+def init(
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="📁 Set the Lint [italic]default directory[/italic] without prompting",
+        ),
+    ] = None,
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="📄 Set the [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic]) without prompting",
+        ),
+    ] = None,
+) -> None:
     """
     Function aimed at initializing Linter commands group settings.
     For the default Lint directory it is by design 'src' or any newly provided, via initialization, directory.
     For the Lint config file it is by design 'pyproject.toml' or any newly provided, via initialization, path.
+    In headless mode (e.g., CI) nothing is prompted: settings not given as options are taken from their environment variable or current value.
+
+    :param default_dir: Lint default directory, prompted for if not given
+    :type default_dir: Path | None
+    :param pyproject_path: pyproject.toml path relative to current working directory, prompted for if not given
+    :type pyproject_path: str | None
+    :return: None
+    :rtype: None
+    """
+    init_settings(default_dir, None if pyproject_path is None else Path(pyproject_path))
+
+
+@daemon_app.command(
+    "status",
+    help="🩺 Show the [bold]status[/bold] of the Mypy daemon serving the [italic]config file[/italic].",
+)
+def daemon_status(
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic])",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at showing the status of the Mypy daemon serving the Lint config file.
+
+    :param pyproject_path: pyproject.toml path relative to current working directory that overwrites the one set at init time
+    :type pyproject_path: str | None
+    :return: None
+    :rtype: None
+    """
+    config_path = get_lint_config_path() if pyproject_path is None else pyproject_path
+    if run_command(get_daemon_command("status", config_path), "Mypy daemon status") is False:
+        raise typer.Exit(1)
+
+
+@daemon_app.command(
+    "restart",
+    help="🔄 [bold]Restart[/bold] the Mypy daemon serving the [italic]config file[/italic] (e.g., after installing new stubs).",
+)
+def daemon_restart(
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic])",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at restarting the Mypy daemon serving the Lint config file.
+
+    :param pyproject_path: pyproject.toml path relative to current working directory that overwrites the one set at init time
+    :type pyproject_path: str | None
+    :return: None
+    :rtype: None
+    """
+    config_path = get_lint_config_path() if pyproject_path is None else pyproject_path
+    if run_command(get_daemon_command("restart", config_path), "Mypy daemon restart") is False:
+        raise typer.Exit(1)
+
+
+@daemon_app.command(
+    "stop",
+    help="🛑 [bold]Stop[/bold] the Mypy daemon serving the [italic]config file[/italic].",
+)
+def daemon_stop(
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic])",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at stopping the Mypy daemon serving the Lint config file.
 
+    :param pyproject_path: pyproject.toml path relative to current working directory that overwrites the one set at init time
+    :type pyproject_path: str | None
     :return: None
     :rtype: None
     """
-    init_settings()
+    config_path = get_lint_config_path() if pyproject_path is None else pyproject_path
+    if run_command(get_daemon_command("stop", config_path), "Mypy daemon stop") is False:
+        raise typer.Exit(1)
@@ -0,0 +1,76 @@
+"""Module defining the persistent Mypy daemon (dmypy) backend for the CLI Linting Commands Group."""
+
+# Import packages and modules
+import hashlib
+from pathlib import Path
+
+from tidy_cli.commons.settings import (
+    SETTINGS_FILE,
+    get_settings,
+)
+
+# Define literals
+DAEMON_DIR = SETTINGS_FILE.parent / "dmypy"  # status files of the daemons, one per config file
+DAEMON_TIMEOUT = 3600  # seconds of inactivity after which the daemon shuts itself down
+
+
+def get_status_file(
+    config_path: str,
+) -> Path:
+    """
+    Function aimed at getting the dmypy status file of the daemon serving a config file.
+    Each project (i.e., settings folder) and config file gets its own daemon, the folder is created if needed.
+
+    :param config_path: path to the Mypy config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: path of the daemon status file
+    :rtype: Path
+    """
+    DAEMON_DIR.mkdir(parents=True, exist_ok=True)
+    config_hash = hashlib.blake2b(str(Path(config_path).resolve()).encode(), digest_size=8).hexdigest()
+    return DAEMON_DIR / f"{config_hash}.json"
+
+
+def get_mypy_flags(
+    config_path: str,
+) -> list[str]:
+    """
+    Function aimed at getting the Mypy flags the daemon is started with (a daemon is restarted when they change).
+
+    :param config_path: path to the Mypy config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: Mypy flags
+    :rtype: list[str]
+    """
+    return ["--pretty", "--config-file", config_path]
+
+
+def get_daemon_command(
+    action: str,
+    config_path: str,
+) -> list[str]:
+    """
+    Function aimed at building the dmypy command performing an action on the daemon serving a config file.
+    The 'run' action starts the daemon if needed and type checks the targets appended to the command.
+
+    :param action: dmypy action among run, status, restart and stop
+    :type action: str
+    :param config_path: path to the Mypy config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: dmypy command
+    :rtype: list[str]
+    """
+    command = ["dmypy", "--status-file", str(get_status_file(config_path)), action]
+    if action in ("run", "restart"):
+        command += ["--timeout", str(DAEMON_TIMEOUT), "--", *get_mypy_flags(config_path)]
+    return command
+
+
+def get_lint_mypy_daemon() -> bool:
+    """
+    Function aimed at getting whether Mypy should run via the daemon from settings, or default (i.e., False).
+
+    :return: whether the Mypy daemon is enabled
+    :rtype: bool
+    """
+    return get_settings().get_bool("lint_mypy_daemon")
@@ -0,0 +1,222 @@
+"""Module defining the in-process Pydoclint engine (i.e., no flake8 subprocess) for the CLI Linting Commands Group."""
+
+# Import packages and modules
+import argparse
+import configparser
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
+from pathlib import Path
+from typing import Any
+
+from tidy_cli.commons.process import LineHandler
+from tidy_cli.commons.pyproject import load_toml
+
+# Define literals
+MIN_PARALLEL_FILES = 16  # below this number of files worker processes startup outweighs the gain
+FLAKE8_ARGUMENTS = ("--select", "DOC")  # command line arguments of the equivalent flake8 run (i.e., flake8 --toml-config <config> --select DOC)
+PLUGIN_API = ("add_options", "parse_options", "run")  # flake8 plugin members of Pydoclint used to register, configure and run it
+
+
+@cache
+def get_plugin() -> type | None:
+    """
+    Function aimed at getting the Pydoclint flake8 plugin, if the installed flake8 and Pydoclint allow running it without flake8 itself.
+    The plugin is configured and its violations are filtered by the flake8 modules the flake8 run relies on (i.e., config, files discovery, style guide),
+    which are not part of the flake8 public API, hence any version lacking them falls back to the flake8 subprocess rather than failing.
+
+    :return: Pydoclint flake8 plugin or None if not available (i.e., the flake8 subprocess has to be used)
+    :rtype: type | None
+    """
+    try:
+        from flake8.discover_files import expand_paths  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.formatting.default import Nothing  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.main.options import register_default_options, stage1_arg_parser  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.options.aggregator import aggregate_options  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.options.config import load_config  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.options.manager import OptionManager  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.processor import FileProcessor  # type: ignore[import-untyped]  # noqa: F401
+        from flake8.style_guide import StyleGuideManager  # type: ignore[import-untyped]  # noqa: F401
+        from pydoclint.flake8_entry import Plugin  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+    if not all(callable(getattr(Plugin, name, None)) for name in PLUGIN_API):
+        return None
+    return Plugin
+
+
+def load_flake8_config(
+    config_path: str,
+) -> tuple[configparser.RawConfigParser, str]:
+    """
+    Function aimed at loading the flake8 config as the flake8-pyproject plugin does for 'flake8 --toml-config <config>':
+    the [tool.flake8] section of the config file, if any, replaces the flake8 config files (e.g., setup.cfg, tox.ini, .flake8) of the current folder.
+
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: flake8 config and the folder its relative paths refer to
+    :rtype: tuple[configparser.RawConfigParser, str]
+    """
+    from flake8.options.config import load_config
+
+    section = load_toml(Path(config_path)).get("tool", {}).get("flake8")
+    if section is None:
+        return load_config(config=None, extra=[], isolated=False)
+
+    config = configparser.RawConfigParser()
+    config.add_section("flake8")
+    for key, value in section.items():
+        config.set("flake8", key, str(value) if isinstance(value, bool | int | float) else value)
+    return config, str(Path(config_path).resolve().parent)
+
+
+@cache
+def load_flake8_options(
+    config_path: str,
+) -> argparse.Namespace:
+    """
+    Function aimed at reading the flake8 options, Pydoclint ones included, once per process, exactly as the equivalent flake8 run would:
+    flake8 and Pydoclint options are registered, read from the flake8 config and overridden by the flake8 command line arguments.
+
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: flake8 options
+    :rtype: argparse.Namespace
+    """
+    from flake8 import __version__  # type: ignore[import-untyped]
+    from flake8.main.options import register_default_options, stage1_arg_parser
+    from flake8.options.aggregator import aggregate_options
+    from flake8.options.manager import OptionManager
+
+    manager = OptionManager(version=__version__, plugin_versions="", parents=[stage1_arg_parser()], formatter_names=[])
+    register_default_options(manager)
+    get_plugin().add_options(manager)  # type: ignore[union-attr]
+    config, config_dir = load_flake8_config(config_path)
+    return aggregate_options(manager, config, config_dir, list(FLAKE8_ARGUMENTS))
+
+
+@cache
+def get_style_guide(
+    config_path: str,
+) -> Any:
+    """
+    Function aimed at getting the flake8 style guide once per process, deciding which violations are reported
+    (i.e., select, ignore, per-file-ignores and noqa comments) as the equivalent flake8 run would.
+
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: flake8 style guide, reporting nothing by itself
+    :rtype: Any
+    """
+    from flake8.formatting.default import Nothing
+    from flake8.style_guide import StyleGuideManager
+
+    options = load_flake8_options(config_path)
+    return StyleGuideManager(options, Nothing(options))
+
+
+def discover_files(
+    targets: list[str],
+    config_path: str,
+) -> list[str]:
+    """
+    Function aimed at listing the Python files under the targets as the equivalent flake8 run would (i.e., filename, exclude and extend-exclude options).
+
+    :param targets: files or directories to be checked
+    :type targets: list[str]
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: sorted files to be checked
+    :rtype: list[str]
+    """
+    from flake8.discover_files import expand_paths
+
+    options = load_flake8_options(config_path)
+    files = expand_paths(
+        paths=targets,
+        stdin_display_name=options.stdin_display_name,
+        filename_patterns=options.filename,
+        exclude=(*options.exclude, *options.extend_exclude),
+    )
+    return sorted(files)
+
+
+def check_file(
+    path: str,
+    config_path: str,
+) -> list[str]:
+    """
+    Function aimed at checking the docstrings of a single file, reporting violations in flake8 format (i.e., 'path:line:col: DOCxxx message').
+    Files flake8 would not check (e.g., '# flake8: noqa', unreadable or invalid) give no violation, as their flake8 errors are not DOC ones.
+
+    :param path: Python file to be checked
+    :type path: str
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: violations in flake8 format
+    :rtype: list[str]
+    """
+    from flake8.processor import FileProcessor
+
+    options = load_flake8_options(config_path)
+    try:
+        processor = FileProcessor(path, options)
+        if processor.should_ignore_file():
+            return []
+        tree = processor.build_ast()
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    plugin = get_plugin()
+    plugin.parse_options(options)  # type: ignore[union-attr]
+    results = []
+    for line, column, text, _ in plugin(tree, path).run():  # type: ignore[misc]
+        code, text = text.split(" ", 1)
+        results.append((code, line, column, text))
+
+    style_guide = get_style_guide(config_path)
+    lines = []
+    for code, line, column, text in sorted(results, key=operator.itemgetter(1, 2)):
+        if style_guide.handle_error(code, path, line, column, text, processor.noqa_line_for(line)) == 1:
+            lines.append(f"{path}:{line}:{(column or 0) + 1}: {code} {text}")
+    return lines
+
+
+def check_paths(
+    targets: list[str],
+    on_line: LineHandler,
+    config_path: str,
+    jobs: int = 1,
+) -> int:
+    """
+    Function aimed at checking the docstrings of the Python files under the targets, in-process or across worker processes,
+    with the same results as 'flake8 --toml-config <config> --select DOC' would give.
+    Violations are forwarded file after file, in the files order, so that the report does not depend on the number of jobs.
+
+    :param targets: files or directories to be checked
+    :type targets: list[str]
+    :param on_line: function called on each violation line (flake8 format) with the name of the stream it goes to
+    :type on_line: LineHandler
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :param jobs: maximum number of worker processes, defaults to 1 (i.e., in-process)
+    :type jobs: int
+    :return: return code as flake8 would give (i.e., 1 if any violation is found and 0 otherwise)
+    :rtype: int
+    """
+    files = discover_files(targets, config_path)
+
+    check = partial(check_file, config_path=config_path)
+    workers = min(jobs, len(files) // MIN_PARALLEL_FILES + 1)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    found = False
+    try:
+        results = map(check, files) if executor is None else executor.map(check, files, chunksize=max(1, len(files) // (workers * 4)))
+        for lines in results:
+            for line in lines:
+                found = True
+                on_line(line, "stdout")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return 1 if found is True else 0
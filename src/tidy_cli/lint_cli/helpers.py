@@ -1,87 +1,184 @@
 """Module defining helpers functions for the CLI Linting Commands Group."""
 
-import subprocess
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import IO
 
-import typer
 from rich.console import Console
 
+from tidy_cli.commons.console import (
+    console,
+    prompt_setting,
+)
+from tidy_cli.commons.git import get_changed_files
+from tidy_cli.commons.process import (
+    LineHandler,
+    spooled_buffer,
+    stream_command,
+)
+from tidy_cli.commons.profiling import record_call
 from tidy_cli.commons.settings import (
     SETTINGS_FILE,
-    load_settings,
+    get_settings,
     update_settings,
 )
 
-console = Console()
+from .sharding import (
+    merge_outputs,
+    write_output_line,
+)
 
 
 def run_command(
     command: list[str],
     description: str,
+    output: Console | None = None,
+    prefix: str | None = None,
+    engine: Callable[[LineHandler], int] | None = None,
 ) -> bool:
     """
-    Function aimed at running terminal commands via subprocess, capture output and print either stdout or stderr (via Rich).
+    Function aimed at running terminal commands via subprocess, streaming stdout and stderr lines (via Rich) as soon as they are produced.
+    When an engine is provided the tool runs in-process instead, with its output lines streamed the same way.
 
     :param command: list of commands to be executed (the list is made of elements that toghether form a single terminal command)
     :type command: list[str]
     :param description: label of the command being executed (e.g., mypy)
     :type description: str
+    :param output: Console where to print the command output (e.g., buffered one when running concurrently), defaults to module Console
+    :type output: Console | None
+    :param prefix: label prepended to each output line (e.g., when interleaving concurrent tools), defaults to None
+    :type prefix: str | None
+    :param engine: function running the tool in-process, called with the line handler and returning the return code, defaults to None
+    :type engine: Callable[[LineHandler], int] | None
     :return: True if the command goes fine and False otherwise
     :rtype: bool
     """
+    output = console if output is None else output
+    line_prefix = "" if prefix is None else f"[{prefix}] "
+
+    def _print_line(line: str, stream: str) -> None:
+        output.print(f"{line_prefix}{line}", style="red" if stream == "stderr" else "white", markup=False, highlight=False)
+
     try:
-        console.print(f"🔧 {description}...")
-        result = subprocess.run(command, capture_output=True, text=True)
-        if result.returncode == 0:
-            console.print(f"✅ {description} completed successfully")
-            console.print(result.stdout, style="white", markup=False) if result.stdout else console.print("")
+        output.print(f"🔧 {description}...")
+        if engine is None:
+            returncode = stream_command(command, on_line=_print_line, label=description)
+        else:
+            started_at = time.perf_counter()
+            returncode = engine(_print_line)
+            record_call(description, started_at, returncode)
+        if returncode == 0:
+            output.print(f"✅ {description} completed successfully")
+            output.print("")
             return True
         else:
-            console.print(f"❌ {description} failed", style="red")
-            if result.stdout:
-                console.print(result.stdout, style="red", markup=False)
-            if result.stderr:
-                console.print(result.stderr, style="red", markup=False)
+            output.print(f"❌ {description} failed", style="red")
+            output.print("")
             return False
     except Exception as e:
-        console.print(f"❌ Error running {description}: {e}", style="red", markup=False)
+        output.print(f"❌ Error running {description}: {e}", style="red", markup=False)
         return False
 
 
-def init_settings() -> None:
+def run_sharded_command(
+    commands: list[list[str]],
+    description: str,
+    output: Console | None = None,
+    prefix: str | None = None,
+) -> bool:
+    """
+    Function aimed at running the shards of a tool concurrently via subprocess, printing their outputs (via Rich) as a single report
+    ordered by file and line once every shard is done.
+
+    :param commands: terminal command of each shard
+    :type commands: list[list[str]]
+    :param description: label of the tool being executed (e.g., mypy)
+    :type description: str
+    :param output: Console where to print the tool output (e.g., buffered one when running concurrently), defaults to module Console
+    :type output: Console | None
+    :param prefix: label prepended to each output line (e.g., when interleaving concurrent tools), defaults to None
+    :type prefix: str | None
+    :return: True if every shard goes fine and False otherwise
+    :rtype: bool
+    """
+    output = console if output is None else output
+    line_prefix = "" if prefix is None else f"[{prefix}] "
+
+    def _run_shard(index: int) -> tuple[int, IO[str]]:
+        # Each shard output is spooled (in memory up to a limit, then in a temporary file) until every shard is done
+        spool = spooled_buffer()
+        returncode = stream_command(commands[index], on_line=partial(write_output_line, spool), label=f"{description} [{index + 1}/{len(commands)}]")
+        return returncode, spool
+
+    try:
+        output.print(f"🔧 {description} ({len(commands)} shards)...")
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            shards = list(executor.map(_run_shard, range(len(commands))))
+        try:
+            for line, stream in merge_outputs([spool for _, spool in shards]):
+                output.print(f"{line_prefix}{line}", style="red" if stream == "stderr" else "white", markup=False, highlight=False)
+        finally:
+            for _, spool in shards:
+                spool.close()
+        if all(returncode == 0 for returncode, _ in shards):
+            output.print(f"✅ {description} completed successfully")
+            output.print("")
+            return True
+        else:
+            output.print(f"❌ {description} failed", style="red")
+            output.print("")
+            return False
+    except Exception as e:
+        output.print(f"❌ Error running {description}: {e}", style="red", markup=False)
+        return False
+
+
+def init_settings(
+    default_path: Path | None = None,
+    config_path: Path | None = None,
+) -> None:
     """
     Function aimed at initializing CLI Linting Commands Group settings.
     It initializes the default directory, namely the one the linters are applied if nothing is provided
     or relative to which the subfolder/file is linted.
     By design it is defaulted, if nothing is provided, with 'src'.
+    Settings not given are prompted for, or taken from their environment variable or current value when the CLI runs headless.
 
+    :param default_path: default directory, defaults to None (i.e., prompted for)
+    :type default_path: Path | None
+    :param config_path: config file path, defaults to None (i.e., prompted for)
+    :type config_path: Path | None
     :return: None
     :rtype: None
     """
     console.print("🔧 Initializing Linter settings...\n")
 
     # Load settings
-    current_settings = load_settings()
+    current_settings = get_settings()
 
     # Default settings
     default_lint_path = current_settings.get("lint_default_path", "src")
     default_config_path = current_settings.get("lint_config_path", "pyproject.toml")
 
     # Configure default Linter path
-    lint_path = typer.prompt(
-        "▪ Default path to lint / parent folder to the path to be linted",
-        default=default_lint_path,
-        show_default=True,
-        type=Path,
-    )
+    lint_path = default_path
+    if lint_path is None:
+        lint_path = prompt_setting(
+            "▪ Default path to lint / parent folder to the path to be linted",
+            "lint_default_path",
+            default_lint_path,
+        )
 
     # Configure Linter config file path
-    config_path = typer.prompt(
-        "▪ Path to Linter config file (relative to current working directory)",
-        default=default_config_path,
-        show_default=True,
-        type=Path,
-    )
+    if config_path is None:
+        config_path = prompt_setting(
+            "▪ Path to Linter config file (relative to current working directory)",
+            "lint_config_path",
+            default_config_path,
+        )
 
     new_settings = {
         "lint_default_path": str(lint_path),
@@ -104,10 +201,7 @@ def get_lint_default_path() -> Path:
     :return: default directory path
     :rtype: Path
     """
-    settings = load_settings()
-    if "lint_default_path" in settings:
-        return Path(settings["lint_default_path"])
-    return Path("src")
+    return Path(get_settings().get("lint_default_path", "src"))
 
 
 def get_lint_config_path() -> str:
@@ -117,7 +211,45 @@ def get_lint_config_path() -> str:
     :return: config file path
     :rtype: str
     """
-    settings = load_settings()
-    if "lint_config_path" in settings:
-        return settings["lint_config_path"]
-    return "pyproject.toml"
+    return get_settings().get("lint_config_path", "pyproject.toml")
+
+
+def get_changed_lint_files(
+    lint_path: Path,
+    since: str | None = None,
+) -> list[Path]:
+    """
+    Function aimed at getting the Python files changed against a base ref (plus staged and untracked ones) under the lint path.
+
+    :param lint_path: file or directory to be linted
+    :type lint_path: Path
+    :param since: base ref to compare with, defaults to HEAD (i.e., uncommitted changes only)
+    :type since: str | None
+    :return: sorted list of changed Python files under lint path
+    :rtype: list[Path]
+    """
+    root = lint_path.resolve()
+    return [file for file in get_changed_files(since) if file.suffix in (".py", ".pyi") and file.is_file() and (file.resolve() == root or file.resolve().is_relative_to(root))]
+
+
+def get_package_roots(
+    files: list[Path],
+    default_dir: Path,
+) -> list[Path]:
+    """
+    Function aimed at getting the top-level packages (or modules) under the default directory containing the given files.
+    It allows type checkers to resolve imports of changed files as they would when checking the whole default directory.
+
+    :param files: files under the default directory
+    :type files: list[Path]
+    :param default_dir: default lint directory (i.e., sources root)
+    :type default_dir: Path
+    :return: sorted list of top-level packages or modules
+    :rtype: list[Path]
+    """
+    source_root = default_dir.resolve()
+    roots = set()
+    for file in files:
+        relative = file.resolve().relative_to(source_root)
+        roots.add(default_dir / relative.parts[0])
+    return sorted(roots)
@@ -0,0 +1,264 @@
+"""Module defining the execution engine scheduling Linting tools for the CLI Linting Commands Group."""
+
+# Import packages and modules
+import io
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import IO, Any
+
+from rich.console import Console
+
+from tidy_cli.commons.console import console
+from tidy_cli.commons.process import (
+    LineHandler,
+    spooled_buffer,
+)
+
+# Define literals
+ToolRunner = Callable[..., bool]  # signature of run_command (command, description, output=Console, prefix=str)
+Engine = Callable[[list[str], LineHandler], int]  # in-process tool run on targets forwarding output lines, returning the return code
+ShardedToolRunner = Callable[..., bool]  # signature of run_sharded_command (commands, description, output=Console, prefix=str)
+
+
+@dataclass
+class LintTool:
+    """
+    Class aimed at describing a single Linting tool to be scheduled by the execution engine.
+
+    .. attribute :: name
+        :type: str
+
+        unique name of the tool in the dependency graph (e.g., ruff-check)
+
+    .. attribute :: description
+        :type: str
+
+        label of the tool printed in the terminal (e.g., Mypy type checking)
+
+    .. attribute :: command
+        :type: list[str]
+
+        terminal command running the tool, without the linted paths
+
+    .. attribute :: targets
+        :type: list[str]
+
+        files or directories the tool runs on, appended to the command
+
+    .. attribute :: mutates_files
+        :type: bool
+
+        whether the tool rewrites the linted files (e.g., ruff format), defaults to False
+
+    .. attribute :: depends_on
+        :type: list[str]
+
+        names of the tools that must complete before this one, on top of the implicit ones
+
+    .. attribute :: shards
+        :type: list[list[str]]
+
+        arguments (i.e., targets) of each process the tool is split into, empty when the tool runs as a single process
+
+    .. attribute :: engine
+        :type: Engine | None
+
+        function running the tool in-process on its targets instead of the command, defaults to None
+    """
+
+    name: str
+    description: str
+    command: list[str]
+    targets: list[str] = field(default_factory=list)
+    mutates_files: bool = False
+    depends_on: list[str] = field(default_factory=list)
+    shards: list[list[str]] = field(default_factory=list)
+    engine: Engine | None = None
+
+    @property
+    def full_command(self) -> list[str]:
+        """
+        Property aimed at building the complete terminal command, namely the command followed by its targets.
+
+        :return: terminal command running the tool on its targets
+        :rtype: list[str]
+        """
+        return [*self.command, *self.targets]
+
+    @property
+    def shard_commands(self) -> list[list[str]]:
+        """
+        Property aimed at building the terminal command of each shard, namely the command followed by the shard arguments.
+
+        :return: terminal commands running the tool on each shard
+        :rtype: list[list[str]]
+        """
+        return [[*self.command, *shard] for shard in self.shards]
+
+
+def build_dependency_graph(
+    tools: list[LintTool],
+) -> dict[str, list[str]]:
+    """
+    Function aimed at building the dependency graph of the selected Linting tools.
+    Tools mutating files are chained in the order they are provided, so that they never touch the same files
+    concurrently, while read-only tools only depend on what they explicitly declare.
+    Explicit dependencies on tools not selected (e.g., skipped ones) are dropped.
+
+    :param tools: selected Linting tools in the order they should be reported
+    :type tools: list[LintTool]
+    :return: mapping between each tool name and the names of the tools it waits for
+    :rtype: dict[str, list[str]]
+    """
+    selected = {tool.name for tool in tools}
+    graph: dict[str, list[str]] = {}
+    previous_mutating: str | None = None
+    for tool in tools:
+        dependencies = [name for name in tool.depends_on if name in selected]
+        if tool.mutates_files is True:
+            if previous_mutating is not None and previous_mutating not in dependencies:
+                dependencies.append(previous_mutating)
+            previous_mutating = tool.name
+        graph[tool.name] = dependencies
+    return graph
+
+
+class OrderedOutput(io.TextIOBase):
+    """
+    Class aimed at relaying the output of a concurrently running tool to the terminal in a fixed order.
+    The output is spooled (in memory up to a limit, then in a temporary file) until the tool gets its turn,
+    then it is replayed and the rest of the output is streamed live.
+
+    :param target: terminal stream receiving the output once live (e.g., sys.stdout)
+    :type target: IO[str]
+    """
+
+    def __init__(
+        self,
+        target: IO[str],
+    ) -> None:
+        self.target = target
+        self.spool: IO[str] | None = spooled_buffer()
+        self.lock = threading.Lock()
+
+    def write(
+        self,
+        text: str,
+    ) -> int:
+        """
+        Method aimed at writing output either to the spool or, once live, to the terminal.
+
+        :param text: rendered output
+        :type text: str
+        :return: number of written characters
+        :rtype: int
+        """
+        with self.lock:
+            if self.spool is None:
+                self.target.write(text)
+                self.target.flush()
+            else:
+                self.spool.write(text)
+        return len(text)
+
+    def go_live(self) -> None:
+        """
+        Method aimed at replaying the spooled output to the terminal and streaming the following one live.
+
+        :return: None
+        :rtype: None
+        """
+        with self.lock:
+            if self.spool is None:
+                return
+            self.spool.seek(0)
+            for chunk in iter(lambda: self.spool.read(64 * 1024), ""):  # type: ignore[union-attr]
+                self.target.write(chunk)
+            self.target.flush()
+            self.spool.close()
+            self.spool = None
+
+
+def _relay_console(
+    relay: OrderedOutput,
+) -> Console:
+    """
+    Function aimed at creating a Console writing to an output relay while mirroring the terminal capabilities of the main one.
+
+    :param relay: output relay of a tool
+    :type relay: OrderedOutput
+    :return: Console writing to the relay
+    :rtype: Console
+    """
+    return Console(
+        file=relay,  # type: ignore[arg-type]
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,  # type: ignore[arg-type]
+        width=console.width,
+    )
+
+
+def run_tools(
+    tools: list[LintTool],
+    runner: ToolRunner,
+    sequential: bool = False,
+    interleave: bool = False,
+    max_workers: int | None = None,
+    sharded_runner: ShardedToolRunner | None = None,
+) -> list[bool]:
+    """
+    Function aimed at running the selected Linting tools according to their dependency graph.
+    Independent tools run concurrently, each in its own subprocess, while their output is printed in the order
+    the tools are provided: the first unfinished tool streams live, the following ones are spooled until their turn.
+
+    :param tools: selected Linting tools in the order they should be reported
+    :type tools: list[LintTool]
+    :param runner: function running a single command (i.e., run_command)
+    :type runner: ToolRunner
+    :param sequential: whether to run tools one after the other printing their output directly, defaults to False
+    :type sequential: bool
+    :param interleave: whether to stream every tool output live, with per-tool prefixes, instead of in fixed order, defaults to False
+    :type interleave: bool
+    :param max_workers: maximum number of tools running at the same time, defaults to the number of tools
+    :type max_workers: int | None
+    :param sharded_runner: function running the shards of a sharded tool as a single report (i.e., run_sharded_command), defaults to None
+    :type sharded_runner: ShardedToolRunner | None
+    :return: outcome of each tool, in the order the tools are provided
+    :rtype: list[bool]
+    """
+
+    def _invoke(tool: LintTool, **kwargs: Any) -> bool:
+        if tool.shards and sharded_runner is not None:
+            return sharded_runner(tool.shard_commands, tool.description, **kwargs)
+        if tool.engine is not None:
+            return runner(tool.full_command, tool.description, engine=partial(tool.engine, tool.targets), **kwargs)
+        return runner(tool.full_command, tool.description, **kwargs)
+
+    if sequential is True or len(tools) <= 1:
+        return [_invoke(tool) for tool in tools]
+
+    graph = build_dependency_graph(tools)
+    futures: dict[str, Future[bool]] = {}
+    relays: dict[str, OrderedOutput] = {}
+
+    def _run(tool: LintTool) -> bool:
+        # Dependencies are always submitted earlier, hence FIFO scheduling cannot deadlock
+        for name in graph[tool.name]:
+            futures[name].result()
+        if interleave is True:
+            return _invoke(tool, prefix=tool.name)
+        return _invoke(tool, output=_relay_console(relays[tool.name]))
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers or len(tools)) as executor:
+        for tool in tools:
+            relays[tool.name] = OrderedOutput(console.file)
+            futures[tool.name] = executor.submit(_run, tool)
+        # Hand the terminal over to each tool in fixed order
+        for tool in tools:
+            relays[tool.name].go_live()
+            results.append(futures[tool.name].result())
+    return results
@@ -0,0 +1,364 @@
+"""Module defining the sharding of Linting tools across CPU cores for the CLI Linting Commands Group."""
+
+# Import packages and modules
+import ast
+import configparser
+import hashlib
+import heapq
+import math
+import os
+import re
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from pathlib import Path
+from typing import IO
+
+from tidy_cli.commons.pyproject import load_toml
+
+from .cache import discover_python_files
+from .scheduler import LintTool
+
+# Define literals
+MIN_SHARD_FILES = 50  # below this number of files per shard the extra process startup outweighs the gain
+MYPY_CACHE_DIR = ".mypy_cache"  # Mypy default cache folder
+MYPY_SHARDS_DIR = "shards"  # folder of the Mypy cache of each shard (by content), as concurrent processes cannot share one cache
+RECORD_PATTERN = re.compile(r"^(?P<path>[^\s:][^:]*\.pyi?):(?P<line>\d+)(?::(?P<col>\d+))?: ")  # first line of a diagnostic
+MYPY_FOUND_PATTERN = re.compile(r"^Found (?P<errors>\d+) errors? in (?P<files>\d+) files? \(checked (?P<checked>\d+) source files?\)$")
+MYPY_SUCCESS_PATTERN = re.compile(r"^Success: no issues found in (?P<checked>\d+) source files?$")
+OutputLine = tuple[str, str]  # (line without trailing newline, stream name among stdout and stderr)
+
+
+def file_size(
+    path: Path,
+) -> int:
+    """
+    Function aimed at getting the size of a file, used as a proxy of the time needed to lint it.
+
+    :param path: file to be linted
+    :type path: Path
+    :return: size of the file in bytes (0 if it cannot be read)
+    :rtype: int
+    """
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def balance(
+    items: list[tuple[int, list[Path]]],
+    jobs: int,
+) -> list[list[Path]]:
+    """
+    Function aimed at distributing weighted groups of paths into at most jobs shards of similar total weight.
+    The heaviest groups are placed first, each one in the currently lightest shard (i.e., longest processing time first).
+
+    :param items: groups of paths that must stay in the same shard, with their weight (e.g., total size in bytes)
+    :type items: list[tuple[int, list[Path]]]
+    :param jobs: maximum number of shards
+    :type jobs: int
+    :return: non-empty shards, each one made of sorted paths
+    :rtype: list[list[Path]]
+    """
+    heap: list[tuple[int, int, list[Path]]] = [(0, index, []) for index in range(max(1, min(jobs, len(items))))]  # (weight, shard index, paths)
+    for weight, item in sorted(items, key=lambda pair: pair[0], reverse=True):
+        total, index, paths = heapq.heappop(heap)
+        heapq.heappush(heap, (total + weight, index, paths + item))
+    return [sorted(paths) for _, _, paths in sorted(heap, key=lambda shard: shard[1]) if paths]
+
+
+def split_files(
+    files: list[Path],
+    jobs: int,
+) -> list[list[Path]]:
+    """
+    Function aimed at splitting files into balanced shards for file-local tools (e.g., Pydoclint),
+    keeping at least MIN_SHARD_FILES files per shard.
+
+    :param files: files to be linted
+    :type files: list[Path]
+    :param jobs: maximum number of shards
+    :type jobs: int
+    :return: balanced shards of files
+    :rtype: list[list[Path]]
+    """
+    shards = min(jobs, math.ceil(len(files) / MIN_SHARD_FILES))
+    return balance([(file_size(path), [path]) for path in files], shards)
+
+
+def get_imported_names(
+    path: Path,
+) -> set[str]:
+    """
+    Function aimed at getting the top-level names of the modules imported by a Python file (relative imports excluded).
+
+    :param path: Python file
+    :type path: Path
+    :return: top-level imported names (e.g., 'tidy_cli' for 'from tidy_cli.commons import git')
+    :rtype: set[str]
+    """
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module is not None:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def group_packages(
+    packages: list[Path],
+) -> list[tuple[int, list[Path]]]:
+    """
+    Function aimed at grouping top-level packages (or modules) connected by imports, in either direction.
+    Packages in different groups never import each other, hence they can be type checked by separate processes
+    without reporting the same errors twice.
+
+    :param packages: top-level packages or modules under the same sources root
+    :type packages: list[Path]
+    :return: groups of packages with their total size in bytes
+    :rtype: list[tuple[int, list[Path]]]
+    """
+    names = {path.stem if path.is_file() else path.name: index for index, path in enumerate(packages)}
+    parents = list(range(len(packages)))
+
+    def _find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    files = [discover_python_files(path) for path in packages]
+    for index, package_files in enumerate(files):
+        for name in set().union(*(get_imported_names(path) for path in package_files)):
+            if name in names:
+                parents[_find(names[name])] = _find(index)
+
+    groups: dict[int, tuple[int, list[Path]]] = {}
+    for index, package_files in enumerate(files):
+        weight, group = groups.get(_find(index), (0, []))
+        groups[_find(index)] = (weight + sum(file_size(path) for path in package_files), [*group, packages[index]])
+    return list(groups.values())
+
+
+def get_top_level_packages(
+    targets: Iterable[str],
+    source_dir: Path,
+) -> list[Path] | None:
+    """
+    Function aimed at expanding type checking targets into the top-level packages (or modules) of the sources root.
+    Targets nested inside a package (e.g., src/pkg/sub) cannot be split, as their imports are resolved through the package.
+
+    :param targets: type checking targets (i.e., sources root or top-level packages)
+    :type targets: Iterable[str]
+    :param source_dir: sources root (i.e., default lint directory)
+    :type source_dir: Path
+    :return: top-level packages or modules, None if targets cannot be split
+    :rtype: list[Path] | None
+    """
+    source_root = source_dir.resolve()
+    packages: list[Path] = []
+    for target in map(Path, targets):
+        if target.resolve() == source_root:
+            children = sorted(path for path in target.iterdir() if not path.name.startswith(".") and (path.is_dir() or path.suffix in (".py", ".pyi")))
+            packages.extend(path for path in children if discover_python_files(path))
+        elif target.resolve().parent == source_root:
+            packages.append(target)
+        else:
+            return None
+    return packages
+
+
+def get_mypy_cache_dir(
+    command: list[str],
+) -> Path | None:
+    """
+    Function aimed at getting the cache folder of a Mypy command as Mypy resolves it: the --cache-dir option,
+    the MYPY_CACHE_DIR environment variable, the cache_dir setting of its config file, then .mypy_cache.
+
+    :param command: Mypy command (e.g., ['mypy', '--pretty', '--config-file', 'pyproject.toml'])
+    :type command: list[str]
+    :return: cache folder, None when the cache is disabled (i.e., set to the null device)
+    :rtype: Path | None
+    """
+    options = dict(zip(command, command[1:], strict=False))
+    cache_dir = options.get("--cache-dir") or os.environ.get("MYPY_CACHE_DIR")
+    config_file = options.get("--config-file")
+    if cache_dir is None and config_file is not None:
+        if config_file.endswith(".toml"):
+            cache_dir = load_toml(Path(config_file)).get("tool", {}).get("mypy", {}).get("cache_dir")
+        else:
+            parser = configparser.ConfigParser()
+            try:
+                parser.read(config_file)
+            except configparser.Error:
+                pass
+            cache_dir = parser.get("mypy", "cache_dir", fallback=None)
+    cache_dir = os.path.expanduser(os.path.expandvars(cache_dir or MYPY_CACHE_DIR))
+    return None if cache_dir == os.devnull else Path(cache_dir)
+
+
+def get_shard_cache_dir(
+    cache_dir: Path,
+    shard: list[Path],
+) -> Path:
+    """
+    Function aimed at getting the Mypy cache folder of a shard, keyed by its packages rather than its position,
+    so that a shard reuses the cache of the same packages across runs whatever the grouping of the others.
+
+    :param cache_dir: configured Mypy cache folder
+    :type cache_dir: Path
+    :param shard: packages type checked by the shard
+    :type shard: list[Path]
+    :return: cache folder of the shard
+    :rtype: Path
+    """
+    key = hashlib.blake2b("\0".join(sorted(str(path.resolve()) for path in shard)).encode(), digest_size=8).hexdigest()
+    return cache_dir / MYPY_SHARDS_DIR / key
+
+
+def shard_tools(
+    tools: list[LintTool],
+    jobs: int,
+    source_dir: Path,
+) -> None:
+    """
+    Function aimed at splitting read-only tools into shards run by separate processes, rewriting their shards in place.
+    Pydoclint run via flake8 is split into balanced chunks of files (the in-process engine has its own worker processes),
+    Mypy into independent groups of top-level packages.
+    Ruff is not split as it is already multi-threaded, nor is the Mypy daemon as it is a single process.
+
+    :param tools: selected Linting tools
+    :type tools: list[LintTool]
+    :param jobs: maximum number of shards per tool
+    :type jobs: int
+    :param source_dir: sources root (i.e., default lint directory)
+    :type source_dir: Path
+    :return: None
+    :rtype: None
+    """
+    if jobs <= 1:
+        return
+
+    for tool in tools:
+        if tool.name == "pydoclint" and tool.engine is None:
+            files = [file for target in tool.targets for file in discover_python_files(Path(target))]
+            shards = split_files(files, jobs)
+            if len(shards) > 1:
+                tool.command += ["--jobs", "1"]  # parallelism comes from the shards
+                tool.shards = [[str(path) for path in shard] for shard in shards]
+        elif tool.name == "mypy" and tool.command[0] == "mypy":
+            packages = get_top_level_packages(tool.targets, source_dir)
+            if packages is not None and len(packages) > 1:
+                shards = balance(group_packages(packages), jobs)
+                cache_dir = get_mypy_cache_dir(tool.command)
+                if len(shards) > 1:
+                    # Each shard gets its own cache under the configured one (none when the cache is disabled)
+                    tool.shards = [[*(["--cache-dir", str(get_shard_cache_dir(cache_dir, shard))] if cache_dir is not None else []), *map(str, shard)] for shard in shards]
+
+
+def write_output_line(
+    spool: IO[str],
+    line: str,
+    stream: str,
+) -> None:
+    """
+    Function aimed at spooling an output line of a shard along with the name of the stream it comes from.
+
+    :param spool: spooled buffer of the shard output (see spooled_buffer)
+    :type spool: IO[str]
+    :param line: output line without trailing newline
+    :type line: str
+    :param stream: stream name among stdout and stderr
+    :type stream: str
+    :return: None
+    :rtype: None
+    """
+    spool.write(f"{stream}:{line}\n")
+
+
+def read_output_lines(
+    spool: IO[str],
+    start: int,
+    end: int,
+) -> Iterator[OutputLine]:
+    """
+    Function aimed at reading back the spooled output lines of a shard between two positions.
+
+    :param spool: spooled buffer of the shard output
+    :type spool: IO[str]
+    :param start: position of the first line
+    :type start: int
+    :param end: position following the last line
+    :type end: int
+    :yield: output line and the name of its stream
+    :ytype: OutputLine
+    """
+    spool.seek(start)
+    while spool.tell() < end:
+        stream, _, line = spool.readline().rstrip("\n").partition(":")
+        yield line, stream
+
+
+def merge_outputs(
+    outputs: list[IO[str]],
+) -> Iterator[OutputLine]:
+    """
+    Function aimed at merging the spooled outputs of the shards of a tool into a single report ordered by file and line.
+    Lines following a diagnostic (e.g., Mypy pretty snippets) stay attached to it, lines preceding any diagnostic are kept first,
+    and Mypy summary lines are combined into a single one.
+    Only the position of each diagnostic in its spool is kept in memory, its lines being read back when the report is written.
+
+    :param outputs: spooled output of each shard (see write_output_line)
+    :type outputs: list[IO[str]]
+    :yield: merged output line and the name of its stream
+    :ytype: OutputLine
+    """
+    preamble: list[list[int]] = []  # [output index, start, end] of each run of lines preceding any diagnostic
+    records: list[tuple[tuple[str, int, int], list[int]]] = []  # (path, line, column) -> [output index, start, end]
+    errors = files = checked = 0
+    has_summary = False
+
+    for index, output in enumerate(outputs):
+        output.seek(0)
+        current: list[int] | None = None
+        while True:
+            start = output.tell()
+            record = output.readline()
+            if not record:
+                break
+            end = output.tell()
+            line = record.rstrip("\n").partition(":")[2]
+            found, success = MYPY_FOUND_PATTERN.match(line), MYPY_SUCCESS_PATTERN.match(line)
+            if found is not None or success is not None:
+                has_summary = True
+                if found is not None:
+                    errors, files = errors + int(found.group("errors")), files + int(found.group("files"))
+                checked += int((found or success).group("checked"))  # type: ignore[union-attr]
+                current = None
+                continue
+            match = RECORD_PATTERN.match(line)
+            if match is not None:
+                current = [index, start, end]
+                records.append(((match.group("path"), int(match.group("line")), int(match.group("col") or 0)), current))
+            elif current is not None:
+                current[2] = end
+            elif preamble and preamble[-1][0] == index and preamble[-1][2] == start:
+                preamble[-1][2] = end
+            else:
+                preamble.append([index, start, end])
+
+    for index, start, end in [*preamble, *(span for _, span in sorted(records, key=lambda record: record[0]))]:
+        yield from read_output_lines(outputs[index], start, end)
+    if has_summary is True:
+        if errors > 0:
+            yield f"Found {errors} error{'s' if errors > 1 else ''} in {files} file{'s' if files > 1 else ''} (checked {checked} source files)", "stdout"
+        else:
+            yield f"Success: no issues found in {checked} source files", "stdout"
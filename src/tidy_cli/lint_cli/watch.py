@@ -0,0 +1,400 @@
+"""Module defining the incremental file-watching mode of the CLI Linting Commands Group."""
+
+# Import packages and modules
+import os
+import re
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+from rich.console import Console
+
+from tidy_cli.commons.process import stream_command
+
+from .cache import (
+    PYTHON_SUFFIXES,
+    SKIPPED_DIRS,
+    hash_bytes,
+)
+from .docstrings import (
+    check_paths,
+    get_plugin,
+)
+
+# Define literals
+POLL_INTERVAL = 0.25  # seconds between two scans of the watched folder when polling
+DIAGNOSTIC_PATTERN = re.compile(r"^(?P<path>.+?):(?P<location>\d+(?::\d+)?): (?P<message>.*)$")  # path:line[:col]: message
+
+
+def normalize_path(
+    path: str | Path,
+) -> str:
+    """
+    Function aimed at normalizing a path, so that paths reported by the tools match the watched ones.
+
+    :param path: absolute or relative path
+    :type path: str | Path
+    :return: path relative to the current working directory (or absolute if on another drive)
+    :rtype: str
+    """
+    try:
+        return os.path.normpath(os.path.relpath(path))
+    except ValueError:
+        return os.path.normpath(os.path.abspath(path))
+
+
+def is_watched(
+    path: Path,
+    root: Path,
+) -> bool:
+    """
+    Function aimed at checking whether a path is a Python file to be linted (i.e., not in hidden, cache or virtual environment folders).
+
+    :param path: changed path
+    :type path: Path
+    :param root: watched folder
+    :type root: Path
+    :return: True if the path has to be linted and False otherwise
+    :rtype: bool
+    """
+    if path.suffix not in PYTHON_SUFFIXES:
+        return False
+    try:
+        parts = path.resolve().relative_to(root.resolve()).parts[:-1]
+    except ValueError:
+        return False
+    return not any(part.startswith(".") or part in SKIPPED_DIRS for part in parts)
+
+
+def scan_files(
+    root: Path,
+) -> dict[str, tuple[int, int]]:
+    """
+    Function aimed at taking a snapshot (modification time and size) of the Python files under the watched folder.
+
+    :param root: watched folder (or single file)
+    :type root: Path
+    :return: modification time in nanoseconds and size of each Python file
+    :rtype: dict[str, tuple[int, int]]
+    """
+    if root.is_file():
+        stat = root.stat()
+        return {normalize_path(root): (stat.st_mtime_ns, stat.st_size)}
+
+    snapshot: dict[str, tuple[int, int]] = {}
+    folders = [str(root)]
+    while folders:
+        try:
+            entries = list(os.scandir(folders.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(".") and entry.name not in SKIPPED_DIRS:
+                    folders.append(entry.path)
+            elif entry.name.endswith(PYTHON_SUFFIXES):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[normalize_path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def poll_changes(
+    root: Path,
+    debounce: float,
+    interval: float = POLL_INTERVAL,
+) -> Iterator[set[Path]]:
+    """
+    Function aimed at watching a folder by periodically scanning it, yielding the Python files changed in each burst of saves.
+    A burst ends once a scan finds no further change after the debounce delay.
+
+    :param root: watched folder
+    :type root: Path
+    :param debounce: seconds without changes after which a burst of changes is yielded
+    :type debounce: float
+    :param interval: seconds between two scans, defaults to POLL_INTERVAL
+    :type interval: float
+    :yield: set of changed (created, modified or deleted) files
+    :ytype: set[Path]
+    """
+    previous = scan_files(root)
+    while True:
+        time.sleep(interval)
+        changed: set[str] = set()
+        current = scan_files(root)
+        while current != previous:
+            changed |= {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+            previous = current
+            time.sleep(debounce)
+            current = scan_files(root)
+        if changed:
+            yield {Path(path) for path in changed}
+
+
+def watch_changes(
+    root: Path,
+    debounce: float,
+    force_polling: bool = False,
+) -> Iterator[set[Path]]:
+    """
+    Function aimed at watching a folder, yielding the Python files changed in each burst of saves.
+    Native file system events (e.g., inotify) are used via watchfiles when installed, polling otherwise.
+
+    :param root: watched folder
+    :type root: Path
+    :param debounce: seconds without changes after which a burst of changes is yielded
+    :type debounce: float
+    :param force_polling: whether to poll even when native events are available, defaults to False
+    :type force_polling: bool
+    :yield: set of changed (created, modified or deleted) files
+    :ytype: set[Path]
+    """
+    try:
+        from watchfiles import watch
+    except ImportError:
+        force_polling = True
+
+    if force_polling is True:
+        yield from poll_changes(root, debounce)
+    else:
+        for changes in watch(root, debounce=int(debounce * 1000), step=20, raise_interrupt=False):
+            changed = {Path(normalize_path(path)) for _, path in changes}
+            changed = {path for path in changed if is_watched(path, root)}
+            if changed:
+                yield changed
+
+
+def parse_diagnostics(
+    lines: list[str],
+) -> dict[str, list[str]]:
+    """
+    Function aimed at grouping tool output lines formatted as 'path:line:col: message' by file.
+    Other lines (e.g., summaries) are dropped.
+
+    :param lines: tool output lines
+    :type lines: list[str]
+    :return: 'line:col: message' entries of each file
+    :rtype: dict[str, list[str]]
+    """
+    diagnostics: dict[str, list[str]] = {}
+    for line in lines:
+        match = DIAGNOSTIC_PATTERN.match(line)
+        if match is not None and match.group("path").endswith(PYTHON_SUFFIXES):
+            diagnostics.setdefault(normalize_path(match.group("path")), []).append(f"{match.group('location')}: {match.group('message')}")
+    return diagnostics
+
+
+def collect_output(
+    command: list[str],
+    label: str,
+) -> tuple[int, list[str]]:
+    """
+    Function aimed at running a tool and collecting its output lines.
+
+    :param command: terminal command to be executed
+    :type command: list[str]
+    :param label: label of the tool (e.g., Ruff linting)
+    :type label: str
+    :return: return code and output lines (both stdout and stderr) of the tool
+    :rtype: tuple[int, list[str]]
+    """
+    lines: list[str] = []
+    returncode = stream_command(command, lambda line, _: lines.append(line), label=label)
+    return returncode, lines
+
+
+def collect_docstrings_output(
+    targets: list[str],
+    config_path: str,
+) -> tuple[int, list[str]]:
+    """
+    Function aimed at running the in-process Pydoclint engine and collecting its output lines.
+
+    :param targets: files or folders to be checked
+    :type targets: list[str]
+    :param config_path: path to the Linting config file (e.g., pyproject.toml)
+    :type config_path: str
+    :return: return code and output lines (flake8 format) of the engine
+    :rtype: tuple[int, list[str]]
+    """
+    lines: list[str] = []
+    returncode = check_paths(targets, lambda line, _: lines.append(line), config_path)
+    return returncode, lines
+
+
+class WatchBoard:
+    """
+    Class aimed at storing the latest Linting issues of every watched file, so that each run only refreshes the files it linted.
+
+    :param root: watched folder
+    :type root: Path
+    :param config_path: path to the Linting config file used by the tools
+    :type config_path: str
+    :param fix: whether Ruff auto-fixes issues when possible
+    :type fix: bool
+    :param mypy_command: Mypy (or dmypy) command type checking the packages of the changed files, None to skip Mypy
+    :type mypy_command: list[str] | None
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        config_path: str,
+        fix: bool = False,
+        mypy_command: list[str] | None = None,
+    ) -> None:
+        # Issues are stored per file and per tool, Mypy output per type checked target
+        self.root = root
+        self.config_path = config_path
+        self.fix = fix
+        self.mypy_command = mypy_command
+        self.issues: dict[str, dict[str, list[str]]] = {}  # path -> tool -> 'line:col: message' entries
+        self.mypy_output: dict[tuple[str, ...], list[str]] = {}  # type checked targets -> output lines of a failed type check
+        self.errors: dict[str, list[str]] = {}  # tool -> output of a crashed run (i.e., no diagnostics parsed)
+        self.hashes: dict[str, str] = {}  # content hash of each file when last linted
+        self.last_run = ""
+
+    def changed_files(
+        self,
+        paths: set[Path],
+    ) -> tuple[list[Path], list[Path]]:
+        """
+        Method aimed at filtering the changed paths whose content actually changed since they were last linted.
+        It drops no-op saves (e.g., touch) and settles Ruff auto-fixes after a single extra run.
+
+        :param paths: paths reported as changed
+        :type paths: set[Path]
+        :return: existing files to be linted and deleted files
+        :rtype: tuple[list[Path], list[Path]]
+        """
+        to_lint: list[Path] = []
+        deleted: list[Path] = []
+        for path in sorted(paths):
+            key = normalize_path(path)
+            try:
+                content_hash = hash_bytes(path.read_bytes())
+            except OSError:
+                if path.exists() is False:
+                    deleted.append(path)
+                    self.hashes.pop(key, None)
+                continue
+            if self.hashes.get(key) != content_hash:
+                self.hashes[key] = content_hash
+                to_lint.append(path)
+        return to_lint, deleted
+
+    def lint(
+        self,
+        files: list[Path],
+        mypy_targets: list[Path] | None = None,
+        targets: list[Path] | None = None,
+    ) -> None:
+        """
+        Method aimed at running the affected tools on the given files only and refreshing their issues.
+        Ruff and Pydoclint run concurrently, unless Ruff auto-fixes (i.e., rewrites) the files: the rewritten content
+        is then the one linted by the other tools and recorded as linted, so that the saves of the fix do not trigger another run.
+
+        :param files: files to be linted
+        :type files: list[Path]
+        :param mypy_targets: packages to be type checked, defaults to None (i.e., no type checking)
+        :type mypy_targets: list[Path] | None
+        :param targets: paths passed to the tools instead of the files (e.g., the watched folder), defaults to None (i.e., the files)
+        :type targets: list[Path] | None
+        :return: None
+        :rtype: None
+        """
+        started_at = time.perf_counter()
+        targets = files if targets is None else targets
+        arguments = [str(target) for target in targets]
+        ruff_command = ["ruff", "check", "--config", self.config_path, "--force-exclude", "--output-format", "concise", "--no-cache"]
+        if self.fix is True:
+            ruff_command.append("--fix")
+        runs: dict[str, Callable[[], tuple[int, list[str]]]] = {"ruff": partial(collect_output, [*ruff_command, *arguments], "Ruff linting")}
+        if get_plugin() is not None:
+            runs["pydoclint"] = partial(collect_docstrings_output, arguments, self.config_path)
+        else:
+            runs["pydoclint"] = partial(collect_output, ["flake8", "--toml-config", self.config_path, "--select", "DOC", *arguments], "Pydoclint")
+        if self.mypy_command is not None and mypy_targets:
+            runs["mypy"] = partial(collect_output, [*self.mypy_command, *[str(target) for target in mypy_targets]], "Mypy type checking")
+
+        outputs = {"ruff": runs.pop("ruff")()} if self.fix is True else {}
+        if self.fix is True:
+            # Files rewritten by the fix are linted as rewritten, hence their saves are not changes to lint again
+            self.changed_files(set(files))
+        with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+            outputs |= dict(zip(runs, executor.map(lambda run: run(), runs.values()), strict=True))
+
+        for tool, (returncode, lines) in outputs.items():
+            if tool == "mypy":
+                checked = tuple(normalize_path(target) for target in mypy_targets or [])
+                self.mypy_output = {key: output for key, output in self.mypy_output.items() if not set(key) & set(checked)}
+                if returncode != 0:
+                    self.mypy_output[checked] = lines
+                continue
+            diagnostics = parse_diagnostics(lines)
+            self.errors.pop(tool, None)
+            if returncode != 0 and not diagnostics:
+                self.errors[tool] = lines
+            for file in files:
+                self.issues.setdefault(normalize_path(file), {})[tool] = diagnostics.get(normalize_path(file), [])
+
+        self.issues = {path: tools for path, tools in self.issues.items() if any(tools.values())}
+        self.last_run = f"last run at {datetime.now():%H:%M:%S} on {len(files)} file(s) in {time.perf_counter() - started_at:.2f}s"
+
+    def forget(
+        self,
+        files: list[Path],
+    ) -> None:
+        """
+        Method aimed at dropping the issues of deleted files.
+
+        :param files: deleted files
+        :type files: list[Path]
+        :return: None
+        :rtype: None
+        """
+        for file in files:
+            self.issues.pop(normalize_path(file), None)
+
+    def render(
+        self,
+        console: Console,
+    ) -> None:
+        """
+        Method aimed at printing the current issues of every watched file, replacing the previous render on terminals.
+
+        :param console: Console where to print the issues
+        :type console: Console
+        :return: None
+        :rtype: None
+        """
+        if console.is_terminal is True:
+            console.clear()
+        console.print(f"👀 Watching [bold]{self.root}[/bold] ({self.last_run}), press [bold]Ctrl+C[/bold] to stop", style="white")
+        console.print("")
+
+        issues_count = sum(len(entries) for tools in self.issues.values() for entries in tools.values())
+        for tool, lines in self.errors.items():
+            console.print(f"❌ {tool} failed", style="red")
+            for line in lines:
+                console.print(line, style="red", markup=False, highlight=False)
+        for path, tools in sorted(self.issues.items()):
+            console.print(path, style="bold", markup=False, highlight=False)
+            for tool, entries in tools.items():
+                for entry in entries:
+                    console.print(f"  [{tool}] {entry}", style="white", markup=False, highlight=False)
+        for target, lines in self.mypy_output.items():
+            console.print(f"mypy: {', '.join(target)}", style="bold", markup=False, highlight=False)
+            for line in lines:
+                console.print(line, style="white", markup=False, highlight=False)
+
+        console.print("")
+        if issues_count == 0 and not self.errors and not self.mypy_output:
+            console.print("✅ No issues found", style="green")
+        else:
+            console.print(f"⚠️ {issues_count} issue(s) in {len(self.issues)} file(s)", style="yellow")
@@ -5,38 +5,76 @@ The structure of the CLI Progam is modular, hence it allows any new Commands Gro
 separate Typer app with its command name and subcommands.
 If any of the Commands Group need to be removed just unlink it to Typer main app, vice versa create a
 new folder with Commands Group with their Typer app and link it to main Typer app to get new ones.
+Commands Groups are linked by import path in COMMAND_GROUPS, so that each one is imported (and reads its settings) only when invoked.
 """
 
 # Import packages and modules
+from pathlib import Path
+from typing import Annotated
+
 import typer
-from rich.console import Console
 
+from .commons.console import (
+    console,
+    is_headless,
+    set_headless,
+)
 from .helpers import (
     get_version,
     show_ascii_art,
 )
-from .lint_cli import (
-    lint_app,
-    lint_init,
-)
-from .pytest_cli import (
-    pytest_app,
-    pytest_init,
+from .lazy_group import (
+    LazyCommandGroup,
+    LazyTyperGroup,
 )
 
-console = Console()
-
 # Main CLI description (runs as no-command callback)
 DESC = """
     🛰️  [bold]CLI[/bold] tool for [italic]development tasks[/italic]: [bold]linting[/bold] and [bold]unit-testing[/bold].
 
     ▪ [code]tidy-cli lint[/code] allows to run linters battery on entire [italic]default[/italic] folder or specific path files 🧼
     ▪ [code]tidy-cli pytest[/code] allows to run pytest on entire [italic]tests[/italic] folder or specific path with logs and with any Pytest extra options 🧪
+    ▪ [code]tidy-cli cache[/code] allows to list and prune bytecode, tools and Tidy CLI caches 🗄️
+    """
+
+# Commands Groups, imported only when invoked (help is the one listed in the main help)
+COMMAND_GROUPS = {
+    "lint": LazyCommandGroup(
+        "tidy_cli.lint_cli.cli:lint_app",
+        help="🧼 Run [bold]Linters[/bold] on [bold]entire[/bold] default folder ([italic]'src'[/italic] or what's defined at [italic]initialization[/italic]) "
+        "or [bold]specific path[/bold] if provided with [bold]interactive mode[/bold] if chosen.",
+        rich_help_panel="🧼 [bold]Linting[/bold] command",
+    ),
+    "pytest": LazyCommandGroup(
+        "tidy_cli.pytest_cli.cli:pytest_app",
+        help="🧪 Run [bold]Pytest[/bold] on [bold]tests[/bold] folder or provided [bold]path[/bold] (with [italic]logs[/italic] or any Pytest [italic]option[/italic]).",
+        rich_help_panel="🧪[bold]Pytest[/bold] command",
+    ),
+    "cache": LazyCommandGroup(
+        "tidy_cli.cache_cli.cli:cache_app",
+        help="🗄️  [bold]List[/bold] and [bold]prune[/bold] bytecode, tools ([italic]Pytest, Mypy, Ruff, Coverage[/italic]) and Tidy CLI caches.",
+        rich_help_panel="🗄️ [bold]Cache[/bold] command",
+    ),
+}
+
+
+class TidyGroup(LazyTyperGroup):
+    """
+    Class aimed at loading the Commands Groups of the main CLI program lazily.
+
+    .. attribute :: lazy_groups
+        :type: dict[str, LazyCommandGroup]
+
+        Commands Groups of COMMAND_GROUPS
     """
 
+    lazy_groups: dict[str, LazyCommandGroup] = COMMAND_GROUPS
+
+
 # Define main CLI program
 app = typer.Typer(
     name="tidy-cli",
+    cls=TidyGroup,
     help=DESC,
     add_completion=True,
     rich_markup_mode="rich",
@@ -48,15 +86,28 @@ app = typer.Typer(
 @app.callback(invoke_without_command=True)
 def callback(
     ctx: typer.Context,
+    headless: Annotated[
+        bool | None,
+        typer.Option(
+            "--headless/--no-headless",
+            help="🤖 Run [bold]headless[/bold]: no animations nor prompts and plain output (by default when the output is not a terminal, "
+            "in [italic]CI[/italic] or with [italic]TIDY_CLI_HEADLESS=1[/italic]).",
+            show_default="auto",
+        ),
+    ] = None,
 ) -> None:
     """
-    Callback function aimed at printing general CLI description when no commands are provided.
+    Callback function aimed at setting the headless mode, and printing general CLI description when no commands are provided.
 
     :param ctx: typer context object (to retrieve CLI information)
     :type ctx: typer.Context
+    :param headless: whether the CLI runs headless, None to auto-detect it
+    :type headless: bool | None
     :return: None
     :rtype: None
     """
+    if headless is not None:
+        set_headless(headless)
     if ctx.invoked_subcommand is None:
         console.print(DESC)
         console.print("🔍 run [code]tidy-cli --help[/code] to know more!")
@@ -98,25 +149,56 @@ def hello() -> None:
     help="🎛️  Initialize CLI [bold]commands groups[/bold] settings.",
     rich_help_panel="🎚️ Plain commands",
 )
-def init() -> None:
+def init(
+    pytest_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--pytest-dir",
+            help="🧪 Set the Pytest [italic]default directory[/italic] without prompting",
+        ),
+    ] = None,
+    pytest_pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pytest-pyproject-path",
+            help="🧪 Set the Pytest [italic]pyproject.toml[/italic] path (relative to its [italic]default directory[/italic]) without prompting",
+        ),
+    ] = None,
+    lint_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--lint-dir",
+            help="🧼 Set the Lint [italic]default directory[/italic] without prompting",
+        ),
+    ] = None,
+    lint_pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--lint-pyproject-path",
+            help="🧼 Set the Lint [italic]pyproject.toml[/italic] path (relative to [italic]current working directory[/italic]) without prompting",
+        ),
+    ] = None,
+) -> None:
     """
     Function aimed at initializing CLI sub-commands groups by calling each group initializer.
     The setting are saved under the local folder in the cli_settings.json file.
-
+    In headless mode nothing is prompted nor animated, settings not given as options being taken from their environment variable or current value.
+
+    :param pytest_dir: Pytest default directory, prompted for if not given
+    :type pytest_dir: Path | None
+    :param pytest_pyproject_path: Pytest pyproject.toml path relative to its default directory, prompted for if not given
+    :type pytest_pyproject_path: str | None
+    :param lint_dir: Lint default directory, prompted for if not given
+    :type lint_dir: Path | None
+    :param lint_pyproject_path: Lint pyproject.toml path relative to current working directory, prompted for if not given
+    :type lint_pyproject_path: str | None
     :return: None
     :rtype: None
     """
-    pytest_init()
-    lint_init()
-    show_ascii_art()
-
+    from .lint_cli import lint_init
+    from .pytest_cli import pytest_init
 
-# Add command groups
-app.add_typer(
-    lint_app,
-    rich_help_panel="🧼 [bold]Linting[/bold] command",
-)
-app.add_typer(
-    pytest_app,
-    rich_help_panel="🧪[bold]Pytest[/bold] command",
-)
+    pytest_init(pytest_dir, pytest_pyproject_path)
+    lint_init(lint_dir, lint_pyproject_path)
+    if is_headless() is False:
+        show_ascii_art()
@@ -2,21 +2,99 @@
 
 # Import packages and modules
 import os
-import subprocess
+import shutil
+import tempfile
+import time
 from pathlib import Path
 from typing import Annotated
 
+import click
+import pytest
 import typer
-from rich.console import Console
 
+from tidy_cli.cache_cli.helpers import (
+    format_age,
+    get_prune_budget,
+)
+from tidy_cli.commons.console import console
+from tidy_cli.commons.git import (
+    GitError,
+    get_changed_lines,
+    get_repo_root,
+)
+from tidy_cli.commons.process import run_profiled
+from tidy_cli.commons.profiling import (
+    finish_profiling,
+    record_call,
+    start_profiling,
+)
+from tidy_cli.commons.settings import SETTINGS_FILE
+
+from .coverage_reports import (
+    COVERAGE_DATA_FILE,
+    get_pytest_coverage_formats,
+    parse_coverage_formats,
+    write_coverage_reports,
+)
+from .durations import (
+    DURATIONS_FILE,
+    get_durations_mode,
+    load_durations,
+    load_reports,
+    record_durations,
+)
 from .helpers import (
-    cleanup_test_cache,
+    CLEANUP_POLICIES,
+    COVERAGE_CORES,
+    cleanup_caches,
+    get_cleanup_skipped_dirs,
+    get_pytest_cleanup_policy,
     get_pytest_config_path,
+    get_pytest_coverage_core,
     get_pytest_default_path,
+    get_pytest_server_preload,
+    get_pytest_slow_ratio,
+    get_pytest_slowest,
+    get_pytest_warm,
     init_settings,
+    is_branch_coverage,
+    resolve_coverage_core,
+)
+from .impact import (
+    IMPACT_FILE,
+    build_impact_map,
+    load_impact_map,
+    save_impact_map,
+    select_affected_tests,
+)
+from .parallel import run_pytest
+from .plugin import (
+    CONTEXTS_OPTION,
+    DURATIONS_MODE_OPTION,
+    DURATIONS_OPTION,
+    PLUGIN,
+    REPORT_DURATIONS_OPTION,
+    SHARD_OPTION,
+    parse_split,
+)
+from .results import (
+    load_results,
+    print_results_summary,
+    write_results_file,
+)
+from .server import (
+    get_server_status,
+    get_socket_path,
+    is_warm_supported,
+    start_server,
+    stop_server,
+)
+from .slow_tests import (
+    compare_durations,
+    find_regressions,
+    print_regressions,
+    print_slow_tests,
 )
-
-console = Console()
 
 # Define Typer Pytest program (i.e., commands group)
 pytest_app = typer.Typer(
@@ -26,6 +104,15 @@ pytest_app = typer.Typer(
     rich_markup_mode="rich",
 )
 
+# Define Typer warm Pytest server program (i.e., commands sub-group of Pytest one)
+server_app = typer.Typer(
+    name="server",
+    help="🔥 Manage the [bold]warm Pytest server[/bold] (Pytest and project modules preloaded) used by [code]pytest run --warm[/code].",
+    add_completion=True,
+    rich_markup_mode="rich",
+)
+pytest_app.add_typer(server_app)
+
 
 @pytest_app.command(
     "run",
@@ -39,7 +126,7 @@ def run(
             help="🎞️  Specific test [bold]path[/bold] to run (relative to [italic]'default'[/italic]), "
             "otherwise entire [bold]default[/bold] folder is tested (i.e., [italic]'src'[/italic] or what's defined at initialisation).",
             callback=lambda path: "" if path is None else path,
-            show_default=str(get_pytest_default_path()),
+            show_default="'pytest_default_path' setting or src",
         ),
     ] = None,
     extra_options: Annotated[
@@ -74,6 +161,144 @@ def run(
             help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]default directory[/italic])",
         ),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="🧵 Split the collected tests across [bold]N worker[/bold] processes (by test module), combining their [italic]coverage[/italic] data.",
+            show_default="1",
+        ),
+    ] = None,
+    shard: Annotated[
+        str | None,
+        typer.Option(
+            "--shard",
+            help="🧩 Run only the [bold]i-th[/bold] out of [bold]n[/bold] shards of the collected tests, given as [italic]i/n[/italic] (e.g., 2/4 in a CI matrix), "
+            "balanced by the [italic]recorded durations[/italic] of the tests.",
+        ),
+    ] = None,
+    record_impact: Annotated[
+        bool,
+        typer.Option(
+            "--record-impact",
+            help="🗺️  Record which tests run each source line ([italic]coverage contexts[/italic]) into the [bold]test impact map[/bold] used by --affected. "
+            "It applies to running all tests only.",
+            show_default="False",
+        ),
+    ] = False,
+    affected: Annotated[
+        bool,
+        typer.Option(
+            "--affected",
+            help="🎯 Run only the tests [bold]affected[/bold] by lines changed against HEAD (per the recorded [italic]test impact map[/italic]), "
+            "plus changed test files. It applies to running all tests only.",
+            show_default="False",
+        ),
+    ] = False,
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="🔀 Run only the tests [bold]affected[/bold] by lines changed since the given [italic]git ref[/italic] (e.g., origin/main), implies --affected.",
+        ),
+    ] = None,
+    cleanup: Annotated[
+        str | None,
+        typer.Option(
+            "--cleanup",
+            click_type=click.Choice(CLEANUP_POLICIES),
+            help="🧹 Post-run [bold]cleanup policy[/bold]: [italic]never[/italic] keeps warm caches, [italic]bytecode[/italic] removes __pycache__ folders, "
+            "[italic]prune[/italic] removes caches beyond the [italic]cache budget[/italic] settings.",
+            show_default="'pytest_cleanup_policy' setting or never",
+        ),
+    ] = None,
+    coverage_core: Annotated[
+        str | None,
+        typer.Option(
+            "--coverage-core",
+            click_type=click.Choice(COVERAGE_CORES),
+            help="📏 Coverage [bold]measurement core[/bold]: [italic]auto[/italic] uses the low overhead [italic]sysmon[/italic] (sys.monitoring) on Python 3.12+ "
+            "when it can measure the run, [italic]ctrace[/italic] (C tracer) otherwise.",
+            show_default="'pytest_coverage_core' setting or auto",
+        ),
+    ] = None,
+    diff_coverage: Annotated[
+        str | None,
+        typer.Option(
+            "--diff-coverage",
+            help="📐 Report coverage of the [bold]lines changed[/bold] since the given [italic]git ref[/italic] (e.g., origin/main, HEAD for uncommitted changes) "
+            "instead of the whole tree. It applies to running all tests only.",
+        ),
+    ] = None,
+    coverage_format: Annotated[
+        str | None,
+        typer.Option(
+            "--coverage-format",
+            help="📊 Comma separated coverage [bold]report formats[/bold] among [italic]term, xml, json, html[/italic] (e.g., term,xml), "
+            "written in one pass next to the stored [italic]coverage data[/italic] under local/coverage.",
+            show_default="'pytest_coverage_formats' setting or term",
+        ),
+    ] = None,
+    slowest: Annotated[
+        int | None,
+        typer.Option(
+            "--slowest",
+            min=0,
+            help="🐢 List the [bold]N slowest[/bold] tests with their [italic]baseline[/italic] (median of their latest recorded durations), 0 to list none.",
+            show_default="'pytest_slowest' setting or 5",
+        ),
+    ] = None,
+    slow_ratio: Annotated[
+        float | None,
+        typer.Option(
+            "--slow-ratio",
+            min=1,
+            help="🐌 Warn about tests [bold]slower[/bold] than the given ratio times their [italic]baseline[/italic] (e.g., 2 for twice as slow).",
+            show_default="'pytest_slow_ratio' setting or 2",
+        ),
+    ] = None,
+    fail_on_slow: Annotated[
+        bool,
+        typer.Option(
+            "--fail-on-slow",
+            help="🚨 [bold]Fail[/bold] the run when tests are slower than --slow-ratio times their [italic]baseline[/italic] instead of warning.",
+            show_default="False",
+        ),
+    ] = False,
+    results_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--results-file",
+            help="🧾 Write the [bold]test results[/bold] (outcome, duration and failure message of each test, counts by outcome) "
+            "as [italic]JSON[/italic] to the given path (relative to [italic]current directory[/italic]).",
+        ),
+    ] = None,
+    warm: Annotated[
+        bool,
+        typer.Option(
+            "--warm",
+            help="🔥 Fork targeted runs (path or --affected) out of a [bold]warm Pytest server[/bold] with Pytest and [italic]'pytest_server_preload'[/italic] modules "
+            "already imported, restarted when their sources change (also enabled by [italic]pytest_warm[/italic] setting).",
+            show_default="False",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="⏱️  Print a [bold]timing and resource[/bold] report (wall time, CPU time, peak RSS) of every spawned tool.",
+            show_default="False",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-output",
+            help="📝 Write the [bold]profile[/bold] report as [italic]JSON[/italic] to the given path (relative to [italic]current directory[/italic]), implies --profile.",
+        ),
+    ] = None,
 ) -> None:
     """
     Entry point function to run Pytests on the entire default folder, 'src' or wath's defined in the settings, or a specific path.
@@ -89,6 +314,38 @@ def run(
     :type default_dir: Path | None
     :param pyproject_path: pyproject.toml path relative to default pytest path that overwrites the one set at init time
     :type pyproject_path: str | None
+    :param workers: number of worker processes the tests are split across, defaults to 1 (i.e., a single Pytest process)
+    :type workers: int | None
+    :param shard: shard of the collected tests to be run, as index out of count (e.g., 2/4)
+    :type shard: str | None
+    :param record_impact: whether to record the test impact map while running all tests, defaults to False
+    :type record_impact: bool
+    :param affected: whether to run only the tests affected by changes against HEAD, defaults to False
+    :type affected: bool
+    :param since: git ref to compute changed lines against (i.e., merge base with HEAD), implies affected
+    :type since: str | None
+    :param cleanup: post-run cleanup policy among never, bytecode and prune, defaults to the one from settings
+    :type cleanup: str | None
+    :param coverage_core: Coverage measurement core among auto, sysmon, ctrace and pytrace, defaults to the one from settings
+    :type coverage_core: str | None
+    :param diff_coverage: git ref to report the coverage of changed lines against (i.e., merge base with HEAD), instead of the whole tree
+    :type diff_coverage: str | None
+    :param coverage_format: comma separated coverage report formats among term, xml, json and html, defaults to the ones from settings
+    :type coverage_format: str | None
+    :param slowest: number of slowest tests to be listed, defaults to the one from settings
+    :type slowest: int | None
+    :param slow_ratio: ratio to their baseline beyond which tests are flagged as slower, defaults to the one from settings
+    :type slow_ratio: float | None
+    :param fail_on_slow: whether tests slower than allowed fail the run, defaults to False
+    :type fail_on_slow: bool
+    :param results_file: path of the JSON file where to write the test results
+    :type results_file: Path | None
+    :param warm: whether to fork targeted runs out of the warm Pytest server, defaults to False (or pytest_warm setting)
+    :type warm: bool
+    :param profile: whether to print the timing and resource report of every spawned tool, defaults to False
+    :type profile: bool
+    :param profile_output: path of the JSON file where to write the profile report, implies profile
+    :type profile_output: Path | None
     :return: None
     :rtype: None
     """
@@ -109,9 +366,76 @@ def run(
     if (path) and (test_path.exists() is False):
         console.print(f"❌ Test path not found: [bold]{test_path}[/bold]", style="red")
         raise typer.Exit(1)
+    if shard is not None:
+        try:
+            parse_split(shard, "--shard")
+        except pytest.UsageError as e:
+            console.print(f"❌ Invalid shard: [bold]{e}[/bold]", style="red")
+            raise typer.Exit(1)  # noqa: B904
+    if profile is True or profile_output is not None:
+        # Resolve the report path before moving to the default directory
+        profile_output = None if profile_output is None else profile_output.resolve()
+        start_profiling()
+    # Resolve the post-run cleanup policy (with its settings) before moving to the default directory
+    cleanup = get_pytest_cleanup_policy() if cleanup is None else cleanup
+    skipped_dirs = get_cleanup_skipped_dirs()
+    prune_budget = get_prune_budget() if cleanup == "prune" else (None, None)
+    data_dir = SETTINGS_FILE.parent.resolve()
+    # Resolve the modules preloaded by the warm server (None when running in a new process) before moving to the default directory
+    preload = get_pytest_server_preload() if warm is True or get_pytest_warm() is True else None
+    # Resolve the results file path before moving to the default directory
+    results_file = None if results_file is None else results_file.resolve()
+    # Resolve the slow tests report settings before moving to the default directory
+    slowest = get_pytest_slowest() if slowest is None else slowest
+    slow_ratio = get_pytest_slow_ratio() if slow_ratio is None else slow_ratio
+    regressions = []
+    # Resolve the test impact map and durations paths before moving to the default directory
+    impact_file = IMPACT_FILE.resolve()
+    durations_file = DURATIONS_FILE.resolve()
+    # The plugin records each test duration into a report folder and, when sharding, keeps the tests of the shard
+    reports_dir = Path(tempfile.mkdtemp(prefix="tidy-cli-"))
+    plugin_options = ["-p", PLUGIN, f"{DURATIONS_OPTION}={durations_file}", f"{REPORT_DURATIONS_OPTION}={reports_dir}"]
+    if shard is not None:
+        plugin_options.append(f"{SHARD_OPTION}={shard}")
+    try:
+        coverage_formats = parse_coverage_formats(get_pytest_coverage_formats() if coverage_format is None else coverage_format)
+    except ValueError as e:
+        console.print(f"❌ Invalid coverage format: [bold]{e}[/bold]", style="red")
+        raise typer.Exit(1)  # noqa: B904
+    # Coverage data is kept next to the settings, to render reports later on without running tests again
+    coverage_core = get_pytest_coverage_core() if coverage_core is None else coverage_core
+    data_file = COVERAGE_DATA_FILE.resolve()
+    original_env = {name: os.environ.get(name) for name in ("COVERAGE_CORE", "COVERAGE_FILE")}
+    # Changed lines and the test impact map are relative to the repository root (the current directory outside git),
+    # so that changes outside the default directory (e.g., sources next to tests) select tests too
+    repo_root = original_cwd
+    if affected is True or since is not None or record_impact is True:
+        try:
+            repo_root = get_repo_root()
+        except GitError:
+            pass
     os.chdir(default_dir)  # type: ignore
 
     try:
+        # Impact mode: run only the tests affected by the lines changed since the base ref
+        returncode = 0
+        affected_tests = None
+        if (affected is True or since is not None) and not path:
+            impact_map = load_impact_map(impact_file)
+            if impact_map is None:
+                console.print("⚠️ No test impact map found (record it with [bold]--record-impact[/bold]), running [bold]all[/bold] tests", style="yellow")
+            else:
+                affected_tests = select_affected_tests(impact_map, get_changed_lines(since), repo_root)
+
+        # Durations are balanced, compared and recorded per run mode, as Coverage and the warm server change how long tests take
+        pyproject_path = get_pytest_config_path() if pyproject_path is None else pyproject_path
+        if path or affected_tests is not None:
+            durations_mode = get_durations_mode(warm=preload is not None and (workers is None or workers <= 1) and is_warm_supported())
+        else:
+            coverage_core = resolve_coverage_core(coverage_core, is_branch_coverage(pyproject_path), record_impact)
+            durations_mode = get_durations_mode(coverage_core)
+        plugin_options.append(f"{DURATIONS_MODE_OPTION}={durations_mode}")
+
         if path:
             (
                 console.print(f"🧪 Running tests for: [bold]{test_path}[/bold]", style="white")
@@ -127,38 +451,172 @@ def run(
             else:
                 console.print("🔇 [bold]Not showing[/bold] logs...", style="white")
             #  Run test with extra options if provided
-            result = subprocess.run(cmd + extra_options) if extra_options else subprocess.run(cmd)
-            if result.returncode == 0:
+            returncode = run_pytest(cmd + plugin_options + extra_options, "Pytest", workers, preload)
+            if returncode == 0:
                 console.print("✅ Tests completed [bold]successfully[/bold]", style="green")
             else:
                 console.print("❌ Some tests [bold]failed[/bold]", style="red")
+        elif affected_tests is not None:
+            if affected_tests:
+                console.print(
+                    f"🎯 Running [bold]{len(affected_tests)}[/bold] test target(s) affected by changes since [bold]{since or 'HEAD'}[/bold]",
+                    style="white",
+                )
+                # Targets are passed via a Pytest arguments file, as they can exceed the command line length limit
+                with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as args_file:
+                    args_file.write("\n".join(affected_tests))
+                try:
+                    returncode = run_pytest(["python", "-m", "pytest", f"@{args_file.name}", *plugin_options, *extra_options], "Pytest (affected)", workers, preload)
+                finally:
+                    Path(args_file.name).unlink(missing_ok=True)
+                if returncode == 0:
+                    console.print("✅ Tests completed [bold]successfully[/bold]", style="green")
+                else:
+                    console.print("❌ Some tests [bold]failed[/bold]", style="red")
+            else:
+                console.print(f"✨ No tests affected by changes since [bold]{since or 'HEAD'}[/bold]", style="green")
         else:
             console.print(f"🧪 Running [bold]all[/bold] tests with [bold]coverage[/bold] for: [bold]{default_dir}[/bold]", style="white")
-            pyproject_path = get_pytest_config_path() if pyproject_path is None else pyproject_path
-            cmd = ["coverage", "run", f"--rcfile={pyproject_path}", "-m", "pytest"]
-            result = subprocess.run(cmd + extra_options) if extra_options else subprocess.run(cmd)
+            if warm is True:
+                console.print("⚠️ The warm Pytest server applies to targeted runs (path or --affected) only, running in a new process", style="yellow")
+            # The core is passed via the environment so that every Coverage process (i.e., workers) uses it
+            os.environ["COVERAGE_CORE"] = coverage_core
+            os.environ["COVERAGE_FILE"] = str(data_file)
+            data_file.parent.mkdir(parents=True, exist_ok=True)
+            console.print(f"📏 Coverage core: [bold]{os.environ['COVERAGE_CORE']}[/bold]", style="white")
+            # The plugin names the coverage context after the running test to record the test impact map
+            impact_options = [CONTEXTS_OPTION] if record_impact is True else []
+            if workers is not None and workers > 1:
+                # Each worker writes its own coverage data file, combined into a single one afterwards
+                cmd = ["coverage", "run", f"--rcfile={pyproject_path}", "--parallel-mode", "-m", "pytest"]
+                returncode = run_pytest(cmd + plugin_options + impact_options + extra_options, "Pytest (coverage)", workers)
+                run_profiled(["coverage", "combine", "--quiet", f"--rcfile={pyproject_path}"], "Coverage combine")
+            else:
+                cmd = ["coverage", "run", f"--rcfile={pyproject_path}", "-m", "pytest"]
+                returncode = run_pytest(cmd + plugin_options + impact_options + extra_options, "Pytest (coverage)")
+
+            if record_impact is True and data_file.exists():
+                save_impact_map(build_impact_map(data_file, repo_root), impact_file)
+                console.print(f"🗺️  Test impact map saved to [bold]{impact_file}[/bold]", style="white")
 
-            if result.returncode == 0:
+            if returncode == 0:
                 # Print coverage for success tests
                 console.print("📊 Displaying [bold]coverage report[/bold]...", style="white")
                 console.print("\n")
-                subprocess.run(["coverage", "report", "-m"])
+                started_at = time.perf_counter()
+                write_coverage_reports(console, data_file, coverage_formats, pyproject_path, diff_coverage)
+                record_call("Coverage reports", started_at, 0)
                 console.print("\n")
                 console.print("✅ Tests and coverage completed [bold]successfully[/bold]", style="green")
             else:
                 console.print("❌ Some tests [bold]failed[/bold]", style="red")
 
-            # Clean up coverage file (if any)
-            Path(".coverage").unlink(missing_ok=True)
+        # Summarize the results logged by the plugin, rather than parsing the Pytest output
+        results = load_results(reports_dir)
+        print_results_summary(console, results)
+        if results_file is not None:
+            write_results_file(results_file, results, returncode)
+            console.print(f"🧾 Test results written to [bold]{results_file}[/bold]", style="white")
 
-        # Clean up test cache
-        cleanup_test_cache()
+        # Compare the durations of the tests that ran with their baseline of the same mode, then store them to balance next shards and workers
+        # (failing runs are not recorded, as failures and errors are not representative of how long tests take)
+        measured, collection = load_reports(reports_dir)
+        timings = compare_durations(measured, load_durations(durations_file, durations_mode))
+        print_slow_tests(console, timings, collection, slowest)
+        regressions = find_regressions(timings, slow_ratio)
+        print_regressions(console, regressions, slow_ratio, fail_on_slow)
+        if returncode == 0:
+            record_durations(measured, durations_file, durations_mode)
+
+        # Clean up caches according to the policy (warm caches are kept for next runs by default)
+        cleanup_caches(cleanup, skipped_dirs, *prune_budget, data_dir)
+
+        if profile is True or profile_output is not None:
+            finish_profiling(console, "pytest run", profile_output)
 
     except Exception as e:
         console.print(f"❌ Error running tests: [bold]{e}[/bold]", style="red")
         raise typer.Exit(1)  # noqa: B904
     finally:
-        # Always return to original directory
+        # Always return to original directory (and Coverage environment)
+        os.chdir(original_cwd)
+        for name, value in original_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(reports_dir, ignore_errors=True)
+    if regressions and fail_on_slow is True:
+        raise typer.Exit(1)
+
+
+@pytest_app.command(
+    "report",
+    help="📊 Render coverage [bold]reports[/bold] out of the coverage data stored by the last [bold]full run[/bold], without running any test.",
+)
+def report(
+    coverage_format: Annotated[
+        str | None,
+        typer.Option(
+            "--coverage-format",
+            help="📊 Comma separated coverage [bold]report formats[/bold] among [italic]term, xml, json, html[/italic] (e.g., term,xml).",
+            show_default="'pytest_coverage_formats' setting or term",
+        ),
+    ] = None,
+    diff_coverage: Annotated[
+        str | None,
+        typer.Option(
+            "--diff-coverage",
+            help="📐 Report coverage of the [bold]lines changed[/bold] since the given [italic]git ref[/italic] (e.g., origin/main, HEAD for uncommitted changes) "
+            "instead of the whole tree.",
+        ),
+    ] = None,
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the test [italic]default directory[/italic]",
+        ),
+    ] = None,
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the [italic]pyproject.toml[/italic] path (relative to [italic]default directory[/italic])",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at rendering coverage reports out of the stored coverage data of the last full run.
+
+    :param coverage_format: comma separated coverage report formats among term, xml, json and html, defaults to the ones from settings
+    :type coverage_format: str | None
+    :param diff_coverage: git ref to report the coverage of changed lines against (i.e., merge base with HEAD), instead of the whole tree
+    :type diff_coverage: str | None
+    :param default_dir: default pytest path that overwrites the one set at init time
+    :type default_dir: Path | None
+    :param pyproject_path: pyproject.toml path relative to default pytest path that overwrites the one set at init time
+    :type pyproject_path: str | None
+    :return: None
+    :rtype: None
+    """
+    try:
+        coverage_formats = parse_coverage_formats(get_pytest_coverage_formats() if coverage_format is None else coverage_format)
+    except ValueError as e:
+        console.print(f"❌ Invalid coverage format: [bold]{e}[/bold]", style="red")
+        raise typer.Exit(1)  # noqa: B904
+    data_file = COVERAGE_DATA_FILE.resolve()
+    if data_file.exists() is False:
+        console.print("❌ No coverage data found, run all tests with [code]tidy-cli pytest run[/code] first", style="red")
+        raise typer.Exit(1)
+    default_dir = get_pytest_default_path() if default_dir is None else default_dir
+    pyproject_path = get_pytest_config_path() if pyproject_path is None else pyproject_path
+    original_cwd = Path.cwd()
+    # Reports are rendered from the default directory, as coverage runs from it
+    os.chdir(default_dir)
+    try:
+        write_coverage_reports(console, data_file, coverage_formats, pyproject_path, diff_coverage)
+    finally:
         os.chdir(original_cwd)
 
 
@@ -166,13 +624,137 @@ def run(
     "init",
     help="🎛️  Initialize CLI [bold]default Pytest directory[/bold] and [bold]config file path[/bold] settings.",
 )
-def init() -> None:
+def init(
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="📁 Set the test [italic]default directory[/italic] without prompting",
+        ),
+    ] = None,
+    pyproject_path: Annotated[
+        str | None,
+        typer.Option(
+            "--pyproject-path",
+            help="📄 Set the [italic]pyproject.toml[/italic] path (relative to [italic]default directory[/italic]) without prompting",
+        ),
+    ] = None,
+) -> None:
     """
     Function aimed at initializing Pytest commands group settings.
     For the default Pytest directory it is by design 'src' or any newly provided, via initialization, directory.
     For the Pytest config file it is by design '../pyproject.toml' or any newly provided, via initialization, path.
+    In headless mode (e.g., CI) nothing is prompted: settings not given as options are taken from their environment variable or current value.
 
+    :param default_dir: test default directory, prompted for if not given
+    :type default_dir: Path | None
+    :param pyproject_path: pyproject.toml path relative to default directory, prompted for if not given
+    :type pyproject_path: str | None
+    :return: None
+    :rtype: None
+    """
+    init_settings(default_dir, None if pyproject_path is None else Path(pyproject_path))
+
+
+@server_app.command(
+    "start",
+    help="🔥 [bold]Start[/bold] (or restart) the warm Pytest server of the [italic]default directory[/italic], "
+    "preloading Pytest and [italic]'pytest_server_preload'[/italic] modules.",
+)
+def server_start(
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the test [italic]default directory[/italic]",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at starting the warm Pytest server of the default directory, stopping the running one (if any).
+
+    :param default_dir: default pytest path that overwrites the one set at init time
+    :type default_dir: Path | None
+    :return: None
+    :rtype: None
+    """
+    if is_warm_supported() is False:
+        console.print("❌ Warm Pytest server not supported on this platform", style="red")
+        raise typer.Exit(1)
+    default_dir = get_pytest_default_path() if default_dir is None else default_dir
+    preload = get_pytest_server_preload()
+    socket_path = get_socket_path(default_dir)
+    stop_server(socket_path)
+    original_cwd = Path.cwd()
+    os.chdir(default_dir)
+    try:
+        start_server(socket_path, preload)
+    except RuntimeError as e:
+        console.print(f"❌ Error starting warm Pytest server: [bold]{e}[/bold]", style="red")
+        raise typer.Exit(1)  # noqa: B904
+    finally:
+        os.chdir(original_cwd)
+    console.print(f"🔥 Warm Pytest server started for [bold]{default_dir}[/bold] preloading [bold]{len(preload)}[/bold] project module(s)", style="green")
+
+
+@server_app.command(
+    "status",
+    help="🩺 Show the [bold]status[/bold] of the warm Pytest server of the [italic]default directory[/italic].",
+)
+def server_status(
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the test [italic]default directory[/italic]",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at showing the status of the warm Pytest server of the default directory.
+
+    :param default_dir: default pytest path that overwrites the one set at init time
+    :type default_dir: Path | None
+    :return: None
+    :rtype: None
+    """
+    default_dir = get_pytest_default_path() if default_dir is None else default_dir
+    status = get_server_status(get_socket_path(default_dir))
+    if status is None:
+        console.print(f"💤 No warm Pytest server running for [bold]{default_dir}[/bold]", style="white")
+        raise typer.Exit(1)
+    console.print(
+        f"🔥 Warm Pytest server running for [bold]{default_dir}[/bold] (pid {status['pid']}, up {format_age(time.time() - status['started'])}, {status['runs']} run(s))",
+        style="green",
+    )
+    console.print(f"📦 Preloaded modules: [bold]{', '.join(status['modules']) or 'Pytest only'}[/bold]", style="white")
+    if status["stale"] is not None:
+        console.print(f"♻️  Restarting on next run, changed source: [bold]{status['stale']}[/bold]", style="yellow")
+
+
+@server_app.command(
+    "stop",
+    help="🛑 [bold]Stop[/bold] the warm Pytest server of the [italic]default directory[/italic].",
+)
+def server_stop(
+    default_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--default-dir",
+            help="🖍️  Overwrite at [bold]runtime[/bold] the test [italic]default directory[/italic]",
+        ),
+    ] = None,
+) -> None:
+    """
+    Function aimed at stopping the warm Pytest server of the default directory.
+
+    :param default_dir: default pytest path that overwrites the one set at init time
+    :type default_dir: Path | None
     :return: None
     :rtype: None
     """
-    init_settings()
+    default_dir = get_pytest_default_path() if default_dir is None else default_dir
+    if stop_server(get_socket_path(default_dir)) is True:
+        console.print(f"🛑 Warm Pytest server stopped for [bold]{default_dir}[/bold]", style="white")
+    else:
+        console.print(f"💤 No warm Pytest server running for [bold]{default_dir}[/bold]", style="white")
@@ -0,0 +1,111 @@
+"""Module defining the stored Coverage data and the reports rendered out of it for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+from pathlib import Path
+
+from coverage import Coverage
+from coverage.exceptions import CoverageException
+from rich.console import Console
+
+from tidy_cli.commons.git import (
+    GitError,
+    get_added_lines,
+    get_repo_root,
+)
+from tidy_cli.commons.settings import (
+    SETTINGS_FILE,
+    get_settings,
+)
+
+from .diff_coverage import (
+    compute_diff_coverage,
+    print_diff_coverage,
+)
+
+# Define literals
+COVERAGE_DIR = SETTINGS_FILE.parent / "coverage"  # Coverage data of the last full run and its reports, next to the CLI settings file
+COVERAGE_DATA_FILE = COVERAGE_DIR / ".coverage"
+COVERAGE_FORMATS = ["term", "xml", "json", "html"]
+REPORT_PATHS = {"xml": "coverage.xml", "json": "coverage.json", "html": "html"}  # relative to the Coverage folder
+
+
+def parse_coverage_formats(
+    value: str,
+) -> list[str]:
+    """
+    Function aimed at parsing comma separated Coverage report formats (e.g., term,xml).
+
+    :param value: comma separated formats among COVERAGE_FORMATS
+    :type value: str
+    :raises ValueError: if a format is unknown or none is given
+    :return: formats in the given order, without duplicates
+    :rtype: list[str]
+    """
+    formats = list(dict.fromkeys(name.strip().lower() for name in value.split(",") if name.strip()))
+    unknown = [name for name in formats if name not in COVERAGE_FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"'{value}' (expected comma separated formats among {', '.join(COVERAGE_FORMATS)})")
+    return formats
+
+
+def get_pytest_coverage_formats() -> str:
+    """
+    Function aimed at getting the Coverage report formats from settings, or default (i.e., term).
+
+    :return: comma separated formats
+    :rtype: str
+    """
+    return get_settings().get("pytest_coverage_formats", "term")
+
+
+def write_coverage_reports(
+    console: Console,
+    data_file: Path,
+    formats: list[str],
+    config_file: str | bool = True,
+    diff_ref: str | None = None,
+) -> list[Path]:
+    """
+    Function aimed at rendering every requested report out of the stored Coverage data, loaded once.
+    The terminal report covers the whole tree or, given a git ref, the changed lines only (i.e., diff coverage),
+    while file reports are written to the Coverage data folder.
+
+    :param console: console to print to
+    :type console: Console
+    :param data_file: Coverage data file
+    :type data_file: Path
+    :param formats: report formats among COVERAGE_FORMATS
+    :type formats: list[str]
+    :param config_file: Coverage config file (e.g., pyproject.toml), defaults to True (i.e., Coverage default ones)
+    :type config_file: str | bool
+    :param diff_ref: git ref the terminal report covers the changed lines since, defaults to None (i.e., whole tree)
+    :type diff_ref: str | None
+    :return: paths of the written file reports
+    :rtype: list[Path]
+    """
+    cov = Coverage(data_file=str(data_file), config_file=config_file)
+    cov.load()
+    written = []
+    for name in formats:
+        path = data_file.parent / REPORT_PATHS.get(name, "")
+        try:
+            if name == "term" and diff_ref is not None:
+                try:
+                    print_diff_coverage(console, compute_diff_coverage(cov, get_added_lines(diff_ref), get_repo_root()), diff_ref)
+                except GitError as e:
+                    console.print(f"⚠️ Could not compute changed lines since [bold]{diff_ref}[/bold]: {e}", style="yellow")
+            elif name == "term":
+                cov.report(show_missing=True)
+            elif name == "xml":
+                cov.xml_report(outfile=str(path))
+            elif name == "json":
+                cov.json_report(outfile=str(path))
+            elif name == "html":
+                cov.html_report(directory=str(path))
+        except CoverageException as e:
+            console.print(f"⚠️ Could not write the {name} coverage report: {e}", style="yellow")
+            continue
+        if name != "term":
+            written.append(path)
+            console.print(f"📄 {name.upper()} coverage report written to [bold]{path}[/bold]", style="white")
+    return written
@@ -0,0 +1,129 @@
+"""Module defining the coverage of changed lines (i.e., diff coverage) report for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+from dataclasses import dataclass
+from pathlib import Path
+
+from coverage import Coverage
+from coverage.exceptions import NoSource
+from coverage.results import format_lines
+from rich.console import Console
+from rich.table import Table
+
+from .impact import is_test_file
+
+
+@dataclass
+class FileDiffCoverage:
+    """
+    Class aimed at storing the coverage of the changed statements of a file.
+
+    .. attribute :: path
+        :type: Path
+
+        path of the file (relative to the repository root)
+
+    .. attribute :: statements
+        :type: set[int]
+
+        changed lines that are statements (i.e., lines to be covered)
+
+    .. attribute :: missing
+        :type: set[int]
+
+        changed statements not run by the tests
+    """
+
+    path: Path
+    statements: set[int]
+    missing: set[int]
+
+    @property
+    def percent(self) -> float:
+        """
+        Method aimed at getting the percentage of changed statements run by the tests.
+
+        :return: covered changed statements percentage (100 when no statement changed)
+        :rtype: float
+        """
+        return 100.0 if not self.statements else 100 * (len(self.statements) - len(self.missing)) / len(self.statements)
+
+
+def compute_diff_coverage(
+    cov: Coverage,
+    changes: dict[Path, set[int] | None],
+    root: Path | None = None,
+) -> list[FileDiffCoverage]:
+    """
+    Function aimed at computing the coverage of the changed lines of the files measured by a run.
+    Test files and files not measured (i.e., neither run nor part of the Coverage 'source') are left out.
+
+    :param cov: Coverage object with the run data loaded
+    :type cov: Coverage
+    :param changes: changed lines of each changed file (numbered as in the current version), None when the whole file is new
+    :type changes: dict[Path, set[int] | None]
+    :param root: folder changed files are relative to (i.e., the repository root), defaults to the current directory
+    :type root: Path | None
+    :return: coverage of the changed statements of each measured file, sorted by path
+    :rtype: list[FileDiffCoverage]
+    """
+    root = (Path.cwd() if root is None else root).resolve()
+    measured = {Path(name).resolve() for name in cov.get_data().measured_files()}
+    results = []
+    for path, lines in sorted(changes.items()):
+        resolved = (root / path).resolve()
+        if path.suffix != ".py" or is_test_file(path) or resolved not in measured:
+            continue
+        try:
+            _, statements, _, missing, _ = cov.analysis2(str(resolved))
+        except NoSource:
+            continue
+        changed = set(statements) if lines is None else lines & set(statements)
+        results.append(FileDiffCoverage(path, changed, changed & set(missing)))
+    return results
+
+
+def print_diff_coverage(
+    console: Console,
+    results: list[FileDiffCoverage],
+    ref: str,
+) -> None:
+    """
+    Function aimed at printing the diff coverage report: a row per file with changed statements and the total.
+
+    :param console: console to print to
+    :type console: Console
+    :param results: coverage of the changed statements of each measured file
+    :type results: list[FileDiffCoverage]
+    :param ref: git ref the changes are computed against (e.g., origin/main)
+    :type ref: str
+    :return: None
+    :rtype: None
+    """
+    results = [result for result in results if result.statements]
+    if not results:
+        console.print(f"✨ No measured statements changed since [bold]{ref}[/bold]", style="green")
+        return
+
+    table = Table(title=f"📐 Coverage of lines changed since {ref}", title_justify="left")
+    table.add_column("File")
+    table.add_column("Changed", justify="right")
+    table.add_column("Miss", justify="right")
+    table.add_column("Cover", justify="right")
+    table.add_column("Missing")
+    for result in results:
+        table.add_row(
+            result.path.as_posix(),
+            str(len(result.statements)),
+            str(len(result.missing)),
+            f"{result.percent:.0f}%",
+            format_lines(sorted(result.statements), sorted(result.missing)),
+        )
+    console.print(table)
+    statements = sum(len(result.statements) for result in results)
+    missing = sum(len(result.missing) for result in results)
+    style = "green" if missing == 0 else "yellow"
+    console.print(
+        f"📐 Diff coverage: [bold]{100 * (statements - missing) / statements:.1f}%[/bold] of [bold]{statements}[/bold] changed statement(s)",
+        style=style,
+    )
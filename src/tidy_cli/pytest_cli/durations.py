@@ -0,0 +1,208 @@
+"""
+Module defining the store of recorded test durations for the CLI Pytest Commands Group.
+Each test keeps its latest durations, whose median is its baseline, used to balance tests across shards and workers
+and to detect tests getting slower. Durations are kept per run mode (i.e., Coverage core, plain or warm run),
+as the measurement overhead of each mode would otherwise skew the baselines of the others.
+"""
+
+# Import packages and modules
+import heapq
+import json
+import statistics
+from pathlib import Path
+
+from tidy_cli.commons.settings import SETTINGS_FILE
+
+# Define literals
+DURATIONS_FILE = SETTINGS_FILE.parent / "tidy_cli_test_durations.json"  # stored next to the CLI settings file
+DEFAULT_DURATION = 1.0  # weight of every test when no duration is recorded at all (i.e., balancing by number of tests)
+HISTORY_SIZE = 5  # number of latest durations kept for each test (i.e., rolling baseline window)
+PLAIN_MODE = "plain"  # tests run in a new process without Coverage
+WARM_MODE = "warm"  # tests run in a child forked out of the warm Pytest server
+COVERAGE_MODE = "coverage-{core}"  # tests run under Coverage with the given measurement core (e.g., coverage-sysmon)
+
+
+def get_durations_mode(
+    coverage_core: str | None = None,
+    warm: bool = False,
+) -> str:
+    """
+    Function aimed at getting the mode under which durations of a run are recorded and compared.
+
+    :param coverage_core: Coverage core measuring the run (e.g., sysmon), defaults to None (i.e., no Coverage)
+    :type coverage_core: str | None
+    :param warm: whether the run is forked out of the warm Pytest server, defaults to False
+    :type warm: bool
+    :return: durations mode among PLAIN_MODE, WARM_MODE and COVERAGE_MODE
+    :rtype: str
+    """
+    if coverage_core is not None:
+        return COVERAGE_MODE.format(core=coverage_core)
+    return WARM_MODE if warm is True else PLAIN_MODE
+
+
+def load_store(
+    durations_file: Path = DURATIONS_FILE,
+) -> dict[str, dict[str, list[float]]]:
+    """
+    Function aimed at loading the recorded durations history of each test for every mode.
+    Durations stored outside of any mode (i.e., written by previous versions, mixing modes) are ignored.
+
+    :param durations_file: path of the JSON file storing the durations, defaults to DURATIONS_FILE
+    :type durations_file: Path
+    :return: latest durations in seconds of each test id, oldest first, by mode (empty if none is recorded yet or the file is unreadable)
+    :rtype: dict[str, dict[str, list[float]]]
+    """
+    try:
+        with open(durations_file) as file:
+            store = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(store, dict):
+        return {}
+    return {
+        mode: {test_id: [float(value) for value in history] for test_id, history in durations.items() if isinstance(history, list)}
+        for mode, durations in store.items()
+        if isinstance(durations, dict)
+    }
+
+
+def load_history(
+    durations_file: Path = DURATIONS_FILE,
+    mode: str = PLAIN_MODE,
+) -> dict[str, list[float]]:
+    """
+    Function aimed at loading the recorded durations history of each test for a mode.
+
+    :param durations_file: path of the JSON file storing the durations, defaults to DURATIONS_FILE
+    :type durations_file: Path
+    :param mode: durations mode (see get_durations_mode), defaults to PLAIN_MODE
+    :type mode: str
+    :return: latest durations in seconds of each test id, oldest first (empty if none is recorded yet or the file is unreadable)
+    :rtype: dict[str, list[float]]
+    """
+    return load_store(durations_file).get(mode, {})
+
+
+def load_durations(
+    durations_file: Path = DURATIONS_FILE,
+    mode: str = PLAIN_MODE,
+) -> dict[str, float]:
+    """
+    Function aimed at loading the baseline duration of each test for a mode, namely the median of its latest recorded durations.
+
+    :param durations_file: path of the JSON file storing the durations, defaults to DURATIONS_FILE
+    :type durations_file: Path
+    :param mode: durations mode (see get_durations_mode), defaults to PLAIN_MODE
+    :type mode: str
+    :return: baseline duration in seconds of each test id (empty if none is recorded yet or the file is unreadable)
+    :rtype: dict[str, float]
+    """
+    return {test_id: statistics.median(history) for test_id, history in load_history(durations_file, mode).items() if history}
+
+
+def load_reports(
+    reports_dir: Path,
+) -> tuple[dict[str, float], float | None]:
+    """
+    Function aimed at loading the durations measured by each Pytest process of a run.
+    Every process collects the whole suite, hence the collection time of the run is the longest one.
+
+    :param reports_dir: folder where each Pytest process wrote the durations it measured
+    :type reports_dir: Path
+    :return: duration in seconds of each test id run and collection time in seconds (None if no process reported it)
+    :rtype: tuple[dict[str, float], float | None]
+    """
+    measured: dict[str, float] = {}
+    collection = None
+    for path in sorted(reports_dir.glob("*.json")):
+        try:
+            with open(path) as file:
+                report = json.load(file)
+        except (OSError, ValueError):
+            continue
+        measured.update(report.get("durations", {}))
+        if report.get("collection") is not None:
+            collection = max(collection or 0.0, report["collection"])
+    return measured, collection
+
+
+def record_durations(
+    measured: dict[str, float],
+    durations_file: Path = DURATIONS_FILE,
+    mode: str = PLAIN_MODE,
+    history_size: int = HISTORY_SIZE,
+) -> int:
+    """
+    Function aimed at appending the durations measured by a run to the history of each test for its mode, keeping the latest ones.
+    Tests that did not run keep their history, while tests of removed modules are dropped.
+
+    :param measured: duration in seconds of each test id run
+    :type measured: dict[str, float]
+    :param durations_file: path of the JSON file storing the durations, defaults to DURATIONS_FILE
+    :type durations_file: Path
+    :param mode: durations mode of the run (see get_durations_mode), defaults to PLAIN_MODE
+    :type mode: str
+    :param history_size: number of latest durations kept for each test, defaults to HISTORY_SIZE
+    :type history_size: int
+    :return: number of test durations recorded by this run
+    :rtype: int
+    """
+    if not measured:
+        return 0
+
+    store = load_store(durations_file)
+    history = store.get(mode, {})
+    for test_id, duration in measured.items():
+        history[test_id] = [*history.get(test_id, []), duration][-history_size:]
+    store[mode] = history
+    store = {name: {test_id: durations for test_id, durations in sorted(tests.items()) if Path(test_id.partition("::")[0]).exists()} for name, tests in sorted(store.items())}
+    durations_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(durations_file, "w") as file:
+        json.dump(store, file, indent=0)
+    return len(measured)
+
+
+def estimate_durations(
+    test_ids: list[str],
+    durations: dict[str, float],
+) -> dict[str, float]:
+    """
+    Function aimed at estimating the duration of each test: its baseline or, for tests without history,
+    the median of the baselines of the other tests.
+
+    :param test_ids: ids of the tests to be run
+    :type test_ids: list[str]
+    :param durations: baseline duration in seconds of each test id
+    :type durations: dict[str, float]
+    :return: estimated duration in seconds of each test id
+    :rtype: dict[str, float]
+    """
+    known = [durations[test_id] for test_id in test_ids if test_id in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {test_id: durations.get(test_id, fallback) for test_id in test_ids}
+
+
+def partition(
+    weights: dict[str, float],
+    count: int,
+) -> list[set[str]]:
+    """
+    Function aimed at partitioning weighted keys (e.g., test ids) into count groups of similar total weight.
+    The heaviest keys are placed first, each one in the currently lightest group (i.e., longest processing time first),
+    ties being broken by key and group index so that every process computes the same partition.
+
+    :param weights: weight of each key (e.g., estimated duration)
+    :type weights: dict[str, float]
+    :param count: number of groups
+    :type count: int
+    :return: keys of each group (possibly empty when there are fewer keys than groups)
+    :rtype: list[set[str]]
+    """
+    groups: list[set[str]] = [set() for _ in range(count)]
+    heap = [(0.0, index) for index in range(count)]  # (total weight, group index)
+    for key, weight in sorted(weights.items(), key=lambda pair: (-pair[1], pair[0])):
+        total, index = heapq.heappop(heap)
+        groups[index].add(key)
+        heapq.heappush(heap, (total + weight, index))
+    return groups
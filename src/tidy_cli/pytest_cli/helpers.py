@@ -1,70 +1,290 @@
 """Module defining helpers functions for th CLI Pytest Commands Group."""
 
 # Import packages and modules
-import subprocess
+import os
+import shutil
+import sys
+import time
 from pathlib import Path
 
-import typer
-from rich.console import Console
+from coverage import Coverage
 
+from tidy_cli.cache_cli.helpers import (
+    format_size,
+    prune_caches,
+)
+from tidy_cli.commons.console import (
+    console,
+    prompt_setting,
+)
 from tidy_cli.commons.settings import (
     SETTINGS_FILE,
-    load_settings,
+    get_settings,
     update_settings,
 )
 
-console = Console()
+# Define literals
+CLEANUP_SKIPPED_DIRS = {"node_modules", "site-packages", "venv"}  # on top of hidden folders (e.g., .venv, .git) and virtual environments
+BYTECODE_SUFFIXES = (".pyc", ".pyo")
+CLEANUP_POLICIES = ["never", "bytecode", "prune"]  # post-run cleanup policies, warm caches are kept by default
+COVERAGE_CORES = ["auto", "sysmon", "ctrace", "pytrace"]  # Coverage measurement cores, auto picks the lowest overhead usable one
+
+
+def get_cleanup_skipped_dirs() -> set[str]:
+    """
+    Function aimed at getting the names of the folders the test cache cleanup does not descend into,
+    namely the defaults plus the comma separated ones of the 'pytest_cleanup_skip_dirs' setting, if any.
+
+    :return: names of the skipped folders (on top of hidden and virtual environment ones)
+    :rtype: set[str]
+    """
+    return CLEANUP_SKIPPED_DIRS | set(get_settings().get_list("pytest_cleanup_skip_dirs"))
+
+
+def remove_bytecode(
+    root: Path,
+    skipped_dirs: set[str],
+) -> tuple[int, int]:
+    """
+    Function aimed at removing __pycache__ folders and stray bytecode files under a root, walking the tree once.
+    Hidden folders (e.g., .git, .venv), virtual environments (i.e., folders with a pyvenv.cfg file) and skipped folders
+    are not descended into, so that their bytecode (e.g., the interpreter's one) is kept.
+
+    :param root: folder to be cleaned up
+    :type root: Path
+    :param skipped_dirs: names of the folders not to descend into
+    :type skipped_dirs: set[str]
+    :return: number of removed __pycache__ folders and bytecode files
+    :rtype: tuple[int, int]
+    """
+    removed_dirs = removed_files = 0
+    for current, dirs, names in os.walk(root):
+        if "pyvenv.cfg" in names and Path(current) != root:
+            dirs.clear()
+            continue
+        for name in dirs:
+            if name == "__pycache__":
+                shutil.rmtree(Path(current) / name, ignore_errors=True)
+                removed_dirs += 1
+        dirs[:] = [name for name in dirs if name != "__pycache__" and not name.startswith(".") and name not in skipped_dirs]
+        for name in names:
+            if name.endswith(BYTECODE_SUFFIXES):
+                (Path(current) / name).unlink(missing_ok=True)
+                removed_files += 1
+    return removed_dirs, removed_files
 
 
-def cleanup_test_cache() -> None:
+def cleanup_test_cache(
+    root: Path = Path("."),
+    skipped_dirs: set[str] | None = None,
+) -> None:
     """
-    Function aimed at cleaning up pytest cache files.
+    Function aimed at cleaning up pytest cache files (i.e., bytecode), reporting what was removed and how long it took.
 
+    :param root: folder to be cleaned up, defaults to the current directory
+    :type root: Path
+    :param skipped_dirs: names of the folders not to descend into, defaults to the ones from settings
+    :type skipped_dirs: set[str] | None
     :return: None
     :rtype: None
     """
     try:
-        subprocess.run(["find", ".", "-name", "__pycache__", "-type", "d", "-exec", "rm", "-rf", "{}", "+"], capture_output=True)
-        subprocess.run(["find", ".", "-name", "*.pyc", "-delete"], capture_output=True)
-        subprocess.run(["find", ".", "-name", "*.pyo", "-delete"], capture_output=True)
-        console.print("🧹 Test cache cleaned up", style="white")
+        started_at = time.perf_counter()
+        removed_dirs, removed_files = remove_bytecode(root, get_cleanup_skipped_dirs() if skipped_dirs is None else skipped_dirs)
+        console.print(
+            f"🧹 Test cache cleaned up: {removed_dirs} __pycache__ folder(s) and {removed_files} file(s) removed in {time.perf_counter() - started_at:.2f}s",
+            style="white",
+        )
     except Exception as e:
         console.print(f"⚠️ Warning: Could not clean up test cache: {e}", style="yellow")
 
 
-def init_settings() -> None:
+def get_pytest_cleanup_policy() -> str:
+    """
+    Function aimed at getting the post-run cleanup policy from settings, or default (i.e., never, keeping warm caches).
+
+    :return: cleanup policy among CLEANUP_POLICIES
+    :rtype: str
+    """
+    policy = get_settings().get("pytest_cleanup_policy", "never")
+    return policy if policy in CLEANUP_POLICIES else "never"
+
+
+def get_pytest_coverage_core() -> str:
+    """
+    Function aimed at getting the Coverage measurement core from settings, or default (i.e., auto).
+
+    :return: Coverage core among COVERAGE_CORES
+    :rtype: str
+    """
+    core = get_settings().get("pytest_coverage_core", "auto")
+    return core if core in COVERAGE_CORES else "auto"
+
+
+def resolve_coverage_core(
+    core: str,
+    branch: bool,
+    contexts: bool,
+) -> str:
+    """
+    Function aimed at resolving the Coverage measurement core to be used.
+    The auto core is sys.monitoring (sysmon) where it can measure the run, namely on Python 3.12+ (3.14+ for branch coverage)
+    without per-test contexts, and the C tracer (ctrace) otherwise. Per-test contexts always require a tracer core.
+
+    :param core: Coverage core among COVERAGE_CORES
+    :type core: str
+    :param branch: whether branch coverage is measured
+    :type branch: bool
+    :param contexts: whether the Coverage context is switched per test (i.e., recording the test impact map)
+    :type contexts: bool
+    :return: Coverage core among sysmon, ctrace and pytrace
+    :rtype: str
+    """
+    sysmon_usable = sys.version_info >= ((3, 14) if branch else (3, 12)) and contexts is False
+    if core == "auto":
+        return "sysmon" if sysmon_usable else "ctrace"
+    if core == "sysmon" and contexts is True:
+        return "ctrace"
+    return core
+
+
+def is_branch_coverage(
+    config_file: str,
+) -> bool:
+    """
+    Function aimed at checking whether branch coverage is enabled in the Coverage config file.
+
+    :param config_file: Coverage config file (e.g., pyproject.toml)
+    :type config_file: str
+    :return: True if branch coverage is measured and False otherwise (or if the config file is unreadable)
+    :rtype: bool
+    """
+    try:
+        return bool(Coverage(config_file=config_file).get_option("run:branch"))
+    except Exception:
+        return False
+
+
+def get_pytest_warm() -> bool:
+    """
+    Function aimed at getting whether targeted runs should use the warm Pytest server from settings, or default (i.e., False).
+
+    :return: whether the warm Pytest server is enabled
+    :rtype: bool
+    """
+    return get_settings().get_bool("pytest_warm")
+
+
+def get_pytest_server_preload() -> list[str]:
+    """
+    Function aimed at getting the project modules the warm Pytest server preloads,
+    namely the comma separated ones of the 'pytest_server_preload' setting, if any.
+
+    :return: names of the modules to be preloaded
+    :rtype: list[str]
+    """
+    return get_settings().get_list("pytest_server_preload")
+
+
+def get_pytest_slowest() -> int:
+    """
+    Function aimed at getting the number of slowest tests listed after a run from settings, or default (i.e., 5).
+
+    :return: number of slowest tests to be listed (0 to list none)
+    :rtype: int
+    """
+    return max(get_settings().get_int("pytest_slowest", 5), 0)
+
+
+def get_pytest_slow_ratio() -> float:
+    """
+    Function aimed at getting the ratio to its baseline beyond which a test is flagged as slower from settings, or default (i.e., 2.0).
+
+    :return: maximum allowed duration to baseline ratio
+    :rtype: float
+    """
+    return get_settings().get_float("pytest_slow_ratio", 2.0) or 2.0
+
+
+def cleanup_caches(
+    policy: str,
+    skipped_dirs: set[str],
+    max_age_days: float | None = None,
+    max_size_mb: float | None = None,
+    data_dir: Path | None = None,
+) -> None:
+    """
+    Function aimed at cleaning up caches after a test run according to the cleanup policy:
+    'never' keeps every cache, 'bytecode' removes bytecode and 'prune' removes caches beyond the age and size budget.
+
+    :param policy: cleanup policy among CLEANUP_POLICIES
+    :type policy: str
+    :param skipped_dirs: names of the folders not to descend into
+    :type skipped_dirs: set[str]
+    :param max_age_days: maximum age in days of the kept caches (prune policy), defaults to None (i.e., no age limit)
+    :type max_age_days: float | None
+    :param max_size_mb: maximum total size in megabytes of the kept caches (prune policy), defaults to None (i.e., no size budget)
+    :type max_size_mb: float | None
+    :param data_dir: folder of the settings file with tidy-cli caches (prune policy), defaults to the one under the current directory
+    :type data_dir: Path | None
+    :return: None
+    :rtype: None
+    """
+    if policy == "bytecode":
+        cleanup_test_cache(skipped_dirs=skipped_dirs)
+    elif policy == "prune":
+        if max_age_days is None and max_size_mb is None:
+            console.print("⚠️ Warning: no cache budget set ('cache_max_age_days' or 'cache_max_size_mb' settings), caches are kept", style="yellow")
+            return
+        try:
+            pruned = prune_caches(Path("."), max_age_days, max_size_mb, skipped_dirs=skipped_dirs, data_dir=data_dir)
+            console.print(f"🧹 Pruned {len(pruned)} cache location(s) beyond budget, freeing {format_size(sum(location.size for location in pruned))}", style="white")
+        except Exception as e:
+            console.print(f"⚠️ Warning: Could not prune caches: {e}", style="yellow")
+
+
+def init_settings(
+    default_path: Path | None = None,
+    config_path: Path | None = None,
+) -> None:
     """
     Function aimed at initializing CLI Pytest Commands Group settings.
     It initializes the default directory, namely the one the system cd into.
     By design it is defaulted, if nothing is provided, with 'src'.
+    Settings not given are prompted for, or taken from their environment variable or current value when the CLI runs headless.
 
+    :param default_path: default directory, defaults to None (i.e., prompted for)
+    :type default_path: Path | None
+    :param config_path: config file path, defaults to None (i.e., prompted for)
+    :type config_path: Path | None
     :return: None
     :rtype: None
     """
     console.print("🔧 Initializing Pytest settings...\n", style="white")
 
     # Load settings
-    current_settings = load_settings()
+    current_settings = get_settings()
 
     # Default settings
     default_test_path = current_settings.get("pytest_default_path", "src")
     default_config_path = current_settings.get("pytest_config_path", "../pyproject.toml")
 
     # Configure default test path
-    test_path = typer.prompt(
-        "▪ Default path to tests",
-        default=default_test_path,
-        show_default=True,
-        type=Path,
-    )
+    test_path = default_path
+    if test_path is None:
+        test_path = prompt_setting(
+            "▪ Default path to tests",
+            "pytest_default_path",
+            default_test_path,
+        )
 
     # Configure Pytest config file path
-    config_path = typer.prompt(
-        "▪ Path to Pytest config file (relative to default directory)",
-        default=default_config_path,
-        show_default=True,
-        type=Path,
-    )
+    if config_path is None:
+        config_path = prompt_setting(
+            "▪ Path to Pytest config file (relative to default directory)",
+            "pytest_config_path",
+            default_config_path,
+        )
 
     new_settings = {
         "pytest_default_path": str(test_path),
@@ -87,10 +307,7 @@ def get_pytest_default_path() -> Path:
     :return: default directory path
     :rtype: Path
     """
-    settings = load_settings()
-    if "pytest_default_path" in settings:
-        return Path(settings["pytest_default_path"])
-    return Path("src")
+    return Path(get_settings().get("pytest_default_path", "src"))
 
 
 def get_pytest_config_path() -> str:
@@ -100,7 +317,4 @@ def get_pytest_config_path() -> str:
     :return: config file path
     :rtype: str
     """
-    settings = load_settings()
-    if "pytest_config_path" in settings:
-        return settings["pytest_config_path"]
-    return "../pyproject.toml"
+    return get_settings().get("pytest_config_path", "../pyproject.toml")
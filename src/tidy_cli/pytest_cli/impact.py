@@ -0,0 +1,148 @@
+"""Module defining the test impact analysis (i.e., which tests run each source line) for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+import json
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+from coverage import CoverageData
+
+from tidy_cli.commons.settings import SETTINGS_FILE
+
+# Define literals
+IMPACT_FILE = SETTINGS_FILE.parent / "tidy_cli_test_impact.json"  # stored next to the CLI settings file
+TEST_FILE_PATTERNS = ("test_*.py", "*_test.py")  # Pytest default test files patterns
+ImpactMap = dict[str, Any]  # {"tests": [test ids], "files": {path: {line: [indexes of the tests running it]}}}
+
+
+def build_impact_map(
+    data_file: Path,
+    root: Path | None = None,
+) -> ImpactMap:
+    """
+    Function aimed at building the test impact map out of Coverage data recorded with a context per test.
+    Only files under the root folder are kept, with paths relative to it (i.e., as git reports changed files).
+    Lines run outside of any test (e.g., at import time) are kept with no tests.
+
+    :param data_file: Coverage data file (e.g., .coverage)
+    :type data_file: Path
+    :param root: folder paths are relative to (i.e., the repository root), defaults to the current directory
+    :type root: Path | None
+    :return: test impact map
+    :rtype: ImpactMap
+    """
+    data = CoverageData(basename=str(data_file))
+    data.read()
+    root = (Path.cwd() if root is None else root).resolve()
+    tests: dict[str, int] = {}  # test id with its index
+    files: dict[str, dict[str, list[int]]] = {}
+    for measured in sorted(data.measured_files()):
+        try:
+            path = Path(measured).resolve().relative_to(root).as_posix()
+        except ValueError:
+            continue
+        files[path] = {
+            str(line): sorted({tests.setdefault(context, len(tests)) for context in sorted(contexts) if context})
+            for line, contexts in sorted(data.contexts_by_lineno(measured).items())
+        }
+    return {"tests": list(tests), "files": files}
+
+
+def save_impact_map(
+    impact_map: ImpactMap,
+    impact_file: Path = IMPACT_FILE,
+) -> None:
+    """
+    Function aimed at persisting the test impact map.
+
+    :param impact_map: test impact map
+    :type impact_map: ImpactMap
+    :param impact_file: path of the JSON file persisting the map, defaults to IMPACT_FILE
+    :type impact_file: Path
+    :return: None
+    :rtype: None
+    """
+    impact_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(impact_file, "w") as file:
+        json.dump(impact_map, file)
+
+
+def load_impact_map(
+    impact_file: Path = IMPACT_FILE,
+) -> ImpactMap | None:
+    """
+    Function aimed at loading the persisted test impact map.
+
+    :param impact_file: path of the JSON file persisting the map, defaults to IMPACT_FILE
+    :type impact_file: Path
+    :return: test impact map or None if not recorded yet (or unreadable)
+    :rtype: ImpactMap | None
+    """
+    try:
+        with open(impact_file) as file:
+            impact_map = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return impact_map if isinstance(impact_map, dict) and {"tests", "files"} <= impact_map.keys() else None
+
+
+def is_test_file(
+    path: Path,
+) -> bool:
+    """
+    Function aimed at checking whether a file is a test module according to Pytest default patterns.
+
+    :param path: file to be checked
+    :type path: Path
+    :return: True if the file is a test module and False otherwise
+    :rtype: bool
+    """
+    return any(fnmatch(path.name, pattern) for pattern in TEST_FILE_PATTERNS)
+
+
+def select_affected_tests(
+    impact_map: ImpactMap,
+    changes: dict[Path, set[int] | None],
+    root: Path | None = None,
+) -> list[str]:
+    """
+    Function aimed at selecting the tests affected by changes: the tests running any changed line, plus changed test files
+    and the folders of changed conftest files (run as a whole).
+    A file changed as a whole, or a changed line run outside of any test (e.g., a function signature), selects every test running the file.
+
+    :param impact_map: test impact map
+    :type impact_map: ImpactMap
+    :param changes: changed lines of each changed file (numbered as in the recorded version), None when the whole file changed
+    :type changes: dict[Path, set[int] | None]
+    :param root: folder changed files and the impact map paths are relative to (i.e., the repository root), defaults to the current directory
+    :type root: Path | None
+    :return: sorted Pytest targets (i.e., test files, folders and test ids) relative to the current directory
+    :rtype: list[str]
+    """
+    root = Path.cwd() if root is None else root
+    targets: set[str] = set()
+    selected: set[int] = set()
+    for path, lines in changes.items():
+        if path.suffix != ".py":
+            continue
+        # Test files and conftest folders are passed to Pytest, hence relative to the directory it runs from
+        target = Path(os.path.relpath(root / path))
+        if path.name == "conftest.py" and target.exists():
+            targets.add(target.parent.as_posix())
+        elif is_test_file(path) and target.exists():
+            targets.add(target.as_posix())
+        elif path.as_posix() in impact_map["files"]:
+            file_lines = impact_map["files"][path.as_posix()]
+            tests = [file_lines.get(str(line)) for line in lines] if lines is not None else [[]]
+            if any(line_tests == [] for line_tests in tests):
+                tests = list(file_lines.values())
+            selected.update(index for line_tests in tests if line_tests for index in line_tests)
+
+    for test_id in (impact_map["tests"][index] for index in selected):
+        module = test_id.partition("::")[0]
+        # Tests of removed modules or of modules already run as a whole are left out
+        if Path(module).exists() and module not in targets and not any(Path(module).is_relative_to(target) for target in targets if Path(target).is_dir()):
+            targets.add(test_id)
+    return sorted(targets)
@@ -0,0 +1,125 @@
+"""Module defining the execution of Pytest across worker processes (or forked out of the warm Pytest server) for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO
+
+from tidy_cli.commons.console import console
+from tidy_cli.commons.process import (
+    run_profiled,
+    spooled_buffer,
+    stream_command,
+)
+from tidy_cli.commons.profiling import record_call
+
+from .plugin import (
+    PLUGIN,
+    WORKER_OPTION,
+)
+from .server import (
+    PYTEST_COMMAND,
+    is_warm_supported,
+    run_warm,
+)
+
+
+def build_worker_commands(
+    command: list[str],
+    workers: int,
+) -> list[list[str]]:
+    """
+    Function aimed at building the Pytest command of each worker, loading the plugin that keeps only the worker's tests.
+
+    :param command: Pytest command as run by a single process (e.g., coverage run -m pytest)
+    :type command: list[str]
+    :param workers: number of worker processes
+    :type workers: int
+    :return: terminal command of each worker
+    :rtype: list[list[str]]
+    """
+    return [[*command, "-p", PLUGIN, f"{WORKER_OPTION}={index}/{workers}"] for index in range(1, workers + 1)]
+
+
+def run_workers(
+    command: list[str],
+    description: str,
+    workers: int,
+) -> int:
+    """
+    Function aimed at running Pytest across worker processes, each one running a balanced share of the test modules.
+    The output of each worker is printed as a whole once it is done, so that workers output is never mixed.
+
+    :param command: Pytest command as run by a single process (e.g., coverage run --parallel-mode -m pytest)
+    :type command: list[str]
+    :param description: label of the run (e.g., Pytest (coverage))
+    :type description: str
+    :param workers: number of worker processes
+    :type workers: int
+    :return: return code of the run (i.e., the highest one among workers)
+    :rtype: int
+    """
+    commands = build_worker_commands(command, workers)
+
+    def _run_worker(index: int) -> tuple[int, IO[str]]:
+        buffer = spooled_buffer()
+
+        def _on_line(line: str, stream: str) -> None:
+            buffer.write(f"{stream}:{line}\n")
+
+        returncode = stream_command(commands[index], on_line=_on_line, label=f"{description} [{index + 1}/{workers}]")
+        buffer.seek(0)
+        return returncode, buffer
+
+    console.print(f"🧵 Running tests across [bold]{workers}[/bold] workers...", style="white")
+    returncodes = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_run_worker, index): index for index in range(workers)}
+        for future in as_completed(futures):
+            returncode, buffer = future.result()
+            returncodes.append(returncode)
+            console.print(f"\n🧵 Worker [bold]{futures[future] + 1}/{workers}[/bold] output:", style="white")
+            with buffer:
+                for record in buffer:
+                    stream, _, line = record.rstrip("\n").partition(":")
+                    console.print(line, style="red" if stream == "stderr" else None, markup=False, highlight=False)
+    return max(returncodes)
+
+
+def run_pytest(
+    command: list[str],
+    description: str,
+    workers: int | None = None,
+    preload: list[str] | None = None,
+) -> int:
+    """
+    Function aimed at running Pytest as a single process, across worker processes or forked out of the warm Pytest server.
+    The warm server runs plain Pytest commands (i.e., python -m pytest) in a single process only,
+    falling back to a new process when it is not supported or cannot be started.
+
+    :param command: Pytest command as run by a single process (e.g., python -m pytest)
+    :type command: list[str]
+    :param description: label of the run (e.g., Pytest)
+    :type description: str
+    :param workers: number of worker processes, defaults to None (i.e., a single process)
+    :type workers: int | None
+    :param preload: project modules preloaded by the warm server, defaults to None (i.e., no warm server)
+    :type preload: list[str] | None
+    :return: return code of the run
+    :rtype: int
+    """
+    if workers is not None and workers > 1:
+        return run_workers(command, description, workers)
+    if preload is not None and command[: len(PYTEST_COMMAND)] == PYTEST_COMMAND:
+        if is_warm_supported() is False:
+            console.print("⚠️ Warm Pytest server not supported on this platform, running in a new process", style="yellow")
+        else:
+            started_at = time.perf_counter()
+            try:
+                returncode = run_warm(command[len(PYTEST_COMMAND) :], preload)
+            except (OSError, RuntimeError) as e:
+                console.print(f"⚠️ Warm Pytest server unavailable ({e}), running in a new process", style="yellow")
+            else:
+                record_call(f"{description} (warm)", started_at, returncode)
+                return returncode
+    return run_profiled(command, description).returncode
@@ -0,0 +1,427 @@
+"""
+Module defining the Pytest plugin loaded by the CLI Pytest Commands Group into the Pytest processes it spawns.
+
+It is enabled via '-p tidy_cli.pytest_cli.plugin' and it allows to:
+- split the collected tests into CI shards: every shard keeps a balanced share of the tests, weighted by their recorded durations
+- split the collected tests across worker processes: every worker keeps only the test modules assigned to it
+- record the duration of each test and the collection time (to balance shards and workers and to detect tests getting slower in later runs)
+- stream the outcome of each test phase to a results log, one JSON line per report (to summarize the run without parsing its output)
+- record which test runs each line: the Coverage context is switched to the running test (to build the test impact map)
+Every shard and worker collects the whole suite and computes the same partition, hence no test id has to be passed around.
+The plugin has no assertion to be rewritten (PYTEST_DONT_REWRITE), as it is already imported by the warm Pytest server.
+"""
+
+# Import packages and modules
+import json
+import os
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import coverage
+import pytest
+
+from .durations import (
+    PLAIN_MODE,
+    estimate_durations,
+    load_durations,
+    partition,
+)
+
+# Define literals
+PLUGIN = "tidy_cli.pytest_cli.plugin"  # name to be given to Pytest '-p' option
+SHARD_OPTION = "--tidy-shard"
+WORKER_OPTION = "--tidy-worker"
+DURATIONS_OPTION = "--tidy-durations"
+DURATIONS_MODE_OPTION = "--tidy-durations-mode"
+REPORT_DURATIONS_OPTION = "--tidy-report-durations"
+CONTEXTS_OPTION = "--tidy-contexts"
+DESELECTED_KEY = pytest.StashKey[int]()  # number of tests deselected because assigned to other shards or workers
+DURATIONS_KEY = pytest.StashKey[dict[str, float]]()  # duration in seconds of each test run by this process
+COLLECTION_KEY = pytest.StashKey[float]()  # collection time in seconds of this process
+RESULTS_LOG_NAME = "tidy-results-log"  # name the results log is registered with as a Pytest plugin
+
+
+def parse_split(
+    value: str,
+    option: str,
+) -> tuple[int, int]:
+    """
+    Function aimed at parsing a shard or worker option value.
+
+    :param value: option value as 'index/count' (e.g., 2/4), index starting from 1
+    :type value: str
+    :param option: option name (used in the error message)
+    :type option: str
+    :raises pytest.UsageError: if the value is not a valid index out of a count
+    :return: index (starting from 1) and count
+    :rtype: tuple[int, int]
+    """
+    index, _, count = value.partition("/")
+    if not (index.isdigit() and count.isdigit()) or not 1 <= int(index) <= int(count):
+        raise pytest.UsageError(f"{option} expects 'index/count' with 1 <= index <= count, got '{value}'")
+    return int(index), int(count)
+
+
+def select_shard(
+    items: list[pytest.Item],
+    durations: dict[str, float],
+    index: int,
+    count: int,
+) -> set[str]:
+    """
+    Function aimed at selecting the tests of a shard, balancing shards by the estimated duration of their tests.
+
+    :param items: collected tests
+    :type items: list[pytest.Item]
+    :param durations: recorded duration in seconds of each test id
+    :type durations: dict[str, float]
+    :param index: shard index (starting from 1)
+    :type index: int
+    :param count: number of shards
+    :type count: int
+    :return: ids of the tests of the shard
+    :rtype: set[str]
+    """
+    return partition(estimate_durations([get_test_id(item) for item in items], durations), count)[index - 1]
+
+
+def select_worker(
+    items: list[pytest.Item],
+    durations: dict[str, float],
+    index: int,
+    count: int,
+) -> set[str]:
+    """
+    Function aimed at selecting the test modules of a worker, balancing workers by the estimated duration of the modules tests
+    (modules are kept whole, so that module fixtures run once).
+
+    :param items: collected tests
+    :type items: list[pytest.Item]
+    :param durations: recorded duration in seconds of each test id
+    :type durations: dict[str, float]
+    :param index: worker index (starting from 1)
+    :type index: int
+    :param count: number of workers
+    :type count: int
+    :return: test modules (as posix paths) of the worker
+    :rtype: set[str]
+    """
+    modules: dict[str, float] = {}
+    for test_id, duration in estimate_durations([get_test_id(item) for item in items], durations).items():
+        module = test_id.partition("::")[0]
+        modules[module] = modules.get(module, 0.0) + duration
+    return partition(modules, count)[index - 1]
+
+
+def get_test_id(
+    item: pytest.Item,
+) -> str:
+    """
+    Function aimed at getting the id of a test relative to the directory Pytest is invoked from,
+    so that it can be passed back to Pytest whatever its rootdir is.
+
+    :param item: collected test
+    :type item: pytest.Item
+    :return: test id (e.g., tests/test_module.py::test_function[param])
+    :rtype: str
+    """
+    _, separator, name = item.nodeid.partition("::")
+    return Path(os.path.relpath(item.path, item.config.invocation_params.dir)).as_posix() + separator + name
+
+
+def get_report_test_id(
+    config: pytest.Config,
+    nodeid: str,
+) -> str:
+    """
+    Function aimed at getting the id of a reported test (or module) relative to the directory Pytest is invoked from,
+    as get_test_id does for collected tests.
+
+    :param config: Pytest config object
+    :type config: pytest.Config
+    :param nodeid: Pytest node id (relative to Pytest rootdir)
+    :type nodeid: str
+    :return: test id (e.g., tests/test_module.py::test_function[param])
+    :rtype: str
+    """
+    module, separator, name = nodeid.partition("::")
+    return Path(os.path.relpath(config.rootpath / module, config.invocation_params.dir)).as_posix() + separator + name
+
+
+def get_report_message(
+    report: pytest.TestReport | pytest.CollectReport,
+) -> str | None:
+    """
+    Function aimed at getting a one line message out of a failed or skipped report (e.g., the assertion error).
+
+    :param report: Pytest test or collection report
+    :type report: pytest.TestReport | pytest.CollectReport
+    :return: failure or skip reason message, None if the report passed
+    :rtype: str | None
+    """
+    if report.passed:
+        return getattr(report, "wasxfail", None) or None
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None:
+        return crash.message.splitlines()[0] if crash.message else None
+    if isinstance(report.longrepr, tuple):  # skip reports carry (path, line number, reason)
+        return str(report.longrepr[2])
+    lines = report.longreprtext.strip().splitlines()
+    return lines[-1] if lines else None
+
+
+class ResultsLog:
+    """
+    Class aimed at streaming the reports of a Pytest process to a JSON lines file as soon as they are made,
+    so that the run can be summarized without buffering or parsing its output.
+
+    :param config: Pytest config object
+    :type config: pytest.Config
+    :param path: path of the JSON lines file
+    :type path: Path
+    """
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        path: Path,
+    ) -> None:
+        # Line buffered, so that every report reaches the file even if the process is interrupted
+        self.config = config
+        self.file = open(path, "w", buffering=1)  # noqa: SIM115
+
+    def write(
+        self,
+        report: pytest.TestReport | pytest.CollectReport,
+        when: str,
+    ) -> None:
+        """
+        Method aimed at writing a report as a JSON line.
+
+        :param report: Pytest test or collection report
+        :type report: pytest.TestReport | pytest.CollectReport
+        :param when: phase of the report among collect, setup, call and teardown
+        :type when: str
+        :return: None
+        :rtype: None
+        """
+        line: dict[str, Any] = {
+            "test_id": get_report_test_id(self.config, report.nodeid),
+            "when": when,
+            "outcome": report.outcome,
+            "duration": getattr(report, "duration", 0.0),
+            "xfail": hasattr(report, "wasxfail"),
+            "message": get_report_message(report),
+        }
+        self.file.write(json.dumps(line) + "\n")
+
+    def pytest_runtest_logreport(
+        self,
+        report: pytest.TestReport,
+    ) -> None:
+        """
+        Hook aimed at logging the report of each test phase (i.e., setup, call and teardown).
+
+        :param report: Pytest test report
+        :type report: pytest.TestReport
+        :return: None
+        :rtype: None
+        """
+        self.write(report, report.when)
+
+    def pytest_collectreport(
+        self,
+        report: pytest.CollectReport,
+    ) -> None:
+        """
+        Hook aimed at logging the collection errors (e.g., a test module failing to import).
+
+        :param report: Pytest collection report
+        :type report: pytest.CollectReport
+        :return: None
+        :rtype: None
+        """
+        if report.failed:
+            self.write(report, "collect")
+
+    def pytest_unconfigure(self) -> None:
+        """
+        Hook aimed at closing the results log.
+
+        :return: None
+        :rtype: None
+        """
+        self.file.close()
+
+
+def pytest_addoption(
+    parser: pytest.Parser,
+) -> None:
+    """
+    Hook aimed at registering the plugin command line options.
+
+    :param parser: Pytest command line parser
+    :type parser: pytest.Parser
+    :return: None
+    :rtype: None
+    """
+    parser.addoption(
+        SHARD_OPTION,
+        dest="tidy_shard",
+        default=None,
+        help="run only the tests assigned to this shard, given as 'index/count' (e.g., 2/4).",
+    )
+    parser.addoption(
+        WORKER_OPTION,
+        dest="tidy_worker",
+        default=None,
+        help="run only the test modules assigned to this worker, given as 'index/count' (e.g., 2/4).",
+    )
+    parser.addoption(
+        DURATIONS_OPTION,
+        dest="tidy_durations",
+        default=None,
+        help="JSON file of the recorded test durations used to balance shards and workers.",
+    )
+    parser.addoption(
+        DURATIONS_MODE_OPTION,
+        dest="tidy_durations_mode",
+        default=PLAIN_MODE,
+        help="mode of the recorded test durations used to balance shards and workers (e.g., plain, warm, coverage-sysmon).",
+    )
+    parser.addoption(
+        REPORT_DURATIONS_OPTION,
+        dest="tidy_report_durations",
+        default=None,
+        help="folder where to write the duration of each test run by this process and the log of its results.",
+    )
+    parser.addoption(
+        CONTEXTS_OPTION,
+        dest="tidy_contexts",
+        action="store_true",
+        default=False,
+        help="switch the Coverage context to the id of each running test (when running under Coverage).",
+    )
+
+
+def pytest_configure(
+    config: pytest.Config,
+) -> None:
+    """
+    Hook aimed at registering the results log of this process, if reports are requested.
+
+    :param config: Pytest config object
+    :type config: pytest.Config
+    :return: None
+    :rtype: None
+    """
+    report_dir = config.getoption("tidy_report_durations")
+    if report_dir is not None and not config.pluginmanager.has_plugin(RESULTS_LOG_NAME):
+        config.pluginmanager.register(ResultsLog(config, Path(report_dir) / f"results-{os.getpid()}.jsonl"), RESULTS_LOG_NAME)
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """
+    Hook aimed at deselecting the tests that are not assigned to this shard and then to this worker.
+
+    :param config: Pytest config object
+    :type config: pytest.Config
+    :param items: collected tests, modified in place
+    :type items: list[pytest.Item]
+    :return: None
+    :rtype: None
+    """
+    shard, worker = config.getoption("tidy_shard"), config.getoption("tidy_worker")
+    if shard is None and worker is None:
+        return
+    durations_file, mode = config.getoption("tidy_durations"), config.getoption("tidy_durations_mode")
+    durations = {} if durations_file is None else load_durations(Path(durations_file), mode)
+    selected = items
+    if shard is not None:
+        tests = select_shard(selected, durations, *parse_split(shard, SHARD_OPTION))
+        selected = [item for item in selected if get_test_id(item) in tests]
+    if worker is not None:
+        modules = select_worker(selected, durations, *parse_split(worker, WORKER_OPTION))
+        selected = [item for item in selected if get_test_id(item).partition("::")[0] in modules]
+
+    kept = {id(item) for item in selected}
+    deselected = [item for item in items if id(item) not in kept]
+    config.stash[DESELECTED_KEY] = len(deselected)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_collection(
+    session: pytest.Session,
+) -> Generator[None, object, object]:
+    """
+    Hook aimed at recording the collection time (shard and worker selection included).
+
+    :param session: Pytest session object
+    :type session: pytest.Session
+    :return: hook wrapper giving control to the Pytest collection and returning its result
+    :rtype: Generator[None, object, object]
+    """
+    started_at = time.perf_counter()
+    try:
+        return (yield)
+    finally:
+        session.config.stash[COLLECTION_KEY] = time.perf_counter() - started_at
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(
+    item: pytest.Item,
+) -> Generator[None, object, object]:
+    """
+    Hook aimed at recording the duration of each test and the lines it runs (setup and teardown included),
+    the latter under a Coverage context named after the test.
+    Lines run outside of any test (e.g., at import time during collection) stay in the empty context.
+
+    :param item: test being run
+    :type item: pytest.Item
+    :return: hook wrapper giving control to the Pytest test protocol and returning its result
+    :rtype: Generator[None, object, object]
+    """
+    current = coverage.Coverage.current() if item.config.getoption("tidy_contexts") is True else None
+    if current is not None:
+        current.switch_context(get_test_id(item))
+    started_at = time.perf_counter()
+    try:
+        result = yield
+    finally:
+        item.config.stash.setdefault(DURATIONS_KEY, {})[get_test_id(item)] = time.perf_counter() - started_at
+        if current is not None:
+            current.switch_context("")
+    return result
+
+
+def pytest_sessionfinish(
+    session: pytest.Session,
+    exitstatus: int,
+) -> None:
+    """
+    Hook aimed at writing the measured test durations and collection time, if requested,
+    and at not failing a shard or worker left without tests because the suite has fewer tests than shards or workers.
+
+    :param session: Pytest session object
+    :type session: pytest.Session
+    :param exitstatus: Pytest exit status
+    :type exitstatus: int
+    :return: None
+    :rtype: None
+    """
+    report_dir = session.config.getoption("tidy_report_durations")
+    if report_dir is not None and (DURATIONS_KEY in session.config.stash or COLLECTION_KEY in session.config.stash):
+        report = {"durations": session.config.stash.get(DURATIONS_KEY, {}), "collection": session.config.stash.get(COLLECTION_KEY, None)}
+        with open(Path(report_dir) / f"durations-{os.getpid()}.json", "w") as file:
+            json.dump(report, file)
+    if exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED and session.config.stash.get(DESELECTED_KEY, 0) > 0:
+        session.exitstatus = pytest.ExitCode.OK
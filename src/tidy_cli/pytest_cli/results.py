@@ -0,0 +1,172 @@
+"""Module defining the structured test results, read from the results log of each Pytest process, for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.markup import escape
+
+# Define literals
+OUTCOMES = ["failed", "error", "passed", "skipped", "xfailed", "xpassed"]  # in the order they are summarized
+OUTCOME_STYLES = {"failed": "red", "error": "red", "passed": "green", "skipped": "yellow", "xfailed": "yellow", "xpassed": "yellow"}
+MAX_LISTED_FAILURES = 10  # failures listed in the summary, the others being counted only
+
+
+@dataclass
+class TestResult:
+    """
+    Class aimed at storing the result of a test, merged out of the reports of its phases.
+
+    .. attribute :: test_id
+        :type: str
+
+        test id (relative to the directory Pytest is run from), or test module id for collection errors
+
+    .. attribute :: outcome
+        :type: str
+
+        outcome of the test among OUTCOMES
+
+    .. attribute :: duration
+        :type: float
+
+        duration in seconds of the test (setup and teardown included)
+
+    .. attribute :: message
+        :type: str | None
+
+        one line failure or skip reason message, if any
+    """
+
+    __test__ = False  # not a Pytest test class, despite its name
+
+    test_id: str
+    outcome: str
+    duration: float = 0.0
+    message: str | None = None
+
+
+def merge_report(
+    result: TestResult | None,
+    report: dict[str, Any],
+) -> TestResult:
+    """
+    Function aimed at merging the report of a test phase into the result of the test.
+    Failures in setup, teardown or collection are errors, while expected failures are counted apart (i.e., xfailed and xpassed).
+
+    :param result: result of the test so far, None for its first report
+    :type result: TestResult | None
+    :param report: test phase report as written by the plugin results log
+    :type report: dict[str, Any]
+    :return: result of the test including the phase
+    :rtype: TestResult
+    """
+    result = TestResult(report["test_id"], "passed") if result is None else result
+    result.duration += report.get("duration") or 0.0
+    outcome, when = report["outcome"], report["when"]
+    if outcome == "failed":
+        outcome = "failed" if when == "call" else "error"
+    elif report.get("xfail") is True:
+        outcome = "xfailed" if outcome == "skipped" else "xpassed"
+    if outcome != "passed" and result.outcome in ("passed", "xpassed"):
+        result.outcome, result.message = outcome, report.get("message")
+    return result
+
+
+def load_results(
+    reports_dir: Path,
+) -> list[TestResult]:
+    """
+    Function aimed at reading the results log of each Pytest process of a run line by line,
+    merging the reports of the phases of each test.
+
+    :param reports_dir: folder where each Pytest process wrote its results log
+    :type reports_dir: Path
+    :return: result of each test, in the order they were reported
+    :rtype: list[TestResult]
+    """
+    results: dict[str, TestResult] = {}
+    for path in sorted(reports_dir.glob("*.jsonl")):
+        with open(path) as file:
+            for line in file:
+                try:
+                    report = json.loads(line)
+                except ValueError:
+                    continue  # a process interrupted while writing leaves a truncated last line
+                results[report["test_id"]] = merge_report(results.get(report["test_id"]), report)
+    return list(results.values())
+
+
+def count_outcomes(
+    results: list[TestResult],
+) -> dict[str, int]:
+    """
+    Function aimed at counting the tests of each outcome.
+
+    :param results: result of each test
+    :type results: list[TestResult]
+    :return: number of tests of each outcome among OUTCOMES, outcomes without tests left out
+    :rtype: dict[str, int]
+    """
+    counts = {outcome: sum(result.outcome == outcome for result in results) for outcome in OUTCOMES}
+    return {outcome: count for outcome, count in counts.items() if count > 0}
+
+
+def print_results_summary(
+    console: Console,
+    results: list[TestResult],
+    max_failures: int = MAX_LISTED_FAILURES,
+) -> None:
+    """
+    Function aimed at printing a compact summary of the results: the failures and errors, then the counts by outcome and the test time.
+
+    :param console: console to print to
+    :type console: Console
+    :param results: result of each test
+    :type results: list[TestResult]
+    :param max_failures: number of failures and errors listed, defaults to MAX_LISTED_FAILURES
+    :type max_failures: int
+    :return: None
+    :rtype: None
+    """
+    if not results:
+        return
+    failures = [result for result in results if result.outcome in ("failed", "error")]
+    for result in failures[:max_failures]:
+        message = "" if result.message is None else f": {escape(result.message)}"
+        console.print(f"💥 {result.outcome.upper()} {escape(result.test_id)}{message}", style="red")
+    if len(failures) > max_failures:
+        console.print(f"💥 ... and [bold]{len(failures) - max_failures}[/bold] more", style="red")
+    counts = ", ".join(f"[{OUTCOME_STYLES[outcome]}]{count} {outcome}[/{OUTCOME_STYLES[outcome]}]" for outcome, count in count_outcomes(results).items())
+    console.print(f"📋 Results: {counts} in [bold]{sum(result.duration for result in results):.2f}s[/bold] of test time", style="white")
+
+
+def write_results_file(
+    path: Path,
+    results: list[TestResult],
+    returncode: int,
+) -> None:
+    """
+    Function aimed at writing the results as a JSON file (e.g., for CI tools), with the counts by outcome and the Pytest exit code.
+
+    :param path: path of the JSON file
+    :type path: Path
+    :param results: result of each test
+    :type results: list[TestResult]
+    :param returncode: Pytest exit code (the highest among the Pytest processes)
+    :type returncode: int
+    :return: None
+    :rtype: None
+    """
+    summary = {
+        "returncode": returncode,
+        "counts": count_outcomes(results),
+        "duration": sum(result.duration for result in results),
+        "tests": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(summary, file, indent=2)
@@ -0,0 +1,497 @@
+"""Module defining the warm Pytest fork server (i.e., a process with Pytest and project modules already imported) for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import IO, Any
+
+# Define literals
+PYTEST_COMMAND = ["python", "-m", "pytest"]  # commands starting with it can be run by the server
+SERVER_TIMEOUT = 3600  # seconds of inactivity after which the server shuts itself down
+SERVER_START_TIMEOUT = 120  # seconds waited for the server to import the preloaded modules
+SERVER_CODE = "import sys; from tidy_cli.pytest_cli.server import serve; serve(sys.argv[1], sys.argv[2:])"
+STD_FDS = [0, 1, 2]  # stdin, stdout and stderr, passed to the forked run so that it writes to the caller terminal
+RUNTIME_DIR_ENV = "XDG_RUNTIME_DIR"  # per-user runtime folder (e.g., /run/user/1000), preferred for sockets
+SOCKET_DIR = "tidy-cli"  # folder of the server sockets and logs, private to the current user
+
+
+def is_warm_supported() -> bool:
+    """
+    Function aimed at checking whether the platform supports the warm server (i.e., fork, file descriptors passing and peer credentials).
+
+    :return: True if the warm server is supported and False otherwise (e.g., on Windows)
+    :rtype: bool
+    """
+    return hasattr(os, "fork") and hasattr(socket, "send_fds") and hasattr(socket, "AF_UNIX") and (hasattr(socket, "SO_PEERCRED") or hasattr(socket, "LOCAL_PEERCRED"))
+
+
+def get_socket_dir() -> Path:
+    """
+    Function aimed at getting the folder of the server sockets, private to the current user: in the runtime folder of the user
+    when available (i.e., XDG_RUNTIME_DIR), in the user cache folder otherwise, rather than in the shared temporary folder.
+
+    :return: path of the sockets folder
+    :rtype: Path
+    """
+    runtime_dir = os.environ.get(RUNTIME_DIR_ENV)
+    base = Path(runtime_dir) if runtime_dir and Path(runtime_dir).is_dir() else Path.home() / ".cache"
+    return base / SOCKET_DIR
+
+
+def make_private_dir(
+    folder: Path,
+) -> None:
+    """
+    Function aimed at creating a folder only the current user can access (i.e., mode 0700), checking it is owned by them when it exists.
+
+    :param folder: folder to be created
+    :type folder: Path
+    :raises RuntimeError: if the folder is owned by another user
+    :return: None
+    :rtype: None
+    """
+    folder.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = folder.stat()
+    if info.st_uid != os.getuid():
+        raise RuntimeError(f"{folder} is owned by another user")
+    if info.st_mode & 0o077:
+        folder.chmod(0o700)
+
+
+def get_peer_uid(
+    connection: socket.socket,
+) -> int | None:
+    """
+    Function aimed at getting the user id of the process at the other end of a Unix socket connection.
+
+    :param connection: Unix socket connection
+    :type connection: socket.socket
+    :return: user id of the peer, None if the platform cannot tell it
+    :rtype: int | None
+    """
+    if hasattr(socket, "SO_PEERCRED"):  # Linux: struct ucred {pid, uid, gid}
+        _, uid, _ = struct.unpack("3i", connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+        return uid
+    if hasattr(socket, "LOCAL_PEERCRED"):  # macOS and BSD: struct xucred {version, uid, ...} at level SOL_LOCAL (i.e., 0)
+        _, uid = struct.unpack_from("2I", connection.getsockopt(getattr(socket, "SOL_LOCAL", 0), socket.LOCAL_PEERCRED, 256))
+        return uid
+    return None
+
+
+def is_same_user(
+    connection: socket.socket,
+) -> bool:
+    """
+    Function aimed at checking whether the process at the other end of a connection runs as the current user,
+    as the server runs code with the environment and terminal it is sent.
+
+    :param connection: Unix socket connection
+    :type connection: socket.socket
+    :return: True if the peer runs as the current user and False otherwise (or when it cannot be told)
+    :rtype: bool
+    """
+    try:
+        return get_peer_uid(connection) == os.getuid()
+    except OSError:
+        return False
+
+
+def get_socket_path(
+    root: Path | None = None,
+) -> Path:
+    """
+    Function aimed at getting the socket path of the server running tests from a folder with the Python interpreter on PATH.
+    Each folder and interpreter (e.g., virtual environment) gets its own server, the socket living in the private sockets folder
+    (see get_socket_dir) as socket paths are limited in length.
+
+    :param root: folder tests are run from, defaults to the current directory
+    :type root: Path | None
+    :return: path of the server socket
+    :rtype: Path
+    """
+    root = Path.cwd() if root is None else root
+    python = shutil.which(PYTEST_COMMAND[0]) or sys.executable
+    key = hashlib.blake2b(f"{root.resolve()}\0{python}".encode(), digest_size=8).hexdigest()
+    return get_socket_dir() / f"pytest-{key}.sock"
+
+
+def snapshot_sources() -> dict[str, float]:
+    """
+    Function aimed at getting the modification time of the source of every imported module.
+
+    :return: modification time of each imported module file
+    :rtype: dict[str, float]
+    """
+    sources = {}
+    for module in list(sys.modules.values()):
+        source = getattr(module, "__file__", None)
+        if isinstance(source, str):
+            try:
+                sources[source] = os.stat(source).st_mtime
+            except OSError:
+                continue
+    return sources
+
+
+def find_stale_source(
+    sources: dict[str, float],
+) -> str | None:
+    """
+    Function aimed at finding an imported module whose source changed (or was removed) since it was imported.
+
+    :param sources: modification time of each imported module file when the server started
+    :type sources: dict[str, float]
+    :return: path of the first changed source, None when every source is unchanged
+    :rtype: str | None
+    """
+    for source, modified in sources.items():
+        try:
+            if os.stat(source).st_mtime != modified:
+                return source
+        except OSError:
+            return source
+    return None
+
+
+def preload(
+    modules: list[str],
+) -> list[str]:
+    """
+    Function aimed at importing Pytest, its builtin plugins and the given project modules.
+
+    :param modules: names of the project modules to be preloaded
+    :type modules: list[str]
+    :return: names of the modules that could not be imported
+    :rtype: list[str]
+    """
+    import _pytest.config
+
+    failed = []
+    for name in [*(f"_pytest.{plugin}" for plugin in _pytest.config.default_plugins), *modules]:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"Could not preload {name}: {e}", file=sys.stderr, flush=True)
+            failed.append(name)
+    return failed
+
+
+def run_forked(
+    connection: socket.socket,
+    request: dict[str, Any],
+    fds: list[int],
+) -> None:
+    """
+    Function aimed at running Pytest in the forked child of the server, as if it was run by the caller,
+    namely with its working directory, environment and terminal, sending back the return code.
+
+    :param connection: connection with the caller
+    :type connection: socket.socket
+    :param request: run request with the Pytest arguments, the working directory and the environment
+    :type request: dict[str, Any]
+    :param fds: caller stdin, stdout and stderr file descriptors
+    :type fds: list[int]
+    :return: None
+    :rtype: None
+    """
+    returncode = 1
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)  # tests may wait for their own subprocesses
+        for target, fd in zip(STD_FDS, fds, strict=True):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdout.reconfigure(line_buffering=True)  # type: ignore[union-attr]
+        sys.stderr.reconfigure(line_buffering=True)  # type: ignore[union-attr]
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.path[0] = request["cwd"]
+        connection.sendall(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+
+        import pytest
+
+        sys.argv = [str(Path(pytest.__file__).with_name("__main__.py")), *request["args"]]
+        returncode = int(pytest.main(request["args"]))
+    except BaseException as e:
+        print(f"Pytest server run failed: {e!r}", file=sys.stderr)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            connection.sendall(json.dumps({"returncode": returncode}).encode() + b"\n")
+        finally:
+            os._exit(returncode)
+
+
+def receive_request(
+    connection: socket.socket,
+) -> tuple[dict[str, Any], list[int]]:
+    """
+    Function aimed at receiving a request (one JSON line) with the file descriptors passed along.
+
+    :param connection: connection with the caller
+    :type connection: socket.socket
+    :return: request and received file descriptors
+    :rtype: tuple[dict[str, Any], list[int]]
+    """
+    data, fds, _, _ = socket.recv_fds(connection, 65536, len(STD_FDS))
+    while data and not data.endswith(b"\n"):
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data), list(fds)
+
+
+def serve(
+    socket_path: str,
+    modules: list[str],
+) -> None:
+    """
+    Function aimed at serving Pytest runs from the current directory: each run is forked out of this process,
+    which has already imported Pytest and the preloaded modules.
+    The server shuts down when any imported source changed (answering the run as stale), when it is stopped
+    or after SERVER_TIMEOUT seconds of inactivity.
+
+    :param socket_path: path of the server socket
+    :type socket_path: str
+    :param modules: names of the project modules to be preloaded
+    :type modules: list[str]
+    :return: None
+    :rtype: None
+    """
+    started_at = time.time()
+    preload(modules)
+    sources = snapshot_sources()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # forked runs are reaped automatically
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+            return  # another server is already serving the folder
+        except OSError:
+            Path(socket_path).unlink(missing_ok=True)
+    os.umask(0o077)  # the socket runs code on behalf of the caller, so it is restricted to the current user
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen()
+    listener.settimeout(SERVER_TIMEOUT)
+    runs = 0
+    try:
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except TimeoutError:
+                break
+            with connection:
+                connection.settimeout(None)
+                if is_same_user(connection) is False:
+                    continue  # only runs of the current user are served
+                try:
+                    request, fds = receive_request(connection)
+                except (OSError, ValueError):
+                    continue
+                action = request.get("action")
+                stale = find_stale_source(sources)
+                if stale is None and action == "run" and request.get("modules") != modules:
+                    stale = "preloaded modules setting"
+                if action == "run" and stale is None:
+                    if os.fork() == 0:
+                        listener.close()
+                        run_forked(connection, request, fds)
+                    runs += 1
+                else:
+                    if action == "stop" or action == "run":
+                        # The socket is removed before replying, so that the caller can start a fresh server right away
+                        listener.close()
+                        Path(socket_path).unlink(missing_ok=True)
+                    reply = {"pid": os.getpid(), "started": started_at, "modules": modules, "runs": runs, "stale": stale}
+                    connection.sendall(json.dumps(reply).encode() + b"\n")
+                for fd in fds:
+                    os.close(fd)
+                if listener.fileno() == -1:
+                    break
+    finally:
+        listener.close()
+        Path(socket_path).unlink(missing_ok=True)
+
+
+def send_request(
+    socket_path: Path,
+    request: dict[str, Any],
+    fds: list[int] | None = None,
+) -> socket.socket:
+    """
+    Function aimed at connecting to the server and sending it a request (one JSON line).
+
+    :param socket_path: path of the server socket
+    :type socket_path: Path
+    :param request: request with its action among run, status and stop
+    :type request: dict[str, Any]
+    :param fds: file descriptors passed along, defaults to None (i.e., none)
+    :type fds: list[int] | None
+    :raises RuntimeError: if the server runs as another user (nothing is sent to it)
+    :return: connection with the server, to read its replies from
+    :rtype: socket.socket
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+        if is_same_user(client) is False:
+            # The request carries the environment (e.g., secrets) and the terminal, hence it is sent to the current user only
+            client.close()
+            raise RuntimeError(f"Pytest server socket {socket_path} is served by another user")
+        data = json.dumps(request).encode() + b"\n"
+        sent = socket.send_fds(client, [data], fds or [])
+        if sent < len(data):
+            # The rest only, as the server may have already replied and closed the connection (e.g., status and stop)
+            client.sendall(data[sent:])
+    except OSError:
+        client.close()
+        raise
+    return client
+
+
+def read_reply(
+    replies: IO[str],
+) -> dict[str, Any] | None:
+    """
+    Function aimed at reading the next reply (one JSON line) of the server.
+
+    :param replies: server replies stream
+    :type replies: IO[str]
+    :return: reply, None when the server closed the connection
+    :rtype: dict[str, Any] | None
+    """
+    line = replies.readline()
+    return json.loads(line) if line else None
+
+
+def get_server_status(
+    socket_path: Path,
+) -> dict[str, Any] | None:
+    """
+    Function aimed at getting the status of the server.
+
+    :param socket_path: path of the server socket
+    :type socket_path: Path
+    :return: server pid, start timestamp, preloaded modules, number of runs and stale source (if any), None when not running (or run by another user)
+    :rtype: dict[str, Any] | None
+    """
+    try:
+        with send_request(socket_path, {"action": "status"}) as client, client.makefile("r") as replies:
+            return read_reply(replies)
+    except (OSError, ValueError, RuntimeError):
+        return None
+
+
+def stop_server(
+    socket_path: Path,
+) -> bool:
+    """
+    Function aimed at stopping the server.
+
+    :param socket_path: path of the server socket
+    :type socket_path: Path
+    :return: True if a running server was stopped and False otherwise
+    :rtype: bool
+    """
+    try:
+        with send_request(socket_path, {"action": "stop"}) as client, client.makefile("r") as replies:
+            return read_reply(replies) is not None
+    except (OSError, ValueError, RuntimeError):
+        return False
+
+
+def start_server(
+    socket_path: Path,
+    modules: list[str],
+) -> None:
+    """
+    Function aimed at starting the server in the background from the current directory and waiting until it is serving.
+    Its output (e.g., preloading errors) goes to a log file next to the socket, in the private sockets folder.
+
+    :param socket_path: path of the server socket
+    :type socket_path: Path
+    :param modules: names of the project modules to be preloaded
+    :type modules: list[str]
+    :raises RuntimeError: if the sockets folder is not private, or the server exits or is not serving within SERVER_START_TIMEOUT seconds
+    :return: None
+    :rtype: None
+    """
+    make_private_dir(socket_path.parent)
+    log_path = socket_path.with_suffix(".log")
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(
+            [PYTEST_COMMAND[0], "-c", SERVER_CODE, str(socket_path), *modules],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,  # not interrupted along with the caller
+        )
+    deadline = time.perf_counter() + SERVER_START_TIMEOUT
+    while time.perf_counter() < deadline:
+        if get_server_status(socket_path) is not None:
+            return
+        if process.poll() is not None:
+            raise RuntimeError(f"Pytest server exited with code {process.returncode}, see {log_path}")
+        time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"Pytest server not serving after {SERVER_START_TIMEOUT}s, see {log_path}")
+
+
+def run_warm(
+    args: list[str],
+    modules: list[str],
+) -> int:
+    """
+    Function aimed at running Pytest with the given arguments in a child forked out of the warm server,
+    writing to the current terminal. The server is started when not running and restarted when stale
+    (i.e., a preloaded source or the preloaded modules changed).
+    Interrupting the caller interrupts the run.
+
+    :param args: Pytest arguments (e.g., tests/test_module.py -v)
+    :type args: list[str]
+    :param modules: names of the project modules to be preloaded
+    :type modules: list[str]
+    :raises RuntimeError: if the server cannot be started or the run gets no return code
+    :return: return code of the run
+    :rtype: int
+    """
+    socket_path = get_socket_path()
+    request = {"action": "run", "args": args, "cwd": str(Path.cwd()), "env": dict(os.environ), "modules": modules}
+    for _ in range(2):
+        if get_server_status(socket_path) is None:
+            start_server(socket_path, modules)
+        pid, interrupted = None, False
+        with send_request(socket_path, request, STD_FDS) as client, client.makefile("r") as replies:
+            while True:
+                try:
+                    reply = read_reply(replies)
+                except KeyboardInterrupt:
+                    if pid is None or interrupted is True:
+                        raise
+                    # The run is interrupted as Pytest would be, waiting for its summary (interrupting again leaves)
+                    os.kill(pid, signal.SIGINT)
+                    interrupted = True
+                    continue
+                if reply is None:
+                    if pid is None:
+                        raise RuntimeError("Pytest server closed the connection")
+                    return 1  # the run died without a return code (e.g., crashed)
+                if "returncode" in reply:
+                    return int(reply["returncode"])
+                if reply.get("stale") is not None:
+                    break  # the server shut down, it is started again with fresh sources
+                pid = reply.get("pid")
+    raise RuntimeError("Pytest server kept restarting on changed sources")
@@ -0,0 +1,160 @@
+"""Module defining the slow tests report and the detection of tests getting slower than their baseline for the CLI Pytest Commands Group."""
+
+# Import packages and modules
+from dataclasses import dataclass
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+# Define literals
+MIN_REGRESSION_DURATION = 0.1  # tests faster than this (in seconds) are not flagged as slower, their timing being mostly noise
+
+
+@dataclass
+class TestTiming:
+    """
+    Class aimed at storing the duration of a test in a run along with its baseline.
+
+    .. attribute :: test_id
+        :type: str
+
+        test id (relative to the directory Pytest is run from)
+
+    .. attribute :: duration
+        :type: float
+
+        duration in seconds of the test in the run
+
+    .. attribute :: baseline
+        :type: float | None
+
+        baseline duration in seconds of the test (i.e., median of its latest recorded durations), None if it has no history
+    """
+
+    __test__ = False  # not a Pytest test class, despite its name
+
+    test_id: str
+    duration: float
+    baseline: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        """
+        Method aimed at getting how many times the test is slower than its baseline.
+
+        :return: duration to baseline ratio, None if the test has no (positive) baseline
+        :rtype: float | None
+        """
+        return None if not self.baseline else self.duration / self.baseline
+
+
+def compare_durations(
+    measured: dict[str, float],
+    baselines: dict[str, float],
+) -> list[TestTiming]:
+    """
+    Function aimed at comparing the durations measured by a run with the baselines recorded before it.
+
+    :param measured: duration in seconds of each test id run
+    :type measured: dict[str, float]
+    :param baselines: baseline duration in seconds of each test id
+    :type baselines: dict[str, float]
+    :return: timing of each test run, slowest first
+    :rtype: list[TestTiming]
+    """
+    timings = [TestTiming(test_id, duration, baselines.get(test_id)) for test_id, duration in measured.items()]
+    return sorted(timings, key=lambda timing: (-timing.duration, timing.test_id))
+
+
+def find_regressions(
+    timings: list[TestTiming],
+    max_ratio: float,
+    min_duration: float = MIN_REGRESSION_DURATION,
+) -> list[TestTiming]:
+    """
+    Function aimed at finding the tests slower than their baseline by more than the given ratio.
+    Tests without history or faster than the minimum duration are left out.
+
+    :param timings: timing of each test run
+    :type timings: list[TestTiming]
+    :param max_ratio: maximum allowed duration to baseline ratio (e.g., 2.0 for twice as slow)
+    :type max_ratio: float
+    :param min_duration: minimum duration in seconds of a test to be flagged, defaults to MIN_REGRESSION_DURATION
+    :type min_duration: float
+    :return: timings of the tests slower than allowed, in the given order
+    :rtype: list[TestTiming]
+    """
+    return [timing for timing in timings if timing.ratio is not None and timing.duration >= min_duration and timing.ratio > max_ratio]
+
+
+def print_slow_tests(
+    console: Console,
+    timings: list[TestTiming],
+    collection: float | None,
+    slowest: int,
+) -> None:
+    """
+    Function aimed at printing the slow tests report: the slowest tests along with their baseline, then the collection time.
+
+    :param console: console to print to
+    :type console: Console
+    :param timings: timing of each test run, slowest first
+    :type timings: list[TestTiming]
+    :param collection: collection time in seconds, None if not measured
+    :type collection: float | None
+    :param slowest: number of slowest tests to be listed (0 to list none)
+    :type slowest: int
+    :return: None
+    :rtype: None
+    """
+    if slowest > 0 and timings:
+        table = Table(title=f"🐢 Slowest {min(slowest, len(timings))} test(s)", title_justify="left")
+        table.add_column("Test")
+        table.add_column("Duration", justify="right")
+        table.add_column("Baseline", justify="right")
+        table.add_column("Ratio", justify="right")
+        for timing in timings[:slowest]:
+            table.add_row(
+                escape(timing.test_id),
+                f"{timing.duration:.2f}s",
+                "-" if timing.baseline is None else f"{timing.baseline:.2f}s",
+                "-" if timing.ratio is None else f"{timing.ratio:.1f}x",
+            )
+        console.print(table)
+    if collection is not None:
+        console.print(f"⏱️  Collection: [bold]{collection:.2f}s[/bold]", style="white")
+
+
+def print_regressions(
+    console: Console,
+    regressions: list[TestTiming],
+    max_ratio: float,
+    fail: bool = False,
+) -> None:
+    """
+    Function aimed at printing the tests slower than their baseline by more than the allowed ratio, if any.
+
+    :param console: console to print to
+    :type console: Console
+    :param regressions: timings of the tests slower than allowed
+    :type regressions: list[TestTiming]
+    :param max_ratio: maximum allowed duration to baseline ratio
+    :type max_ratio: float
+    :param fail: whether slower tests fail the run (printed as errors rather than warnings), defaults to False
+    :type fail: bool
+    :return: None
+    :rtype: None
+    """
+    if not regressions:
+        return
+    style = "red" if fail is True else "yellow"
+    console.print(
+        f"{'❌' if fail is True else '⚠️'} [bold]{len(regressions)}[/bold] test(s) slower than [bold]{max_ratio:g}x[/bold] their baseline:",
+        style=style,
+    )
+    for timing in regressions:
+        console.print(
+            f"🐌 {escape(timing.test_id)}: [bold]{timing.duration:.2f}s[/bold] vs {timing.baseline:.2f}s baseline ([bold]{timing.ratio:.1f}x[/bold])",
+            style=style,
+        )
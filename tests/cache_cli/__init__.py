@@ -0,0 +1 @@
+"""Tests for the lint CLI module."""
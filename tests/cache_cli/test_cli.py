@@ -0,0 +1,59 @@
+"""Tests for the cache CLI module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from tidy_cli.cache_cli.cli import cache_app
+from tidy_cli.cache_cli.helpers import CacheLocation
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Return a CLI runner."""
+    return CliRunner()
+
+
+LOCATIONS = [
+    CacheLocation(Path(".pytest_cache"), "pytest", 2048, 0.0),
+    CacheLocation(Path("src/__pycache__"), "bytecode", 1024, 0.0),
+]
+
+
+def test_list_caches(runner):
+    """Test listing of caches totals."""
+    with patch("tidy_cli.cache_cli.cli.find_cache_locations", return_value=LOCATIONS), patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(cache_app, ["list"])
+
+        assert result.exit_code == 0
+        mock_print.assert_called_with("💾 Total: [bold]3.0 KB[/bold] in [bold]2[/bold] location(s)", style="white")
+
+
+def test_list_caches_empty(runner):
+    """Test listing when no cache is found."""
+    with patch("tidy_cli.cache_cli.cli.find_cache_locations", return_value=[]), patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(cache_app, ["list", "src"])
+
+        assert result.exit_code == 0
+        mock_print.assert_called_with("✨ No caches found under [bold]src[/bold]", style="green")
+
+
+def test_prune_requires_criteria(runner):
+    """Test that prune refuses to run without an age, a size budget or --all."""
+    with patch("tidy_cli.cache_cli.cli.prune_caches") as mock_prune, patch("rich.console.Console.print"):
+        result = runner.invoke(cache_app, ["prune"])
+
+        assert result.exit_code == 1
+        mock_prune.assert_not_called()
+
+
+def test_prune(runner):
+    """Test pruning by age and size budget restricted to a kind of cache."""
+    with patch("tidy_cli.cache_cli.cli.prune_caches", return_value=LOCATIONS) as mock_prune, patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(cache_app, ["prune", "--older-than", "7", "--max-size", "100", "--kind", "pytest", "--dry-run"])
+
+        assert result.exit_code == 0
+        mock_prune.assert_called_once_with(Path("."), 7.0, 100.0, ["pytest"], dry_run=True)
+        mock_print.assert_called_with("👀 Would prune [bold]2[/bold] cache location(s), freeing [bold]3.0 KB[/bold]", style="white")
@@ -0,0 +1,125 @@
+"""Tests for the cache helpers module."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from tidy_cli.cache_cli.helpers import (
+    TIDY_CACHES,
+    CacheLocation,
+    find_cache_locations,
+    format_age,
+    format_size,
+    prune_caches,
+    select_prunable,
+)
+from tidy_cli.commons.settings import Settings
+
+
+def _touch(path: Path, size: int = 10, modified: float | None = None) -> Path:
+    """Create a file of the given size and modification time."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    if modified is not None:
+        os.utime(path, (modified, modified))
+        os.utime(path.parent, (modified, modified))
+    return path
+
+
+def test_find_cache_locations(tmp_path, monkeypatch):
+    """Test that caches are found in a single walk, skipping virtual environments and hidden folders."""
+    monkeypatch.chdir(tmp_path)
+    _touch(tmp_path / "src" / "pkg" / "__pycache__" / "a.pyc", size=100)
+    _touch(tmp_path / ".pytest_cache" / "v" / "lastfailed", size=20)
+    _touch(tmp_path / ".mypy_cache" / "3.11" / "a.json")
+    _touch(tmp_path / ".coverage")
+    _touch(tmp_path / "src" / ".coverage.host.1.2")
+    _touch(tmp_path / ".venv" / "lib" / "__pycache__" / "b.pyc")
+    _touch(tmp_path / "env" / "pyvenv.cfg")
+    _touch(tmp_path / "env" / "lib" / "__pycache__" / "c.pyc")
+    _touch(tmp_path / "local" / "tidy_cli_settings.json")
+    _touch(tmp_path / "local" / "tidy_cli_settings.json.lock")
+    _touch(tmp_path / "local" / "tidy_cli_settings.json.corrupt")
+    _touch(tmp_path / "local" / "notes.txt")
+    _touch(tmp_path / "local" / "tidy_cli_test_durations.json")
+    _touch(tmp_path / "local" / "coverage" / ".coverage")
+
+    locations = find_cache_locations(Path("."))
+
+    assert [(location.path.as_posix(), location.kind) for location in locations] == [
+        (".coverage", "coverage"),
+        (".mypy_cache", "mypy"),
+        (".pytest_cache", "pytest"),
+        ("local/coverage", "tidy"),
+        ("local/tidy_cli_test_durations.json", "tidy"),
+        ("src/.coverage.host.1.2", "coverage"),
+        ("src/pkg/__pycache__", "bytecode"),
+    ]
+    assert locations[-1].size == 100
+    # Tidy CLI caches are looked for under the given root, or in the given data folder (e.g., resolved before moving elsewhere)
+    monkeypatch.chdir(tmp_path / "src")
+    assert [location.path for location in find_cache_locations(tmp_path) if location.kind == "tidy"][-1] == tmp_path / "local" / "tidy_cli_test_durations.json"
+    assert [location.path.name for location in find_cache_locations(Path("."), data_dir=tmp_path / "local")] == [
+        ".coverage.host.1.2",
+        "coverage",
+        "tidy_cli_test_durations.json",
+        "__pycache__",
+    ]
+
+
+def test_select_prunable_by_age_and_size():
+    """Test that old locations are pruned first, then the least recently modified ones beyond the size budget."""
+    locations = [
+        CacheLocation(Path("a"), "pytest", 10, 100.0),
+        CacheLocation(Path("b"), "mypy", 50, 900.0),
+        CacheLocation(Path("c"), "ruff", 30, 800.0),
+        CacheLocation(Path("d"), "bytecode", 30, 700.0),
+    ]
+
+    assert [location.path for location in select_prunable(locations, max_age=500, now=1000.0)] == [Path("a")]
+    assert [location.path for location in select_prunable(locations, max_size=80, now=1000.0)] == [Path("a"), Path("d")]
+    assert [location.path for location in select_prunable(locations, max_age=500, max_size=50, now=1000.0)] == [Path("a"), Path("d"), Path("c")]
+    assert select_prunable(locations) == []
+
+
+def test_prune_caches(tmp_path, monkeypatch):
+    """Test pruning by kind, dry run and age."""
+    monkeypatch.chdir(tmp_path)
+    _touch(tmp_path / ".ruff_cache" / "a", modified=0.0)
+    _touch(tmp_path / "pkg" / "__pycache__" / "a.pyc")
+
+    assert [location.kind for location in prune_caches(kinds=["ruff"], dry_run=True)] == ["ruff"]
+    assert (tmp_path / ".ruff_cache").exists()
+    assert [location.kind for location in prune_caches(max_age_days=1)] == ["ruff"]
+    assert not (tmp_path / ".ruff_cache").exists()
+    assert (tmp_path / "pkg" / "__pycache__").exists()
+    assert [location.kind for location in prune_caches()] == ["bytecode"]
+    assert not (tmp_path / "pkg" / "__pycache__").exists()
+
+
+def test_format_size_and_age():
+    """Test human readable sizes and ages."""
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(3 * 1024**3) == "3.0 GB"
+    assert format_age(30) == "30 s"
+    assert format_age(5400) == "1.5 h"
+    assert format_age(2 * 86400) == "2.0 d"
+
+
+def test_get_prune_budget():
+    """Test the prune budget from settings."""
+    from tidy_cli.cache_cli.helpers import get_prune_budget
+
+    with patch("tidy_cli.cache_cli.helpers.get_settings", return_value=Settings({"cache_max_age_days": "7"})):
+        assert get_prune_budget() == (7.0, None)
+
+
+def test_tidy_caches_match_written_files():
+    """Test that the listed Tidy CLI caches are the files the Commands Groups write next to the settings file."""
+    from tidy_cli.lint_cli.cache import CACHE_FILE
+    from tidy_cli.pytest_cli.coverage_reports import COVERAGE_DIR
+    from tidy_cli.pytest_cli.durations import DURATIONS_FILE
+    from tidy_cli.pytest_cli.impact import IMPACT_FILE
+
+    assert set(TIDY_CACHES) == {path.name for path in (CACHE_FILE, COVERAGE_DIR, DURATIONS_FILE, IMPACT_FILE)}
@@ -0,0 +1,97 @@
+"""Tests for the commons console module."""
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from rich.table import Table
+
+from tidy_cli.commons.console import (
+    HEADLESS_ENV,
+    ConsoleProxy,
+    is_headless,
+    prompt_setting,
+    set_headless,
+    to_plain_text,
+)
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        # Command line option wins over everything
+        {"option": True, "env": {HEADLESS_ENV: "0"}, "tty": True, "expected": True},
+        {"option": False, "env": {"CI": "true"}, "tty": False, "expected": False},
+        # Environment variable forcing the mode
+        {"option": None, "env": {HEADLESS_ENV: "1"}, "tty": True, "expected": True},
+        {"option": None, "env": {HEADLESS_ENV: "off", "CI": "true"}, "tty": False, "expected": False},
+        # CI environment variables
+        {"option": None, "env": {"GITHUB_ACTIONS": "true"}, "tty": True, "expected": True},
+        {"option": None, "env": {"CI": "false"}, "tty": True, "expected": False},
+        # Output not being a terminal
+        {"option": None, "env": {}, "tty": False, "expected": True},
+    ],
+)
+def test_is_headless(scenario, monkeypatch):
+    """Test headless mode detection order: option, TIDY_CLI_HEADLESS, CI variables, then terminal output."""
+    for name in (HEADLESS_ENV, "CI", "GITHUB_ACTIONS", "GITLAB_CI", "BUILDKITE", "CIRCLECI", "JENKINS_URL", "TF_BUILD", "TEAMCITY_VERSION"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in scenario["env"].items():
+        monkeypatch.setenv(name, value)
+    set_headless(scenario["option"])
+
+    with patch("sys.stdout.isatty", return_value=scenario["tty"]):
+        assert is_headless() is scenario["expected"]
+
+
+def test_to_plain_text():
+    """Test that markup and emoji are removed, while escaped brackets are kept."""
+    assert to_plain_text("✅ Settings saved to [bold]local/file.json[/bold]") == "Settings saved to local/file.json"
+    assert to_plain_text("⚠️  Warning: [yellow]tests/test_a.py::test\\[1][/yellow]") == "Warning: tests/test_a.py::test[1]"
+    assert to_plain_text("[bold]not markup", markup=False) == "[bold]not markup"
+
+
+def test_console_proxy_headless_print():
+    """Test that in headless mode strings are written as plain text and other renderables through a colorless Rich console."""
+    proxy, output = ConsoleProxy(), io.StringIO()
+    set_headless(True)
+    proxy.get_console().file = output
+
+    proxy.print("🧪 Running [bold]tests[/bold]", style="white")
+    proxy.print("a", "b", sep="-", end="")
+    table = Table("Test")
+    table.add_row("test_a")
+    proxy.print(table)
+
+    lines = output.getvalue().splitlines()
+    assert lines[:2] == ["Running tests", "a-b┏━━━━━━━━┓"]
+    assert "\x1b[" not in output.getvalue()
+    assert proxy.is_terminal is False
+
+
+def test_console_proxy_interactive_print():
+    """Test that in interactive mode printing is left to the Rich console."""
+    set_headless(False)
+
+    with patch("rich.console.Console.print") as mock_print:
+        ConsoleProxy().print("🧪 Running [bold]tests[/bold]", style="white")
+
+    mock_print.assert_called_once_with("🧪 Running [bold]tests[/bold]", style="white")
+
+
+def test_prompt_setting(monkeypatch):
+    """Test that settings come from their environment variable, the default in headless mode, or the prompt otherwise."""
+    monkeypatch.setenv("TIDY_CLI_LINT_DEFAULT_PATH", "app")
+    with patch("typer.prompt") as mock_prompt:
+        assert prompt_setting("▪ Path", "lint_default_path", "src") == Path("app")
+
+        monkeypatch.delenv("TIDY_CLI_LINT_DEFAULT_PATH")
+        set_headless(True)
+        assert prompt_setting("▪ Path", "lint_default_path", "src") == Path("src")
+        mock_prompt.assert_not_called()
+
+        set_headless(False)
+        mock_prompt.return_value = Path("lib")
+        assert prompt_setting("▪ Path", "lint_default_path", "src") == Path("lib")
+        mock_prompt.assert_called_once_with("▪ Path", default="src", show_default=True, type=Path)
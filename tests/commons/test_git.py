@@ -0,0 +1,152 @@
+"""Tests for the commons git module."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.tidy_cli.commons.git import (
+    GitError,
+    get_added_lines,
+    get_changed_files,
+    get_changed_lines,
+    parse_diff,
+    run_git,
+)
+
+
+def git(*args: str) -> None:
+    """Run a git command in the current working directory."""
+    subprocess.run(["git", *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repository(tmp_path: Path):
+    """Return a temporary git repository with a main branch and a feature branch checked out."""
+    original_cwd = Path.cwd()
+    os.chdir(tmp_path)
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    Path("committed.py").write_text("x = 1\n")
+    Path("deleted.py").write_text("x = 1\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "base")
+    git("checkout", "-q", "-b", "feature")
+    Path("feature.py").write_text("x = 1\n")
+    git("add", "feature.py")
+    git("commit", "-q", "-m", "feature")
+    yield tmp_path
+    os.chdir(original_cwd)
+
+
+def test_get_changed_files_uncommitted(repository: Path) -> None:
+    """Test changed files against HEAD include unstaged, staged and untracked files but not deleted ones."""
+    Path("committed.py").write_text("x = 2\n")
+    Path("staged.py").write_text("x = 1\n")
+    git("add", "staged.py")
+    Path("untracked.py").write_text("x = 1\n")
+    Path("deleted.py").unlink()
+
+    assert get_changed_files() == [Path("committed.py"), Path("staged.py"), Path("untracked.py")]
+
+
+def test_get_changed_files_since(repository: Path) -> None:
+    """Test changed files since a ref include committed changes on the branch."""
+    Path("untracked.py").write_text("x = 1\n")
+
+    assert get_changed_files("main") == [Path("feature.py"), Path("untracked.py")]
+
+
+def test_get_changed_files_unknown_ref(repository: Path) -> None:
+    """Test an unknown ref raises GitError."""
+    with pytest.raises(GitError):
+        get_changed_files("does-not-exist")
+
+
+def test_run_git_not_a_repository(tmp_path: Path) -> None:
+    """Test running git outside a repository raises GitError."""
+    original_cwd = Path.cwd()
+    os.chdir(tmp_path)
+    try:
+        with pytest.raises(GitError):
+            run_git(["rev-parse", "HEAD"])
+    finally:
+        os.chdir(original_cwd)
+
+
+def test_get_changed_lines(repository: Path) -> None:
+    """Test changed lines are numbered as in the base version and whole-file changes are None."""
+    Path("committed.py").write_text("y = 0\nx = 1\nz = 2\n")
+    Path("deleted.py").unlink()
+    Path("untracked.py").write_text("x = 1\n")
+
+    assert get_changed_lines() == {
+        Path("committed.py"): {0, 1, 2},
+        Path("deleted.py"): None,
+        Path("untracked.py"): None,
+    }
+
+    Path("committed.py").write_text("x = 3\n")
+
+    assert get_changed_lines("main") == {
+        Path("committed.py"): {1},
+        Path("deleted.py"): None,
+        Path("feature.py"): None,
+        Path("untracked.py"): None,
+    }
+
+
+def test_get_changed_lines_from_subfolder(repository: Path) -> None:
+    """Test changed lines are relative to the repository root when run from a subfolder (e.g., the tests folder)."""
+    Path("tests").mkdir()
+    Path("committed.py").write_text("x = 3\n")
+    Path("untracked.py").write_text("x = 1\n")
+    os.chdir("tests")
+
+    assert get_changed_lines() == {
+        Path("committed.py"): {1},
+        Path("untracked.py"): None,
+    }
+
+
+def test_parse_diff_content_like_headers() -> None:
+    """Test content lines looking like file headers (e.g., a removed '-- comment' line) are not read as headers."""
+    diff = (
+        "diff --git a/query.sql b/query.sql\n"
+        "index 1111111..2222222 100644\n"
+        "--- a/query.sql\n"
+        "+++ b/query.sql\n"
+        "@@ -2 +1,0 @@\n"
+        "--- comment\n"
+        "@@ -5,0 +5 @@\n"
+        "+++ added\n"
+        "diff --git a/new.py b/new.py\n"
+        "new file mode 100644\n"
+        "--- /dev/null\n"
+        "+++ b/new.py\n"
+        "@@ -0,0 +1,2 @@\n"
+        "+x = 1\n"
+        "+y = 2\n"
+    )
+
+    assert parse_diff(diff) == {Path("query.sql"): {2, 5, 6}, Path("new.py"): None}
+    assert parse_diff(diff, new_side=True) == {Path("query.sql"): {5}, Path("new.py"): None}
+
+
+def test_get_added_lines(repository: Path) -> None:
+    """Test added lines are numbered as in the current version, new files are None and deleted ones are excluded."""
+    Path("committed.py").write_text("y = 0\nx = 1\nz = 2\n")
+    Path("deleted.py").unlink()
+    Path("untracked.py").write_text("x = 1\n")
+
+    assert get_added_lines() == {
+        Path("committed.py"): {1, 3},
+        Path("untracked.py"): None,
+    }
+    assert get_added_lines("main") == {
+        Path("committed.py"): {1, 3},
+        Path("feature.py"): None,
+        Path("untracked.py"): None,
+    }
@@ -0,0 +1,48 @@
+"""Tests for the commons process module."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+from src.tidy_cli.commons.process import (
+    run_profiled,
+    spooled_buffer,
+    stream_command,
+)
+
+
+def test_stream_command() -> None:
+    """Test stream_command forwards every stdout and stderr line and returns the return code."""
+    lines = []
+    command = [sys.executable, "-c", "import sys; print('out 1'); sys.stderr.write('err 1\\n'); print('out 2'); sys.exit(2)"]
+
+    returncode = stream_command(command, on_line=lambda line, stream: lines.append((stream, line)))
+
+    assert returncode == 2
+    assert [line for line in lines if line[0] == "stdout"] == [("stdout", "out 1"), ("stdout", "out 2")]
+    assert [line for line in lines if line[0] == "stderr"] == [("stderr", "err 1")]
+
+
+def test_run_profiled_not_profiling() -> None:
+    """Test run_profiled is a plain subprocess.run call when profiling is disabled."""
+    with patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+        result = run_profiled(["pytest"], "Pytest", env={"A": "1"})
+
+    assert result.returncode == 0
+    mock_run.assert_called_once_with(["pytest"], env={"A": "1"})
+
+
+def test_run_profiled_profiling() -> None:
+    """Test run_profiled returns the return code when profiling."""
+    with patch("src.tidy_cli.commons.process.is_profiling", return_value=True), patch("src.tidy_cli.commons.process.wait_process", return_value=5) as mock_wait:
+        result = run_profiled([sys.executable, "-c", "pass"], "Pytest")
+
+    assert result.returncode == 5
+    assert mock_wait.call_args[0][1] == "Pytest"
+
+
+def test_spooled_buffer() -> None:
+    """Test spooled_buffer is a readable text buffer."""
+    buffer = spooled_buffer()
+    buffer.write("text")
+    buffer.seek(0)
+    assert buffer.read() == "text"
@@ -0,0 +1,79 @@
+"""Tests for the commons profiling module."""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from src.tidy_cli.commons.profiling import (
+    finish_profiling,
+    get_profiles,
+    is_profiling,
+    start_profiling,
+    wait_process,
+)
+
+
+@pytest.fixture
+def console() -> Console:
+    """Return a Console writing to memory."""
+    return Console(file=io.StringIO(), width=120)
+
+
+def test_wait_process_not_profiling() -> None:
+    """Test wait_process only waits when profiling is disabled."""
+    process = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    assert is_profiling() is False
+    assert wait_process(process, "Tool", 0.0) == 3
+    assert get_profiles() == []
+
+
+def test_profiling_roundtrip(console: Console, tmp_path: Path) -> None:
+    """Test profiles are recorded while profiling, printed and written as JSON."""
+    start_profiling()
+    process = subprocess.Popen([sys.executable, "-c", "sum(range(10**6))"])
+    assert wait_process(process, "Busy tool", 0.0) == 0
+    assert process.returncode == 0
+
+    profiles = get_profiles()
+    assert [profile.label for profile in profiles] == ["Busy tool"]
+    if sys.platform != "win32":
+        assert profiles[0].cpu_time is not None and profiles[0].cpu_time > 0
+        assert profiles[0].peak_rss_mb is not None and profiles[0].peak_rss_mb > 1
+
+    output_path = tmp_path / "reports" / "profile.json"
+    finish_profiling(console, "lint run", output_path)
+
+    assert is_profiling() is False
+    assert "Busy tool" in console.file.getvalue()
+    report = json.loads(output_path.read_text())
+    assert report["command"] == "lint run"
+    assert report["tools"][0]["label"] == "Busy tool"
+
+
+def test_profiling_without_wait4(console: Console) -> None:
+    """Test platforms without os.wait4 record wall time only."""
+    start_profiling()
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    with patch("src.tidy_cli.commons.profiling.hasattr", return_value=False, create=True):
+        wait_process(process, "Tool", 0.0)
+    finish_profiling(console, "pytest run")
+
+    profile = get_profiles()[0]
+    assert profile.cpu_time is None
+    assert profile.peak_rss_mb is None
+
+
+def test_start_profiling_discards_previous(console: Console) -> None:
+    """Test starting profiling again discards previous profiles."""
+    start_profiling()
+    wait_process(subprocess.Popen([sys.executable, "-c", "pass"]), "Tool", 0.0)
+    finish_profiling(console, "lint run")
+    start_profiling()
+    assert get_profiles() == []
+    finish_profiling(console, "lint run")
@@ -0,0 +1,85 @@
+"""Tests for the commons pyproject module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src.tidy_cli.commons import pyproject
+from src.tidy_cli.commons.pyproject import (
+    find_pyproject,
+    flatten_section,
+    get_tool_section,
+    load_toml,
+)
+
+
+def test_load_toml_parsed_once_per_content(tmp_path: Path) -> None:
+    """
+    Test load_toml function parsing a file again only when its content changes.
+
+    :param tmp_path: temporary folder storing the TOML file
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_text("[tool.ruff]\nline-length = 100\n")
+
+    with patch("src.tidy_cli.commons.pyproject.tomllib.loads", wraps=pyproject.tomllib.loads) as mock_loads:
+        assert load_toml(path) == {"tool": {"ruff": {"line-length": 100}}}
+        assert load_toml(path) is load_toml(path)
+        assert mock_loads.call_count == 1
+
+        path.write_text("[tool.ruff]\nline-length = 120\n")
+        assert load_toml(path)["tool"]["ruff"]["line-length"] == 120
+        assert mock_loads.call_count == 2
+
+
+def test_load_toml_missing_or_invalid(tmp_path: Path) -> None:
+    """
+    Test load_toml function returning an empty dictionary for missing and invalid files.
+
+    :param tmp_path: temporary folder storing the TOML file
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    path = tmp_path / "pyproject.toml"
+    assert load_toml(path) == {}
+
+    path.write_text("[tool.ruff\n")
+    assert load_toml(path) == {}
+    assert get_tool_section(path) is None
+
+
+def test_find_pyproject(tmp_path: Path) -> None:
+    """
+    Test find_pyproject function walking up to the nearest pyproject.toml with a [tool.tidy-cli] section, within the project root.
+
+    :param tmp_path: temporary folder storing the project
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    root, package = tmp_path / "root", tmp_path / "root" / "packages" / "app"
+    package.mkdir(parents=True)
+    (tmp_path / "pyproject.toml").write_text("[tool.tidy-cli]\nlint_default_path = 'outside'\n")
+    (root / ".git").mkdir()
+    (package / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+
+    assert find_pyproject(package) is None
+
+    (root / "pyproject.toml").write_text("[tool.tidy-cli]\nlint_default_path = 'src'\n")
+    assert find_pyproject(package) == root / "pyproject.toml"
+    assert get_tool_section(root / "pyproject.toml") == {"lint_default_path": "src"}
+
+
+def test_flatten_section() -> None:
+    """
+    Test flatten_section function naming the settings of nested tables and dashed keys as the settings file ones.
+
+    :return: None
+    :rtype: None
+    """
+    section = {"pytest_warm": True, "lint": {"default-path": "src"}, "pytest": {"server-preload": ["app"]}}
+
+    assert flatten_section(section) == {"pytest_warm": True, "lint_default_path": "src", "pytest_server_preload": ["app"]}
@@ -1,13 +1,18 @@
 """Tests for the commons settings module."""
 
 import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 from typing import Any
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
 from src.tidy_cli.commons.settings import (
-    SETTINGS_FILE,
+    Settings,
+    get_settings,
     load_settings,
     save_settings,
     update_settings,
@@ -25,25 +30,25 @@ def mock_settings() -> dict[str, str]:
     [
         # Load existing settings file
         {
-            "mock_open": json.dumps({"lint_path": "src", "pytest_path": "tests"}),
-            "mock_path": True,
+            "file_content": json.dumps({"lint_path": "src", "pytest_path": "tests"}),
             "expected_output": {"lint_path": "src", "pytest_path": "tests"},
         },
         # Settings file does not exists
         {
-            "mock_open": None,
-            "mock_path": False,
+            "file_content": None,
             "expected_output": {},
         },
         # Invalid JSON file
         {
-            "mock_open": "This is an invalid JSON",
-            "mock_path": True,
+            "file_content": "This is an invalid JSON",
             "expected_output": {},
         },
     ],
 )
-def test_load_settings(scenario: dict[str, Any]) -> None:
+def test_load_settings(
+    scenario: dict[str, Any],
+    tmp_path: Path,
+) -> None:
     """
     Test load_settings function.
     It tests the following scenarios:
@@ -53,50 +58,251 @@ def test_load_settings(scenario: dict[str, Any]) -> None:
 
     :param scenario: tested scenario coming from Pytest marker
     :type scenario: dict[str, Any]
+    :param tmp_path: temporary folder storing the settings file
+    :type tmp_path: Path
     :return: tests different scenarios
     :rtype: None
     """
-    with (
-        patch("src.tidy_cli.commons.settings.Path.exists", return_value=scenario.get("mock_path")),
-        patch("src.tidy_cli.commons.settings.open", mock_open(read_data=scenario.get("mock_open"))),
-    ):
+    settings_file = tmp_path / "tidy_cli_settings.json"
+    if scenario.get("file_content") is not None:
+        settings_file.write_text(scenario["file_content"])
+    with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
         output = load_settings()
-        print(output)
         assert output == scenario.get("expected_output")
 
 
-@pytest.mark.parametrize(
-    "scenario",
-    [
-        # Plain scenario
-        {
-            "mock_mkdir": None,
-            "open_args": [SETTINGS_FILE, "w"],
-            "setting_file": {},
-        },
-    ],
-)
-def test_save_settings(
-    scenario: dict[str, Any],
+def test_get_settings_memoized_until_file_changes(tmp_path: Path) -> None:
+    """
+    Test get_settings function parsing the settings file once and again only when the file changes or is saved.
+
+    :param tmp_path: temporary folder storing the settings file
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    settings_file = tmp_path / "local" / "tidy_cli_settings.json"
+    with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
+        assert get_settings() == Settings({})
+
+        save_settings({"lint_default_path": "src"})
+        with patch("src.tidy_cli.commons.settings.json.load", wraps=json.load) as mock_load:
+            first = get_settings()
+            assert get_settings() is first
+            assert mock_load.call_count == 1
+
+            settings_file.write_text(json.dumps({"lint_default_path": "app"}))
+            os.utime(settings_file, ns=(0, 0))
+            assert get_settings().get("lint_default_path") == "app"
+            assert mock_load.call_count == 2
+
+
+def test_settings_typed_getters() -> None:
+    """
+    Test Settings typed getters falling back to defaults when settings are missing or invalid.
+
+    :return: None
+    :rtype: None
+    """
+    settings = Settings({"flag": "True", "other_flag": False, "count": "3", "ratio": "bad", "items": "a, b,,c "})
+
+    assert settings.get("count") == "3"
+    assert settings.get("missing", "default") == "default"
+    assert settings.get_bool("flag") is True
+    assert settings.get_bool("other_flag", default=True) is False
+    assert settings.get_bool("missing", default=True) is True
+    assert settings.get_int("count", 5) == 3
+    assert settings.get_int("flag", 5) == 5
+    assert settings.get_float("ratio", 2.0) == 2.0
+    assert settings.get_float("missing") is None
+    assert settings.get_list("items") == ["a", "b", "c"]
+    assert settings.get_list("missing") == []
+    assert Settings({"items": ["a", " b", ""]}).get_list("items") == ["a", "b"]
+
+
+def test_get_settings_layers_pyproject_and_settings_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """
-    Test save_settings function.
+    Test get_settings function layering the settings file over the [tool.tidy-cli] section of the nearest pyproject.toml.
 
-    :param scenario: tested scenario coming from Pytest marker
-    :type scenario: dict[str, Any]
-    :return: tests different scenarios
+    :param tmp_path: temporary project folder
+    :type tmp_path: Path
+    :param monkeypatch: Pytest fixture changing the current directory
+    :type monkeypatch: pytest.MonkeyPatch
+    :return: None
     :rtype: None
     """
-    with (
-        patch("src.tidy_cli.commons.settings.json.dump") as mock_json_dump,
-        patch("src.tidy_cli.commons.settings.open", mock_open()) as mock_open_file,
-        patch("src.tidy_cli.commons.settings.Path.mkdir", return_value=scenario.get("mock_mkdir")),
-    ):
-        save_settings(scenario.get("setting_file", {}))
-        # Check open called with proper args
-        mock_open_file.assert_called_once_with(*scenario.get("open_args", []))
-        # Check json dump only ones
-        mock_json_dump.assert_called_once()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "pyproject.toml").write_text('[tool.tidy-cli]\npytest_slowest = 3\n\n[tool.tidy-cli.lint]\ndefault-path = "app"\nconfig-path = "setup.toml"\n')
+    (tmp_path / "package").mkdir()
+    monkeypatch.chdir(tmp_path / "package")
+    settings_file = tmp_path / "package" / "local" / "tidy_cli_settings.json"
+
+    with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
+        # Path settings are relative to the pyproject.toml folder, hence to the parent folder here
+        assert get_settings().values == {"pytest_slowest": 3, "lint_default_path": "../app", "lint_config_path": "../setup.toml"}
+
+        update_settings({"lint_default_path": "lib"})
+        assert json.loads(settings_file.read_text()) == {"lint_default_path": "lib"}
+        assert get_settings().get("lint_default_path") == "lib"
+        assert get_settings().get_int("pytest_slowest", 5) == 3
+
+
+def test_get_settings_resolves_pyproject_paths_from_nested_folder(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test path settings of the pyproject.toml being resolved against its folder rather than the current directory, at any depth.
+
+    :param tmp_path: temporary project folder
+    :type tmp_path: Path
+    :param monkeypatch: Pytest fixture changing the current directory
+    :type monkeypatch: pytest.MonkeyPatch
+    :return: None
+    :rtype: None
+    """
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.tidy-cli.lint]\ndefault-path = "src"\nconfig-path = "pyproject.toml"\n\n[tool.tidy-cli.pytest]\ndefault-path = "tests"\nconfig-path = "../pyproject.toml"\n'
+    )
+
+    for folder, prefix in ((tmp_path, ""), (tmp_path / "sub", "../"), (tmp_path / "sub" / "deeper", "../../")):
+        monkeypatch.chdir(folder)
+        with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", folder / "local" / "tidy_cli_settings.json"):
+            settings = get_settings()
+
+        assert settings.get("lint_default_path") == f"{prefix}src"
+        assert Path(settings.get("lint_default_path")).resolve() == tmp_path / "src"
+        assert settings.get("lint_config_path") == f"{prefix}pyproject.toml"
+        assert settings.get("pytest_default_path") == f"{prefix}tests"
+        # The Pytest config file path is relative to the Pytest default directory, hence left as is
+        assert settings.get("pytest_config_path") == "../pyproject.toml"
+
+
+def test_get_settings_picks_up_new_pyproject_section(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test get_settings function discovering again the pyproject.toml when a candidate file changes (e.g., in watch mode).
+
+    :param tmp_path: temporary project folder
+    :type tmp_path: Path
+    :param monkeypatch: Pytest fixture changing the current directory
+    :type monkeypatch: pytest.MonkeyPatch
+    :return: None
+    :rtype: None
+    """
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "package").mkdir()
+    monkeypatch.chdir(tmp_path / "package")
+    settings_file = tmp_path / "package" / "local" / "tidy_cli_settings.json"
+
+    with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
+        assert get_settings().values == {}
+
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'package'\n")
+        assert get_settings().values == {}
+
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'package'\n\n[tool.tidy-cli]\npytest_slowest = 3\n")
+        assert get_settings().values == {"pytest_slowest": 3}
+
+        (tmp_path / "package" / "pyproject.toml").write_text("[tool.tidy-cli]\npytest_slowest = 1\n")
+        assert get_settings().values == {"pytest_slowest": 1}
+
+        (tmp_path / "package" / "pyproject.toml").unlink()
+        assert get_settings().values == {"pytest_slowest": 3}
+
+
+def test_save_settings(tmp_path: Path) -> None:
+    """
+    Test save_settings function replacing the settings file atomically, leaving the previous one untouched when writing fails.
+
+    :param tmp_path: temporary folder storing the settings file
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    settings_file = tmp_path / "local" / "tidy_cli_settings.json"
+    with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
+        save_settings({"lint_default_path": "src"})
+        assert json.loads(settings_file.read_text()) == {"lint_default_path": "src"}
+
+        with patch("src.tidy_cli.commons.settings.json.dump", side_effect=KeyboardInterrupt), pytest.raises(KeyboardInterrupt):
+            save_settings({"lint_default_path": "app"})
+        assert json.loads(settings_file.read_text()) == {"lint_default_path": "src"}
+        assert {path.name for path in settings_file.parent.iterdir()} == {"tidy_cli_settings.json", "tidy_cli_settings.json.lock"}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+def test_save_settings_keeps_permissions(tmp_path: Path) -> None:
+    """
+    Test save_settings function giving a new settings file the umask permissions and keeping the ones of an existing file.
+
+    :param tmp_path: temporary folder storing the settings file
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    settings_file = tmp_path / "tidy_cli_settings.json"
+    umask = os.umask(0o022)
+    try:
+        with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
+            save_settings({"lint_default_path": "src"})
+            assert settings_file.stat().st_mode & 0o777 == 0o644
+
+            settings_file.chmod(0o664)
+            save_settings({"lint_default_path": "app"})
+            assert settings_file.stat().st_mode & 0o777 == 0o664
+    finally:
+        os.umask(umask)
+
+
+def test_update_settings_recovers_corrupt_file(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """
+    Test update_settings function moving a corrupt settings file aside before writing, while reads report it and use defaults.
+
+    :param tmp_path: temporary folder storing the settings file
+    :type tmp_path: Path
+    :param capsys: Pytest fixture capturing the printed warnings
+    :type capsys: pytest.CaptureFixture[str]
+    :return: None
+    :rtype: None
+    """
+    settings_file = tmp_path / "tidy_cli_settings.json"
+    settings_file.write_text('{"lint_default_path": "sr')
+    with patch("src.tidy_cli.commons.settings.SETTINGS_FILE", settings_file):
+        assert get_settings().values == {}
+        assert "is corrupt and ignored" in capsys.readouterr().err
+
+        update_settings({"pytest_default_path": "tests"})
+
+    assert "is corrupt, moved to" in capsys.readouterr().err
+    assert json.loads(settings_file.read_text()) == {"pytest_default_path": "tests"}
+    assert (tmp_path / "tidy_cli_settings.json.corrupt").read_text() == '{"lint_default_path": "sr'
+
+
+def test_update_settings_concurrent_processes(tmp_path: Path) -> None:
+    """
+    Test update_settings function keeping the settings of all the processes updating them concurrently.
+
+    :param tmp_path: temporary folder the processes run from
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    script = "import sys\nfrom tidy_cli.commons.settings import update_settings\nfor i in range(20):\n    update_settings({f'{sys.argv[1]}_{i}': str(i)})\n"
+    processes = [subprocess.Popen([sys.executable, "-c", script, f"process{n}"], cwd=tmp_path) for n in range(4)]
+
+    assert [process.wait(timeout=60) for process in processes] == [0] * 4
+    assert len(json.loads((tmp_path / "local" / "tidy_cli_settings.json").read_text())) == 80
 
 
 @pytest.mark.parametrize(
@@ -124,6 +330,7 @@ def test_save_settings(
 )
 def test_update_settings(
     scenario: dict[str, Any],
+    tmp_path: Path,
 ) -> None:
     """
     Test update_settings function.
@@ -134,10 +341,13 @@ def test_update_settings(
 
     :param scenario: tested scenario coming from Pytest marker
     :type scenario: dict[str, Any]
+    :param tmp_path: temporary folder storing the settings lock file
+    :type tmp_path: Path
     :return: tests different scenarios
     :rtype: None
     """
     with (
+        patch("src.tidy_cli.commons.settings.SETTINGS_FILE", tmp_path / "tidy_cli_settings.json"),
         patch("src.tidy_cli.commons.settings.load_settings", return_value=scenario.get("existing_settings")),
         patch("src.tidy_cli.commons.settings.save_settings") as mock_save_settings,
     ):
@@ -1,9 +1,19 @@
 """Common test fixtures and configuration."""
 
 import pytest
-from pathlib import Path
 from typer.testing import CliRunner
 
+from tidy_cli.commons.console import HEADLESS_ENV, set_headless
+
+
+@pytest.fixture(autouse=True)
+def interactive_mode(monkeypatch):
+    """Run tests in interactive mode (Pytest output being never a terminal), restoring auto-detection after tests setting it."""
+    monkeypatch.setenv(HEADLESS_ENV, "0")
+    yield
+    set_headless(None)
+
+
 @pytest.fixture(scope="module")
 def runner():
     """Return a CLI runner."""
@@ -56,4 +66,4 @@ def temp_config_file(tmp_path, sample_databricks_config):
     config_dir.mkdir()
     config_file = config_dir / "databrickscfg"
     config_file.write_text(sample_databricks_config)
-    return config_file
\ No newline at end of file
+    return config_file
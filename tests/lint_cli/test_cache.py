@@ -0,0 +1,120 @@
+"""Tests for the lint CLI cache module."""
+
+from pathlib import Path
+
+import pytest
+
+from tidy_cli.lint_cli.cache import (
+    LintCache,
+    discover_python_files,
+    get_config_hash,
+)
+from tidy_cli.lint_cli.scheduler import LintTool
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Return a temporary project with a config file and a small source tree."""
+    (tmp_path / "pyproject.toml").write_text("[tool.ruff]\n")
+    package = tmp_path / "src" / "pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "module.py").write_text("x = 1\n")
+    (package / "notes.txt").write_text("not python")
+    (tmp_path / "src" / ".venv").mkdir()
+    (tmp_path / "src" / ".venv" / "ignored.py").write_text("")
+    (package / "__pycache__").mkdir()
+    (package / "__pycache__" / "ignored.py").write_text("")
+    return tmp_path
+
+
+def make_tools(lint_path: Path) -> list[LintTool]:
+    """Return ruff check, pydoclint and mypy tools targeting lint_path."""
+    return [
+        LintTool("ruff-check", "Ruff linting", ["ruff", "check", "--config", "pyproject.toml"], [str(lint_path)]),
+        LintTool("pydoclint", "Pydoclint", ["flake8", "--select", "DOC"], [str(lint_path)]),
+        LintTool("mypy", "Mypy type checking", ["mypy"], [str(lint_path)]),
+    ]
+
+
+def test_discover_python_files(project: Path) -> None:
+    """Test discover_python_files skips hidden and cache folders and non Python files."""
+    files = discover_python_files(project / "src")
+    assert files == [project / "src" / "pkg" / "__init__.py", project / "src" / "pkg" / "module.py"]
+    assert discover_python_files(project / "src" / "pkg" / "module.py") == [project / "src" / "pkg" / "module.py"]
+
+
+def test_get_config_hash(project: Path) -> None:
+    """Test get_config_hash changes with config content and handles missing files."""
+    config = project / "pyproject.toml"
+    first = get_config_hash(str(config))
+    config.write_text("[tool.ruff]\nline-length = 100\n")
+    assert get_config_hash(str(config)) != first
+    assert get_config_hash(str(project / "missing.toml")) == "missing"
+
+
+def test_cache_roundtrip(project: Path) -> None:
+    """Test a clean run is cached, persisted and invalidated by content changes."""
+    cache_file = project / "local" / "cache.json"
+    config = str(project / "pyproject.toml")
+    lint_path = project / "src"
+
+    # Cold cache: every file-local tool runs on the whole path
+    cache = LintCache(config, cache_file=cache_file)
+    to_run, cached = cache.apply(make_tools(lint_path), discover_python_files(lint_path))
+    assert [tool.name for tool in to_run] == ["ruff-check", "pydoclint", "mypy"]
+    assert cached == []
+    assert to_run[0].full_command == ["ruff", "check", "--config", "pyproject.toml", str(lint_path)]
+    cache.record(to_run, [True, False, True])
+    assert cache_file.exists()
+
+    # Warm cache: ruff check skipped, failed pydoclint and mypy run again
+    cache = LintCache(config, cache_file=cache_file)
+    to_run, cached = cache.apply(make_tools(lint_path), discover_python_files(lint_path))
+    assert [tool.name for tool in cached] == ["ruff-check"]
+    assert [tool.name for tool in to_run] == ["pydoclint", "mypy"]
+
+    # Changed file: only that file is linted, with ruff exclusions enforced
+    (project / "src" / "pkg" / "module.py").write_text("x = 2\n")
+    cache = LintCache(config, cache_file=cache_file)
+    to_run, cached = cache.apply(make_tools(lint_path), discover_python_files(lint_path))
+    assert to_run[0].full_command == ["ruff", "check", "--config", "pyproject.toml", "--force-exclude", str(project / "src" / "pkg" / "module.py")]
+
+
+def test_cache_config_change_invalidates(project: Path) -> None:
+    """Test a config change invalidates every cached result."""
+    cache_file = project / "local" / "cache.json"
+    config = project / "pyproject.toml"
+    lint_path = project / "src"
+
+    cache = LintCache(str(config), cache_file=cache_file)
+    to_run, _ = cache.apply(make_tools(lint_path), discover_python_files(lint_path))
+    cache.record(to_run, [True, True, True])
+
+    config.write_text("[tool.ruff]\nline-length = 100\n")
+    cache = LintCache(str(config), cache_file=cache_file)
+    _, cached = cache.apply(make_tools(lint_path), discover_python_files(lint_path))
+    assert cached == []
+
+
+def test_cache_file_rewritten_during_run(project: Path) -> None:
+    """Test files rewritten by a tool during the run are not recorded as clean."""
+    cache_file = project / "local" / "cache.json"
+    lint_path = project / "src"
+
+    cache = LintCache(str(project / "pyproject.toml"), cache_file=cache_file)
+    to_run, _ = cache.apply(make_tools(lint_path), discover_python_files(lint_path))
+    (project / "src" / "pkg" / "module.py").write_text("x = 1  # reformatted\n")
+    cache.record(to_run, [True, True, True])
+
+    assert "ruff-check" not in cache.clean.get(str(project / "src" / "pkg" / "module.py"), {})
+    assert "ruff-check" in cache.clean[str(project / "src" / "pkg" / "__init__.py")]
+
+
+def test_cache_corrupted_file(project: Path) -> None:
+    """Test a corrupted cache file behaves as an empty cache."""
+    cache_file = project / "cache.json"
+    cache_file.write_text("not a JSON")
+    cache = LintCache(str(project / "pyproject.toml"), cache_file=cache_file)
+    assert cache.clean == {}
+    assert cache.file_hashes == {}
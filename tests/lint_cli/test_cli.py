@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 from typer.testing import CliRunner
 
 from tidy_cli.lint_cli.cli import lint_app
+from tidy_cli.lint_cli.helpers import run_sharded_command
 
 
 @pytest.fixture
@@ -92,11 +93,33 @@ def test_run_with_fix_option(runner):
         result = runner.invoke(lint_app, ["run", "src", "--fix"])
         
         assert result.exit_code == 0
-        # Check that --fix was added to ruff check command
-        ruff_check_call = mock_run_cmd.call_args_list[0]
+        # Check that --fix was added to ruff check command (tools may start in any order)
+        ruff_check_call = next(call for call in mock_run_cmd.call_args_list if call[0][0][:2] == ["ruff", "check"])
         assert "--fix" in ruff_check_call[0][0]
 
 
+def test_run_sequential_option(runner):
+    """Test run command with sequential option runs tools in declared order on the main console."""
+    with patch("tidy_cli.lint_cli.cli.get_lint_default_path") as mock_get_default, \
+         patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.run_command", return_value=True) as mock_run_cmd, \
+         patch("rich.console.Console.print"):
+
+        # Mock path exists
+        mock_default_dir = MagicMock()
+        mock_lint_path = MagicMock()
+        mock_lint_path.exists.return_value = True
+        mock_default_dir.__truediv__.return_value = mock_lint_path
+        mock_get_default.return_value = mock_default_dir
+
+        result = runner.invoke(lint_app, ["run", "src", "--sequential"])
+
+        assert result.exit_code == 0
+        descriptions = [call[0][1] for call in mock_run_cmd.call_args_list]
+        assert descriptions == ["Ruff linting", "Ruff formatting", "Pydoclint", "Mypy type checking"]
+        assert all("output" not in call[1] for call in mock_run_cmd.call_args_list)
+
+
 def test_run_skip_options(runner):
     """Test run command with skip options."""
     with patch("tidy_cli.lint_cli.cli.get_lint_default_path") as mock_get_default, \
@@ -140,6 +163,130 @@ def test_run_interactive_mode(runner):
         assert mock_run_cmd.call_count == 2  # Only ruff format and mypy
 
 
+def test_run_changed_mode(runner, tmp_path):
+    """Test run command in changed mode targets changed files and mypy package roots."""
+    changed = [tmp_path / "pkg" / "a.py"]
+    with patch("tidy_cli.lint_cli.cli.get_changed_lint_files", return_value=changed) as mock_changed, \
+         patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.run_command", return_value=True) as mock_run_cmd, \
+         patch("rich.console.Console.print"):
+
+        result = runner.invoke(lint_app, ["run", "--default-dir", str(tmp_path), "--since", "main", "--no-cache", "--sequential"])
+
+        assert result.exit_code == 0
+        mock_changed.assert_called_once_with(tmp_path, "main")
+        commands = [call[0][0] for call in mock_run_cmd.call_args_list]
+        assert commands[0] == ["ruff", "check", "--config", "pyproject.toml", "--force-exclude", str(changed[0])]
+        assert commands[2] == ["pydoclint", "--config", "pyproject.toml", str(changed[0])]
+        assert commands[3] == ["mypy", "--pretty", "--config-file", "pyproject.toml", str(tmp_path / "pkg")]
+        assert mock_run_cmd.call_args_list[2][1]["engine"].args == ([str(changed[0])],)
+
+
+def test_run_pydoclint_flake8_fallback(runner, tmp_path):
+    """Test run command falls back to the flake8 subprocess when the Pydoclint flake8 plugin cannot run in-process."""
+    with patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.get_plugin", return_value=None), \
+         patch("tidy_cli.lint_cli.cli.run_command", return_value=True) as mock_run_cmd, \
+         patch("rich.console.Console.print"):
+
+        result = runner.invoke(lint_app, ["run", "--default-dir", str(tmp_path), "--no-cache", "--sequential", "--skip-ruff", "--skip-format", "--skip-mypy"])
+
+        assert result.exit_code == 0
+        assert mock_run_cmd.call_args[0][0] == ["flake8", "--toml-config", "pyproject.toml", "--select", "DOC", str(tmp_path)]
+        assert "engine" not in mock_run_cmd.call_args[1]
+
+
+def test_run_changed_mode_no_files(runner, tmp_path):
+    """Test run command in changed mode with no changed files does not run any tool."""
+    with patch("tidy_cli.lint_cli.cli.get_changed_lint_files", return_value=[]), \
+         patch("tidy_cli.lint_cli.cli.run_command") as mock_run_cmd, \
+         patch("rich.console.Console.print") as mock_print:
+
+        result = runner.invoke(lint_app, ["run", "--default-dir", str(tmp_path), "--changed"])
+
+        assert result.exit_code == 0
+        mock_run_cmd.assert_not_called()
+        mock_print.assert_any_call("✨ No changed Python files to lint", style="green")
+
+
+def test_run_mypy_daemon(runner, tmp_path):
+    """Test run command with the mypy daemon backend runs dmypy instead of mypy."""
+    with patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.get_daemon_command", return_value=["dmypy", "run", "--"]), \
+         patch("tidy_cli.lint_cli.cli.run_command", return_value=True) as mock_run_cmd, \
+         patch("rich.console.Console.print"):
+
+        result = runner.invoke(lint_app, ["run", "--default-dir", str(tmp_path), "--skip-ruff", "--skip-format", "--skip-pydoclint", "--mypy-daemon"])
+
+        assert result.exit_code == 0
+        mock_run_cmd.assert_called_once_with(["dmypy", "run", "--", str(tmp_path)], "Mypy type checking (daemon)")
+
+
+@pytest.mark.parametrize("action", ["status", "restart", "stop"])
+def test_daemon_commands(runner, action):
+    """Test daemon commands run the matching dmypy action and exit with failure when it fails."""
+    with patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.get_daemon_command", return_value=["dmypy", action]) as mock_command, \
+         patch("tidy_cli.lint_cli.cli.run_command", side_effect=[True, False]):
+
+        assert runner.invoke(lint_app, ["daemon", action]).exit_code == 0
+        assert runner.invoke(lint_app, ["daemon", action, "--pyproject-path", "custom.toml"]).exit_code == 1
+        mock_command.assert_any_call(action, "pyproject.toml")
+        mock_command.assert_any_call(action, "custom.toml")
+
+
+def test_run_profile(runner, tmp_path):
+    """Test run command with profile output prints and writes the profile report."""
+    with patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.run_command", return_value=True), \
+         patch("tidy_cli.lint_cli.cli.start_profiling") as mock_start, \
+         patch("tidy_cli.lint_cli.cli.finish_profiling") as mock_finish, \
+         patch("rich.console.Console.print"):
+
+        result = runner.invoke(lint_app, ["run", "--default-dir", str(tmp_path), "--no-cache", "--profile-output", "profile.json"])
+
+        assert result.exit_code == 0
+        mock_start.assert_called_once()
+        assert mock_finish.call_args[0][1:] == ("lint run", Path("profile.json"))
+
+
+def test_run_jobs(runner, tmp_path):
+    """Test run command passes the number of jobs to the sharding layer and the sharded runner to the scheduler."""
+    with patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.shard_tools") as mock_shard, \
+         patch("tidy_cli.lint_cli.cli.run_tools", return_value=[True, True, True, True]) as mock_run_tools, \
+         patch("rich.console.Console.print"):
+
+        result = runner.invoke(lint_app, ["run", "--default-dir", str(tmp_path), "--no-cache", "--jobs", "3"])
+
+        assert result.exit_code == 0
+        assert mock_shard.call_args[0][1:] == (3, tmp_path)
+        assert mock_run_tools.call_args[1]["sharded_runner"] is run_sharded_command
+
+
+def test_watch_relints_changed_files(runner, tmp_path):
+    """Test watch command lints every file first, then the changed ones only."""
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "b.py").write_text("y = 1\n")
+
+    def fake_watch_changes(root, debounce, force_polling=False):
+        (tmp_path / "a.py").write_text("x = 2\n")
+        yield {tmp_path / "a.py", tmp_path / "b.py"}
+
+    with patch("tidy_cli.lint_cli.cli.get_lint_config_path", return_value="pyproject.toml"), \
+         patch("tidy_cli.lint_cli.cli.watch_changes", side_effect=fake_watch_changes) as mock_watch, \
+         patch("tidy_cli.lint_cli.watch.WatchBoard.lint") as mock_lint, \
+         patch("rich.console.Console.print") as mock_print:
+
+        result = runner.invoke(lint_app, ["watch", "--default-dir", str(tmp_path), "--poll"])
+
+        assert result.exit_code == 0
+        assert mock_watch.call_args[1] == {"force_polling": True}
+        assert mock_lint.call_args_list[0][0] == ([tmp_path / "a.py", tmp_path / "b.py"], None)
+        assert mock_lint.call_args_list[1][0] == ([tmp_path / "a.py"], None)
+        mock_print.assert_any_call("👋 Stopped watching", style="white")
+
+
 def test_init_command(runner):
     """Test init command."""
     with patch("tidy_cli.lint_cli.cli.init_settings") as mock_init:
@@ -0,0 +1,75 @@
+"""Tests for the lint CLI daemon module."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from tidy_cli.commons.settings import Settings
+from tidy_cli.lint_cli.daemon import (
+    DAEMON_TIMEOUT,
+    get_daemon_command,
+    get_lint_mypy_daemon,
+    get_status_file,
+)
+
+
+@pytest.fixture
+def daemon_dir(tmp_path: Path):
+    """Patch the daemon folder with a temporary one."""
+    with patch("tidy_cli.lint_cli.daemon.DAEMON_DIR", tmp_path / "dmypy"):
+        yield tmp_path / "dmypy"
+
+
+def test_get_status_file(daemon_dir: Path) -> None:
+    """Test status files are created under the daemon folder, one per config file."""
+    first = get_status_file("pyproject.toml")
+    second = get_status_file("other/pyproject.toml")
+
+    assert daemon_dir.is_dir()
+    assert first.parent == daemon_dir
+    assert first != second
+    assert get_status_file("pyproject.toml") == first
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        # Run starts the daemon if needed with the mypy flags
+        {"action": "run", "expected_tail": ["run", "--timeout", str(DAEMON_TIMEOUT), "--", "--pretty", "--config-file", "pyproject.toml"]},
+        # Restart keeps the same flags
+        {"action": "restart", "expected_tail": ["restart", "--timeout", str(DAEMON_TIMEOUT), "--", "--pretty", "--config-file", "pyproject.toml"]},
+        # Status and stop have no flags
+        {"action": "status", "expected_tail": ["status"]},
+        {"action": "stop", "expected_tail": ["stop"]},
+    ],
+)
+def test_get_daemon_command(daemon_dir: Path, scenario: dict[str, Any]) -> None:
+    """
+    Test get_daemon_command function.
+
+    :param daemon_dir: temporary daemon folder
+    :type daemon_dir: Path
+    :param scenario: tested scenario coming from Pytest marker
+    :type scenario: dict[str, Any]
+    :return: tests different scenarios
+    :rtype: None
+    """
+    command = get_daemon_command(scenario["action"], "pyproject.toml")
+    assert command[:3] == ["dmypy", "--status-file", str(get_status_file("pyproject.toml"))]
+    assert command[3:] == scenario["expected_tail"]
+
+
+@pytest.mark.parametrize(
+    "settings, expected",
+    [
+        ({}, False),
+        ({"lint_mypy_daemon": "true"}, True),
+        ({"lint_mypy_daemon": "False"}, False),
+    ],
+)
+def test_get_lint_mypy_daemon(settings: dict[str, str], expected: bool) -> None:
+    """Test get_lint_mypy_daemon reads the setting with a False default."""
+    with patch("tidy_cli.lint_cli.daemon.get_settings", return_value=Settings(settings)):
+        assert get_lint_mypy_daemon() is expected
@@ -0,0 +1,200 @@
+"""Tests for the lint docstrings module."""
+
+import subprocess
+import sys
+
+import pytest
+
+from tidy_cli.lint_cli.docstrings import (
+    check_file,
+    check_paths,
+    discover_files,
+    get_plugin,
+    get_style_guide,
+    load_flake8_options,
+)
+
+UNDOCUMENTED_ARGUMENT = '''def add(a: int, b: int) -> int:{noqa}
+    """
+    Add two numbers.
+
+    :param a: first number
+    :type a: int
+    :return: sum
+    :rtype: int
+    """
+    return a + b
+'''
+
+
+def clear_caches():
+    """Clear the flake8 options and style guide read once per process."""
+    load_flake8_options.cache_clear()
+    get_style_guide.cache_clear()
+
+
+def write_config(tmp_path, content):
+    """Write a pyproject.toml with the given content and return its path."""
+    clear_caches()
+    path = tmp_path / "pyproject.toml"
+    path.write_text(content)
+    return str(path)
+
+
+def run_flake8(targets, config_path):
+    """Run the flake8 command the engine replaces and return its output lines."""
+    command = [sys.executable, "-m", "flake8", "--toml-config", config_path, "--select", "DOC", *targets]
+    return subprocess.run(command, capture_output=True, text=True, check=False).stdout.splitlines()
+
+
+def run_engine(targets, config_path):
+    """Run the in-process engine and return its return code and output lines."""
+    lines = []
+    returncode = check_paths(targets, lambda line, _: lines.append(line), config_path)
+    return returncode, lines
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Return a pyproject.toml configuring Pydoclint for Sphinx docstrings through flake8."""
+    yield write_config(tmp_path, '[tool.flake8]\nstyle = "sphinx"\nskip-checking-short-docstrings = false\n')
+    clear_caches()
+
+
+@pytest.fixture
+def plugin_cache():
+    """Clear the cached Pydoclint flake8 plugin around a test."""
+    get_plugin.cache_clear()
+    yield
+    get_plugin.cache_clear()
+
+
+def test_get_plugin(plugin_cache):
+    """Test that the installed flake8 and Pydoclint allow running the plugin in-process."""
+    assert get_plugin() is not None
+
+
+def test_get_plugin_missing_flake8_internals(plugin_cache, monkeypatch):
+    """Test that versions lacking the flake8 internals or the plugin API fall back to the flake8 subprocess rather than failing."""
+    monkeypatch.setitem(sys.modules, "flake8.style_guide", None)
+    assert get_plugin() is None
+
+    get_plugin.cache_clear()
+    monkeypatch.delitem(sys.modules, "flake8.style_guide")
+    from pydoclint.flake8_entry import Plugin
+
+    monkeypatch.delattr(Plugin, "parse_options")
+    assert get_plugin() is None
+
+
+def test_load_flake8_options(tmp_path):
+    """Test that options are read from the flake8 section only, the command line selecting DOC violations."""
+    path = write_config(
+        tmp_path,
+        '[tool.pydoclint]\nstyle = "google"\n\n'
+        '[tool.flake8]\nstyle = "sphinx"\ncheck-return-types = false\nselect = ["E"]\nextend-ignore = ["DOC201"]\nexclude = ["generated"]\n',
+    )
+
+    options = load_flake8_options(path)
+
+    assert options.style == "sphinx"
+    assert options.check_return_types == "False"
+    assert options.select == ["DOC"]
+    assert options.extend_ignore == ["DOC201"]
+    assert options.exclude == ["generated"]
+    clear_caches()
+
+
+def test_load_flake8_options_missing_section(tmp_path, monkeypatch):
+    """Test that without a flake8 section the flake8 config files of the current folder are read, as flake8 does."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "setup.cfg").write_text("[flake8]\nstyle = sphinx\n")
+    path = write_config(tmp_path, '[tool.pydoclint]\nstyle = "google"\n')
+
+    assert load_flake8_options(path).style == "sphinx"
+    clear_caches()
+
+
+def test_check_file_flake8_format(tmp_path, config_path):
+    """Test that violations are reported in flake8 format and noqa comments are honoured."""
+    module = tmp_path / "module.py"
+    module.write_text(UNDOCUMENTED_ARGUMENT.format(noqa=""))
+
+    lines = check_file(str(module), config_path)
+
+    assert lines
+    assert all(line.startswith(f"{module}:1:1: DOC10") for line in lines)
+
+    module.write_text(UNDOCUMENTED_ARGUMENT.format(noqa="  # noqa: DOC1"))
+    assert check_file(str(module), config_path) == []
+
+    module.write_text("# flake8: noqa\n" + UNDOCUMENTED_ARGUMENT.format(noqa=""))
+    assert check_file(str(module), config_path) == []
+
+    module.write_text("def broken(:\n")
+    assert check_file(str(module), config_path) == []
+
+
+def test_discover_files(tmp_path):
+    """Test that files are discovered with the flake8 exclude and extend-exclude options."""
+    for name in ("pkg/module.py", "pkg/generated/module.py", "pkg/legacy.py", "pkg/__pycache__/module.py", "pkg/notes.txt"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x = 1\n")
+    path = write_config(tmp_path, '[tool.flake8]\nextend-exclude = ["generated", "legacy.py"]\n')
+
+    assert discover_files([str(tmp_path / "pkg")], path) == [str(tmp_path / "pkg" / "module.py")]
+    clear_caches()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_paths(tmp_path, config_path, jobs):
+    """Test that violations are forwarded in files order, whatever the number of jobs."""
+    package = tmp_path / "pkg"
+    package.mkdir()
+    for index in range(20):
+        (package / f"module_{index:02d}.py").write_text(UNDOCUMENTED_ARGUMENT.format(noqa="") if index % 5 == 0 else "x = 1\n")
+    lines = []
+
+    returncode = check_paths([str(package)], lambda line, stream: lines.append((line, stream)), config_path, jobs=jobs)
+
+    assert returncode == 1
+    reported = [line.split(":")[0] for line, _ in lines]
+    assert sorted(set(reported)) == [str(package / f"module_{index:02d}.py") for index in (0, 5, 10, 15)]
+    assert reported == sorted(reported)
+    assert all(stream == "stdout" for _, stream in lines)
+
+
+def test_check_paths_clean(tmp_path, config_path):
+    """Test that a clean tree gives a zero return code."""
+    (tmp_path / "module.py").write_text("x = 1\n")
+
+    assert check_paths([str(tmp_path)], lambda line, stream: None, config_path) == 0
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        "",
+        '[tool.pydoclint]\nstyle = "sphinx"\nskip-checking-short-docstrings = false\n',
+        '[tool.flake8]\nstyle = "sphinx"\nskip-checking-short-docstrings = false\n',
+        '[tool.flake8]\nstyle = "sphinx"\nextend-ignore = ["DOC1"]\n',
+        '[tool.flake8]\nstyle = "sphinx"\nignore = ["DOC"]\nextend-select = ["DOC105"]\n',
+        '[tool.flake8]\nstyle = "sphinx"\nper-file-ignores = ["pkg/legacy/*:DOC", "module_2.py:DOC101,DOC103"]\n',
+        '[tool.flake8]\nstyle = "sphinx"\nexclude = ["legacy"]\n',
+    ],
+)
+def test_check_paths_matches_flake8(tmp_path, monkeypatch, config):
+    """Test that the engine gives the same results as the flake8 run it replaces, whatever the flake8 config."""
+    monkeypatch.chdir(tmp_path)
+    for name in ("pkg/module_1.py", "pkg/module_2.py", "pkg/legacy/module_3.py"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(UNDOCUMENTED_ARGUMENT.format(noqa="") + "\n\ndef empty(a):\n    pass\n")
+    (tmp_path / "pkg" / "module_4.py").write_text(UNDOCUMENTED_ARGUMENT.format(noqa="  # noqa: DOC101"))
+    path = write_config(tmp_path, config)
+
+    expected = run_flake8(["pkg"], path)
+    returncode, lines = run_engine(["pkg"], path)
+
+    assert lines == expected
+    assert returncode == (1 if expected else 0)
+    clear_caches()
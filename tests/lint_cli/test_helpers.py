@@ -1,92 +1,131 @@
 """Tests for the lint CLI helpers module."""
 
-import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from tidy_cli.commons.settings import Settings
 from tidy_cli.lint_cli.helpers import (
+    get_changed_lint_files,
     get_lint_config_path,
     get_lint_default_path,
+    get_package_roots,
     init_settings,
     run_command,
+    run_sharded_command,
 )
 
 
 def test_run_command_success():
     """Test run_command with successful execution."""
-    with patch("subprocess.run") as mock_run, \
-         patch("rich.console.Console.print") as mock_print:
-        
-        # Mock successful command
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Success output"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-        
-        result = run_command(["echo", "test"], "Test command")
-        
+    with patch("rich.console.Console.print") as mock_print:
+        result = run_command([sys.executable, "-c", "print('Success output')"], "Test command")
+
         assert result is True
         mock_print.assert_any_call("🔧 Test command...")
         mock_print.assert_any_call("✅ Test command completed successfully")
-        mock_print.assert_any_call("Success output", style="white", markup=False)
+        mock_print.assert_any_call("Success output", style="white", markup=False, highlight=False)
 
 
 def test_run_command_failure():
     """Test run_command with failed execution."""
-    with patch("subprocess.run") as mock_run, \
-         patch("rich.console.Console.print") as mock_print:
-        
-        # Mock failed command
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = "Error output"
-        mock_result.stderr = "Error message"
-        mock_run.return_value = mock_result
-        
-        result = run_command(["false"], "Test command")
-        
+    command = [sys.executable, "-c", "import sys; print('Error output'); sys.stderr.write('Error message\\n'); sys.exit(1)"]
+    with patch("rich.console.Console.print") as mock_print:
+        result = run_command(command, "Test command")
+
         assert result is False
         mock_print.assert_any_call("🔧 Test command...")
         mock_print.assert_any_call("❌ Test command failed", style="red")
-        mock_print.assert_any_call("Error output", style="red", markup=False)
-        mock_print.assert_any_call("Error message", style="red", markup=False)
+        mock_print.assert_any_call("Error output", style="white", markup=False, highlight=False)
+        mock_print.assert_any_call("Error message", style="red", markup=False, highlight=False)
 
 
 def test_run_command_exception():
     """Test run_command with exception."""
-    with patch("subprocess.run", side_effect=Exception("Test error")) as mock_run, \
+    with patch("tidy_cli.lint_cli.helpers.stream_command", side_effect=Exception("Test error")), \
          patch("rich.console.Console.print") as mock_print:
-        
+
         result = run_command(["test"], "Test command")
-        
+
         assert result is False
         mock_print.assert_any_call("❌ Error running Test command: Test error", style="red", markup=False)
 
 
 def test_run_command_no_output():
     """Test run_command with no stdout."""
-    with patch("subprocess.run") as mock_run, \
-         patch("rich.console.Console.print") as mock_print:
-        
-        # Mock successful command with no output
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-        
-        result = run_command(["echo"], "Test command")
-        
+    with patch("rich.console.Console.print") as mock_print:
+        result = run_command([sys.executable, "-c", "pass"], "Test command")
+
         assert result is True
         mock_print.assert_any_call("")
 
 
+def test_run_command_engine():
+    """Test run_command runs an in-process engine instead of the command."""
+    def engine(on_line):
+        on_line("src/a.py:2:1: DOC201 missing", "stdout")
+        return 1
+
+    with patch("tidy_cli.lint_cli.helpers.stream_command") as mock_stream, \
+         patch("rich.console.Console.print") as mock_print:
+        result = run_command(["pydoclint"], "Pydoclint", engine=engine)
+
+        assert result is False
+        mock_stream.assert_not_called()
+        mock_print.assert_any_call("src/a.py:2:1: DOC201 missing", style="white", markup=False, highlight=False)
+        mock_print.assert_any_call("❌ Pydoclint failed", style="red")
+
+
+def test_run_sharded_command_merges_outputs():
+    """Test run_sharded_command prints shard outputs as a single ordered report."""
+    commands = [
+        [sys.executable, "-c", "print('src/b.py:1:1: DOC101 missing')"],
+        [sys.executable, "-c", "import sys; print('src/a.py:2:1: DOC201 missing'); sys.exit(1)"],
+    ]
+    with patch("rich.console.Console.print") as mock_print:
+        result = run_sharded_command(commands, "Pydoclint")
+
+        assert result is False
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        assert printed[:3] == ["🔧 Pydoclint (2 shards)...", "src/a.py:2:1: DOC201 missing", "src/b.py:1:1: DOC101 missing"]
+        mock_print.assert_any_call("❌ Pydoclint failed", style="red")
+
+
+def test_run_command_streams_lines_as_produced():
+    """Test run_command forwards each line before the command exits, with the given prefix."""
+    timeline = []
+
+    def fake_stream_command(command, on_line, label=None):
+        on_line("first line", "stdout")
+        timeline.append("still running")
+        on_line("second line", "stderr")
+        return 0
+
+    output = MagicMock()
+    output.print.side_effect = lambda *args, **kwargs: timeline.append(args[0])
+    with patch("tidy_cli.lint_cli.helpers.stream_command", side_effect=fake_stream_command):
+        result = run_command(["tool"], "Test command", output=output, prefix="tool")
+
+    assert result is True
+    assert timeline[:4] == ["🔧 Test command...", "[tool] first line", "still running", "[tool] second line"]
+
+
+def test_run_command_custom_output():
+    """Test run_command printing on the provided output Console."""
+    output = MagicMock()
+
+    result = run_command([sys.executable, "-c", "print('Success output')"], "Test command", output=output)
+
+    assert result is True
+    output.print.assert_any_call("🔧 Test command...")
+    output.print.assert_any_call("Success output", style="white", markup=False, highlight=False)
+
+
 def test_init_settings():
     """Test init_settings function."""
-    with patch("tidy_cli.lint_cli.helpers.load_settings", return_value={}) as mock_load, \
+    with patch("tidy_cli.lint_cli.helpers.get_settings", return_value=Settings({})) as mock_load, \
          patch("tidy_cli.lint_cli.helpers.update_settings") as mock_update, \
          patch("typer.prompt", side_effect=[Path("custom_src"), Path("custom.toml")]) as mock_prompt, \
          patch("rich.console.Console.print") as mock_print:
@@ -108,7 +147,7 @@ def test_init_settings_with_existing():
         "lint_config_path": "existing.toml"
     }
     
-    with patch("tidy_cli.lint_cli.helpers.load_settings", return_value=existing_settings), \
+    with patch("tidy_cli.lint_cli.helpers.get_settings", return_value=Settings(existing_settings)), \
          patch("tidy_cli.lint_cli.helpers.update_settings") as mock_update, \
          patch("typer.prompt", side_effect=[Path("new_src"), Path("new.toml")]), \
          patch("rich.console.Console.print"):
@@ -123,7 +162,7 @@ def test_init_settings_with_existing():
 
 def test_get_lint_default_path_default():
     """Test get_lint_default_path with default value."""
-    with patch("tidy_cli.lint_cli.helpers.load_settings", return_value={}):
+    with patch("tidy_cli.lint_cli.helpers.get_settings", return_value=Settings({})):
         result = get_lint_default_path()
         assert result == Path("src")
 
@@ -132,14 +171,14 @@ def test_get_lint_default_path_from_settings():
     """Test get_lint_default_path from settings."""
     settings = {"lint_default_path": "custom_path"}
     
-    with patch("tidy_cli.lint_cli.helpers.load_settings", return_value=settings):
+    with patch("tidy_cli.lint_cli.helpers.get_settings", return_value=Settings(settings)):
         result = get_lint_default_path()
         assert result == Path("custom_path")
 
 
 def test_get_lint_config_path_default():
     """Test get_lint_config_path with default value."""
-    with patch("tidy_cli.lint_cli.helpers.load_settings", return_value={}):
+    with patch("tidy_cli.lint_cli.helpers.get_settings", return_value=Settings({})):
         result = get_lint_config_path()
         assert result == "pyproject.toml"
 
@@ -148,6 +187,29 @@ def test_get_lint_config_path_from_settings():
     """Test get_lint_config_path from settings."""
     settings = {"lint_config_path": "custom.toml"}
     
-    with patch("tidy_cli.lint_cli.helpers.load_settings", return_value=settings):
+    with patch("tidy_cli.lint_cli.helpers.get_settings", return_value=Settings(settings)):
         result = get_lint_config_path()
-        assert result == "custom.toml"
\ No newline at end of file
+        assert result == "custom.toml"
+
+
+def test_get_changed_lint_files(tmp_path, monkeypatch):
+    """Test get_changed_lint_files keeps existing Python files under the lint path only."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    for name in ["src/pkg/a.py", "src/pkg/b.txt", "other.py"]:
+        (tmp_path / name).write_text("")
+    changed = [Path("src/pkg/a.py"), Path("src/pkg/b.txt"), Path("src/pkg/gone.py"), Path("other.py")]
+
+    with patch("tidy_cli.lint_cli.helpers.get_changed_files", return_value=changed) as mock_changed:
+        result = get_changed_lint_files(Path("src"), "main")
+
+    mock_changed.assert_called_once_with("main")
+    assert result == [Path("src/pkg/a.py")]
+
+
+def test_get_package_roots(tmp_path, monkeypatch):
+    """Test get_package_roots returns top-level packages and modules under the default directory."""
+    monkeypatch.chdir(tmp_path)
+    files = [Path("src/pkg/sub/a.py"), Path("src/pkg/b.py"), Path("src/script.py"), Path("src/other/c.py")]
+
+    assert get_package_roots(files, Path("src")) == [Path("src/other"), Path("src/pkg"), Path("src/script.py")]
@@ -0,0 +1,174 @@
+"""Tests for the lint CLI scheduler module."""
+
+import io
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from tidy_cli.lint_cli.scheduler import (
+    LintTool,
+    OrderedOutput,
+    build_dependency_graph,
+    run_tools,
+)
+
+
+@pytest.fixture
+def tools() -> list[LintTool]:
+    """Return the default battery of linting tools with ruff auto-fix enabled."""
+    return [
+        LintTool("ruff-check", "Ruff linting", ["ruff", "check"], mutates_files=True),
+        LintTool("ruff-format", "Ruff formatting", ["ruff", "format"], mutates_files=True),
+        LintTool("pydoclint", "Pydoclint", ["flake8"]),
+        LintTool("mypy", "Mypy type checking", ["mypy"]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        # Mutating tools are chained while read-only ones are independent
+        {
+            "skip": [],
+            "expected_graph": {"ruff-check": [], "ruff-format": ["ruff-check"], "pydoclint": [], "mypy": []},
+        },
+        # Skipping the first mutating tool removes the edge
+        {
+            "skip": ["ruff-check"],
+            "expected_graph": {"ruff-format": [], "pydoclint": [], "mypy": []},
+        },
+    ],
+)
+def test_build_dependency_graph(tools: list[LintTool], scenario: dict[str, Any]) -> None:
+    """
+    Test build_dependency_graph function.
+
+    :param tools: linting tools fixture
+    :type tools: list[LintTool]
+    :param scenario: tested scenario coming from Pytest marker
+    :type scenario: dict[str, Any]
+    :return: tests different scenarios
+    :rtype: None
+    """
+    selected = [tool for tool in tools if tool.name not in scenario["skip"]]
+    assert build_dependency_graph(selected) == scenario["expected_graph"]
+
+
+def test_build_dependency_graph_explicit_dependency() -> None:
+    """Test explicit dependencies are kept only when the dependency is selected."""
+    tools = [
+        LintTool("a", "A", ["a"]),
+        LintTool("b", "B", ["b"], depends_on=["a", "missing"]),
+    ]
+    assert build_dependency_graph(tools) == {"a": [], "b": ["a"]}
+
+
+def test_run_tools_sequential(tools: list[LintTool]) -> None:
+    """Test sequential mode calls the runner in order without buffered outputs."""
+    calls = []
+
+    def runner(command: list[str], description: str, **kwargs: Any) -> bool:
+        calls.append((description, kwargs))
+        return description != "Pydoclint"
+
+    results = run_tools(tools, runner=runner, sequential=True)
+
+    assert results == [True, True, False, True]
+    assert [description for description, _ in calls] == ["Ruff linting", "Ruff formatting", "Pydoclint", "Mypy type checking"]
+    assert all(kwargs == {} for _, kwargs in calls)
+
+
+def test_run_tools_concurrent(tools: list[LintTool]) -> None:
+    """Test read-only tools overlap, mutating tools stay ordered and outputs are printed in fixed order."""
+    running: set[str] = set()
+    overlaps: list[set[str]] = []
+    finished: list[str] = []
+    lock = threading.Lock()
+
+    def runner(command: list[str], description: str, output: Any = None) -> bool:
+        with lock:
+            running.add(description)
+            overlaps.append(set(running))
+        time.sleep(0.05)
+        output.print(f"output of {description}")
+        with lock:
+            running.discard(description)
+            finished.append(description)
+        return True
+
+    terminal = Console(file=io.StringIO(), width=120)
+    with patch("tidy_cli.lint_cli.scheduler.console", terminal):
+        results = run_tools(tools, runner=runner)
+
+    assert results == [True, True, True, True]
+    # Read-only tools ran alongside ruff
+    assert any({"Pydoclint", "Mypy type checking"} <= active for active in overlaps)
+    # Ruff format never overlapped with ruff check
+    assert not any({"Ruff linting", "Ruff formatting"} <= active for active in overlaps)
+    assert finished.index("Ruff linting") < finished.index("Ruff formatting")
+    # Outputs printed in declared order
+    printed = terminal.file.getvalue().splitlines()
+    assert printed == [f"output of {tool.description}" for tool in tools]
+
+
+def test_run_tools_interleave(tools: list[LintTool]) -> None:
+    """Test interleave mode streams each tool on the main console with its name as prefix."""
+    calls = []
+
+    def runner(command: list[str], description: str, **kwargs: Any) -> bool:
+        calls.append(kwargs)
+        return True
+
+    results = run_tools(tools, runner=runner, interleave=True)
+
+    assert results == [True, True, True, True]
+    assert sorted(call["prefix"] for call in calls) == sorted(tool.name for tool in tools)
+    assert all("output" not in call for call in calls)
+
+
+def test_run_tools_sharded(tools: list[LintTool]) -> None:
+    """Test sharded tools are run by the sharded runner with one command per shard."""
+    tools[2].shards = [["a.py"], ["b.py"]]
+    sharded_calls = []
+
+    def runner(command: list[str], description: str, **kwargs: Any) -> bool:
+        return True
+
+    def sharded_runner(commands: list[list[str]], description: str, **kwargs: Any) -> bool:
+        sharded_calls.append((commands, description))
+        return False
+
+    results = run_tools(tools, runner=runner, sequential=True, sharded_runner=sharded_runner)
+
+    assert results == [True, True, False, True]
+    assert sharded_calls == [([[*tools[2].command, "a.py"], [*tools[2].command, "b.py"]], "Pydoclint")]
+
+
+def test_ordered_output() -> None:
+    """Test the output relay spools until live, then replays and streams directly."""
+    target = io.StringIO()
+    relay = OrderedOutput(target)
+
+    relay.write("spooled ")
+    assert target.getvalue() == ""
+    relay.go_live()
+    assert target.getvalue() == "spooled "
+    relay.write("live")
+    assert target.getvalue() == "spooled live"
+    relay.go_live()  # going live twice is harmless
+    assert target.getvalue() == "spooled live"
+
+
+def test_ordered_output_spills_to_disk() -> None:
+    """Test the relay spool moves to a temporary file above the spill limit and replays it fully."""
+    target = io.StringIO()
+    with patch("tidy_cli.commons.process.SPILL_LIMIT", 10):
+        relay = OrderedOutput(target)
+    relay.write("x" * 100)
+    assert relay.spool._rolled is True  # type: ignore[union-attr]
+    relay.go_live()
+    assert target.getvalue() == "x" * 100
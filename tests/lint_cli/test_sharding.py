@@ -0,0 +1,203 @@
+"""Tests for the lint sharding module."""
+
+from pathlib import Path
+from typing import IO
+from unittest.mock import patch
+
+from tidy_cli.commons.process import spooled_buffer
+from tidy_cli.lint_cli.scheduler import LintTool
+from tidy_cli.lint_cli.sharding import (
+    MYPY_CACHE_DIR,
+    MYPY_SHARDS_DIR,
+    balance,
+    get_mypy_cache_dir,
+    get_shard_cache_dir,
+    get_top_level_packages,
+    group_packages,
+    merge_outputs,
+    shard_tools,
+    split_files,
+    write_output_line,
+)
+
+
+def _write_package(root: Path, name: str, imports: str = "", modules: int = 1) -> Path:
+    """Create a package made of modules with the given imports."""
+    package = root / name
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    for index in range(modules):
+        (package / f"module_{index}.py").write_text(f"{imports}\nx = {index}\n")
+    return package
+
+
+def _spool(lines: list[tuple[str, str]]) -> IO[str]:
+    """Spool the output lines of a shard."""
+    spool = spooled_buffer()
+    for line, stream in lines:
+        write_output_line(spool, line, stream)
+    return spool
+
+
+def test_balance_longest_processing_time_first():
+    """Test that heavier groups are spread across the lightest shards."""
+    items = [(5, [Path("a")]), (4, [Path("b")]), (3, [Path("c")]), (3, [Path("d")]), (1, [Path("e")])]
+
+    shards = balance(items, 2)
+
+    assert shards == [[Path("a"), Path("d")], [Path("b"), Path("c"), Path("e")]]
+
+
+def test_split_files_keeps_minimum_shard_size(tmp_path):
+    """Test that small file sets are not split."""
+    files = [tmp_path / f"module_{index}.py" for index in range(60)]
+    for file in files:
+        file.write_text("x = 1\n")
+
+    assert len(split_files(files, 8)) == 2
+    assert len(split_files(files[:10], 8)) == 1
+    assert sorted(path for shard in split_files(files, 8) for path in shard) == sorted(files)
+
+
+def test_group_packages_follows_imports(tmp_path):
+    """Test that packages importing each other end up in the same group."""
+    core = _write_package(tmp_path, "core")
+    api = _write_package(tmp_path, "api", imports="from core import x")
+    tools = _write_package(tmp_path, "tools", imports="import os")
+
+    groups = group_packages([api, core, tools])
+
+    assert sorted(group for _, group in groups) == [[api, core], [tools]]
+
+
+def test_get_top_level_packages(tmp_path):
+    """Test expansion of type checking targets into top-level packages."""
+    core = _write_package(tmp_path, "core")
+    api = _write_package(tmp_path, "api")
+    (tmp_path / ".hidden").mkdir()
+
+    assert get_top_level_packages([str(tmp_path)], tmp_path) == [api, core]
+    assert get_top_level_packages([str(core)], tmp_path) == [core]
+    assert get_top_level_packages([str(core / "module_0.py")], tmp_path) is None
+
+
+def test_shard_tools(tmp_path):
+    """Test that Pydoclint is split by files and Mypy by independent packages."""
+    for name in ("core", "api", "tools"):
+        _write_package(tmp_path, name, modules=40)
+    pydoclint = LintTool("pydoclint", "Pydoclint", ["flake8"], [str(tmp_path)])
+    mypy = LintTool("mypy", "Mypy type checking", ["mypy"], [str(tmp_path)])
+    daemon = LintTool("mypy", "Mypy type checking (daemon)", ["dmypy", "run"], [str(tmp_path)])
+    ruff = LintTool("ruff-check", "Ruff linting", ["ruff", "check"], [str(tmp_path)])
+
+    shard_tools([pydoclint, mypy, daemon, ruff], 2, tmp_path)
+
+    assert pydoclint.command == ["flake8", "--jobs", "1"]
+    assert len(pydoclint.shards) == 2
+    assert sum(len(shard) for shard in pydoclint.shards) == 123
+    assert [shard[:2] for shard in mypy.shards] == [
+        ["--cache-dir", str(get_shard_cache_dir(Path(MYPY_CACHE_DIR), [Path(target) for target in shard[2:]]))] for shard in mypy.shards
+    ]
+    assert sorted(target for shard in mypy.shards for target in shard[2:]) == [str(tmp_path / name) for name in ("api", "core", "tools")]
+    assert daemon.shards == []
+    assert ruff.shards == []
+
+
+def test_get_mypy_cache_dir(tmp_path, monkeypatch):
+    """Test that the Mypy cache folder is resolved as Mypy does: option, environment variable, config file, default."""
+    monkeypatch.delenv("MYPY_CACHE_DIR", raising=False)
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.mypy]\ncache_dir = "build/mypy"\n')
+    mypy_ini = tmp_path / "mypy.ini"
+    mypy_ini.write_text("[mypy]\ncache_dir = /dev/null\n")
+
+    assert get_mypy_cache_dir(["mypy"]) == Path(MYPY_CACHE_DIR)
+    assert get_mypy_cache_dir(["mypy", "--config-file", str(pyproject)]) == Path("build/mypy")
+    assert get_mypy_cache_dir(["mypy", "--config-file", str(mypy_ini)]) is None
+    assert get_mypy_cache_dir(["mypy", "--cache-dir", "custom", "--config-file", str(pyproject)]) == Path("custom")
+    monkeypatch.setenv("MYPY_CACHE_DIR", "from-env")
+    assert get_mypy_cache_dir(["mypy", "--config-file", str(pyproject)]) == Path("from-env")
+
+
+def test_get_shard_cache_dir(tmp_path):
+    """Test that shard caches are keyed by their packages, whatever their order, under the configured cache folder."""
+    core, api = tmp_path / "core", tmp_path / "api"
+
+    cache_dir = get_shard_cache_dir(Path("build/mypy"), [core, api])
+
+    assert cache_dir.parent == Path("build/mypy") / MYPY_SHARDS_DIR
+    assert cache_dir == get_shard_cache_dir(Path("build/mypy"), [api, core])
+    assert cache_dir != get_shard_cache_dir(Path("build/mypy"), [core])
+
+
+def test_shard_tools_disabled(tmp_path):
+    """Test that a single job leaves tools untouched."""
+    _write_package(tmp_path, "core", modules=200)
+    pydoclint = LintTool("pydoclint", "Pydoclint", ["flake8"], [str(tmp_path)])
+
+    shard_tools([pydoclint], 1, tmp_path)
+
+    assert pydoclint.command == ["flake8"]
+    assert pydoclint.shards == []
+
+
+def test_merge_outputs_orders_records_and_combines_summaries():
+    """Test merging of shard outputs into a single report."""
+    outputs = [
+        [
+            ("src/b.py:3: error: Incompatible types", "stdout"),
+            ("    x: int = 'a'", "stdout"),
+            ("Found 1 error in 1 file (checked 2 source files)", "stdout"),
+        ],
+        [
+            ("src/a.py:7: error: Missing return", "stdout"),
+            ("src/a.py:1: note: See here", "stdout"),
+            ("Found 2 errors in 1 file (checked 3 source files)", "stdout"),
+        ],
+        [
+            ("Success: no issues found in 4 source files", "stdout"),
+        ],
+    ]
+
+    merged = list(merge_outputs([_spool(output) for output in outputs]))
+
+    assert [line for line, _ in merged] == [
+        "src/a.py:1: note: See here",
+        "src/a.py:7: error: Missing return",
+        "src/b.py:3: error: Incompatible types",
+        "    x: int = 'a'",
+        "Found 3 errors in 2 files (checked 9 source files)",
+    ]
+
+
+def test_merge_outputs_keeps_preamble_first():
+    """Test that lines preceding any diagnostic are kept first."""
+    outputs = [[("src/b.py:1:1: DOC101 missing", "stdout")], [("warning: something", "stderr"), ("src/a.py:2:1: DOC201 missing", "stdout")]]
+
+    assert list(merge_outputs([_spool(output) for output in outputs])) == [
+        ("warning: something", "stderr"),
+        ("src/a.py:2:1: DOC201 missing", "stdout"),
+        ("src/b.py:1:1: DOC101 missing", "stdout"),
+    ]
+
+
+def test_merge_outputs_spilled_to_disk():
+    """Test that shard outputs spilled from memory to temporary files merge the same way, keeping snippets and preambles whole."""
+    outputs = [
+        [("note: a: b", "stderr"), ("src/b.py:3: error: Incompatible", "stdout"), ("    x: int = 'a'", "stdout"), ("    ^", "stdout")],
+        [("src/a.py:7:1: error: Missing", "stdout"), ("Found 1 error in 1 file (checked 3 source files)", "stdout"), ("trailing", "stdout")],
+    ]
+
+    with patch("tidy_cli.commons.process.SPILL_LIMIT", 16):
+        spools = [_spool(output) for output in outputs]
+
+    assert all(spool._rolled for spool in spools)  # type: ignore[attr-defined]
+    assert list(merge_outputs(spools)) == [
+        ("note: a: b", "stderr"),
+        ("trailing", "stdout"),
+        ("src/a.py:7:1: error: Missing", "stdout"),
+        ("src/b.py:3: error: Incompatible", "stdout"),
+        ("    x: int = 'a'", "stdout"),
+        ("    ^", "stdout"),
+        ("Found 1 error in 1 file (checked 3 source files)", "stdout"),
+    ]
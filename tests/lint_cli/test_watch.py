@@ -0,0 +1,165 @@
+"""Tests for the lint watch module."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from tidy_cli.lint_cli.watch import (
+    WatchBoard,
+    is_watched,
+    parse_diagnostics,
+    poll_changes,
+    scan_files,
+)
+
+
+def test_parse_diagnostics():
+    """Test grouping of tool output lines by file."""
+    lines = [
+        "src/pkg/a.py:17:8: F401 [*] `os` imported but unused",
+        "src/pkg/b.py:3:1: DOC201 does not have a return section",
+        "Found 1 error.",
+    ]
+
+    diagnostics = parse_diagnostics(lines)
+
+    assert diagnostics == {
+        str(Path("src/pkg/a.py")): ["17:8: F401 [*] `os` imported but unused"],
+        str(Path("src/pkg/b.py")): ["3:1: DOC201 does not have a return section"],
+    }
+
+
+def test_is_watched(tmp_path):
+    """Test that only Python files outside hidden and cache folders are watched."""
+    assert is_watched(tmp_path / "pkg" / "module.py", tmp_path) is True
+    assert is_watched(tmp_path / "pkg" / "notes.txt", tmp_path) is False
+    assert is_watched(tmp_path / ".venv" / "module.py", tmp_path) is False
+    assert is_watched(tmp_path / "__pycache__" / "module.py", tmp_path) is False
+    assert is_watched(tmp_path.parent / "module.py", tmp_path) is False
+
+
+def test_scan_files_skips_hidden_folders(tmp_path, monkeypatch):
+    """Test snapshot of the watched Python files."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src" / ".hidden").mkdir(parents=True)
+    (tmp_path / "src" / "module.py").write_text("x = 1\n")
+    (tmp_path / "src" / "notes.txt").write_text("notes\n")
+    (tmp_path / "src" / ".hidden" / "module.py").write_text("x = 1\n")
+
+    snapshot = scan_files(Path("src"))
+
+    assert list(snapshot) == [str(Path("src/module.py"))]
+
+
+def test_poll_changes_debounces_burst(tmp_path, monkeypatch):
+    """Test that a burst of saves is yielded as a single set of changes."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("x = 1\n")
+
+    def _save() -> None:
+        time.sleep(0.1)
+        (tmp_path / "src" / "a.py").write_text("x = 2\n")
+        (tmp_path / "src" / "b.py").write_text("y = 1\n")
+
+    changes = poll_changes(Path("src"), debounce=0.05, interval=0.02)
+    threading.Thread(target=_save).start()
+
+    assert next(changes) == {Path("src/a.py"), Path("src/b.py")}
+
+
+def test_changed_files_skips_unchanged_content(tmp_path):
+    """Test that files are linted again only when their content changes."""
+    file = tmp_path / "a.py"
+    file.write_text("x = 1\n")
+    board = WatchBoard(tmp_path, "pyproject.toml")
+
+    assert board.changed_files({file}) == ([file], [])
+    assert board.changed_files({file}) == ([], [])
+
+    file.unlink()
+    assert board.changed_files({file}) == ([], [file])
+
+
+def test_lint_refreshes_linted_files_only():
+    """Test that a run replaces the issues of the linted files and keeps the others."""
+    board = WatchBoard(Path("src"), "pyproject.toml")
+    board.issues = {str(Path("src/b.py")): {"ruff": ["2:1: E402 Module level import not at top of file"]}}
+
+    with (
+        patch("tidy_cli.lint_cli.watch.collect_output", return_value=(1, ["src/a.py:1:8: F401 `os` imported but unused", "Found 1 error."])) as mock_collect,
+        patch("tidy_cli.lint_cli.watch.collect_docstrings_output", return_value=(1, ["src/a.py:3:1: DOC201 missing return"])) as mock_docstrings,
+    ):
+        board.lint([Path("src/a.py")])
+
+    ruff_command = mock_collect.call_args[0][0]
+    assert ruff_command[-1] == "src/a.py"
+    assert "--fix" not in ruff_command
+    mock_docstrings.assert_called_once_with(["src/a.py"], "pyproject.toml")
+    assert board.issues == {
+        str(Path("src/a.py")): {"ruff": ["1:8: F401 `os` imported but unused"], "pydoclint": ["3:1: DOC201 missing return"]},
+        str(Path("src/b.py")): {"ruff": ["2:1: E402 Module level import not at top of file"]},
+    }
+
+
+def test_lint_fix_ignores_own_rewrites(tmp_path):
+    """Test that files rewritten by Ruff auto-fix are recorded as linted, so that the saves of the fix do not trigger another run."""
+    file = tmp_path / "a.py"
+    file.write_text("import os\nx = 1\n")
+    board = WatchBoard(tmp_path, "pyproject.toml", fix=True)
+    files, _ = board.changed_files({file})
+
+    def fix(command, label):
+        file.write_text("x = 1\n")
+        return 0, []
+
+    with patch("tidy_cli.lint_cli.watch.collect_output", side_effect=fix) as mock_collect, patch("tidy_cli.lint_cli.watch.collect_docstrings_output", return_value=(0, [])):
+        board.lint(files)
+
+    assert "--fix" in mock_collect.call_args[0][0]
+    assert board.changed_files({file}) == ([], [])
+
+
+def test_lint_targets_instead_of_files():
+    """Test that the tools get the given targets (e.g., the watched folder) instead of every file, while issues are refreshed per file."""
+    board = WatchBoard(Path("src"), "pyproject.toml")
+
+    with (
+        patch("tidy_cli.lint_cli.watch.collect_output", return_value=(1, ["src/b.py:1:8: F401 `os` imported but unused"])) as mock_collect,
+        patch("tidy_cli.lint_cli.watch.collect_docstrings_output", return_value=(0, [])) as mock_docstrings,
+    ):
+        board.lint([Path("src/a.py"), Path("src/b.py")], targets=[Path("src")])
+
+    assert mock_collect.call_args[0][0][-1] == "src"
+    mock_docstrings.assert_called_once_with(["src"], "pyproject.toml")
+    assert board.issues == {str(Path("src/b.py")): {"ruff": ["1:8: F401 `os` imported but unused"], "pydoclint": []}}
+
+
+def test_lint_with_mypy_replaces_previous_output():
+    """Test that Mypy output of the type checked packages is replaced by the latest run."""
+    board = WatchBoard(Path("src"), "pyproject.toml", mypy_command=["mypy"])
+    board.mypy_output = {(str(Path("src/pkg")),): ["old error"]}
+
+    with (
+        patch("tidy_cli.lint_cli.watch.collect_output", return_value=(0, [])) as mock_collect,
+        patch("tidy_cli.lint_cli.watch.collect_docstrings_output", return_value=(0, [])),
+    ):
+        board.lint([Path("src/pkg/a.py")], [Path("src/pkg")])
+
+    mock_collect.assert_any_call(["mypy", "src/pkg"], "Mypy type checking")
+    assert board.mypy_output == {}
+
+
+def test_render_summary():
+    """Test rendering of the issues summary."""
+    console = MagicMock()
+    console.is_terminal = False
+    board = WatchBoard(Path("src"), "pyproject.toml")
+    board.issues = {"src/a.py": {"ruff": ["1:8: F401 `os` imported but unused"]}}
+
+    board.render(console)
+
+    console.clear.assert_not_called()
+    console.print.assert_any_call("  [ruff] 1:8: F401 `os` imported but unused", style="white", markup=False, highlight=False)
+    console.print.assert_any_call("⚠️ 1 issue(s) in 1 file(s)", style="yellow")
@@ -1,13 +1,18 @@
 """Tests for the pytest CLI module."""
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+from tidy_cli.commons.settings import SETTINGS_FILE, Settings
 from tidy_cli.pytest_cli.cli import pytest_app
+from tidy_cli.pytest_cli.coverage_reports import COVERAGE_DATA_FILE
+from tidy_cli.pytest_cli.durations import DURATIONS_FILE
 from tidy_cli.pytest_cli.helpers import cleanup_test_cache
+from tidy_cli.pytest_cli.results import TestResult
 
 @pytest.fixture(scope="module")
 def runner():
@@ -16,21 +21,22 @@ def runner():
 
 
 
-def test_cleanup_test_cache():
+def test_cleanup_test_cache(tmp_path):
     """Test the cleanup_test_cache function."""
-    with patch("subprocess.run") as mock_run, patch("rich.console.Console.print") as mock_print:
+    (tmp_path / "__pycache__").mkdir()
+    with patch("tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings({})), patch("rich.console.Console.print") as mock_print:
         # Call the function
-        cleanup_test_cache()
+        cleanup_test_cache(tmp_path)
 
-        # Check that subprocess.run was called 3 times (for each cleanup command)
-        assert mock_run.call_count == 3
-        # Check that the console print was called
-        mock_print.assert_called_with("🧹 Test cache cleaned up", style="white")
+        # Check that the console print was called with the report
+        assert (tmp_path / "__pycache__").exists() is False
+        assert mock_print.call_args[0][0].startswith("🧹 Test cache cleaned up: 1 __pycache__ folder(s) and 0 file(s) removed in ")
+        assert mock_print.call_args[1] == {"style": "white"}
 
 
 def test_cleanup_test_cache_exception():
     """Test the cleanup_test_cache function when an exception occurs."""
-    with patch("subprocess.run", side_effect=Exception("Test error")), patch("rich.console.Console.print") as mock_print:
+    with patch("tidy_cli.pytest_cli.helpers.remove_bytecode", side_effect=Exception("Test error")), patch("rich.console.Console.print") as mock_print:
         # Call the function
         cleanup_test_cache()
 
@@ -77,7 +83,7 @@ def test_run_specific_path_success(runner):
         patch("os.chdir") as mock_chdir,
         patch("subprocess.run") as mock_run,
         patch("rich.console.Console.print") as mock_print,
-        patch("tidy_cli.pytest_cli.cli.cleanup_test_cache") as mock_cleanup,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
         patch("tidy_cli.pytest_cli.cli.get_pytest_default_path", return_value=Path(".")),
     ):
         # Mock successful test run
@@ -101,7 +107,7 @@ def test_run_specific_path_with_logs(runner):
         patch("os.chdir") as mock_chdir,
         patch("subprocess.run") as mock_run,
         patch("rich.console.Console.print") as mock_print,
-        patch("tidy_cli.pytest_cli.cli.cleanup_test_cache") as mock_cleanup,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
     ):
         # Mock successful test run
         mock_run.return_value = MagicMock(returncode=0)
@@ -124,7 +130,7 @@ def test_run_specific_path_failure(runner):
         patch("os.chdir") as mock_chdir,
         patch("subprocess.run") as mock_run,
         patch("rich.console.Console.print") as mock_print,
-        patch("tidy_cli.pytest_cli.cli.cleanup_test_cache") as mock_cleanup,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
     ):
         # Mock failed test run
         mock_run.return_value = MagicMock(returncode=1)
@@ -146,8 +152,9 @@ def test_run_all_tests_success(runner):
         patch("subprocess.run") as mock_run,
         patch("pathlib.Path.unlink") as mock_unlink,
         patch("rich.console.Console.print") as mock_print,
-        patch("tidy_cli.pytest_cli.cli.cleanup_test_cache") as mock_cleanup,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
         patch("tidy_cli.pytest_cli.cli.get_pytest_default_path", return_value=Path(".")),
+        patch("tidy_cli.pytest_cli.cli.write_coverage_reports") as mock_reports,
     ):
         # Create a mock that returns success for both calls
         mock_process = MagicMock(returncode=0)
@@ -167,18 +174,16 @@ def test_run_all_tests_success(runner):
         assert "run" in first_call_args
         assert "pytest" in first_call_args
 
-        # Verify second call (coverage report)
-        second_call_args = mock_run.call_args_list[1][0][0]
-        assert "coverage" in second_call_args
-        assert "report" in second_call_args
+        # Verify coverage reports are rendered out of the stored data
+        assert mock_reports.call_args[0][2] == ["term"]
 
         # Verify console output
         mock_print.assert_any_call("🧪 Running [bold]all[/bold] tests with [bold]coverage[/bold] for: [bold].[/bold]", style="white")
         mock_print.assert_any_call("📊 Displaying [bold]coverage report[/bold]...", style="white")
         mock_print.assert_any_call("✅ Tests and coverage completed [bold]successfully[/bold]", style="green")
 
-        # Verify cleanup
-        mock_unlink.assert_called_once_with(missing_ok=True)
+        # Verify coverage data is kept and caches cleanup
+        mock_unlink.assert_not_called()
         mock_cleanup.assert_called_once()
 
 
@@ -190,7 +195,7 @@ def test_run_all_tests_failure(runner):
         patch("subprocess.run") as mock_run,
         patch("pathlib.Path.unlink") as mock_unlink,
         patch("rich.console.Console.print") as mock_print,
-        patch("tidy_cli.pytest_cli.cli.cleanup_test_cache") as mock_cleanup,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
     ):
         # Mock failed test run
         mock_run.return_value = MagicMock(returncode=1)
@@ -224,7 +229,7 @@ def test_run_chdir_restored(runner):
     """Test that the original working directory is restored after running tests."""
     original_dir = Path.cwd()
 
-    with patch("pathlib.Path.exists", return_value=True), patch("subprocess.run") as mock_run, patch("tidy_cli.pytest_cli.cli.cleanup_test_cache"):
+    with patch("pathlib.Path.exists", return_value=True), patch("subprocess.run") as mock_run, patch("tidy_cli.pytest_cli.cli.cleanup_caches"):
         # Mock successful test run
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -232,3 +237,325 @@ def test_run_chdir_restored(runner):
 
         # Check that we're back in the original directory
         assert Path.cwd() == original_dir
+
+
+def test_run_profile(runner, tmp_path):
+    """Test run command with profile output resolves the report path before changing directory."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)),
+        patch("rich.console.Console.print"),
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.start_profiling") as mock_start,
+        patch("tidy_cli.pytest_cli.cli.finish_profiling") as mock_finish,
+    ):
+        result = runner.invoke(pytest_app, ["run", "tests/test_example.py", "--profile-output", "profile.json"])
+
+        assert result.exit_code == 0
+        mock_start.assert_called_once()
+        assert mock_finish.call_args[0][1:] == ("pytest run", Path("profile.json").resolve())
+
+
+def test_run_all_tests_workers(runner):
+    """Test run command for all tests split across workers combines coverage data."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
+        patch("pathlib.Path.unlink"),
+        patch("rich.console.Console.print") as mock_print,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.parallel.run_workers", return_value=0) as mock_workers,
+        patch("tidy_cli.pytest_cli.cli.write_coverage_reports"),
+    ):
+        result = runner.invoke(pytest_app, ["run", "--workers", "4", "--pyproject-path", "pyproject.toml"])
+
+        assert result.exit_code == 0
+        command, description, workers = mock_workers.call_args[0]
+        assert command[:6] == ["coverage", "run", "--rcfile=pyproject.toml", "--parallel-mode", "-m", "pytest"]
+        assert (description, workers) == ("Pytest (coverage)", 4)
+        assert [call[0][0] for call in mock_run.call_args_list] == [
+            ["coverage", "combine", "--quiet", "--rcfile=pyproject.toml"],
+        ]
+        mock_print.assert_any_call("✅ Tests and coverage completed [bold]successfully[/bold]", style="green")
+
+
+def test_run_record_impact(runner, tmp_path):
+    """Test run command for all tests recording the test impact map."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
+        patch("pathlib.Path.unlink"),
+        patch("rich.console.Console.print"),
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.get_repo_root", return_value=tmp_path),
+        patch("tidy_cli.pytest_cli.cli.build_impact_map", return_value={"tests": [], "files": {}}) as mock_build,
+        patch("tidy_cli.pytest_cli.cli.save_impact_map") as mock_save,
+        patch("tidy_cli.pytest_cli.cli.write_coverage_reports"),
+    ):
+        result = runner.invoke(pytest_app, ["run", "--record-impact", "--pyproject-path", "pyproject.toml"])
+
+        assert result.exit_code == 0
+        assert "--tidy-contexts" in mock_run.call_args_list[0][0][0]
+        mock_build.assert_called_once_with(COVERAGE_DATA_FILE.resolve(), tmp_path)
+        mock_save.assert_called_once()
+
+
+def test_run_affected(runner):
+    """Test run command running only the tests affected by changes since a ref."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
+        patch("rich.console.Console.print") as mock_print,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.load_impact_map", return_value={"tests": [], "files": {}}),
+        patch("tidy_cli.pytest_cli.cli.get_repo_root", return_value=Path("/repo")),
+        patch("tidy_cli.pytest_cli.cli.get_changed_lines", return_value={}) as mock_changed,
+        patch("tidy_cli.pytest_cli.cli.select_affected_tests", return_value=["tests/test_a.py", "tests/test_b.py::test_one"]) as mock_select,
+    ):
+        result = runner.invoke(pytest_app, ["run", "--since", "main", "-e", "-x"])
+
+        assert result.exit_code == 0
+        mock_changed.assert_called_once_with("main")
+        mock_select.assert_called_once_with({"tests": [], "files": {}}, {}, Path("/repo"))
+        command = mock_run.call_args[0][0]
+        assert command[:3] == ["python", "-m", "pytest"]
+        assert command[3].startswith("@")
+        assert command[-1] == "-x"
+        mock_print.assert_any_call("🎯 Running [bold]2[/bold] test target(s) affected by changes since [bold]main[/bold]", style="white")
+
+
+def test_run_affected_without_changes(runner):
+    """Test run command skipping tests when no test is affected by changes."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run") as mock_run,
+        patch("rich.console.Console.print") as mock_print,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.load_impact_map", return_value={"tests": [], "files": {}}),
+        patch("tidy_cli.pytest_cli.cli.get_repo_root", return_value=Path("/repo")),
+        patch("tidy_cli.pytest_cli.cli.get_changed_lines", return_value={}),
+    ):
+        result = runner.invoke(pytest_app, ["run", "--affected"])
+
+        assert result.exit_code == 0
+        mock_run.assert_not_called()
+        mock_print.assert_any_call("✨ No tests affected by changes since [bold]HEAD[/bold]", style="green")
+
+
+def test_run_shard(runner):
+    """Test run command passing the shard to the plugin and recording durations."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
+        patch("rich.console.Console.print"),
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.record_durations") as mock_record,
+    ):
+        result = runner.invoke(pytest_app, ["run", "tests", "--shard", "2/4"])
+
+        assert result.exit_code == 0
+        command = mock_run.call_args[0][0]
+        assert command[command.index("-p") + 1] == "tidy_cli.pytest_cli.plugin"
+        assert "--tidy-shard=2/4" in command
+        mock_record.assert_called_once()
+
+
+def test_run_slow_tests(runner):
+    """Test run command comparing test durations with their baseline, warning or failing on slower tests."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)),
+        patch("rich.console.Console.print") as mock_print,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
+        patch("tidy_cli.pytest_cli.cli.load_reports", return_value=({"tests/test_a.py::test_one": 3.0}, 0.5)),
+        patch("tidy_cli.pytest_cli.cli.load_durations", return_value={"tests/test_a.py::test_one": 1.0}) as mock_load,
+        patch("tidy_cli.pytest_cli.cli.record_durations") as mock_record,
+    ):
+        result = runner.invoke(pytest_app, ["run", "tests", "--slow-ratio", "2"])
+
+        assert result.exit_code == 0
+        mock_load.assert_called_with(DURATIONS_FILE.resolve(), "plain")
+        mock_print.assert_any_call("⏱️  Collection: [bold]0.50s[/bold]", style="white")
+        mock_print.assert_any_call("⚠️ [bold]1[/bold] test(s) slower than [bold]2x[/bold] their baseline:", style="yellow")
+        mock_record.assert_called_once_with({"tests/test_a.py::test_one": 3.0}, DURATIONS_FILE.resolve(), "plain")
+
+        result = runner.invoke(pytest_app, ["run", "tests", "--slow-ratio", "2", "--fail-on-slow"])
+
+        assert result.exit_code == 1
+        mock_print.assert_any_call("❌ [bold]1[/bold] test(s) slower than [bold]2x[/bold] their baseline:", style="red")
+        assert mock_cleanup.call_count == 2
+
+        result = runner.invoke(pytest_app, ["run", "tests", "--slow-ratio", "4", "--fail-on-slow"])
+
+        assert result.exit_code == 0
+
+
+def test_run_durations_mode(runner):
+    """Test run command recording durations of successful runs only, under the mode of the run (i.e., the Coverage core)."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as mock_run,
+        patch("rich.console.Console.print"),
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.write_coverage_reports"),
+        patch("tidy_cli.pytest_cli.cli.load_reports", return_value=({"tests/test_a.py::test_one": 3.0}, 0.5)),
+        patch("tidy_cli.pytest_cli.cli.record_durations") as mock_record,
+    ):
+        result = runner.invoke(pytest_app, ["run", "--coverage-core", "pytrace"])
+
+        assert result.exit_code == 0
+        assert "--tidy-durations-mode=coverage-pytrace" in mock_run.call_args[0][0]
+        mock_record.assert_called_once_with({"tests/test_a.py::test_one": 3.0}, DURATIONS_FILE.resolve(), "coverage-pytrace")
+
+        mock_run.return_value = MagicMock(returncode=1)
+        result = runner.invoke(pytest_app, ["run", "--coverage-core", "pytrace"])
+
+        assert result.exit_code == 0
+        mock_record.assert_called_once()
+
+
+def test_run_results_file(runner, tmp_path):
+    """Test run command summarizing the logged test results and writing them to the results file."""
+    results = [TestResult("tests/test_a.py::test_one", "failed", 1.0, "assert 1 == 2")]
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=1)),
+        patch("rich.console.Console.print") as mock_print,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.load_results", return_value=results),
+        patch("tidy_cli.pytest_cli.cli.write_results_file") as mock_write,
+    ):
+        result = runner.invoke(pytest_app, ["run", "tests", "--results-file", str(tmp_path / "results.json")])
+
+        assert result.exit_code == 0
+        mock_print.assert_any_call("💥 FAILED tests/test_a.py::test_one: assert 1 == 2", style="red")
+        mock_write.assert_called_once_with(tmp_path / "results.json", results, 1)
+
+
+def test_run_invalid_shard(runner):
+    """Test run command with an invalid shard."""
+    with patch("pathlib.Path.exists", return_value=True), patch("subprocess.run") as mock_run, patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(pytest_app, ["run", "--shard", "5/4"])
+
+        assert result.exit_code == 1
+        mock_run.assert_not_called()
+        mock_print.assert_called_with("❌ Invalid shard: [bold]--shard expects 'index/count' with 1 <= index <= count, got '5/4'[/bold]", style="red")
+
+
+def test_run_cleanup_policy(runner):
+    """Test run command keeps caches by default and applies the given cleanup policy."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)),
+        patch("rich.console.Console.print"),
+        patch("tidy_cli.pytest_cli.cli.get_pytest_cleanup_policy", return_value="never"),
+        patch("tidy_cli.pytest_cli.cli.get_prune_budget", return_value=(7.0, None)),
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches") as mock_cleanup,
+    ):
+        runner.invoke(pytest_app, ["run", "tests"])
+        assert mock_cleanup.call_args[0][0] == "never"
+
+        runner.invoke(pytest_app, ["run", "tests", "--cleanup", "prune"])
+        assert mock_cleanup.call_args[0][0] == "prune"
+        assert mock_cleanup.call_args[0][2:] == (7.0, None, SETTINGS_FILE.parent.resolve())
+
+
+def test_run_warm(runner):
+    """Test run command forks targeted runs out of the warm server with the preloaded modules from settings."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("rich.console.Console.print"),
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.get_pytest_server_preload", return_value=["pkg.heavy"]),
+        patch("tidy_cli.pytest_cli.cli.run_pytest", return_value=0) as mock_run,
+    ):
+        result = runner.invoke(pytest_app, ["run", "tests/test_example.py", "--warm"])
+
+        assert result.exit_code == 0
+        assert mock_run.call_args[0][3] == ["pkg.heavy"]
+
+
+def test_server_status_not_running(runner):
+    """Test server status when no warm server is running."""
+    with patch("tidy_cli.pytest_cli.cli.get_server_status", return_value=None), patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(pytest_app, ["server", "status", "--default-dir", "tests"])
+
+        assert result.exit_code == 1
+        mock_print.assert_called_with("💤 No warm Pytest server running for [bold]tests[/bold]", style="white")
+
+
+def test_server_stop(runner):
+    """Test server stop."""
+    with patch("tidy_cli.pytest_cli.cli.stop_server", return_value=True), patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(pytest_app, ["server", "stop", "--default-dir", "tests"])
+
+        assert result.exit_code == 0
+        mock_print.assert_called_with("🛑 Warm Pytest server stopped for [bold]tests[/bold]", style="white")
+
+
+def test_run_diff_coverage(runner):
+    """Test run command reports coverage of changed lines in the given formats, with the Coverage environment set for the run only."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)),
+        patch("rich.console.Console.print") as mock_print,
+        patch("tidy_cli.pytest_cli.cli.cleanup_caches"),
+        patch("tidy_cli.pytest_cli.cli.write_coverage_reports") as mock_reports,
+        patch.dict("os.environ", {"COVERAGE_CORE": "ctrace"}),
+    ):
+        result = runner.invoke(pytest_app, ["run", "--diff-coverage", "main", "--coverage-core", "pytrace", "--coverage-format", "xml,term"])
+
+        assert result.exit_code == 0
+        _, data_file, formats, _, diff_ref = mock_reports.call_args[0]
+        assert (data_file, formats, diff_ref) == (COVERAGE_DATA_FILE.resolve(), ["xml", "term"], "main")
+        mock_print.assert_any_call("📏 Coverage core: [bold]pytrace[/bold]", style="white")
+        assert os.environ["COVERAGE_CORE"] == "ctrace"
+        assert "COVERAGE_FILE" not in os.environ
+
+
+def test_run_invalid_coverage_format(runner):
+    """Test run command with an unknown coverage format."""
+    with patch("rich.console.Console.print") as mock_print, patch("subprocess.run") as mock_run:
+        result = runner.invoke(pytest_app, ["run", "--coverage-format", "term,pdf"])
+
+        assert result.exit_code == 1
+        mock_run.assert_not_called()
+        mock_print.assert_called_with(
+            "❌ Invalid coverage format: [bold]'term,pdf' (expected comma separated formats among term, xml, json, html)[/bold]",
+            style="red",
+        )
+
+
+def test_report_without_data(runner):
+    """Test report command when no coverage data is stored."""
+    with patch("pathlib.Path.exists", return_value=False), patch("rich.console.Console.print") as mock_print:
+        result = runner.invoke(pytest_app, ["report"])
+
+        assert result.exit_code == 1
+        mock_print.assert_called_with("❌ No coverage data found, run all tests with [code]tidy-cli pytest run[/code] first", style="red")
+
+
+def test_report(runner):
+    """Test report command renders the requested formats out of the stored data from the default directory."""
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("os.chdir") as mock_chdir,
+        patch("tidy_cli.pytest_cli.cli.write_coverage_reports") as mock_reports,
+    ):
+        result = runner.invoke(pytest_app, ["report", "--coverage-format", "html", "--default-dir", "src", "--pyproject-path", "pyproject.toml"])
+
+        assert result.exit_code == 0
+        mock_chdir.assert_any_call(Path("src"))
+        assert mock_reports.call_args[0][1:] == (COVERAGE_DATA_FILE.resolve(), ["html"], "pyproject.toml", None)
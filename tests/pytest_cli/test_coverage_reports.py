@@ -0,0 +1,43 @@
+"""Tests for the pytest coverage reports module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from coverage import Coverage
+
+from tidy_cli.pytest_cli.coverage_reports import (
+    parse_coverage_formats,
+    write_coverage_reports,
+)
+
+
+def test_parse_coverage_formats():
+    """Test parsing of comma separated formats, keeping their order without duplicates."""
+    assert parse_coverage_formats("term") == ["term"]
+    assert parse_coverage_formats(" XML, term,xml ,") == ["xml", "term"]
+    with pytest.raises(ValueError):
+        parse_coverage_formats("term,pdf")
+    with pytest.raises(ValueError):
+        parse_coverage_formats(" , ")
+
+
+def test_write_coverage_reports(tmp_path, monkeypatch, capsys):
+    """Test that every requested report is rendered out of the stored data next to it."""
+    monkeypatch.chdir(tmp_path)
+    module = tmp_path / "module.py"
+    module.write_text("def one():\n    return 1\n\n\none()\n")
+    data_file = tmp_path / "coverage" / ".coverage"
+    data_file.parent.mkdir()
+    cov = Coverage(data_file=str(data_file), config_file=False)
+    cov.start()
+    exec(compile(module.read_text(), str(module), "exec"), {})
+    cov.stop()
+    cov.save()
+    console = MagicMock()
+
+    written = write_coverage_reports(console, data_file, ["term", "xml", "json", "html"], config_file=False)
+
+    assert written == [data_file.parent / "coverage.xml", data_file.parent / "coverage.json", data_file.parent / "html"]
+    assert all(path.exists() for path in written)
+    assert "module.py" in capsys.readouterr().out
+    console.print.assert_any_call(f"📄 XML coverage report written to [bold]{data_file.parent / 'coverage.xml'}[/bold]", style="white")
@@ -0,0 +1,60 @@
+"""Tests for the pytest diff coverage module."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from coverage import Coverage
+
+from tidy_cli.pytest_cli.diff_coverage import (
+    FileDiffCoverage,
+    compute_diff_coverage,
+    print_diff_coverage,
+)
+
+SOURCE = """def small(x):
+    if x > 10:
+        return "big"
+    return "small"
+
+
+small(1)
+"""
+
+
+def test_compute_diff_coverage(tmp_path, monkeypatch):
+    """Test that only changed statements of measured source files are reported."""
+    monkeypatch.chdir(tmp_path)
+    module = tmp_path / "module.py"
+    module.write_text(SOURCE)
+    (tmp_path / "test_module.py").write_text("def test_small():\n    pass\n")
+    cov = Coverage(data_file=str(tmp_path / ".coverage"), config_file=False)
+    cov.start()
+    exec(compile(SOURCE, str(module), "exec"), {})
+    cov.stop()
+    cov.save()
+
+    cov = Coverage(data_file=str(tmp_path / ".coverage"), config_file=False)
+    cov.load()
+    results = compute_diff_coverage(
+        cov,
+        {Path("module.py"): {3, 4, 5}, Path("test_module.py"): None, Path("unmeasured.py"): None, Path("README.md"): None},
+    )
+
+    assert results == [FileDiffCoverage(Path("module.py"), {3, 4}, {3})]
+    assert results[0].percent == 50.0
+    assert compute_diff_coverage(cov, {Path("module.py"): None})[0].statements == {1, 2, 3, 4, 7}
+    # Changed files are relative to the given root (i.e., the repository root) when running from a subfolder
+    (tmp_path / "tests").mkdir()
+    monkeypatch.chdir(tmp_path / "tests")
+    assert compute_diff_coverage(cov, {Path("module.py"): {3, 4, 5}}, tmp_path) == [FileDiffCoverage(Path("module.py"), {3, 4}, {3})]
+
+
+def test_print_diff_coverage():
+    """Test the diff coverage total and the message when no measured statement changed."""
+    console = MagicMock()
+
+    print_diff_coverage(console, [FileDiffCoverage(Path("a.py"), {1, 2, 3, 4}, {4}), FileDiffCoverage(Path("b.py"), set(), set())], "main")
+    console.print.assert_called_with("📐 Diff coverage: [bold]75.0%[/bold] of [bold]4[/bold] changed statement(s)", style="yellow")
+
+    print_diff_coverage(console, [FileDiffCoverage(Path("b.py"), set(), set())], "main")
+    console.print.assert_called_with("✨ No measured statements changed since [bold]main[/bold]", style="green")
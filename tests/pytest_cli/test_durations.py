@@ -0,0 +1,92 @@
+"""Tests for the pytest durations module."""
+
+import json
+
+from tidy_cli.pytest_cli.durations import (
+    PLAIN_MODE,
+    WARM_MODE,
+    estimate_durations,
+    get_durations_mode,
+    load_durations,
+    load_history,
+    load_reports,
+    load_store,
+    partition,
+    record_durations,
+)
+
+
+def test_record_durations_appends_history(tmp_path, monkeypatch):
+    """Test that measured durations are appended to the history of their mode, keeping tests that did not run and dropping removed modules."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("")
+    durations_file = tmp_path / "local" / "durations.json"
+    durations_file.parent.mkdir()
+    history = {"tests/test_a.py::test_one": [1.0, 2.0, 3.0], "tests/test_a.py::test_two": [2.0], "tests/test_removed.py::test_one": [3.0]}
+    durations_file.write_text(json.dumps({PLAIN_MODE: history, WARM_MODE: {"tests/test_a.py::test_one": [0.1]}}))
+
+    assert record_durations({"tests/test_a.py::test_one": 0.5, "tests/test_a.py::test_three": 0.25}, durations_file, PLAIN_MODE, history_size=3) == 2
+    assert load_history(durations_file, PLAIN_MODE) == {
+        "tests/test_a.py::test_one": [2.0, 3.0, 0.5],
+        "tests/test_a.py::test_three": [0.25],
+        "tests/test_a.py::test_two": [2.0],
+    }
+    assert load_durations(durations_file, PLAIN_MODE) == {"tests/test_a.py::test_one": 2.0, "tests/test_a.py::test_three": 0.25, "tests/test_a.py::test_two": 2.0}
+    assert load_durations(durations_file, WARM_MODE) == {"tests/test_a.py::test_one": 0.1}
+
+
+def test_record_durations_by_mode(tmp_path, monkeypatch):
+    """Test that each mode keeps its own history and durations stored outside of any mode (i.e., previous versions) are ignored."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test_a.py").write_text("")
+    durations_file = tmp_path / "durations.json"
+    durations_file.write_text(json.dumps({"test_a.py::test_one": 9.0, "test_a.py::test_two": [9.0]}))
+    coverage_mode = get_durations_mode("sysmon")
+
+    record_durations({"test_a.py::test_one": 2.0}, durations_file, coverage_mode)
+    record_durations({"test_a.py::test_one": 0.5}, durations_file, get_durations_mode(warm=True))
+
+    assert load_store(durations_file) == {coverage_mode: {"test_a.py::test_one": [2.0]}, WARM_MODE: {"test_a.py::test_one": [0.5]}}
+    assert load_durations(durations_file) == {}
+
+
+def test_get_durations_mode():
+    """Test that Coverage runs are told apart by core, and other runs by whether they are warm."""
+    assert get_durations_mode("ctrace") == "coverage-ctrace"
+    assert get_durations_mode("ctrace", warm=True) == "coverage-ctrace"
+    assert get_durations_mode(warm=True) == WARM_MODE
+    assert get_durations_mode() == PLAIN_MODE
+
+
+def test_record_durations_without_measures(tmp_path):
+    """Test that the store is left untouched when no test ran."""
+    durations_file = tmp_path / "durations.json"
+
+    assert record_durations({}, durations_file) == 0
+    assert durations_file.exists() is False
+    assert load_durations(durations_file) == {}
+
+
+def test_load_reports(tmp_path):
+    """Test that the reports of every Pytest process are merged, the collection time being the longest one."""
+    (tmp_path / "durations-1.json").write_text(json.dumps({"durations": {"tests/test_a.py::test_one": 0.5}, "collection": 0.25}))
+    (tmp_path / "durations-2.json").write_text(json.dumps({"durations": {"tests/test_b.py::test_one": 1.5}, "collection": 0.75}))
+    (tmp_path / "durations-3.json").write_text("{")
+
+    assert load_reports(tmp_path) == ({"tests/test_a.py::test_one": 0.5, "tests/test_b.py::test_one": 1.5}, 0.75)
+    assert load_reports(tmp_path / "missing") == ({}, None)
+
+
+def test_estimate_durations_median_fallback():
+    """Test that tests without history are given the median of the recorded durations."""
+    assert estimate_durations(["a", "b", "c", "d"], {"a": 1.0, "b": 5.0, "c": 2.0}) == {"a": 1.0, "b": 5.0, "c": 2.0, "d": 2.0}
+    assert estimate_durations(["a"], {}) == {"a": 1.0}
+
+
+def test_partition_longest_processing_time_first():
+    """Test that heavier keys are spread across the lightest groups deterministically."""
+    weights = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 1.0}
+
+    assert partition(weights, 2) == [{"a", "d"}, {"b", "c", "e"}]
+    assert partition({"a": 1.0}, 3) == [{"a"}, set(), set()]
@@ -2,53 +2,69 @@
 
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from src.tidy_cli.commons.settings import Settings
 from src.tidy_cli.pytest_cli.helpers import (
+    cleanup_caches,
     cleanup_test_cache,
+    get_pytest_cleanup_policy,
     get_pytest_config_path,
     get_pytest_default_path,
     init_settings,
+    resolve_coverage_core,
 )
 
 
-@pytest.mark.parametrize(
-    "scenario",
-    [
-        # Successful scenario
-        {
-            "mock_subprocess": {"return_value": MagicMock(returncode=0)},
-            "expected_rich_print": "🧹 Test cache cleaned up",
-            "expected_rich_style": {"style": "white"},
-        },
-        # Failing scenario
-        {
-            "mock_subprocess": {"side_effect": Exception("Error")},
-            "expected_rich_print": "⚠️ Warning: Could not clean up test cache: Error",
-            "expected_rich_style": {"style": "yellow"},
-        },
-    ]
-)
-def test_cleanup_test_cache(
-    scenario: dict[str, Any]
+def test_cleanup_test_cache_reports_removed_bytecode(
+    tmp_path: Path,
 ) -> None:
     """
-    Function to test cleanup_test_chache.
-    It tests the following scenarios:
-    - successful scenario
-    - failing scenario
+    Function to test cleanup_test_cache removes bytecode in a single walk, keeping the one of skipped folders.
+
+    :param tmp_path: temporary folder
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    for folder in ("pkg/__pycache__", "pkg/sub/__pycache__", ".venv/lib/__pycache__", "env/lib/__pycache__", "node_modules/x/__pycache__", "custom/__pycache__"):
+        (tmp_path / folder).mkdir(parents=True)
+        (tmp_path / folder / "module.cpython-311.pyc").write_bytes(b"")
+    (tmp_path / "env" / "pyvenv.cfg").write_text("")
+    (tmp_path / "pkg" / "stray.pyc").write_bytes(b"")
+
+    with (
+        patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings({"pytest_cleanup_skip_dirs": "custom, other"})),
+        patch("src.tidy_cli.pytest_cli.helpers.console.print", return_value=None) as mock_rich_print,
+    ):
+        cleanup_test_cache(tmp_path)
+
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("__pycache__")) == [
+        ".venv/lib/__pycache__",
+        "custom/__pycache__",
+        "env/lib/__pycache__",
+        "node_modules/x/__pycache__",
+    ]
+    assert (tmp_path / "pkg" / "stray.pyc").exists() is False
+    message = mock_rich_print.call_args[0][0]
+    assert message.startswith("🧹 Test cache cleaned up: 2 __pycache__ folder(s) and 1 file(s) removed in ")
+
+
+def test_cleanup_test_cache_failure() -> None:
+    """
+    Function to test cleanup_test_cache warns instead of failing when the cleanup raises.
 
     :return: None
     :rtype: None
     """
     with (
-        patch("src.tidy_cli.pytest_cli.helpers.subprocess.run", **scenario.get("mock_subprocess", {})),
+        patch("src.tidy_cli.pytest_cli.helpers.remove_bytecode", side_effect=Exception("Error")),
         patch("src.tidy_cli.pytest_cli.helpers.console.print", return_value=None) as mock_rich_print,
     ):
         cleanup_test_cache()
-        mock_rich_print.assert_called_once_with(scenario.get("expected_rich_print"), **scenario.get("expected_rich_style", {}))
+        mock_rich_print.assert_called_once_with("⚠️ Warning: Could not clean up test cache: Error", style="yellow")
 
 
 @pytest.mark.parametrize(
@@ -56,8 +72,8 @@ def test_cleanup_test_cache(
     [
         # No initial settings
         {
-            "load_settings": {
-                "mock_value": {"return_value": {}},
+            "get_settings": {
+                "mock_value": {"return_value": Settings()},
                 "assert_value": 1,
             },
             "update_settings": {
@@ -73,35 +89,34 @@ def test_cleanup_test_cache(
                 "assert_value": 5,
             },
         }
-    ]
+    ],
 )
 def test_init_settings(
     scenario: dict[str, Any],
 ) -> None:
     """TBA"""
     with (
-        patch("src.tidy_cli.pytest_cli.helpers.load_settings", **scenario.get("load_settings", {}).get("mock_value", {})) as mock_load,
+        patch("src.tidy_cli.pytest_cli.helpers.get_settings", **scenario.get("get_settings", {}).get("mock_value", {})) as mock_load,
         patch("src.tidy_cli.pytest_cli.helpers.update_settings", **scenario.get("update_settings", {}).get("mock_value", {})) as mock_update,
-        patch("src.tidy_cli.pytest_cli.helpers.typer.prompt", **scenario.get("prompt", {}).get("mock_value", {})) as mock_prompt,
+        patch("typer.prompt", **scenario.get("prompt", {}).get("mock_value", {})) as mock_prompt,
         patch("src.tidy_cli.pytest_cli.helpers.console.print", **scenario.get("rich_print", {}).get("mock_value", {})) as mock_print,
         patch("src.tidy_cli.pytest_cli.helpers.SETTINGS_FILE", "test_settings.json"),
     ):
         init_settings()
         # Test calls
-        assert mock_load.call_count == scenario.get("load_settings", {}).get("assert_value")
+        assert mock_load.call_count == scenario.get("get_settings", {}).get("assert_value")
         assert mock_prompt.call_count == scenario.get("prompt", {}).get("assert_value")
         print(mock_print.call_args_list)
         assert mock_update.call_args[0][0] == scenario.get("update_settings", {}).get("assert_value")
         assert mock_print.call_count == scenario.get("rich_print", {}).get("assert_value")
 
 
-
 def test_init_settings_with_existing():
     """Test init_settings with existing settings."""
     existing_settings = {"pytest_default_path": "existing_tests", "pytest_config_path": "existing.toml"}
 
     with (
-        patch("src.tidy_cli.pytest_cli.helpers.load_settings", return_value=existing_settings),
+        patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings(existing_settings)),
         patch("src.tidy_cli.pytest_cli.helpers.update_settings") as mock_update,
         patch("typer.prompt", side_effect=[Path("new_tests"), Path("new.toml")]),
         patch("rich.console.Console.print") as mock_print,
@@ -118,7 +133,7 @@ def test_init_settings_with_existing():
 
 def test_get_pytest_default_path_default():
     """Test get_pytest_default_path with default value."""
-    with patch("src.tidy_cli.pytest_cli.helpers.load_settings", return_value={}):
+    with patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings({})):
         result = get_pytest_default_path()
         assert result == Path("src")
 
@@ -127,14 +142,14 @@ def test_get_pytest_default_path_from_settings():
     """Test get_pytest_default_path from settings."""
     settings = {"pytest_default_path": "custom_tests"}
 
-    with patch("src.tidy_cli.pytest_cli.helpers.load_settings", return_value=settings):
+    with patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings(settings)):
         result = get_pytest_default_path()
         assert result == Path("custom_tests")
 
 
 def test_get_pytest_config_path_default():
     """Test get_pytest_config_path with default value."""
-    with patch("src.tidy_cli.pytest_cli.helpers.load_settings", return_value={}):
+    with patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings({})):
         result = get_pytest_config_path()
         assert result == "../pyproject.toml"
 
@@ -143,6 +158,60 @@ def test_get_pytest_config_path_from_settings():
     """Test get_pytest_config_path from settings."""
     settings = {"pytest_config_path": "custom.toml"}
 
-    with patch("src.tidy_cli.pytest_cli.helpers.load_settings", return_value=settings):
+    with patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings(settings)):
         result = get_pytest_config_path()
         assert result == "custom.toml"
+
+
+@pytest.mark.parametrize(
+    ("settings", "expected"),
+    [
+        ({}, "never"),
+        ({"pytest_cleanup_policy": "prune"}, "prune"),
+        ({"pytest_cleanup_policy": "unknown"}, "never"),
+    ],
+)
+def test_get_pytest_cleanup_policy(settings, expected):
+    """Test get_pytest_cleanup_policy from settings, defaulting to never."""
+    with patch("src.tidy_cli.pytest_cli.helpers.get_settings", return_value=Settings(settings)):
+        assert get_pytest_cleanup_policy() == expected
+
+
+def test_cleanup_caches_policies():
+    """Test that each cleanup policy removes the expected caches."""
+    with (
+        patch("src.tidy_cli.pytest_cli.helpers.cleanup_test_cache") as mock_bytecode,
+        patch("src.tidy_cli.pytest_cli.helpers.prune_caches", return_value=[]) as mock_prune,
+        patch("src.tidy_cli.pytest_cli.helpers.console.print") as mock_print,
+    ):
+        cleanup_caches("never", set())
+        mock_bytecode.assert_not_called()
+        mock_prune.assert_not_called()
+
+        cleanup_caches("bytecode", {"custom"})
+        mock_bytecode.assert_called_once_with(skipped_dirs={"custom"})
+
+        cleanup_caches("prune", {"custom"})
+        mock_prune.assert_not_called()
+        assert "no cache budget set" in mock_print.call_args[0][0]
+
+        cleanup_caches("prune", {"custom"}, 7.0, 100.0, Path("/project/local"))
+        mock_prune.assert_called_once_with(Path("."), 7.0, 100.0, skipped_dirs={"custom"}, data_dir=Path("/project/local"))
+
+
+@pytest.mark.parametrize(
+    ("core", "version", "branch", "contexts", "expected"),
+    [
+        ("auto", (3, 12), False, False, "sysmon"),
+        ("auto", (3, 11), False, False, "ctrace"),
+        ("auto", (3, 12), True, False, "ctrace"),
+        ("auto", (3, 14), True, False, "sysmon"),
+        ("auto", (3, 14), False, True, "ctrace"),
+        ("sysmon", (3, 12), False, True, "ctrace"),
+        ("pytrace", (3, 12), False, False, "pytrace"),
+    ],
+)
+def test_resolve_coverage_core(core, version, branch, contexts, expected):
+    """Test the Coverage core resolution by Python version, branch coverage and per-test contexts."""
+    with patch("src.tidy_cli.pytest_cli.helpers.sys.version_info", version):
+        assert resolve_coverage_core(core, branch, contexts) == expected
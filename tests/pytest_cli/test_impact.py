@@ -0,0 +1,111 @@
+"""Tests for the pytest impact module."""
+
+from pathlib import Path
+
+from coverage import CoverageData
+
+from tidy_cli.pytest_cli.impact import (
+    build_impact_map,
+    is_test_file,
+    load_impact_map,
+    save_impact_map,
+    select_affected_tests,
+)
+
+IMPACT_MAP = {
+    "tests": ["tests/test_a.py::test_one", "tests/test_a.py::test_two", "tests/test_b.py::test_three"],
+    "files": {
+        "pkg/a.py": {"1": [], "2": [0, 1], "3": [0]},
+        "pkg/b.py": {"1": [], "2": [2]},
+    },
+}
+
+
+def _write_tests(root: Path) -> None:
+    """Create the test modules referenced by the impact map."""
+    (root / "tests").mkdir()
+    (root / "tests" / "test_a.py").write_text("")
+    (root / "tests" / "test_b.py").write_text("")
+
+
+def test_build_impact_map(tmp_path, monkeypatch):
+    """Test that coverage contexts are turned into the tests running each line."""
+    monkeypatch.chdir(tmp_path)
+    source = str(tmp_path / "pkg" / "a.py")
+    data = CoverageData(basename=str(tmp_path / ".coverage"))
+    data.set_context("")
+    data.add_lines({source: [1], "/elsewhere/module.py": [1]})
+    data.set_context("tests/test_a.py::test_one")
+    data.add_lines({source: [2, 3]})
+    data.set_context("tests/test_a.py::test_two")
+    data.add_lines({source: [2]})
+    data.write()
+
+    impact_map = build_impact_map(tmp_path / ".coverage")
+
+    assert impact_map == {
+        "tests": ["tests/test_a.py::test_one", "tests/test_a.py::test_two"],
+        "files": {"pkg/a.py": {"1": [], "2": [0, 1], "3": [0]}},
+    }
+    # Paths are relative to the given root (i.e., the repository root) rather than the current directory
+    (tmp_path / "tests").mkdir()
+    monkeypatch.chdir(tmp_path / "tests")
+    assert build_impact_map(tmp_path / ".coverage", tmp_path)["files"] == {"pkg/a.py": {"1": [], "2": [0, 1], "3": [0]}}
+
+
+def test_save_and_load_impact_map(tmp_path):
+    """Test persistence of the impact map and handling of missing or invalid files."""
+    impact_file = tmp_path / "local" / "impact.json"
+
+    assert load_impact_map(impact_file) is None
+    save_impact_map(IMPACT_MAP, impact_file)
+    assert load_impact_map(impact_file) == IMPACT_MAP
+    impact_file.write_text("[]")
+    assert load_impact_map(impact_file) is None
+
+
+def test_is_test_file():
+    """Test detection of test modules."""
+    assert is_test_file(Path("tests/test_a.py")) is True
+    assert is_test_file(Path("tests/a_test.py")) is True
+    assert is_test_file(Path("pkg/a.py")) is False
+
+
+def test_select_affected_tests_by_line(tmp_path, monkeypatch):
+    """Test that only the tests running a changed line are selected."""
+    monkeypatch.chdir(tmp_path)
+    _write_tests(tmp_path)
+
+    assert select_affected_tests(IMPACT_MAP, {Path("pkg/a.py"): {3, 10}}) == ["tests/test_a.py::test_one"]
+    assert select_affected_tests(IMPACT_MAP, {Path("pkg/a.py"): {10}, Path("README.md"): None}) == []
+
+
+def test_select_affected_tests_whole_file(tmp_path, monkeypatch):
+    """Test that whole-file changes and lines run outside of tests select every test running the file."""
+    monkeypatch.chdir(tmp_path)
+    _write_tests(tmp_path)
+
+    assert select_affected_tests(IMPACT_MAP, {Path("pkg/a.py"): {1}}) == ["tests/test_a.py::test_one", "tests/test_a.py::test_two"]
+    assert select_affected_tests(IMPACT_MAP, {Path("pkg/b.py"): None}) == ["tests/test_b.py::test_three"]
+
+
+def test_select_affected_tests_changed_test_files(tmp_path, monkeypatch):
+    """Test that changed test files and conftest folders are run as a whole, including their tests selected by line."""
+    monkeypatch.chdir(tmp_path)
+    _write_tests(tmp_path)
+    (tmp_path / "tests" / "unit").mkdir()
+    (tmp_path / "tests" / "unit" / "conftest.py").write_text("")
+
+    changes = {Path("pkg/a.py"): {2}, Path("tests/test_a.py"): {1}, Path("tests/unit/conftest.py"): {1}, Path("tests/test_removed.py"): None}
+
+    assert select_affected_tests(IMPACT_MAP, changes) == ["tests/test_a.py", "tests/unit"]
+
+
+def test_select_affected_tests_from_subfolder(tmp_path, monkeypatch):
+    """Test that changes relative to the repository root select tests run from a subfolder (e.g., the tests folder)."""
+    _write_tests(tmp_path)
+    monkeypatch.chdir(tmp_path / "tests")
+    impact_map = {"tests": ["test_a.py::test_one"], "files": {"pkg/a.py": {"3": [0]}}}
+
+    assert select_affected_tests(impact_map, {Path("pkg/a.py"): {3}}, tmp_path) == ["test_a.py::test_one"]
+    assert select_affected_tests(impact_map, {Path("tests/test_b.py"): {1}}, tmp_path) == ["test_b.py"]
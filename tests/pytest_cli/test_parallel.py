@@ -0,0 +1,58 @@
+"""Tests for the pytest parallel module."""
+
+from unittest.mock import patch
+
+from tidy_cli.pytest_cli.parallel import (
+    build_worker_commands,
+    run_pytest,
+    run_workers,
+)
+
+
+def test_build_worker_commands():
+    """Test that every worker loads the plugin with its own index."""
+    commands = build_worker_commands(["python", "-m", "pytest", "-x"], 2)
+
+    assert commands == [
+        ["python", "-m", "pytest", "-x", "-p", "tidy_cli.pytest_cli.plugin", "--tidy-worker=1/2"],
+        ["python", "-m", "pytest", "-x", "-p", "tidy_cli.pytest_cli.plugin", "--tidy-worker=2/2"],
+    ]
+
+
+def test_run_workers_prints_outputs_and_returns_worst_code():
+    """Test that each worker output is printed as a whole and failures are reported."""
+
+    def _stream(command, on_line, label):
+        worker = command[-1].split("=")[1]
+        on_line(f"output of {worker}", "stdout")
+        on_line(f"error of {worker}", "stderr")
+        return 1 if worker == "2/2" else 0
+
+    with patch("tidy_cli.pytest_cli.parallel.stream_command", side_effect=_stream), patch("rich.console.Console.print") as mock_print:
+        returncode = run_workers(["python", "-m", "pytest"], "Pytest", 2)
+
+    assert returncode == 1
+    mock_print.assert_any_call("output of 1/2", style=None, markup=False, highlight=False)
+    mock_print.assert_any_call("error of 2/2", style="red", markup=False, highlight=False)
+
+
+def test_run_pytest_warm():
+    """Test that plain Pytest commands are forked out of the warm server, falling back to a new process."""
+    with (
+        patch("tidy_cli.pytest_cli.parallel.is_warm_supported", return_value=True),
+        patch("tidy_cli.pytest_cli.parallel.run_warm", return_value=1) as mock_warm,
+        patch("tidy_cli.pytest_cli.parallel.run_profiled") as mock_run,
+        patch("rich.console.Console.print") as mock_print,
+    ):
+        assert run_pytest(["python", "-m", "pytest", "tests"], "Pytest", preload=["pkg"]) == 1
+        mock_warm.assert_called_once_with(["tests"], ["pkg"])
+        mock_run.assert_not_called()
+
+        mock_warm.side_effect = RuntimeError("boom")
+        mock_run.return_value.returncode = 0
+        assert run_pytest(["python", "-m", "pytest", "tests"], "Pytest", preload=[]) == 0
+        mock_print.assert_called_with("⚠️ Warm Pytest server unavailable (boom), running in a new process", style="yellow")
+
+        mock_warm.reset_mock()
+        run_pytest(["coverage", "run", "-m", "pytest"], "Pytest (coverage)", preload=[])
+        mock_warm.assert_not_called()
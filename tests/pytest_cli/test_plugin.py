@@ -0,0 +1,153 @@
+"""Tests for the pytest plugin module."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tidy_cli.pytest_cli.plugin import (
+    COLLECTION_KEY,
+    DESELECTED_KEY,
+    DURATIONS_KEY,
+    get_test_id,
+    parse_split,
+    pytest_collection_modifyitems,
+    pytest_sessionfinish,
+    select_shard,
+    select_worker,
+)
+from tidy_cli.pytest_cli.results import load_results
+
+
+def _item(test_id: str, root: Path = Path("/project")) -> MagicMock:
+    """Return a collected test with the given id relative to the invocation directory."""
+    module, _, name = test_id.partition("::")
+    item = MagicMock(nodeid=test_id, path=root / module)
+    item.config.invocation_params.dir = root
+    return item
+
+
+def _config(**options: str | None) -> MagicMock:
+    """Return a Pytest config with the given plugin options."""
+    config = MagicMock()
+    config.getoption.side_effect = lambda name: options.get(name)
+    config.stash = {}
+    return config
+
+
+def test_parse_split():
+    """Test parsing of the shard and worker options."""
+    assert parse_split("2/4", "--tidy-shard") == (2, 4)
+    for value in ("0/4", "5/4", "a/b", "2"):
+        with pytest.raises(pytest.UsageError):
+            parse_split(value, "--tidy-shard")
+
+
+def test_get_test_id_relative_to_invocation_dir(tmp_path):
+    """Test that test ids are relative to the directory Pytest is invoked from rather than its rootdir."""
+    item = MagicMock(nodeid="src/tests/test_a.py::TestA::test_one[x::y]", path=tmp_path / "src" / "tests" / "test_a.py")
+    item.config.invocation_params.dir = tmp_path / "src"
+
+    assert get_test_id(item) == "tests/test_a.py::TestA::test_one[x::y]"
+
+
+def test_select_shard_balances_durations():
+    """Test that shards are balanced by recorded durations, tests without history weighting the median."""
+    items = [_item(f"tests/test_a.py::test_{index}") for index in range(4)]
+    durations = {"tests/test_a.py::test_0": 9.0, "tests/test_a.py::test_1": 1.0, "tests/test_a.py::test_2": 3.0}
+
+    assert select_shard(items, durations, 1, 2) == {"tests/test_a.py::test_0"}
+    assert select_shard(items, durations, 2, 2) == {"tests/test_a.py::test_1", "tests/test_a.py::test_2", "tests/test_a.py::test_3"}
+
+
+def test_select_worker_keeps_modules_whole():
+    """Test that workers get whole modules balanced by their total duration."""
+    items = [_item("tests/test_a.py::test_one"), _item("tests/test_a.py::test_two"), _item("tests/test_b.py::test_one"), _item("tests/test_c.py::test_one")]
+
+    assert select_worker(items, {}, 1, 2) == {"tests/test_a.py"}
+    assert select_worker(items, {}, 2, 2) == {"tests/test_b.py", "tests/test_c.py"}
+    assert select_worker(items, {}, 4, 4) == set()
+
+
+def test_collection_modifyitems_shard_then_worker(tmp_path):
+    """Test that tests out of the shard, then out of the worker, are deselected."""
+    durations_file = tmp_path / "durations.json"
+    durations_file.write_text(json.dumps({"coverage-sysmon": {"tests/test_a.py::test_one": [10.0]}}))
+    items = [_item("tests/test_a.py::test_one"), _item("tests/test_b.py::test_one"), _item("tests/test_c.py::test_one")]
+    config = _config(tidy_shard="2/2", tidy_worker="1/2", tidy_durations=str(durations_file), tidy_durations_mode="coverage-sysmon")
+
+    pytest_collection_modifyitems(config, items)
+
+    assert [get_test_id(item) for item in items] == ["tests/test_b.py::test_one"]
+    config.hook.pytest_deselected.assert_called_once()
+    assert config.stash[DESELECTED_KEY] == 2
+
+
+def test_collection_modifyitems_without_split():
+    """Test that tests are untouched when neither shard nor worker is given."""
+    items = [_item("tests/test_a.py::test_one"), _item("tests/test_b.py::test_one")]
+
+    pytest_collection_modifyitems(_config(), items)
+
+    assert len(items) == 2
+
+
+def test_sessionfinish_writes_durations_and_passes_empty_split(tmp_path):
+    """Test that measured durations and collection time are written and that a worker left without tests does not fail the run."""
+    session = MagicMock()
+    session.config = _config(tidy_report_durations=str(tmp_path))
+    session.config.stash[DESELECTED_KEY] = 2
+    session.config.stash[DURATIONS_KEY] = {"tests/test_a.py::test_one": 0.5}
+    session.config.stash[COLLECTION_KEY] = 0.25
+
+    pytest_sessionfinish(session, pytest.ExitCode.NO_TESTS_COLLECTED)
+
+    assert session.exitstatus == pytest.ExitCode.OK
+    [report] = tmp_path.glob("*.json")
+    assert json.loads(report.read_text()) == {"durations": {"tests/test_a.py::test_one": 0.5}, "collection": 0.25}
+
+
+def test_results_log(tmp_path):
+    """Test that a Pytest run streams the reports of its tests, collection errors included, to the results log."""
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text(
+        "import pytest\n\n"
+        "def test_pass():\n    pass\n\n"
+        "def test_fail():\n    assert 1 == 2\n\n"
+        "@pytest.mark.skip(reason='not now')\ndef test_skip():\n    pass\n\n"
+        "@pytest.mark.xfail\ndef test_xfail():\n    assert False\n"
+    )
+    (tmp_path / "tests" / "test_broken.py").write_text("import missing_module\n")
+    reports_dir = tmp_path / "reports"
+    reports_dir.mkdir()
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "tests",
+            "-p",
+            "tidy_cli.pytest_cli.plugin",
+            f"--tidy-report-durations={reports_dir}",
+            "-p",
+            "no:cacheprovider",
+            "--continue-on-collection-errors",
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+    )
+
+    results = {result.test_id: result for result in load_results(reports_dir)}
+    assert {test_id: result.outcome for test_id, result in results.items()} == {
+        "tests/test_broken.py": "error",
+        "tests/test_a.py::test_pass": "passed",
+        "tests/test_a.py::test_fail": "failed",
+        "tests/test_a.py::test_skip": "skipped",
+        "tests/test_a.py::test_xfail": "xfailed",
+    }
+    assert results["tests/test_a.py::test_fail"].message == "assert 1 == 2"
+    assert results["tests/test_a.py::test_skip"].message == "Skipped: not now"
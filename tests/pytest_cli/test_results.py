@@ -0,0 +1,75 @@
+"""Tests for the pytest results module."""
+
+import json
+from unittest.mock import MagicMock
+
+from tidy_cli.pytest_cli.results import (
+    TestResult,
+    count_outcomes,
+    load_results,
+    merge_report,
+    print_results_summary,
+    write_results_file,
+)
+
+
+def _report(test_id: str, when: str, outcome: str, xfail: bool = False, message: str | None = None) -> dict:
+    """Return a test phase report as written by the plugin results log."""
+    return {"test_id": test_id, "when": when, "outcome": outcome, "duration": 0.5, "xfail": xfail, "message": message}
+
+
+def _merge(*reports: dict) -> TestResult:
+    """Return the result merged out of the given phase reports."""
+    result = None
+    for report in reports:
+        result = merge_report(result, report)
+    assert result is not None
+    return result
+
+
+def test_merge_report_outcomes():
+    """Test that phase reports are merged into the outcome of the test."""
+    assert _merge(_report("a", "setup", "passed"), _report("a", "call", "passed"), _report("a", "teardown", "passed")) == TestResult("a", "passed", 1.5)
+    assert _merge(_report("a", "setup", "passed"), _report("a", "call", "failed", message="assert 1 == 2")).outcome == "failed"
+    assert _merge(_report("a", "setup", "failed", message="fixture error")) == TestResult("a", "error", 0.5, "fixture error")
+    assert _merge(_report("a", "setup", "skipped", message="not on CI")) == TestResult("a", "skipped", 0.5, "not on CI")
+    assert _merge(_report("a", "call", "skipped", xfail=True)).outcome == "xfailed"
+    assert _merge(_report("a", "call", "passed", xfail=True), _report("a", "teardown", "passed")).outcome == "xpassed"
+    assert _merge(_report("a", "call", "passed"), _report("a", "teardown", "failed", message="teardown error")).outcome == "error"
+    assert _merge(_report("a", "call", "failed", message="first"), _report("a", "teardown", "failed", message="second")).message == "first"
+    assert _merge(_report("tests/test_a.py", "collect", "failed")).outcome == "error"
+
+
+def test_load_results(tmp_path):
+    """Test that the results logs of every process are merged, a truncated last line being skipped."""
+    (tmp_path / "results-1.jsonl").write_text(json.dumps(_report("a", "call", "passed")) + "\n" + json.dumps(_report("a", "teardown", "passed")) + "\n")
+    (tmp_path / "results-2.jsonl").write_text(json.dumps(_report("b", "call", "failed", message="boom")) + "\n" + '{"test_id": "c", "wh')
+
+    assert load_results(tmp_path) == [TestResult("a", "passed", 1.0), TestResult("b", "failed", 0.5, "boom")]
+    assert count_outcomes(load_results(tmp_path)) == {"failed": 1, "passed": 1}
+
+
+def test_print_results_summary():
+    """Test that failures are listed, up to a maximum, before the counts by outcome."""
+    console = MagicMock()
+    results = [TestResult("a", "failed", 1.0, "assert [x]"), TestResult("b", "error", 0.5), TestResult("c", "passed", 0.5)]
+
+    print_results_summary(console, results, max_failures=1)
+
+    console.print.assert_any_call("💥 FAILED a: assert \\[x]", style="red")
+    console.print.assert_any_call("💥 ... and [bold]1[/bold] more", style="red")
+    console.print.assert_called_with("📋 Results: [red]1 failed[/red], [red]1 error[/red], [green]1 passed[/green] in [bold]2.00s[/bold] of test time", style="white")
+
+
+def test_write_results_file(tmp_path):
+    """Test that results are written as JSON with the counts and exit code."""
+    path = tmp_path / "reports" / "results.json"
+
+    write_results_file(path, [TestResult("a", "failed", 1.0, "boom"), TestResult("b", "passed", 0.5)], 1)
+
+    assert json.loads(path.read_text()) == {
+        "returncode": 1,
+        "counts": {"failed": 1, "passed": 1},
+        "duration": 1.5,
+        "tests": [{"test_id": "a", "outcome": "failed", "duration": 1.0, "message": "boom"}, {"test_id": "b", "outcome": "passed", "duration": 0.5, "message": None}],
+    }
@@ -0,0 +1,142 @@
+"""Tests for the pytest server module."""
+
+import os
+import socket
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tidy_cli.pytest_cli.server import (
+    find_stale_source,
+    get_server_status,
+    get_socket_dir,
+    get_socket_path,
+    is_warm_supported,
+    make_private_dir,
+    run_warm,
+    send_request,
+    snapshot_sources,
+    start_server,
+    stop_server,
+)
+
+
+def test_get_socket_path(tmp_path):
+    """Test that each folder gets its own server socket."""
+    assert get_socket_path(tmp_path) == get_socket_path(tmp_path / ".")
+    assert get_socket_path(tmp_path) != get_socket_path(tmp_path / "other")
+    assert get_socket_path(tmp_path).suffix == ".sock"
+
+
+def test_find_stale_source(tmp_path):
+    """Test that changed and removed sources of imported modules are detected."""
+    source = tmp_path / "module.py"
+    source.write_text("VALUE = 1\n")
+    sources = {str(source): source.stat().st_mtime}
+
+    assert find_stale_source(sources) is None
+    os.utime(source, (0, 0))
+    assert find_stale_source(sources) == str(source)
+    source.unlink()
+    assert find_stale_source(sources) == str(source)
+
+
+def test_snapshot_sources():
+    """Test that the sources of imported modules are snapshotted."""
+    assert sys.modules["tidy_cli.pytest_cli.server"].__file__ in snapshot_sources()
+
+
+def test_get_server_status_not_running(tmp_path):
+    """Test status and stop when no server is running."""
+    assert get_server_status(tmp_path / "missing.sock") is None
+    assert stop_server(tmp_path / "missing.sock") is False
+
+
+@pytest.mark.skipif(not is_warm_supported(), reason="fork server not supported on this platform")
+def test_run_warm(tmp_path, monkeypatch):
+    """Test that runs are forked out of the server, which restarts when a preloaded source changes."""
+    (tmp_path / "warm_module.py").write_text("VALUE = 1\n")
+    (tmp_path / "test_warm.py").write_text("from warm_module import VALUE\n\n\ndef test_value():\n    assert VALUE == 1\n")
+    monkeypatch.chdir(tmp_path)
+    socket_path = get_socket_path()
+    try:
+        assert run_warm(["-q", "-p", "no:cacheprovider", "test_warm.py"], ["warm_module"]) == 0
+        first = get_server_status(socket_path)
+        assert first is not None and first["runs"] == 1 and first["modules"] == ["warm_module"]
+
+        assert run_warm(["-q", "-p", "no:cacheprovider", "test_warm.py"], ["warm_module"]) == 0
+        assert get_server_status(socket_path)["pid"] == first["pid"]
+
+        (tmp_path / "warm_module.py").write_text("VALUE = 2\n")
+        os.utime(tmp_path / "warm_module.py", (0, 0))
+        assert run_warm(["-q", "-p", "no:cacheprovider", "test_warm.py"], ["warm_module"]) == 1
+        assert get_server_status(socket_path)["pid"] != first["pid"]
+    finally:
+        stop_server(socket_path)
+    assert not Path(socket_path).exists()
+
+
+@pytest.mark.skipif(not is_warm_supported(), reason="fork server not supported on this platform")
+def test_repeated_status_requests(tmp_path, monkeypatch):
+    """Test that status requests answered and closed by the server at once never fail (e.g., on a broken pipe)."""
+    monkeypatch.chdir(tmp_path)
+    socket_path = get_socket_path()
+    start_server(socket_path, [])
+
+    class ClosedPipeSocket(socket.socket):
+        """Socket whose peer always closed the connection once the request is sent (i.e., sendall raises EPIPE)."""
+
+        def sendall(self, data, flags=0):
+            raise BrokenPipeError
+
+    try:
+        with patch("socket.socket", ClosedPipeSocket):
+            statuses = [get_server_status(socket_path) for _ in range(50)]
+
+        assert all(status is not None for status in statuses)
+        assert len({status["pid"] for status in statuses}) == 1
+    finally:
+        assert stop_server(socket_path) is True
+
+
+def test_get_socket_dir(tmp_path, monkeypatch):
+    """Test that sockets live in the user runtime folder when available, and in the user cache folder otherwise."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert get_socket_path(tmp_path).parent == tmp_path / "tidy-cli"
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    assert get_socket_dir() == tmp_path / "home" / ".cache" / "tidy-cli"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_make_private_dir(tmp_path):
+    """Test that the sockets folder is made accessible to the current user only."""
+    folder = tmp_path / "sockets"
+    folder.mkdir(mode=0o755)
+    folder.chmod(0o755)
+
+    make_private_dir(folder)
+
+    assert folder.stat().st_mode & 0o777 == 0o700
+    with patch("os.getuid", return_value=folder.stat().st_uid + 1), pytest.raises(RuntimeError, match="another user"):
+        make_private_dir(folder)
+
+
+@pytest.mark.skipif(not is_warm_supported(), reason="fork server not supported on this platform")
+def test_send_request_to_another_user(tmp_path):
+    """Test that nothing is sent to a server run by another user (e.g., one binding the socket first)."""
+    socket_path = tmp_path / "server.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+        with patch("os.getuid", return_value=os.getuid() + 1):
+            with pytest.raises(RuntimeError, match="another user"):
+                send_request(socket_path, {"action": "run", "env": {"SECRET": "value"}})
+            assert get_server_status(socket_path) is None
+        for _ in range(2):
+            connection, _ = listener.accept()
+            with connection:
+                assert connection.recv(1024) == b""
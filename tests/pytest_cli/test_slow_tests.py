@@ -0,0 +1,68 @@
+"""Tests for the pytest slow tests module."""
+
+from unittest.mock import MagicMock
+
+from rich.table import Table
+
+from tidy_cli.pytest_cli.slow_tests import (
+    TestTiming,
+    compare_durations,
+    find_regressions,
+    print_regressions,
+    print_slow_tests,
+)
+
+
+def test_compare_durations_slowest_first():
+    """Test that measured durations are paired with their baseline and sorted slowest first."""
+    timings = compare_durations({"a": 0.5, "b": 2.0, "c": 1.0}, {"b": 1.0, "c": 0.0})
+
+    assert timings == [TestTiming("b", 2.0, 1.0), TestTiming("c", 1.0, 0.0), TestTiming("a", 0.5, None)]
+    assert [timing.ratio for timing in timings] == [2.0, None, None]
+
+
+def test_find_regressions():
+    """Test that only tests with history, not too fast and beyond the ratio are flagged."""
+    timings = [
+        TestTiming("slower", 3.0, 1.0),
+        TestTiming("steady", 1.5, 1.0),
+        TestTiming("new", 5.0, None),
+        TestTiming("fast", 0.05, 0.001),
+    ]
+
+    assert find_regressions(timings, 2.0) == [TestTiming("slower", 3.0, 1.0)]
+    assert find_regressions(timings, 1.2) == [TestTiming("slower", 3.0, 1.0), TestTiming("steady", 1.5, 1.0)]
+
+
+def test_print_slow_tests():
+    """Test that the slowest tests are listed before the collection time."""
+    console = MagicMock()
+
+    print_slow_tests(console, [TestTiming("tests/test_a.py::test_one[a]", 2.0, 1.0), TestTiming("b", 1.0, None)], 0.5, 1)
+
+    table = console.print.call_args_list[0][0][0]
+    assert isinstance(table, Table)
+    assert table.title == "🐢 Slowest 1 test(s)"
+    assert table.row_count == 1
+    console.print.assert_called_with("⏱️  Collection: [bold]0.50s[/bold]", style="white")
+
+
+def test_print_slow_tests_none_listed():
+    """Test that no table is printed when listing no test."""
+    console = MagicMock()
+
+    print_slow_tests(console, [TestTiming("a", 2.0, 1.0)], None, 0)
+
+    console.print.assert_not_called()
+
+
+def test_print_regressions():
+    """Test that slower tests are printed as warnings, or errors when they fail the run."""
+    console = MagicMock()
+
+    print_regressions(console, [], 2.0)
+    console.print.assert_not_called()
+
+    print_regressions(console, [TestTiming("a", 3.0, 1.0)], 2.0, fail=True)
+    console.print.assert_any_call("❌ [bold]1[/bold] test(s) slower than [bold]2x[/bold] their baseline:", style="red")
+    console.print.assert_called_with("🐌 a: [bold]3.00s[/bold] vs 1.00s baseline ([bold]3.0x[/bold])", style="red")
@@ -0,0 +1,63 @@
+"""Tests for the benchmark suite helpers (i.e., parsing, storing and regression flagging, not the timings themselves)."""
+
+import pytest
+
+from benchmarks.run import find_regressions, store_results
+from benchmarks.suite import Measurement, make_bytecode_tree, parse_import_times
+
+
+def test_parse_import_times():
+    """Test parsing of python -X importtime output into self and cumulative times."""
+    stderr = "import time: self [us] | cumulative | imported package\nimport time:       120 |        120 |   typer.params\nimport time:      2000 |       5000 | tidy_cli\n"
+
+    assert parse_import_times(stderr) == {"typer.params": (120, 120), "tidy_cli": (2000, 5000)}
+
+
+def test_measurement_statistics():
+    """Test median and best duration of a measurement."""
+    measurement = Measurement("command:version", [0.3, 0.1, 0.2])
+
+    assert measurement.median == 0.2
+    assert measurement.best == 0.1
+
+
+@pytest.mark.parametrize(
+    "median, expected",
+    [
+        (0.12, {}),  # within the threshold
+        (0.2, {"command:version": 2.0}),  # above the threshold
+    ],
+)
+def test_find_regressions(median, expected):
+    """Test that benchmarks regress above the threshold ratio only, skipping the ones missing from the baseline."""
+    baseline = {"benchmarks": {"command:version": {"median": 0.1}}}
+    results = {"benchmarks": {"command:version": {"median": median}, "command:new": {"median": 1.0}}}
+
+    assert find_regressions(results, baseline, threshold=1.25) == pytest.approx(expected)
+
+
+def test_find_regressions_ignores_noise():
+    """Test that fast benchmarks growing by less than the minimum delta do not regress."""
+    baseline = {"benchmarks": {"settings:cached:depth-1": {"median": 0.00001}}}
+    results = {"benchmarks": {"settings:cached:depth-1": {"median": 0.00005}}}
+
+    assert find_regressions(results, baseline, threshold=1.25) == {}
+
+
+def test_store_results(tmp_path):
+    """Test that the first run becomes the baseline, later ones are compared with it and every run is kept in the history."""
+    first, second = {"benchmarks": {"a": {"median": 1.0}}}, {"benchmarks": {"a": {"median": 2.0}}}
+
+    assert store_results(first, tmp_path, save_baseline=False) is None
+    assert store_results(second, tmp_path, save_baseline=False) == first
+    assert store_results(second, tmp_path, save_baseline=True) is None
+    assert store_results(first, tmp_path, save_baseline=False) == second
+    assert len((tmp_path / "history.jsonl").read_text().splitlines()) == 4
+
+
+def test_make_bytecode_tree(tmp_path):
+    """Test that synthetic trees hold the requested number of bytecode files."""
+    make_bytecode_tree(tmp_path, 120)
+
+    assert len(list(tmp_path.rglob("*.pyc"))) == 120
+    assert len(list(tmp_path.glob("*/__pycache__"))) == 3
@@ -37,11 +37,12 @@ def test_get_version_metadata_error():
 
 def test_show_ascii_art():
     """Test show_ascii_art function."""
-    with patch("tidy_cli.helpers.get_version", return_value="1.0.0") as mock_get_version, \
-         patch("rich.console.Console.print") as mock_print:
-        
+    with (
+        patch("tidy_cli.helpers.get_version", return_value="1.0.0") as mock_get_version,
+        patch("rich.console.Console.print") as mock_print,
+    ):
         show_ascii_art()
-        
+
         mock_get_version.assert_called_once()
         # Verify that console.print was called multiple times (for the ASCII art)
         assert mock_print.call_count > 5
@@ -49,10 +50,23 @@ def test_show_ascii_art():
 
 def test_show_ascii_art_with_version_error():
     """Test show_ascii_art when get_version fails."""
-    with patch("tidy_cli.helpers.get_version", side_effect=Exception("Version error")) as mock_get_version, \
-         patch("rich.console.Console.print") as mock_print:
-        
+    with (
+        patch("tidy_cli.helpers.get_version", side_effect=Exception("Version error")) as mock_get_version,
+        patch("rich.console.Console.print"),
+    ):
         with pytest.raises(Exception, match="Version error"):
             show_ascii_art()
-        
-        mock_get_version.assert_called_once()
\ No newline at end of file
+
+        mock_get_version.assert_called_once()
+
+
+def test_show_ascii_art_headless():
+    """Test show_ascii_art function not pausing between lines when the CLI runs headless."""
+    with (
+        patch("tidy_cli.helpers.is_headless", return_value=True),
+        patch("tidy_cli.helpers.time.sleep") as mock_sleep,
+        patch("rich.console.Console.print"),
+    ):
+        show_ascii_art()
+
+        assert all(call.args == (0.0,) for call in mock_sleep.call_args_list)
@@ -0,0 +1,75 @@
+"""Tests for the lazy loading of the Commands Groups of the main CLI program."""
+
+import subprocess
+import sys
+
+from typer.core import TyperGroup
+from typer.testing import CliRunner
+
+from tidy_cli.lazy_group import (
+    LazyCommandGroup,
+    LazyTyperGroup,
+    load_command_group,
+)
+from tidy_cli.main_cli import COMMAND_GROUPS, app
+
+# Startup time itself is not asserted here, as wall-clock budgets are flaky on shared runners:
+# it is tracked by the benchmark suite (import:tidy_cli and command:version benchmarks) against its regression threshold
+STARTUP_SCRIPT = """
+import sys
+from tidy_cli import app
+for args in (["version"], ["--help"]):
+    try:
+        app(args)
+    except SystemExit:
+        pass
+print(",".join(sorted(name for name in sys.modules if name.startswith("tidy_cli."))))
+"""
+
+
+def _startup_modules() -> set[str]:
+    """Return the Tidy CLI modules imported by plain commands and the main help in a fresh interpreter."""
+    output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True, check=True).stdout.splitlines()
+    return set(output[-1].split(","))
+
+
+def test_plain_commands_do_not_import_command_groups():
+    """Test that plain commands and the main help import neither Commands Groups nor settings."""
+    modules = _startup_modules()
+
+    assert modules == {"tidy_cli.commons", "tidy_cli.commons.console", "tidy_cli.helpers", "tidy_cli.lazy_group", "tidy_cli.main_cli"}
+
+
+def test_load_command_group():
+    """Test that a Commands Group is built out of its Typer app with its name and help panel."""
+    group = load_command_group("tests", LazyCommandGroup("tidy_cli.cache_cli.cli:cache_app", help="", rich_help_panel="panel"))
+
+    assert isinstance(group, TyperGroup)
+    assert group.name == "tests"
+    assert group.rich_help_panel == "panel"
+    assert set(group.commands) == {"list", "prune"}
+
+
+def test_lazy_group_placeholders_swapped_when_invoked():
+    """Test that groups are listed as placeholders and swapped for the actual ones once invoked."""
+
+    class Group(LazyTyperGroup):
+        lazy_groups = {"cache": COMMAND_GROUPS["cache"]}
+
+    group = Group(name="main")
+    assert group.commands["cache"].help == COMMAND_GROUPS["cache"].help
+    assert group.commands["cache"].commands == {}  # type: ignore[attr-defined]
+
+    name, command, args = group.resolve_command(group.make_context("main", ["cache", "list"]), ["cache", "list"])
+
+    assert (name, args) == ("cache", ["list"])
+    assert set(command.commands) == {"list", "prune"}
+    assert group.commands["cache"] is command
+
+
+def test_main_cli_invokes_command_groups():
+    """Test that the main CLI program runs the commands of the lazily loaded groups."""
+    result = CliRunner().invoke(app, ["pytest", "--help"])
+
+    assert result.exit_code == 0
+    assert "report" in result.output
@@ -0,0 +1,28 @@
+"""Tests for the main CLI program."""
+
+import json
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from tidy_cli.main_cli import app
+
+
+def test_init_headless(tmp_path, monkeypatch):
+    """Test that headless init neither prompts nor animates, taking settings from options, environment variables and defaults."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TIDY_CLI_LINT_DEFAULT_PATH", "app")
+
+    with patch("typer.prompt") as mock_prompt, patch("tidy_cli.main_cli.show_ascii_art") as mock_art:
+        result = CliRunner().invoke(app, ["--headless", "init", "--pytest-dir", "tests"])
+
+    assert result.exit_code == 0, result.output
+    assert "✅" not in result.output and "Settings saved to" in result.output
+    mock_prompt.assert_not_called()
+    mock_art.assert_not_called()
+    assert json.loads((tmp_path / "local" / "tidy_cli_settings.json").read_text()) == {
+        "pytest_default_path": "tests",
+        "pytest_config_path": "../pyproject.toml",
+        "lint_default_path": "app",
+        "lint_config_path": "pyproject.toml",
+    }